@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""Memory benchmark for parsed issue models.
+
+Parses a batch of generated issue bodies and measures, with tracemalloc, the
+memory retained by the results:
+
+- the parse_body() results with the slotted models, against the same data
+  rebuilt with dict-backed copies of the model classes
+- sub-issue summaries held as IssueSummary records, against the nested
+  dicts IssueService used to build for them
+
+Usage:
+    python benchmarks/memory.py [--issues N]
+"""
+
+import argparse
+import dataclasses
+import gc
+import sys
+import tracemalloc
+
+from ghoo.core import IssueParser
+from ghoo.models import Condition, IssueSummary, LogEntry, LogSubEntry, Section, Todo
+
+
+def generate_body(issue: int) -> str:
+    """Build a small, typical issue body."""
+    parts = [f"Description of issue {issue}.", ""]
+
+    for section in ("Summary", "Acceptance Criteria", "Implementation Plan"):
+        parts.append(f"## {section}")
+        parts.append(f"Text for {section.lower()} of issue {issue}.")
+        for todo in range(4):
+            mark = "x" if (issue + todo) % 3 == 0 else " "
+            parts.append(f"- [{mark}] Todo {todo} of issue {issue}")
+        parts.append("")
+
+    parts.extend([
+        f"### CONDITION: Condition of issue {issue}",
+        "- [ ] VERIFIED",
+        "- **Signed-off by:** _Not yet verified_",
+        "- **Requirements:** Tests pass",
+        "- **Evidence:** _Not yet provided_",
+        "",
+        "## Log",
+        "",
+    ])
+    for entry, state in enumerate(("planning", "awaiting-plan-approval", "plan-approved")):
+        parts.extend([
+            "---",
+            f"### → {state} [2024-01-{entry + 1:02d} 10:00:00 UTC]",
+            f"*by @user{issue % 7}*",
+            "",
+        ])
+
+    return "\n".join(parts)
+
+
+def generate_node(issue: int) -> dict:
+    """Build a GraphQL sub-issue node."""
+    return {
+        'number': issue,
+        'title': f"Issue {issue}",
+        'state': 'CLOSED' if issue % 2 else 'OPEN',
+        'author': {'login': f"user{issue % 7}"},
+        'assignees': {'nodes': [{'login': f"user{issue % 5}"}]},
+        'labels': {'nodes': [{'name': 'status:in-progress', 'color': 'fbca04'},
+                             {'name': 'type:task', 'color': '0e8a16'}]},
+    }
+
+
+def _unslotted(cls):
+    """Return a dict-backed dataclass with the fields of cls."""
+    return dataclasses.make_dataclass(
+        cls.__name__, [(field.name, field.type) for field in dataclasses.fields(cls)]
+    )
+
+
+PLAIN_TODO = _unslotted(Todo)
+PLAIN_SECTION = _unslotted(Section)
+PLAIN_CONDITION = _unslotted(Condition)
+PLAIN_LOG_ENTRY = _unslotted(LogEntry)
+PLAIN_LOG_SUB_ENTRY = _unslotted(LogSubEntry)
+
+
+def _copy(obj, cls, **overrides):
+    values = {field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)}
+    values.update(overrides)
+    return cls(**values)
+
+
+def to_plain(parsed: dict) -> dict:
+    """Rebuild a parse_body() result with the dict-backed model copies."""
+    return {
+        'pre_section_description': parsed['pre_section_description'],
+        'sections': [
+            _copy(section, PLAIN_SECTION,
+                  todos=[_copy(todo, PLAIN_TODO) for todo in section.todos])
+            for section in parsed['sections']
+        ],
+        'conditions': [_copy(condition, PLAIN_CONDITION) for condition in parsed['conditions']],
+        'log_entries': [
+            _copy(entry, PLAIN_LOG_ENTRY,
+                  sub_entries=[_copy(sub, PLAIN_LOG_SUB_ENTRY) for sub in entry.sub_entries])
+            for entry in parsed['log_entries']
+        ],
+    }
+
+
+def legacy_summary(node: dict) -> dict:
+    """Format a sub-issue node as IssueService did before IssueSummary."""
+    labels = [{'name': label['name'], 'color': label['color']} for label in node['labels']['nodes']]
+    return {
+        'number': node['number'],
+        'title': node['title'],
+        'state': node['state'].lower(),
+        'author': node['author']['login'],
+        'assignees': [assignee['login'] for assignee in node['assignees']['nodes']],
+        'labels': labels,
+        'workflow_status': next((label['name'][7:] for label in labels
+                                 if label['name'].startswith('status:')), None),
+    }
+
+
+def retained(build) -> int:
+    """Return the bytes still allocated by the result of build()."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure memory retained by parsed issues")
+    parser.add_argument("--issues", type=int, default=10000, help="Number of synthetic issues")
+    options = parser.parse_args()
+
+    bodies = [generate_body(issue) for issue in range(options.issues)]
+    nodes = [generate_node(issue) for issue in range(options.issues)]
+
+    def report(name, size, baseline):
+        print(f"{name}: {size / 1024 / 1024:.1f} MB, {size / options.issues:.0f} B/issue, "
+              f"{(1 - size / baseline) * 100:.0f}% less")
+
+    print(f"{options.issues} issues")
+    plain = retained(lambda: [to_plain(IssueParser.parse_body(body)) for body in bodies])
+    slotted = retained(lambda: [IssueParser.parse_body(body) for body in bodies])
+    print(f"parsed bodies (dict-backed models): {plain / 1024 / 1024:.1f} MB, {plain / options.issues:.0f} B/issue")
+    report("parsed bodies (slotted models)", slotted, plain)
+
+    legacy = retained(lambda: [legacy_summary(node) for node in nodes])
+    compact = retained(lambda: [IssueSummary.from_graphql(node) for node in nodes])
+    print(f"sub-issue summaries (dicts): {legacy / 1024 / 1024:.1f} MB, {legacy / options.issues:.0f} B/issue")
+    report("sub-issue summaries (IssueSummary)", compact, legacy)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""IssueParser.parse_body benchmark.
+
+Parses a generated issue body of the requested size. The body has a few
+sections with todos, some conditions and a ## Log section that holds most of
+the bytes, like a long-lived issue with thousands of state transitions.
+
+Also reports parse_body_cached() hits from the in-memory and on-disk layers,
+reading one section through index_sections() as `ghoo get section` does, and
+parsing a batch of bodies in a loop versus IssueParser.parse_many().
+
+Usage:
+    python benchmarks/parse_body.py [--size KB] [--repeat N] [--batch N] [--workers N]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ghoo.core import IssueParser
+from ghoo.utils.parse_cache import ParseCache
+
+
+def generate_body(size_kb: int = 64) -> str:
+    """Build an issue body of roughly size_kb kilobytes."""
+    parts = ["# Epic: Benchmark issue", "", "Some description of the work.", ""]
+
+    for section in range(5):
+        parts.append(f"## Section {section}")
+        parts.append(f"Body text for section {section} with **markdown** and `code`.")
+        for todo in range(10):
+            mark = "x" if todo % 3 == 0 else " "
+            parts.append(f"- [{mark}] Todo {section}.{todo}")
+        parts.append("")
+
+    for condition in range(5):
+        parts.extend([
+            f"### CONDITION: Condition {condition}",
+            "- [ ] VERIFIED",
+            "- **Signed-off by:** _Not yet verified_",
+            f"- **Requirements:** Requirement {condition}",
+            "- **Evidence:** _Not yet provided_",
+            "",
+        ])
+
+    parts.append("## Log")
+    parts.append("")
+    target = size_kb * 1024
+    size = sum(len(part) + 1 for part in parts)
+    entry = 0
+    while size < target:
+        lines = [
+            "---",
+            f"### → in-progress [2024-01-{entry % 28 + 1:02d} 10:{entry % 60:02d}:00 UTC]",
+            f"*by @user{entry % 7}*",
+            f"**Message**: Transition number {entry}",
+            "",
+        ]
+        parts.extend(lines)
+        size += sum(len(line) + 1 for line in lines)
+        entry += 1
+
+    return "\n".join(parts)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure IssueParser.parse_body")
+    parser.add_argument("--size", type=int, default=64, help="Body size in KB")
+    parser.add_argument("--repeat", type=int, default=50, help="Number of timed parses")
+    parser.add_argument("--batch", type=int, default=2000, help="Bodies parsed by parse_many")
+    parser.add_argument("--workers", type=int, default=None, help="parse_many workers (default: CPUs)")
+    options = parser.parse_args()
+
+    body = generate_body(options.size)
+    result = IssueParser.parse_body(body)
+
+    median = _median_time(lambda: IssueParser.parse_body(body), options.repeat)
+    print(f"body: {len(body) / 1024:.1f} KB, {body.count(chr(10)) + 1} lines, "
+          f"{len(result['log_entries'])} log entries, {len(result['sections'])} sections")
+    print(f"parse_body: median {median * 1000:.2f} ms, "
+          f"{len(body) / median / 1024 / 1024:.1f} MB/s over {options.repeat} runs")
+
+    memory_cache = ParseCache()
+    IssueParser.parse_body_cached(body, memory_cache)
+    median = _median_time(lambda: IssueParser.parse_body_cached(body, memory_cache), options.repeat)
+    print(f"parse_body_cached (memory hit): median {median * 1000:.2f} ms")
+
+    with tempfile.TemporaryDirectory() as directory:
+        IssueParser.parse_body_cached(body, ParseCache(Path(directory)))
+        median = _median_time(
+            lambda: IssueParser.parse_body_cached(body, ParseCache(Path(directory))), options.repeat
+        )
+    print(f"parse_body_cached (disk hit): median {median * 1000:.2f} ms")
+
+    def read_section():
+        index = IssueParser.index_sections(body)
+        return index.section(index.find("Section 4"))
+
+    median = _median_time(read_section, options.repeat)
+    print(f"index_sections + section: median {median * 1000000:.0f} us")
+
+    batch = [generate_body(4) + f"\nBody {i}" for i in range(options.batch)]
+    start = time.perf_counter()
+    results = [IssueParser.parse_body(item) for item in batch]
+    loop = time.perf_counter() - start
+    del results
+    start = time.perf_counter()
+    IssueParser.parse_many(batch, workers=options.workers)
+    pooled = time.perf_counter() - start
+    print(f"{options.batch} x 4 KB bodies: loop {loop * 1000:.0f} ms, "
+          f"parse_many {pooled * 1000:.0f} ms ({loop / pooled:.1f}x)")
+    return 0
+
+
+def _median_time(function, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
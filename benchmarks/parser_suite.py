@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""Parser and body-editing benchmark suite with pathological inputs.
+
+Generates synthetic issue bodies that stress the parser in different ways and
+times each parsing and body-editing routine on each of them:
+
+- large:      a 65 KB body of ordinary sections, conditions and log entries
+- todos:      one section with 5,000 todos
+- log:        2,000 log entries
+- conditions: 500 conditions
+- unicode:    tables, emoji and non-Latin text
+
+The median time of every (input, routine) case is compared against
+benchmarks/parser_thresholds.json, and the script exits with status 1 if any
+case is slower than its threshold. Thresholds leave generous headroom over a
+reference run, so they catch algorithmic regressions (such as a quadratic
+loop) rather than machine noise. After an intended change, rewrite them with
+--update-thresholds and commit the file.
+
+Usage:
+    python benchmarks/parser_suite.py [--repeat N] [--output FILE] [--json]
+                                      [--only NAME] [--update-thresholds]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from ghoo.core import ConditionCommand, GitHubClient, IssueParser
+from ghoo.models import LogEntry
+
+
+THRESHOLDS_PATH = Path(__file__).with_name("parser_thresholds.json")
+
+# --update-thresholds stores the measured median times this factor
+HEADROOM = 5.0
+
+# Thresholds below this are raised to it, so fast cases don't fail on jitter
+MINIMUM_THRESHOLD_MS = 1.0
+
+CONDITION_BLOCK = """### CONDITION: {text}
+- [{mark}] VERIFIED
+- **Signed-off by:** {signed_off_by}
+- **Requirements:** {requirements}
+- **Evidence:** {evidence}
+"""
+
+
+def _condition(index: int) -> str:
+    verified = index % 2 == 0
+    return CONDITION_BLOCK.format(
+        text=f"Condition {index} holds",
+        mark="x" if verified else " ",
+        signed_off_by=f"@user{index % 7}" if verified else "_Not yet verified_",
+        requirements=f"Requirement number {index} is met",
+        evidence=f"Build {index} passed" if verified else "_Not yet provided_",
+    )
+
+
+def _log_entry(index: int) -> str:
+    return "\n".join([
+        "---",
+        f"### → in-progress [2024-{index % 12 + 1:02d}-{index % 28 + 1:02d} 10:{index % 60:02d}:00 UTC]",
+        f"*by @user{index % 7}*",
+        f"**Message**: Transition number {index}",
+        "",
+    ])
+
+
+def large_body(size_kb: int = 65) -> str:
+    """An ordinary body grown to size_kb kilobytes with log entries."""
+    parts = ["Some description of the work.", ""]
+    for section in range(8):
+        parts.append(f"## Section {section}")
+        parts.append(f"Body text for section {section} with **markdown** and `code`.")
+        parts.extend(f"- [{'x' if todo % 3 == 0 else ' '}] Todo {section}.{todo}" for todo in range(10))
+        parts.append("")
+    parts.extend(_condition(condition) for condition in range(5))
+    parts.extend(["## Log", ""])
+
+    size = sum(len(part) + 1 for part in parts)
+    entry = 0
+    while size < size_kb * 1024:
+        block = _log_entry(entry)
+        parts.append(block)
+        size += len(block) + 1
+        entry += 1
+    return "\n".join(parts)
+
+
+def todos_body(count: int = 5000) -> str:
+    """One section with count todos."""
+    parts = ["Many todos.", "", "## Tasks"]
+    parts.extend(f"- [{'x' if todo % 2 else ' '}] Todo number {todo}" for todo in range(count))
+    parts.extend(["", "## Log", "", _log_entry(0)])
+    return "\n".join(parts)
+
+
+def log_body(count: int = 2000) -> str:
+    """A short body with count log entries."""
+    parts = ["Long history.", "", "## Summary", "- [ ] Finish", "", "## Log", ""]
+    parts.extend(_log_entry(entry) for entry in range(count))
+    return "\n".join(parts)
+
+
+def conditions_body(count: int = 500) -> str:
+    """A body with count conditions."""
+    parts = ["Many conditions.", "", "## Summary", "- [x] Done", ""]
+    parts.extend(_condition(condition) for condition in range(count))
+    parts.extend(["## Log", "", _log_entry(0)])
+    return "\n".join(parts)
+
+
+def unicode_body(rows: int = 400) -> str:
+    """A body of tables, emoji and non-Latin text."""
+    parts = ["Ünïcödé 🚀 описание 説明 وصف", ""]
+    for section in range(10):
+        parts.append(f"## Раздел {section} 🧪")
+        parts.append("| Столбец | 列 | Status | Notes |")
+        parts.append("|---|---|---|---|")
+        parts.extend(
+            f"| Значение {row} | 値 {row} | - [ ] not a todo | émoji 🎉 `code` **bold** |"
+            for row in range(rows // 10)
+        )
+        parts.extend(f"- [{'x' if todo % 2 else ' '}] Задача {todo} ✅ 任务" for todo in range(10))
+        parts.append("")
+    parts.extend(["## Log", "", _log_entry(0)])
+    return "\n".join(parts)
+
+
+INPUTS: Dict[str, Callable[[], str]] = {
+    "large": large_body,
+    "todos": todos_body,
+    "log": log_body,
+    "conditions": conditions_body,
+    "unicode": unicode_body,
+}
+
+
+def rewrite_first_section(body: str) -> str:
+    """Replace the text of the body's first section, as update-section does."""
+    document = IssueParser.parse_document(body)
+    if document.sections:
+        document.set_section_body(document.sections[0], ["Rewritten by the benchmark"])
+    return document.text
+
+
+def routines(body: str) -> Dict[str, Callable[[], object]]:
+    """Return the routines to time on body, bound to their arguments.
+
+    The command helpers are instance methods that don't touch GitHub, so
+    they are called on instances created without a client.
+    """
+    parsed = IssueParser.parse_body(body)
+    log_content = body.split("\n## Log\n", 1)[1] if "\n## Log\n" in body else ""
+    entry = LogEntry(to_state="in-review", timestamp=datetime(2024, 6, 1, tzinfo=timezone.utc),
+                     author="benchmark", message="Appended by the benchmark")
+
+    client = GitHubClient.__new__(GitHubClient)
+    condition_command = ConditionCommand.__new__(ConditionCommand)
+
+    return {
+        "parse_body": lambda: IssueParser.parse_body(body),
+        "_parse_log_section": lambda: IssueParser._parse_log_section(log_content),
+        "set_section_body": lambda: rewrite_first_section(body),
+        "_reconstruct_body_with_conditions":
+            lambda: condition_command._reconstruct_body_with_conditions(parsed, parsed["conditions"]),
+        "_append_to_log_section": lambda: client._append_to_log_section(body, entry),
+        "_strip_condition_blocks_from_text": lambda: condition_command._strip_condition_blocks_from_text(body),
+    }
+
+
+def median_ms(function: Callable[[], object], repeat: int) -> float:
+    """Return the median time of function in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def run(repeat: int, only: List[str]) -> List[Dict[str, object]]:
+    """Time every routine on every input."""
+    results = []
+    for name, generate in INPUTS.items():
+        if only and name not in only:
+            continue
+        body = generate()
+        for routine, function in routines(body).items():
+            results.append({
+                "case": f"{name}/{routine}",
+                "input_kb": round(len(body.encode("utf-8")) / 1024, 1),
+                "median_ms": round(median_ms(function, repeat), 3),
+            })
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the issue body parser")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per case (median is reported)")
+    parser.add_argument("--output", type=Path, help="Write the results to this JSON file")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--only", action="append", default=[], choices=sorted(INPUTS),
+                        help="Run only this input (repeatable)")
+    parser.add_argument("--update-thresholds", action="store_true",
+                        help=f"Store the measured times x{HEADROOM:g} as the new thresholds")
+    options = parser.parse_args()
+
+    results = run(options.repeat, options.only)
+
+    thresholds = json.loads(THRESHOLDS_PATH.read_text()) if THRESHOLDS_PATH.exists() else {}
+    if options.update_thresholds:
+        thresholds.update({
+            result["case"]: round(max(result["median_ms"] * HEADROOM, MINIMUM_THRESHOLD_MS), 1)
+            for result in results
+        })
+        THRESHOLDS_PATH.write_text(json.dumps(dict(sorted(thresholds.items())), indent=2) + "\n")
+
+    for result in results:
+        threshold = thresholds.get(result["case"])
+        result["threshold_ms"] = threshold
+        result["passed"] = threshold is None or result["median_ms"] <= threshold
+
+    if options.output:
+        options.output.write_text(json.dumps({
+            "python": sys.version.split()[0],
+            "repeat": options.repeat,
+            "results": results,
+        }, indent=2) + "\n")
+
+    if options.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            status = "✅" if result["passed"] else "❌"
+            threshold = f"{result['threshold_ms']:.1f} ms" if result["threshold_ms"] is not None else "none"
+            print(f"{status} {result['case']:<50} {result['median_ms']:9.3f} ms "
+                  f"(threshold {threshold}, {result['input_kb']} KB)")
+
+    return 0 if all(result["passed"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
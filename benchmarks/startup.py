@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""CLI startup benchmark for ghoo.
+
+Runs simple ghoo commands in fresh interpreters, reports the median wall-clock
+time of each and the modules that dominate its import time (as measured by
+`python -X importtime`), and exits with status 1 if any command is slower than
+its threshold.
+
+Most of a cold start is the interpreter and Typer (--help also imports
+typer.rich_utils), which take very different times on different machines.
+Thresholds are therefore stored in benchmarks/startup_thresholds.json as
+multiples of a baseline measured in the same run: a fresh interpreter that
+only imports Typer. They are a reference run with HEADROOM on top, enough to
+ignore machine noise but not PyGithub or ghoo.core being imported eagerly
+again. Commands in CEILINGS_MS must also start within an absolute time,
+however slow the baseline. After an intended change, rewrite the thresholds
+with --update-thresholds and commit the file.
+
+Commands run with GHOO_NO_DAEMON=1 so a running `ghoo serve` doesn't hide the
+cold start cost.
+
+Usage:
+    python benchmarks/startup.py [--runs N] [--threshold MS] [--top N] [--json]
+                                 [--update-thresholds]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+
+# Commands expected to start without importing PyGithub or ghoo.core
+COMMANDS = [
+    ["version"],
+    ["--help"],
+    ["get", "--help"],
+]
+
+THRESHOLDS_PATH = Path(__file__).with_name("startup_thresholds.json")
+
+# --update-thresholds stores the measured median times this factor
+HEADROOM = 1.3
+
+# Absolute limits in milliseconds, applied on top of the relative thresholds:
+# the 150 ms cold start target. --help imports Rich, so it only has a relative one
+CEILINGS_MS = {
+    "ghoo version": 150.0,
+}
+
+# Floor of every ghoo command's start time, measured to scale the thresholds
+BASELINE = "import typer"
+
+# Runs ghoo the way the console script does
+LAUNCHER = "import sys; from ghoo.main import main; sys.argv[0] = 'ghoo'; main()"
+
+
+def _environment() -> Dict[str, str]:
+    env = dict(os.environ)
+    env["GHOO_NO_DAEMON"] = "1"
+    return env
+
+
+def time_command(args: List[str], runs: int, code: str = LAUNCHER) -> float:
+    """Return the median wall-clock time of a command in milliseconds."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code, *args],
+            env=_environment(), capture_output=True, check=True,
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def import_profile(args: List[str]) -> List[Tuple[str, float]]:
+    """Return (module, cumulative ms) for top-level imports of a command.
+
+    Only imports made directly by the interpreter or by ghoo modules are
+    listed, so nested imports of a dependency are folded into its total.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", LAUNCHER, *args],
+        env=_environment(), capture_output=True, text=True, check=True,
+    )
+
+    profile = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        try:
+            _, cumulative, name = line.split("|")
+            cumulative_ms = int(cumulative) / 1000
+        except ValueError:
+            continue
+        depth = len(name) - len(name.lstrip())
+        module = name.strip()
+        if depth <= 1 or module.startswith("ghoo"):
+            profile.append((module, cumulative_ms))
+    return profile
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure ghoo CLI startup time")
+    parser.add_argument("--runs", type=int, default=7, help="Runs per command (median is reported)")
+    parser.add_argument("--threshold", type=float,
+                        help="Maximum median start time in milliseconds for every command "
+                             "(default: the stored thresholds)")
+    parser.add_argument("--top", type=int, default=8, help="Number of imports to list per command")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--update-thresholds", action="store_true",
+                        help=f"Store the measured times x{HEADROOM:g} as the new thresholds")
+    options = parser.parse_args()
+
+    baseline_ms = time_command([], options.runs, code=BASELINE)
+
+    results = []
+    for args in COMMANDS:
+        median_ms = time_command(args, options.runs)
+        imports = sorted(import_profile(args), key=lambda item: item[1], reverse=True)[:options.top]
+        results.append({
+            "command": " ".join(["ghoo", *args]),
+            "median_ms": round(median_ms, 1),
+            "imports": [{"module": module, "cumulative_ms": round(ms, 1)} for module, ms in imports],
+        })
+
+    thresholds = json.loads(THRESHOLDS_PATH.read_text()) if THRESHOLDS_PATH.exists() else {}
+    if options.update_thresholds:
+        thresholds.update({
+            result["command"]: round(result["median_ms"] / baseline_ms * HEADROOM, 2)
+            for result in results
+        })
+        THRESHOLDS_PATH.write_text(json.dumps(dict(sorted(thresholds.items())), indent=2) + "\n")
+
+    for result in results:
+        if options.threshold is not None:
+            threshold = options.threshold
+        else:
+            limits = [CEILINGS_MS.get(result["command"])]
+            if result["command"] in thresholds:
+                limits.append(round(thresholds[result["command"]] * baseline_ms, 1))
+            limits = [limit for limit in limits if limit is not None]
+            threshold = min(limits) if limits else None
+        result["threshold_ms"] = threshold
+        result["passed"] = threshold is None or result["median_ms"] <= threshold
+
+    if options.json:
+        print(json.dumps({"baseline_ms": round(baseline_ms, 1), "results": results}, indent=2))
+    else:
+        print(f"Baseline ({BASELINE}): {baseline_ms:.1f} ms")
+        for result in results:
+            status = "✅" if result["passed"] else "❌"
+            threshold = f"{result['threshold_ms']:.0f} ms" if result["threshold_ms"] is not None else "none"
+            print(f"{status} {result['command']}: {result['median_ms']:.1f} ms (threshold {threshold})")
+            for entry in result["imports"]:
+                print(f"     {entry['cumulative_ms']:8.1f} ms  {entry['module']}")
+
+    return 0 if all(result["passed"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
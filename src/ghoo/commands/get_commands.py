@@ -5,7 +5,6 @@ from typing import Optional
 import sys
 import json
 
-from ..core import GitHubClient, ConfigLoader
 from ..exceptions import (
     MissingTokenError,
     InvalidTokenError,
@@ -13,14 +12,23 @@ from ..exceptions import (
     ConfigNotFoundError,
     InvalidYAMLError,
 )
-from .get_epic import GetEpicCommand
-from .get_task import GetTaskCommand
-from .get_subtask import GetSubtaskCommand
-from .get_milestone import GetMilestoneCommand
-from .get_section import GetSectionCommand
-from .get_todo import GetTodoCommand
-from .get_condition import GetConditionCommand
-from ..core import GetConditionsCommand
+from ..utils.lazy import lazy_importer, load_lazy_imports
+
+# Imported when a get command runs rather than when the CLI starts
+_LAZY_IMPORTS = {
+    'GitHubClient': '..core',
+    'ConfigLoader': '..core',
+    'GetConditionsCommand': '..core',
+    'GetEpicCommand': '.get_epic',
+    'GetTaskCommand': '.get_task',
+    'GetSubtaskCommand': '.get_subtask',
+    'GetMilestoneCommand': '.get_milestone',
+    'GetSectionCommand': '.get_section',
+    'GetTodoCommand': '.get_todo',
+    'GetConditionCommand': '.get_condition',
+}
+
+__getattr__ = lazy_importer(globals(), _LAZY_IMPORTS, __package__)
 
 # Create the get subcommand group
 get_app = typer.Typer(
@@ -30,6 +38,12 @@ get_app = typer.Typer(
 )
 
 
+@get_app.callback()
+def _load_command_dependencies():
+    """Import the modules the get commands depend on."""
+    load_lazy_imports(globals(), _LAZY_IMPORTS, __package__)
+
+
 @get_app.command()
 def epic(
     repo: Optional[str] = typer.Option(
@@ -43,6 +57,11 @@ def epic(
         "--format", 
         "-f",
         help="Output format: 'rich' for formatted display or 'json' for raw JSON"
+    ),
+    full_log: bool = typer.Option(
+        False,
+        "--full-log",
+        help="Include log entries archived to comments"
     )
 ):
     """Get and display an Epic issue with parsed body content."""
@@ -58,7 +77,7 @@ def epic(
         
         # Execute get epic command
         get_epic_command = GetEpicCommand(github_client, config_loader)
-        issue_data = get_epic_command.execute(repo, id, format)
+        issue_data = get_epic_command.execute(repo, id, format, full_log=full_log)
         
         # Display results based on format
         if format.lower() == 'json':
@@ -104,6 +123,11 @@ def task(
         "--format", 
         "-f",
         help="Output format: 'rich' for formatted display or 'json' for raw JSON"
+    ),
+    full_log: bool = typer.Option(
+        False,
+        "--full-log",
+        help="Include log entries archived to comments"
     )
 ):
     """Get and display a Task issue with parsed body content."""
@@ -119,7 +143,7 @@ def task(
         
         # Execute get task command
         get_task_command = GetTaskCommand(github_client, config_loader)
-        issue_data = get_task_command.execute(repo, id, format)
+        issue_data = get_task_command.execute(repo, id, format, full_log=full_log)
         
         # Display results based on format
         if format.lower() == 'json':
@@ -165,6 +189,11 @@ def subtask(
         "--format", 
         "-f",
         help="Output format: 'rich' for formatted display or 'json' for raw JSON"
+    ),
+    full_log: bool = typer.Option(
+        False,
+        "--full-log",
+        help="Include log entries archived to comments"
     )
 ):
     """Get and display a Subtask issue with parsed body content."""
@@ -180,7 +209,7 @@ def subtask(
         
         # Execute get subtask command
         get_subtask_command = GetSubtaskCommand(github_client, config_loader)
-        issue_data = get_subtask_command.execute(repo, id, format)
+        issue_data = get_subtask_command.execute(repo, id, format, full_log=full_log)
         
         # Display results based on format
         if format.lower() == 'json':
@@ -632,6 +661,7 @@ def _display_epic_issue(issue_data):
         typer.echo(f"\n📋 Log ({len(log_entries)} entries):")
         for log_entry in log_entries:
             _display_log_entry(log_entry)
+    _display_log_archive(issue_data)
     
     # Comments
     comments = issue_data.get('comments', [])
@@ -677,6 +707,20 @@ def _display_epic_issue(issue_data):
             typer.echo(f"\n⚠️  {issue_data['milestone_error']}", color=typer.colors.YELLOW)
 
 
+def _display_log_archive(issue_data):
+    """Display where archived log entries are kept, unless they were included.
+    
+    Args:
+        issue_data: Issue data dictionary
+    """
+    log_archive = issue_data.get('log_archive')
+    if not log_archive or 'entries' in log_archive:
+        return
+    count = len(log_archive['comments'])
+    typer.echo(f"   Older entries are archived in {count} comment{'s' if count != 1 else ''}; "
+               f"use --full-log to include them", color=typer.colors.BRIGHT_BLACK)
+
+
 def _display_log_entry(log_entry):
     """Display a single log entry with formatting (simplified from main.py).
     
@@ -1028,6 +1072,7 @@ def _display_task_issue(issue_data):
         typer.echo(f"\n📋 Log ({len(log_entries)} entries):")
         for log_entry in log_entries:
             _display_log_entry(log_entry)
+    _display_log_archive(issue_data)
     
     # Task-specific data - subtasks
     if 'sub_issues' in issue_data and issue_data['sub_issues']:
@@ -1127,6 +1172,7 @@ def _display_subtask_issue(issue_data):
         typer.echo(f"\n📋 Log ({len(log_entries)} entries):")
         for log_entry in log_entries:
             _display_log_entry(log_entry)
+    _display_log_archive(issue_data)
     
     # Comments
     comments = issue_data.get('comments', [])
@@ -124,20 +124,20 @@ class GetMilestoneCommand:
             milestone = github_repo.get_milestone(milestone_data['number'])
             
             # Fetch all issues for this milestone
-            issues = github_repo.get_issues(milestone=milestone, state='all')
+            issues = list(github_repo.get_issues(milestone=milestone, state='all'))
+            
+            # Detect all issue types with batched queries instead of one per issue
+            issue_types = self.issue_service.detect_issue_types(issues, repo)
             
             # Format issue data with type detection
             milestone_issues = []
             for issue in issues:
                 try:
-                    # Detect issue type using IssueService
-                    issue_type = self.issue_service.detect_issue_type(issue)
-                    
                     issue_data = {
                         'number': issue.number,
                         'title': issue.title,
                         'state': issue.state,
-                        'type': issue_type,
+                        'type': issue_types.get(issue.number, 'unknown'),
                         'author': issue.user.login,
                         'url': issue.html_url,
                         'created_at': issue.created_at.isoformat(),
@@ -52,8 +52,9 @@ class GetSectionCommand:
         # Resolve repository from parameter or config
         resolved_repo = resolve_repository(repo, self.config_loader)
         
-        # Retrieve issue data using IssueService
-        issue_data = self.issue_service.get_issue_with_details(resolved_repo, issue_id)
+        # Fetch only the body and its section index; the rest of the issue
+        # (comments, sub-issues, log) isn't needed for a single section
+        issue_data = self.issue_service.get_issue_outline(resolved_repo, issue_id)
         
         # Find the specified section
         section_data = self._find_section(issue_data, section_title)
@@ -67,7 +68,7 @@ class GetSectionCommand:
         """Find and extract the specified section from issue data.
         
         Args:
-            issue_data: Complete issue data from IssueService
+            issue_data: Issue outline from IssueService.get_issue_outline()
             section_title: Section title to find (case-insensitive)
             
         Returns:
@@ -76,29 +77,26 @@ class GetSectionCommand:
         Raises:
             ValueError: If section not found with available sections listed
         """
-        sections = issue_data.get('sections', [])
+        section_index = issue_data['section_index']
+        available_sections = section_index.titles()
         
-        if not sections:
+        if not available_sections:
             raise ValueError(f"❌ Issue #{issue_data['number']} has no sections")
         
         # Perform case-insensitive search
-        section_title_lower = section_title.lower()
-        matching_section = None
+        entry = section_index.find(section_title)
         
-        for section in sections:
-            if section['title'].lower() == section_title_lower:
-                matching_section = section
-                break
-        
-        if not matching_section:
+        if entry is None:
             # Build error message with available sections
-            available_sections = [section['title'] for section in sections]
             available_list = '\n'.join([f"   - {title}" for title in available_sections])
             raise ValueError(
                 f"❌ Section '{section_title}' not found in issue #{issue_data['number']}\n"
                 f"   Available sections:\n{available_list}"
             )
         
+        # Parse only the matching section
+        matching_section = self.issue_service.format_section(section_index.section(entry))
+        
         # Add issue metadata to section data
         section_with_metadata = {
             **matching_section,
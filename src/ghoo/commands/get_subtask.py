@@ -31,13 +31,15 @@ class GetSubtaskCommand:
         self.config_loader = config_loader
         self.issue_service = IssueService(github_client)
     
-    def execute(self, repo: Optional[str], issue_number: int, format: str = "rich") -> Dict[str, Any]:
+    def execute(self, repo: Optional[str], issue_number: int, format: str = "rich",
+                full_log: bool = False) -> Dict[str, Any]:
         """Execute the get subtask command.
         
         Args:
             repo: Repository in format 'owner/repo' or None to use config
             issue_number: Issue number to retrieve
             format: Output format ('rich' or 'json')
+            full_log: Include log entries archived to comments
             
         Returns:
             Dictionary containing formatted issue data
@@ -52,7 +54,9 @@ class GetSubtaskCommand:
         resolved_repo = resolve_repository(repo, self.config_loader)
         
         # Retrieve issue data using IssueService
-        issue_data = self.issue_service.get_issue_with_details(resolved_repo, issue_number)
+        issue_data = self.issue_service.get_issue_with_details(
+            resolved_repo, issue_number, full_log=full_log
+        )
         
         # Validate that the issue is actually a subtask
         if issue_data['type'] != 'subtask':
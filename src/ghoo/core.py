@@ -1,14 +1,18 @@
 """Core logic for GitHub API interaction."""
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Callable, Iterable, Iterator, Sequence
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import os
 import re
+import sys
+import hashlib
 from pathlib import Path
 import yaml
 import json
 import requests
 import subprocess
+from datetime import datetime, timezone
 from time import sleep
 
 from github import Github, GithubException
@@ -25,7 +29,16 @@ from .exceptions import (
     GraphQLError,
     FeatureUnavailableError,
 )
-from .models import Config
+from .models import Config, Section, Todo, Condition, LogEntry, LogSubEntry, DEFAULT_STATUS_FIELD_OPTIONS
+from .utils.cache import get_cache_dir, cache_enabled
+from .utils.http_cache import HTTPCache, install_http_adapter
+from .utils.identity import IdentityCache
+from .utils.labels import LabelCache
+from .utils.log_archive import GITHUB_BODY_LIMIT, LogArchiveIndex, pack_archive
+from .utils.parse_cache import ParseCache, dump_parsed, load_parsed
+from .utils.projects import ProjectCache
+from .utils.rate_limit import RateLimitScheduler
+from .utils.session import install_session
 
 
 class GraphQLClient:
@@ -38,13 +51,16 @@ class GraphQLClient:
     # GitHub GraphQL API endpoint
     GRAPHQL_URL = "https://api.github.com/graphql"
     
-    def __init__(self, token: str):
+    def __init__(self, token: str, scheduler: Optional[RateLimitScheduler] = None):
         """Initialize GraphQL client with authentication token.
         
         Args:
             token: GitHub personal access token
+            scheduler: Rate-limit scheduler shared with the REST client. An
+                       in-memory scheduler is created if not provided.
         """
         self.token = token
+        self.scheduler = scheduler or RateLimitScheduler()
         self.session = requests.Session()
         self.session.headers.update({
             'Authorization': f'Bearer {token}',
@@ -69,6 +85,35 @@ class GraphQLClient:
         Raises:
             GraphQLError: If the GraphQL request fails or returns errors
         """
+        data, errors = self._execute_partial(query, variables, max_retries)
+        
+        # Check for GraphQL errors with detailed parsing
+        if errors:
+            parsed_errors = self._parse_graphql_errors(errors)
+            raise GraphQLError(f"GraphQL query failed: {'; '.join(parsed_errors)}")
+        
+        return data
+    
+    def _execute_partial(self, query: str, variables: Optional[Dict[str, Any]] = None,
+                         max_retries: int = 3) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Execute a GraphQL document and return its data together with its errors.
+        
+        GraphQL resolves each field independently, so a document with several
+        aliased selections can partially succeed. Unlike _execute(), errors in
+        the response body are returned instead of raised so callers can map
+        them to the selections they belong to.
+        
+        Args:
+            query: The GraphQL query or mutation string
+            variables: Optional variables for the query
+            max_retries: Maximum number of retries for rate limiting
+            
+        Returns:
+            Tuple of (response data, list of GraphQL error objects)
+            
+        Raises:
+            GraphQLError: If the HTTP request itself fails
+        """
         payload = {
             'query': query,
             'variables': variables or {}
@@ -78,15 +123,19 @@ class GraphQLClient:
         
         for attempt in range(max_retries + 1):
             try:
+                # Wait for budget (and for any secondary rate limit backoff)
+                self.scheduler.acquire('graphql')
                 response = self.session.post(self.GRAPHQL_URL, json=payload)
                 
-                # Handle rate limiting
-                if response.status_code == 429:
-                    retry_after = int(response.headers.get('retry-after', 60))
+                body = response.text if response.status_code in (403, 429) else ''
+                self.scheduler.observe_headers(response.headers, response.status_code, body)
+                
+                # Handle rate limiting; the scheduler has recorded the backoff
+                if RateLimitScheduler.is_secondary_limit(response.status_code, response.headers, body):
                     if attempt < max_retries:
-                        sleep(retry_after)
                         continue
                     else:
+                        retry_after = response.headers.get('retry-after', 60)
                         raise GraphQLError(f"Rate limit exceeded. Please wait {retry_after} seconds before retrying.")
                 
                 # Handle authentication errors
@@ -108,13 +157,12 @@ class GraphQLClient:
                 
                 result = response.json()
                 
-                # Check for GraphQL errors with detailed parsing
-                if 'errors' in result:
-                    errors = result['errors']
-                    parsed_errors = self._parse_graphql_errors(errors)
-                    raise GraphQLError(f"GraphQL query failed: {'; '.join(parsed_errors)}")
+                # Queries that select rateLimit report their point cost
+                data = result.get('data') or {}
+                if isinstance(data, dict) and data.get('rateLimit'):
+                    self.scheduler.observe_graphql_rate_limit(data['rateLimit'])
                 
-                return result.get('data', {})
+                return result.get('data') or {}, result.get('errors') or []
                 
             except requests.exceptions.ConnectionError as e:
                 last_exception = GraphQLError(f"Connection error: {str(e)}")
@@ -307,6 +355,10 @@ class GraphQLClient:
                             title
                             number
                         }
+                        pageInfo {
+                            hasNextPage
+                            endCursor
+                        }
                     }
                 }
             }
@@ -320,7 +372,14 @@ class GraphQLClient:
         }
         
         try:
-            return self._execute(mutation, variables)
+            result = self._execute(mutation, variables)
+            issue = (result.get('reprioritizeSubIssue') or {}).get('issue')
+            if issue:
+                self._complete_connection(
+                    issue, 'subIssues',
+                    lambda cursor: self.iter_sub_issues(issue['id'], fields="id title number", after=cursor)
+                )
+            return result
         except GraphQLError as e:
             if "not available" in str(e).lower() or "feature" in str(e).lower():
                 raise FeatureUnavailableError(
@@ -329,9 +388,408 @@ class GraphQLClient:
                 )
             raise
     
+    # Mutations composed into one aliased document; each mutation costs five
+    # secondary-rate-limit points, so documents are kept small
+    MUTATION_BATCH_SIZE = 25
+
+    def execute_mutations(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run many mutations as aliased fields of a few GraphQL documents.
+
+        Mutation fields in one document are executed in order, and an error in
+        one of them doesn't prevent the others from running. Errors are mapped
+        back to the operation they belong to through the alias in their path.
+        An error without an alias path fails the operations of its document
+        that returned no data; the results of earlier documents are kept.
+        Once a document after the first fails as a whole, it and the
+        remaining operations are reported as failed.
+
+        Args:
+            operations: List of operations, each a dictionary with
+                        'mutation' (field name, e.g. 'addSubIssue'),
+                        'input' (input object) and optional 'fields'
+                        (selection on the payload, defaults to 'clientMutationId')
+
+        Returns:
+            One result per operation, in order, with 'success', 'data' (the
+            payload or None) and 'error' (message or None)
+
+        Raises:
+            GraphQLError: If the first request fails as a whole (network or
+                          authentication), so that no operation was applied
+        """
+        results: List[Dict[str, Any]] = []
+
+        for start in range(0, len(operations), self.MUTATION_BATCH_SIZE):
+            chunk = operations[start:start + self.MUTATION_BATCH_SIZE]
+            declarations = []
+            selections = []
+            variables = {}
+            for index, operation in enumerate(chunk):
+                mutation = operation['mutation']
+                input_type = f"{mutation[0].upper()}{mutation[1:]}Input"
+                declarations.append(f"$input{index}: {input_type}!")
+                selections.append(
+                    f"op{index}: {mutation}(input: $input{index}) {{ {operation.get('fields') or 'clientMutationId'} }}"
+                )
+                variables[f"input{index}"] = operation['input']
+
+            document = f"""
+            mutation BatchMutations({', '.join(declarations)}) {{
+                {' '.join(selections)}
+            }}
+            """
+
+            try:
+                data, errors = self._execute_partial(document, variables)
+            except GraphQLError as e:
+                if not results:
+                    raise
+                # Earlier documents were applied; report the rest as failed
+                results.extend(
+                    {'success': False, 'data': None, 'error': str(e)}
+                    for _ in operations[start:]
+                )
+                break
+
+            aliases = [f"op{index}" for index in range(len(chunk))]
+            errors_by_alias: Dict[str, List[Dict[str, Any]]] = {}
+            unattributed: List[Dict[str, Any]] = []
+            for error in errors:
+                path = error.get('path') or []
+                if path and path[0] in aliases:
+                    errors_by_alias.setdefault(path[0], []).append(error)
+                else:
+                    unattributed.append(error)
+
+            for alias in aliases:
+                alias_errors = errors_by_alias.get(alias, [])
+                if unattributed and data.get(alias) is None:
+                    # Only a returned payload shows that this mutation ran
+                    alias_errors = alias_errors + unattributed
+                results.append({
+                    'success': not alias_errors,
+                    'data': data.get(alias),
+                    'error': '; '.join(self._parse_graphql_errors(alias_errors)) if alias_errors else None,
+                })
+
+        return results
+
+    def add_sub_issues(self, parent_node_id: str, child_node_ids: List[str]) -> List[Dict[str, Any]]:
+        """Add many sub-issues to one parent with batched mutations.
+
+        Args:
+            parent_node_id: GraphQL node ID of the parent issue
+            child_node_ids: GraphQL node IDs of the issues to add, in order
+
+        Returns:
+            One result per child as returned by execute_mutations()
+
+        Raises:
+            GraphQLError: If the first request fails as a whole
+        """
+        return self.execute_mutations([
+            {
+                'mutation': 'addSubIssue',
+                'input': {'issueId': parent_node_id, 'subIssueId': child_node_id},
+                'fields': 'subIssue { id number title }',
+            }
+            for child_node_id in child_node_ids
+        ])
+
+    def remove_sub_issues(self, parent_node_id: str, child_node_ids: List[str]) -> List[Dict[str, Any]]:
+        """Remove many sub-issues from one parent with batched mutations.
+
+        Args:
+            parent_node_id: GraphQL node ID of the parent issue
+            child_node_ids: GraphQL node IDs of the issues to remove
+
+        Returns:
+            One result per child as returned by execute_mutations()
+
+        Raises:
+            GraphQLError: If the first request fails as a whole
+        """
+        return self.execute_mutations([
+            {
+                'mutation': 'removeSubIssue',
+                'input': {'issueId': parent_node_id, 'subIssueId': child_node_id},
+                'fields': 'subIssue { id number title }',
+            }
+            for child_node_id in child_node_ids
+        ])
+
+    def reprioritize_sub_issues(self, issue_id: str, moves: List[Tuple[str, Optional[str]]]) -> List[Dict[str, Any]]:
+        """Apply many sub-issue moves with batched mutations.
+
+        Moves are applied in order, so a full ordering can be expressed as
+        each sub-issue placed after its predecessor.
+
+        Args:
+            issue_id: GraphQL node ID of the parent issue
+            moves: List of (sub_issue_id, after_id) pairs; after_id may be None
+
+        Returns:
+            One result per move as returned by execute_mutations()
+
+        Raises:
+            GraphQLError: If the first request fails as a whole
+        """
+        return self.execute_mutations([
+            {
+                'mutation': 'reprioritizeSubIssue',
+                'input': {'issueId': issue_id, 'subIssueId': sub_issue_id, 'afterId': after_id},
+                'fields': 'issue { id }',
+            }
+            for sub_issue_id, after_id in moves
+        ])
+
+    def add_labels_batch(self, label_ids_by_node: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        """Add labels to many issues with batched mutations.
+
+        Args:
+            label_ids_by_node: Label node IDs to add, keyed by issue node ID
+
+        Returns:
+            One result per issue as returned by execute_mutations()
+
+        Raises:
+            GraphQLError: If the first request fails as a whole
+        """
+        return self.execute_mutations([
+            {
+                'mutation': 'addLabelsToLabelable',
+                'input': {'labelableId': node_id, 'labelIds': label_ids},
+            }
+            for node_id, label_ids in label_ids_by_node.items()
+        ])
+
+    def remove_labels_batch(self, label_ids_by_node: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        """Remove labels from many issues with batched mutations.
+
+        Args:
+            label_ids_by_node: Label node IDs to remove, keyed by issue node ID
+
+        Returns:
+            One result per issue as returned by execute_mutations()
+
+        Raises:
+            GraphQLError: If the first request fails as a whole
+        """
+        return self.execute_mutations([
+            {
+                'mutation': 'removeLabelsFromLabelable',
+                'input': {'labelableId': node_id, 'labelIds': label_ids},
+            }
+            for node_id, label_ids in label_ids_by_node.items()
+        ])
+
+    def get_repository_labels(self, owner: str, repo: str) -> Dict[str, str]:
+        """Get the node ID of every label of a repository.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+
+        Returns:
+            Label node IDs keyed by label name
+
+        Raises:
+            GraphQLError: If the query fails
+        """
+        query = """
+        query GetRepositoryLabels($owner: String!, $repo: String!, $first: Int!, $after: String) {
+            repository(owner: $owner, name: $repo) {
+                labels(first: $first, after: $after) {
+                    nodes {
+                        id
+                        name
+                    }
+                    pageInfo {
+                        hasNextPage
+                        endCursor
+                    }
+                }
+            }
+        }
+        """
+        return {
+            label['name']: label['id']
+            for label in self.paginate(query, {'owner': owner, 'repo': repo}, ('repository', 'labels'))
+        }
+
+    # Fields fetched for every sub-issue by iter_sub_issues() unless overridden
+    _SUB_ISSUE_STREAM_FIELDS = """
+        id
+        title
+        number
+        body
+        state
+        createdAt
+        updatedAt
+        author {
+            login
+        }
+        labels(first: 100) {
+            nodes {
+                name
+                color
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+        assignees(first: 100) {
+            nodes {
+                login
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    """
+
+    def paginate(self, query: str, variables: Optional[Dict[str, Any]] = None,
+                 path: Sequence[str] = (), page_size: int = 100,
+                 after: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stream the nodes of a GraphQL connection across all of its pages.
+
+        The query must declare `$first: Int!` and `$after: String` variables,
+        pass them to the connection and select its `nodes` and
+        `pageInfo { hasNextPage endCursor }`. Pages are fetched in sequence;
+        while the nodes of one page are being consumed, the next page is
+        already requested in the background.
+
+        Args:
+            query: GraphQL query selecting one paginated connection
+            variables: Query variables other than $first and $after
+            path: Keys leading from the response data to the connection,
+                  e.g. ('node', 'subIssues')
+            page_size: Number of nodes requested per page (GitHub allows up to 100)
+            after: Cursor to start after, or None to start at the beginning
+
+        Yields:
+            Connection nodes in order
+
+        Raises:
+            GraphQLError: If fetching any page fails
+        """
+        def fetch_page(cursor: Optional[str]) -> Optional[Dict[str, Any]]:
+            result = self._execute(query, {**(variables or {}), 'first': page_size, 'after': cursor})
+            connection = result
+            for key in path:
+                connection = (connection or {}).get(key)
+            return connection
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            pending = executor.submit(fetch_page, after)
+            while pending is not None:
+                connection = pending.result()
+                if not connection:
+                    return
+
+                page_info = connection.get('pageInfo') or {}
+                pending = None
+                if page_info.get('hasNextPage') and page_info.get('endCursor'):
+                    # Prefetch the next page while the caller consumes this one
+                    pending = executor.submit(fetch_page, page_info['endCursor'])
+
+                yield from connection.get('nodes') or []
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_issue_connection(self, node_id: str, connection: str, fields: str,
+                              after: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stream the nodes of a connection on an issue (comments, labels, ...).
+
+        Args:
+            node_id: GraphQL node ID of the issue
+            connection: Name of the connection field (e.g. 'comments')
+            fields: GraphQL selection for each node of the connection
+            after: Cursor to continue from, or None to start at the beginning
+
+        Yields:
+            Connection nodes in order
+
+        Raises:
+            GraphQLError: If the query fails
+        """
+        query = f"""
+        query IterIssueConnection($id: ID!, $first: Int!, $after: String) {{
+            node(id: $id) {{
+                ... on Issue {{
+                    {connection}(first: $first, after: $after) {{
+                        nodes {{
+                            {fields}
+                        }}
+                        pageInfo {{
+                            hasNextPage
+                            endCursor
+                        }}
+                    }}
+                }}
+            }}
+        }}
+        """
+        return self.paginate(query, {'id': node_id}, ('node', connection), after=after)
+
+    def iter_sub_issues(self, node_id: str, fields: Optional[str] = None,
+                        after: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stream all sub-issues of an issue, page by page.
+
+        Labels and assignees of each sub-issue are completed with follow-up
+        queries when they exceed one page, so nothing is truncated.
+
+        Args:
+            node_id: GraphQL node ID of the parent issue
+            fields: GraphQL selection for each sub-issue (defaults to id, title,
+                    number, body, state, timestamps, author, labels and assignees)
+            after: Cursor to continue from, or None to start at the beginning
+
+        Yields:
+            Sub-issue nodes in priority order
+
+        Raises:
+            GraphQLError: If the query fails
+        """
+        for sub_issue in self.iter_issue_connection(node_id, 'subIssues', fields or self._SUB_ISSUE_STREAM_FIELDS, after):
+            self._complete_nested_connections(sub_issue)
+            yield sub_issue
+
+    def _complete_connection(self, node: Dict[str, Any], connection: str,
+                             remaining: Callable[[str], Iterable[Dict[str, Any]]]) -> None:
+        """Append the pages of a connection that a response did not include.
+
+        Args:
+            node: Object holding the connection
+            connection: Name of the connection field
+            remaining: Callable returning the nodes after a given cursor
+        """
+        page = node.get(connection)
+        page_info = (page or {}).get('pageInfo') or {}
+        if page_info.get('hasNextPage') and page_info.get('endCursor'):
+            page['nodes'].extend(remaining(page_info['endCursor']))
+            page['pageInfo'] = {'hasNextPage': False, 'endCursor': page_info['endCursor']}
+
+    def _complete_nested_connections(self, issue: Dict[str, Any]) -> None:
+        """Complete the labels and assignees of an issue node in place."""
+        if not issue.get('id'):
+            return
+        for connection, fields in (('labels', "name color"), ('assignees', "login")):
+            self._complete_connection(
+                issue, connection,
+                lambda cursor, c=connection, f=fields: self.iter_issue_connection(issue['id'], c, f, after=cursor)
+            )
+
     def get_issue_with_sub_issues(self, node_id: str) -> Dict[str, Any]:
         """Get an issue with all its sub-issues and their details.
         
+        The first page of sub-issues is fetched with the issue itself; any
+        further pages (and labels or assignees beyond the first page) are
+        fetched through the paginator, so the returned lists are complete.
+        
         Args:
             node_id: GraphQL node ID of the issue
             
@@ -341,10 +799,10 @@ class GraphQLClient:
         Raises:
             GraphQLError: If the query fails
         """
-        query = """
-        query GetIssueWithSubIssues($id: ID!) {
-            node(id: $id) {
-                ... on Issue {
+        query = f"""
+        query GetIssueWithSubIssues($id: ID!) {{
+            node(id: $id) {{
+                ... on Issue {{
                     id
                     title
                     number
@@ -352,62 +810,61 @@ class GraphQLClient:
                     state
                     createdAt
                     updatedAt
-                    author {
+                    author {{
                         login
-                    }
-                    repository {
+                    }}
+                    repository {{
                         name
-                        owner {
+                        owner {{
                             login
-                        }
-                    }
-                    subIssues(first: 100) {
+                        }}
+                    }}
+                    subIssues(first: 100) {{
                         totalCount
-                        nodes {
-                            id
-                            title
-                            number
-                            body
-                            state
-                            createdAt
-                            updatedAt
-                            author {
-                                login
-                            }
-                            labels(first: 20) {
-                                nodes {
-                                    name
-                                    color
-                                }
-                            }
-                            assignees(first: 10) {
-                                nodes {
-                                    login
-                                }
-                            }
-                        }
-                        pageInfo {
+                        nodes {{
+                            {self._SUB_ISSUE_STREAM_FIELDS}
+                        }}
+                        pageInfo {{
                             hasNextPage
                             endCursor
-                        }
-                    }
-                    labels(first: 20) {
-                        nodes {
+                        }}
+                    }}
+                    labels(first: 100) {{
+                        nodes {{
                             name
                             color
-                        }
-                    }
-                }
-            }
-        }
+                        }}
+                        pageInfo {{
+                            hasNextPage
+                            endCursor
+                        }}
+                    }}
+                }}
+            }}
+        }}
         """
         
         variables = {'id': node_id}
-        return self._execute(query, variables)
+        result = self._execute(query, variables)
+        
+        issue = result.get('node') if result else None
+        if issue:
+            self._complete_nested_connections(issue)
+            for sub_issue in (issue.get('subIssues') or {}).get('nodes', []):
+                self._complete_nested_connections(sub_issue)
+            self._complete_connection(
+                issue, 'subIssues',
+                lambda cursor: self.iter_sub_issues(node_id, after=cursor)
+            )
+        
+        return result
     
     def get_sub_issues_summary(self, node_id: str) -> Dict[str, Any]:
         """Get summary statistics for sub-issues of an issue.
         
+        Every page of sub-issues is counted, so the statistics are exact for
+        issues with more than 100 sub-issues.
+        
         Args:
             node_id: GraphQL node ID of the parent issue
             
@@ -418,53 +875,331 @@ class GraphQLClient:
             GraphQLError: If the query fails
         """
         query = """
-        query GetSubIssuesSummary($id: ID!) {
+        query GetSubIssuesSummary($id: ID!, $first: Int!, $after: String) {
             node(id: $id) {
                 ... on Issue {
                     id
-                    title
-                    number
-                    subIssues(first: 100) {
+                    subIssues(first: $first, after: $after) {
                         totalCount
                         nodes {
-                            id
                             state
                         }
+                        pageInfo {
+                            hasNextPage
+                            endCursor
+                        }
                     }
                 }
             }
         }
         """
         
-        variables = {'id': node_id}
-        result = self._execute(query, variables)
+        open_count = 0
+        closed_count = 0
+        for sub in self.paginate(query, {'id': node_id}, ('node', 'subIssues')):
+            if sub['state'] == 'OPEN':
+                open_count += 1
+            elif sub['state'] == 'CLOSED':
+                closed_count += 1
         
-        # Process the result to provide summary statistics
-        if result and 'node' in result and result['node']:
-            sub_issues = result['node']['subIssues']['nodes']
-            total_count = result['node']['subIssues']['totalCount']
-            open_count = sum(1 for sub in sub_issues if sub['state'] == 'OPEN')
-            closed_count = sum(1 for sub in sub_issues if sub['state'] == 'CLOSED')
-            
-            return {
-                'total': total_count,
-                'open': open_count,
-                'closed': closed_count,
-                'completion_rate': (closed_count / total_count * 100) if total_count > 0 else 0
+        total_count = open_count + closed_count
+        return {
+            'total': total_count,
+            'open': open_count,
+            'closed': closed_count,
+            'completion_rate': (closed_count / total_count * 100) if total_count > 0 else 0
+        }
+
+    # Fields fetched for every sub-issue in the composed issue details query
+    _SUB_ISSUE_FIELDS = """
+        id
+        number
+        title
+        state
+        author {
+            login
+        }
+        labels(first: 100) {
+            nodes {
+                name
+                color
             }
-        
-        return {'total': 0, 'open': 0, 'closed': 0, 'completion_rate': 0}
-    
-    def get_node_id(self, repo_owner: str, repo_name: str, issue_number: int) -> str:
-        """Convert an issue number to its GraphQL node ID.
-        
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+        assignees(first: 100) {
+            nodes {
+                login
+            }
+            pageInfo {
+                hasNextPage
+                endCursor
+            }
+        }
+    """
+
+    # Fields fetched for every comment in the composed issue details query
+    _COMMENT_FIELDS = """
+        databaseId
+        author {
+            login
+        }
+        body
+        createdAt
+        updatedAt
+        url
+    """
+
+    def get_issue_details(self, repo_owner: str, repo_name: str, issue_number: int) -> Dict[str, Any]:
+        """Fetch everything the get commands display for an issue in one query.
+
+        The issue body, type, labels, assignees, milestone, comments, sub-issues
+        and native parent are requested in a single composed document. Comments
+        and sub-issues beyond the first page are fetched with follow-up queries
+        so the returned connections are always complete.
+
         Args:
             repo_owner: Repository owner (user or organization)
             repo_name: Repository name
             issue_number: Issue number
-            
+
         Returns:
-            GraphQL node ID for the issue
+            Dictionary with the issue data; 'comments' and 'subIssues' contain
+            the complete node lists under 'nodes'
+
+        Raises:
+            GraphQLError: If the query fails or the issue doesn't exist
+        """
+        query = f"""
+        query GetIssueDetails($owner: String!, $repo: String!, $number: Int!) {{
+            rateLimit {{
+                cost
+                remaining
+                resetAt
+                limit
+            }}
+            repository(owner: $owner, name: $repo) {{
+                issue(number: $number) {{
+                    id
+                    number
+                    title
+                    body
+                    state
+                    createdAt
+                    updatedAt
+                    url
+                    author {{
+                        login
+                    }}
+                    issueType {{
+                        name
+                    }}
+                    labels(first: 100) {{
+                        nodes {{
+                            name
+                            color
+                        }}
+                        pageInfo {{
+                            hasNextPage
+                            endCursor
+                        }}
+                    }}
+                    assignees(first: 100) {{
+                        nodes {{
+                            login
+                        }}
+                        pageInfo {{
+                            hasNextPage
+                            endCursor
+                        }}
+                    }}
+                    milestone {{
+                        title
+                        state
+                        dueOn
+                    }}
+                    parent {{
+                        number
+                        title
+                        state
+                        url
+                        issueType {{
+                            name
+                        }}
+                        labels(first: 100) {{
+                            nodes {{
+                                name
+                            }}
+                        }}
+                    }}
+                    comments(first: 100) {{
+                        nodes {{
+                            {self._COMMENT_FIELDS}
+                        }}
+                        pageInfo {{
+                            hasNextPage
+                            endCursor
+                        }}
+                    }}
+                    subIssues(first: 100) {{
+                        totalCount
+                        nodes {{
+                            {self._SUB_ISSUE_FIELDS}
+                        }}
+                        pageInfo {{
+                            hasNextPage
+                            endCursor
+                        }}
+                    }}
+                }}
+            }}
+        }}
+        """
+
+        variables = {
+            'owner': repo_owner,
+            'repo': repo_name,
+            'number': issue_number
+        }
+
+        result = self._execute(query, variables)
+
+        issue = (result.get('repository') or {}).get('issue')
+        if not issue:
+            raise GraphQLError(f"Issue #{issue_number} not found in {repo_owner}/{repo_name}")
+
+        self._complete_nested_connections(issue)
+        self._complete_connection(
+            issue, 'comments',
+            lambda cursor: self.iter_issue_connection(issue['id'], 'comments', self._COMMENT_FIELDS, after=cursor)
+        )
+        for sub_issue in issue['subIssues']['nodes']:
+            self._complete_nested_connections(sub_issue)
+        self._complete_connection(
+            issue, 'subIssues',
+            lambda cursor: self.iter_sub_issues(issue['id'], fields=self._SUB_ISSUE_FIELDS, after=cursor)
+        )
+
+        return issue
+
+    def get_issue_parent(self, repo_owner: str, repo_name: str, issue_number: int) -> Optional[Dict[str, Any]]:
+        """Get the native parent of an issue.
+        
+        Args:
+            repo_owner: Repository owner (user or organization)
+            repo_name: Repository name
+            issue_number: Issue number
+            
+        Returns:
+            Parent issue node (number, title, state, url, issueType, labels)
+            or None if the issue has no native parent
+            
+        Raises:
+            GraphQLError: If the query fails or the issue doesn't exist
+        """
+        query = """
+        query GetIssueParent($owner: String!, $repo: String!, $number: Int!) {
+            repository(owner: $owner, name: $repo) {
+                issue(number: $number) {
+                    parent {
+                        number
+                        title
+                        state
+                        url
+                        issueType {
+                            name
+                        }
+                        labels(first: 100) {
+                            nodes {
+                                name
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        """
+        
+        variables = {
+            'owner': repo_owner,
+            'repo': repo_name,
+            'number': issue_number
+        }
+        
+        result = self._execute(query, variables)
+        
+        issue = (result.get('repository') or {}).get('issue')
+        if not issue:
+            raise GraphQLError(f"Issue #{issue_number} not found in {repo_owner}/{repo_name}")
+        
+        return issue.get('parent')
+
+    def get_issue_body(self, repo_owner: str, repo_name: str, issue_number: int) -> Dict[str, Any]:
+        """Fetch an issue's body with just the fields needed to describe it.
+
+        Used by lookups that only read the body (a section, todo or
+        condition), so comments, sub-issues and the parent aren't requested.
+
+        Args:
+            repo_owner: Repository owner (user or organization)
+            repo_name: Repository name
+            issue_number: Issue number
+
+        Returns:
+            Issue node with number, title, state, url, body, issueType and
+            label names
+
+        Raises:
+            GraphQLError: If the query fails or the issue doesn't exist
+        """
+        query = """
+        query GetIssueBody($owner: String!, $repo: String!, $number: Int!) {
+            repository(owner: $owner, name: $repo) {
+                issue(number: $number) {
+                    number
+                    title
+                    state
+                    url
+                    body
+                    issueType {
+                        name
+                    }
+                    labels(first: 100) {
+                        nodes {
+                            name
+                        }
+                    }
+                }
+            }
+        }
+        """
+
+        variables = {
+            'owner': repo_owner,
+            'repo': repo_name,
+            'number': issue_number
+        }
+
+        result = self._execute(query, variables)
+
+        issue = (result.get('repository') or {}).get('issue')
+        if not issue:
+            raise GraphQLError(f"Issue #{issue_number} not found in {repo_owner}/{repo_name}")
+
+        return issue
+
+    def get_node_id(self, repo_owner: str, repo_name: str, issue_number: int) -> str:
+        """Convert an issue number to its GraphQL node ID.
+        
+        Args:
+            repo_owner: Repository owner (user or organization)
+            repo_name: Repository name
+            issue_number: Issue number
+            
+        Returns:
+            GraphQL node ID for the issue
             
         Raises:
             GraphQLError: If the query fails or issue doesn't exist
@@ -496,6 +1231,83 @@ class GraphQLClient:
         
         raise GraphQLError(f"Issue #{issue_number} not found in {repo_owner}/{repo_name}")
     
+    # Issues resolved per aliased batch query; keeps each document well under
+    # GitHub's node and query cost limits even when nested connections are selected
+    BATCH_SIZE = 50
+
+    def get_issues_batch(self, repo_owner: str, repo_name: str, numbers: Iterable[int],
+                         fields: str = "id number title state") -> Dict[int, Optional[Dict[str, Any]]]:
+        """Resolve many issues of one repository with aliased queries.
+
+        Each issue becomes an aliased `issue(number: N)` selection; issues are
+        grouped into documents of BATCH_SIZE, so N issues cost ceil(N / 50)
+        requests instead of N.
+
+        Args:
+            repo_owner: Repository owner (user or organization)
+            repo_name: Repository name
+            numbers: Issue numbers to resolve (duplicates are resolved once)
+            fields: GraphQL selection for each issue
+
+        Returns:
+            Dictionary mapping each issue number to its issue node, or to None
+            if the issue doesn't exist
+
+        Raises:
+            GraphQLError: If a query fails for a reason other than a missing issue
+        """
+        unique_numbers = list(dict.fromkeys(int(number) for number in numbers))
+        issues: Dict[int, Optional[Dict[str, Any]]] = {}
+
+        for start in range(0, len(unique_numbers), self.BATCH_SIZE):
+            chunk = unique_numbers[start:start + self.BATCH_SIZE]
+            selections = "\n".join(
+                f"issue{number}: issue(number: {number}) {{ {fields} }}" for number in chunk
+            )
+            query = f"""
+            query GetIssuesBatch($owner: String!, $repo: String!) {{
+                repository(owner: $owner, name: $repo) {{
+                    {selections}
+                }}
+            }}
+            """
+
+            data, errors = self._execute_partial(query, {'owner': repo_owner, 'repo': repo_name})
+
+            # Missing issues only null their own alias; anything else fails the batch
+            unexpected = [error for error in errors if error.get('type') != 'NOT_FOUND'
+                          or len(error.get('path') or []) < 2]
+            if unexpected:
+                parsed_errors = self._parse_graphql_errors(unexpected)
+                raise GraphQLError(f"GraphQL query failed: {'; '.join(parsed_errors)}")
+
+            repository = data.get('repository')
+            if repository is None:
+                raise GraphQLError(f"Repository {repo_owner}/{repo_name} not found")
+
+            for number in chunk:
+                issues[number] = repository.get(f"issue{number}")
+
+        return issues
+
+    def get_node_ids(self, repo_owner: str, repo_name: str, numbers: Iterable[int]) -> Dict[int, Optional[str]]:
+        """Convert many issue numbers to GraphQL node IDs in batched requests.
+
+        Args:
+            repo_owner: Repository owner (user or organization)
+            repo_name: Repository name
+            numbers: Issue numbers
+
+        Returns:
+            Dictionary mapping each issue number to its node ID, or None if the
+            issue doesn't exist
+
+        Raises:
+            GraphQLError: If a query fails
+        """
+        issues = self.get_issues_batch(repo_owner, repo_name, numbers, fields="id")
+        return {number: issue['id'] if issue else None for number, issue in issues.items()}
+
     def parse_node_id(self, node_id: str) -> Dict[str, Any]:
         """Extract information from a GraphQL node ID.
         
@@ -659,33 +1471,111 @@ class GraphQLClient:
         result = self._execute(query, variables)
         
         if result and 'node' in result and result['node']:
-            project = result['node']
-            fields = project['fields']['nodes']
-            
-            # Organize fields by name for easier lookup
-            fields_by_name = {}
-            for field in fields:
-                field_data = {
-                    'id': field['id'],
-                    'name': field['name'],
-                    'dataType': field['dataType']
-                }
-                
-                # Add options for single-select fields
-                if 'options' in field:
-                    field_data['options'] = {
-                        opt['name']: opt['id'] for opt in field['options']
-                    }
-                
-                fields_by_name[field['name']] = field_data
+            return self._project_schema(result['node'])
+        
+        raise GraphQLError(f"Project with ID {project_id} not found")
+    
+    def get_project_schema(self, owner_type: str, owner: str, project_number: int) -> Dict[str, Any]:
+        """Get the ID and fields of a GitHub Project V2 from its URL parts.
+        
+        Args:
+            owner_type: 'orgs' or 'users', as in the project URL
+            owner: Organization or user login
+            project_number: Project number
             
-            return {
-                'project_id': project['id'],
-                'project_title': project['title'],
-                'fields': fields_by_name
+        Returns:
+            Dictionary in the format returned by get_project_fields()
+            
+        Raises:
+            GraphQLError: If the query fails or the project doesn't exist
+        """
+        container = "organization" if owner_type == "orgs" else "user"
+        query = f"""
+        query GetProjectSchema($owner: String!, $number: Int!) {{
+            {container}(login: $owner) {{
+                projectV2(number: $number) {{
+                    id
+                    title
+                    fields(first: 50) {{
+                        nodes {{
+                            ... on ProjectV2FieldCommon {{
+                                id
+                                name
+                                dataType
+                            }}
+                            ... on ProjectV2SingleSelectField {{
+                                options {{
+                                    id
+                                    name
+                                }}
+                            }}
+                        }}
+                    }}
+                }}
+            }}
+        }}
+        """
+        result = self._execute(query, {'owner': owner, 'number': project_number})
+        project = (result.get(container) or {}).get('projectV2')
+        if not project:
+            raise GraphQLError(f"Project {project_number} not found for {container} '{owner}'")
+        return self._project_schema(project)
+    
+    def _project_schema(self, project: Dict[str, Any]) -> Dict[str, Any]:
+        """Organize the fields of a project node by name for easier lookup."""
+        fields_by_name = {}
+        for field in project['fields']['nodes']:
+            if not field:
+                continue
+            field_data = {
+                'id': field['id'],
+                'name': field['name'],
+                'dataType': field['dataType']
             }
+            
+            # Add options for single-select fields
+            if 'options' in field:
+                field_data['options'] = {
+                    opt['name']: opt['id'] for opt in field['options']
+                }
+            
+            fields_by_name[field['name']] = field_data
         
-        raise GraphQLError(f"Project with ID {project_id} not found")
+        return {
+            'project_id': project['id'],
+            'project_title': project['title'],
+            'fields': fields_by_name
+        }
+    
+    def get_project_item_ids(self, repo_owner: str, repo_name: str, project_id: str,
+                             numbers: Iterable[int]) -> Dict[int, Optional[str]]:
+        """Resolve the items of many issues in one project with batched queries.
+        
+        Args:
+            repo_owner: Repository owner (user or organization)
+            repo_name: Repository name
+            project_id: GraphQL node ID of the project
+            numbers: Issue numbers
+            
+        Returns:
+            Dictionary mapping each issue number to its item ID in the
+            project, or to None if the issue isn't in the project or doesn't exist
+            
+        Raises:
+            GraphQLError: If a query fails
+        """
+        issues = self.get_issues_batch(
+            repo_owner, repo_name, numbers,
+            fields="projectItems(first: 50) { nodes { id project { id } } }"
+        )
+        item_ids: Dict[int, Optional[str]] = {}
+        for number, issue in issues.items():
+            items = ((issue or {}).get('projectItems') or {}).get('nodes') or []
+            item_ids[number] = next(
+                (item['id'] for item in items if item and (item.get('project') or {}).get('id') == project_id),
+                None
+            )
+        return item_ids
     
     def check_sub_issues_available(self, repo_owner: str, repo_name: str) -> bool:
         """Check if the sub-issues feature is available for a repository.
@@ -1138,6 +2028,14 @@ class GitHubClient:
     - Direct GraphQL calls for advanced features (sub-issues, issue types)
     """
     
+    # Log entries kept in the body when it would exceed GitHub's size limit
+    # and no log_keep_entries is configured
+    DEFAULT_LOG_KEEP_ENTRIES = 20
+    
+    # Whether bodies this client writes get a ghoo:index line even if they
+    # don't have one yet; set per client from the body_index config option
+    body_index = False
+    
     def __init__(self, token: Optional[str] = None, use_testing_token: bool = False, config: Optional['Config'] = None, config_dir: Optional[Path] = None):
         """Initialize GitHub client with authentication token.
         
@@ -1164,17 +2062,46 @@ class GitHubClient:
             if not self.token:
                 raise MissingTokenError(is_testing=False)
         
-        # Create authenticated GitHub client
+        # Directory for persisted caches and indexes of this project
+        self.cache_dir = get_cache_dir(config_dir)
+        # Token state is shared by the projects a token works on
+        shared_cache_dir = get_cache_dir() if cache_enabled() else None
+        
+        # Budget shared by REST and GraphQL requests (and other ghoo processes)
+        self.rate_limiter = RateLimitScheduler.for_token(self.token, shared_cache_dir)
+        
+        # Login of the token's user, shared with other ghoo processes
+        self.identity = IdentityCache.for_token(self.token, shared_cache_dir)
+        
+        # Label node IDs for GraphQL label mutations, shared with other ghoo processes
+        self.labels = LabelCache.for_cache_dir(self.cache_dir if cache_enabled() else None)
+        
+        # Projects V2 fields, options and item IDs, shared with other ghoo processes
+        self.projects = ProjectCache.for_cache_dir(self.cache_dir if cache_enabled() else None)
+        
+        # Persist parsed issue bodies next to the other caches
+        if cache_enabled():
+            IssueParser.parse_cache.directory = self.cache_dir / "parse"
+        
+        # Add the ghoo:index line to the bodies this client writes
+        self.body_index = isinstance(config, Config) and config.body_index
+        
+        # Create authenticated GitHub client. The token is not validated up
+        # front; the first request rejected with 401 raises InvalidTokenError.
         try:
             auth = Token(self.token)
             self.github = Github(auth=auth)
-            # Validate token by making a simple API call
-            self._validate_token()
+            # Revalidate repeated REST GETs with ETags and pace them by the rate limit
+            http_cache = HTTPCache(self.cache_dir / "http") if cache_enabled() else None
+            install_http_adapter(self.github, http_cache, self.rate_limiter,
+                                 on_unauthorized=self._on_unauthorized)
+            # Share repositories and issues between everything this invocation does
+            self.session = install_session(self.github)
         except GithubException as e:
             raise InvalidTokenError(str(e))
         
         # Initialize GraphQL client for advanced features
-        self.graphql = GraphQLClient(self.token)
+        self.graphql = GraphQLClient(self.token, scheduler=self.rate_limiter)
         
         # Store configuration for issue type method
         self.config = config
@@ -1244,13 +2171,16 @@ class GitHubClient:
     def _validate_token(self):
         """Validate that the token works by making a simple API call.
         
+        Not called during initialization; use it where a command must fail
+        early rather than on its first API request.
+        
         Raises:
             InvalidTokenError: If the token is invalid or expired
         """
         try:
             # Try to get the authenticated user - this will fail if token is invalid
             user = self.github.get_user()
-            _ = user.login  # Force the API call
+            self.identity.put(user.login)  # Force the API call
         except GithubException as e:
             if e.status == 401:
                 raise InvalidTokenError("Invalid or expired token")
@@ -1259,6 +2189,30 @@ class GitHubClient:
             else:
                 raise InvalidTokenError(str(e))
     
+    def _on_unauthorized(self, response) -> None:
+        """Turn a REST response rejected with 401 into InvalidTokenError."""
+        self.identity.clear()
+        raise InvalidTokenError("Invalid or expired token")
+    
+    def get_authenticated_login(self) -> str:
+        """Get the login of the user the token authenticates as.
+        
+        The login is cached on disk per token (see IdentityCache), so only
+        the first call within the cache TTL costs a 'GET /user' request.
+        
+        Returns:
+            GitHub user login
+            
+        Raises:
+            InvalidTokenError: If the token is invalid or expired
+            GithubException: If the user cannot be fetched
+        """
+        login = self.identity.get()
+        if login is None:
+            login = self.github.get_user().login
+            self.identity.put(login)
+        return login
+    
     def init_repository(self, repo_url: str) -> Dict[str, Any]:
         """Initialize a repository with required issue types and labels.
         
@@ -1271,6 +2225,113 @@ class GitHubClient:
         # Placeholder implementation
         raise NotImplementedError("Repository initialization not yet implemented")
     
+    def invalidate_issue(self, repo: str, issue_number: Optional[int] = None) -> None:
+        """Drop an issue from this invocation's session after writing it.
+        
+        Only needed after writes that don't go through the issue's own
+        edit() method, such as GraphQL mutations.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            issue_number: Issue number, or None for every issue of the repository
+        """
+        session = getattr(self, 'session', None)
+        if session is not None:
+            session.invalidate(repo, issue_number)
+
+    def get_label_ids(self, repo: str, names: List[str]) -> Dict[str, str]:
+        """Resolve label names to GraphQL node IDs.
+
+        The label map of the repository is cached on disk (see LabelCache);
+        it is fetched again when it has expired or lacks one of the names.
+
+        Args:
+            repo: Repository in format 'owner/repo'
+            names: Label names to resolve
+
+        Returns:
+            Node IDs keyed by name; names of labels that don't exist are missing
+
+        Raises:
+            GraphQLError: If the labels cannot be fetched
+        """
+        labels = self.labels.get(repo)
+        if labels is None or any(name not in labels for name in names):
+            owner, name = repo.split('/')
+            labels = self.graphql.get_repository_labels(owner, name)
+            self.labels.put(repo, labels)
+        return {name: labels[name] for name in names if name in labels}
+
+    def apply_issue_mutations(
+        self,
+        repo: str,
+        issue,
+        remove_label_ids: Optional[List[str]] = None,
+        add_label_ids: Optional[List[str]] = None,
+        body: Optional[str] = None,
+        comment: Optional[str] = None,
+        close: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """Apply several changes to one issue with a single GraphQL document.
+
+        The changes are aliased mutations of one request, executed in the
+        order removeLabelsFromLabelable, addLabelsToLabelable, updateIssue,
+        addComment and closeIssue. A failing change doesn't prevent the
+        others from being applied.
+
+        Args:
+            repo: Repository in format 'owner/repo'
+            issue: PyGithub Issue to change
+            remove_label_ids: Node IDs of labels to remove
+            add_label_ids: Node IDs of labels to add
+            body: New issue body
+            comment: Body of a comment to add
+            close: Whether to close the issue
+
+        Returns:
+            Result of every requested change as returned by execute_mutations(),
+            keyed by 'remove_labels', 'add_labels', 'body', 'comment' and 'close'
+
+        Raises:
+            GraphQLError: If the request fails as a whole
+        """
+        node_id = issue.node_id
+        operations = []
+        if remove_label_ids:
+            operations.append(('remove_labels', {
+                'mutation': 'removeLabelsFromLabelable',
+                'input': {'labelableId': node_id, 'labelIds': remove_label_ids},
+            }))
+        if add_label_ids:
+            operations.append(('add_labels', {
+                'mutation': 'addLabelsToLabelable',
+                'input': {'labelableId': node_id, 'labelIds': add_label_ids},
+            }))
+        if body is not None:
+            operations.append(('body', {
+                'mutation': 'updateIssue',
+                'input': {'id': node_id, 'body': body},
+            }))
+        if comment is not None:
+            operations.append(('comment', {
+                'mutation': 'addComment',
+                'input': {'subjectId': node_id, 'body': comment},
+            }))
+        if close:
+            operations.append(('close', {
+                'mutation': 'closeIssue',
+                'input': {'issueId': node_id},
+            }))
+        if not operations:
+            return {}
+
+        try:
+            results = self.graphql.execute_mutations([operation for _, operation in operations])
+        finally:
+            # The session's copy of the issue no longer matches GitHub
+            self.invalidate_issue(repo, issue.number)
+        return {key: result for (key, _), result in zip(operations, results)}
+
     def get_issue(self, repo: str, issue_id: int):
         """Get details for a specific issue.
         
@@ -1325,7 +2386,6 @@ class GitHubClient:
             ```
         """
         parent_owner, parent_name = parent_repo.split('/')
-        child_owner, child_name = child_repo.split('/')
         
         # Check if sub-issues are available first
         if not self.graphql.check_sub_issues_available(parent_owner, parent_name):
@@ -1335,8 +2395,9 @@ class GitHubClient:
             )
         
         # Convert issue numbers to node IDs
-        parent_node_id = self.graphql.get_node_id(parent_owner, parent_name, parent_issue_number)
-        child_node_id = self.graphql.get_node_id(child_owner, child_name, child_issue_number)
+        parent_node_id, child_node_id = self._resolve_node_id_pair(
+            parent_repo, parent_issue_number, child_repo, child_issue_number
+        )
         
         return self.graphql.add_sub_issue(parent_node_id, child_node_id)
     
@@ -1373,15 +2434,116 @@ class GitHubClient:
                 parent_issue.edit(body='\\n'.join(filtered_lines))
             ```
         """
-        parent_owner, parent_name = parent_repo.split('/')
-        child_owner, child_name = child_repo.split('/')
-        
         # Convert issue numbers to node IDs
-        parent_node_id = self.graphql.get_node_id(parent_owner, parent_name, parent_issue_number)
-        child_node_id = self.graphql.get_node_id(child_owner, child_name, child_issue_number)
+        parent_node_id, child_node_id = self._resolve_node_id_pair(
+            parent_repo, parent_issue_number, child_repo, child_issue_number
+        )
         
         return self.graphql.remove_sub_issue(parent_node_id, child_node_id)
     
+    def add_sub_issues(self, parent_repo: str, parent_issue_number: int,
+                       child_repo: str, child_issue_numbers: List[int]) -> List[Dict[str, Any]]:
+        """Link many sub-issues to one parent using batched GraphQL requests.
+        
+        Node IDs are resolved with aliased queries and the links are created
+        with aliased mutations, so linking N issues takes a handful of
+        requests instead of 2N. Each child succeeds or fails on its own.
+        
+        Args:
+            parent_repo: Repository of parent issue in format 'owner/repo'
+            parent_issue_number: Parent issue number
+            child_repo: Repository of the child issues in format 'owner/repo'
+            child_issue_numbers: Child issue numbers, in the order to add them
+            
+        Returns:
+            One result per child with 'number', 'success' and 'error'
+            
+        Raises:
+            GraphQLError: If the parent can't be resolved or a request fails as a whole
+            FeatureUnavailableError: If sub-issues are not available
+        """
+        parent_owner, parent_name = parent_repo.split('/')
+        
+        if not self.graphql.check_sub_issues_available(parent_owner, parent_name):
+            raise FeatureUnavailableError(
+                "sub_issues",
+                "Use issue body references as a fallback."
+            )
+        
+        return self._link_sub_issues(
+            self.graphql.add_sub_issues, parent_repo, parent_issue_number, child_repo, child_issue_numbers
+        )
+    
+    def remove_sub_issues(self, parent_repo: str, parent_issue_number: int,
+                          child_repo: str, child_issue_numbers: List[int]) -> List[Dict[str, Any]]:
+        """Unlink many sub-issues from one parent using batched GraphQL requests.
+        
+        Args:
+            parent_repo: Repository of parent issue in format 'owner/repo'
+            parent_issue_number: Parent issue number
+            child_repo: Repository of the child issues in format 'owner/repo'
+            child_issue_numbers: Child issue numbers
+            
+        Returns:
+            One result per child with 'number', 'success' and 'error'
+            
+        Raises:
+            GraphQLError: If the parent can't be resolved or a request fails as a whole
+        """
+        return self._link_sub_issues(
+            self.graphql.remove_sub_issues, parent_repo, parent_issue_number, child_repo, child_issue_numbers
+        )
+    
+    def _link_sub_issues(self, mutate, parent_repo: str, parent_issue_number: int,
+                         child_repo: str, child_issue_numbers: List[int]) -> List[Dict[str, Any]]:
+        """Resolve node IDs in batches and apply a bulk sub-issue mutation."""
+        parent_owner, parent_name = parent_repo.split('/')
+        child_owner, child_name = child_repo.split('/')
+        
+        if parent_repo == child_repo:
+            node_ids = self.graphql.get_node_ids(parent_owner, parent_name,
+                                                 [parent_issue_number, *child_issue_numbers])
+            parent_node_id = node_ids.get(parent_issue_number)
+        else:
+            parent_node_id = self.graphql.get_node_id(parent_owner, parent_name, parent_issue_number)
+            node_ids = self.graphql.get_node_ids(child_owner, child_name, child_issue_numbers)
+        
+        if not parent_node_id:
+            raise GraphQLError(f"Issue #{parent_issue_number} not found in {parent_repo}")
+        
+        results = [{'number': number, 'success': False, 'error': f"Issue #{number} not found in {child_repo}"}
+                   for number in child_issue_numbers]
+        resolved = [(result, node_ids[result['number']]) for result in results if node_ids.get(result['number'])]
+        
+        outcomes = mutate(parent_node_id, [node_id for _, node_id in resolved])
+        for (result, _), outcome in zip(resolved, outcomes):
+            result['success'] = outcome['success']
+            result['error'] = outcome['error']
+        
+        return results
+    
+    def _resolve_node_id_pair(self, parent_repo: str, parent_issue_number: int,
+                              child_repo: str, child_issue_number: int) -> Tuple[str, str]:
+        """Resolve the node IDs of a parent and a child issue.
+        
+        Issues in the same repository are resolved with a single batched query.
+        
+        Raises:
+            GraphQLError: If either issue doesn't exist or the query fails
+        """
+        parent_owner, parent_name = parent_repo.split('/')
+        child_owner, child_name = child_repo.split('/')
+        
+        if (parent_owner, parent_name) != (child_owner, child_name):
+            return (self.graphql.get_node_id(parent_owner, parent_name, parent_issue_number),
+                    self.graphql.get_node_id(child_owner, child_name, child_issue_number))
+        
+        node_ids = self.graphql.get_node_ids(parent_owner, parent_name, [parent_issue_number, child_issue_number])
+        for number in (parent_issue_number, child_issue_number):
+            if not node_ids.get(number):
+                raise GraphQLError(f"Issue #{number} not found in {parent_repo}")
+        return node_ids[parent_issue_number], node_ids[child_issue_number]
+    
     def get_issue_with_sub_issues(self, repo: str, issue_number: int) -> Dict[str, Any]:
         r"""Get an issue with all its sub-issues using GraphQL.
         
@@ -1420,6 +2582,78 @@ class GitHubClient:
         node_id = self.graphql.get_node_id(repo_owner, repo_name, issue_number)
         return self.graphql.get_issue_with_sub_issues(node_id)
     
+    def iter_sub_issues(self, repo: str, issue_number: int) -> Iterator[Dict[str, Any]]:
+        """Stream all sub-issues of an issue using GraphQL.
+        
+        The issue's node ID is resolved immediately; sub-issue pages are then
+        fetched lazily as the returned iterator is consumed.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            issue_number: Issue number
+            
+        Returns:
+            Iterator over sub-issue nodes in priority order
+            
+        Raises:
+            GraphQLError: If the query fails
+        """
+        repo_owner, repo_name = repo.split('/')
+        node_id = self.graphql.get_node_id(repo_owner, repo_name, issue_number)
+        return self.graphql.iter_sub_issues(node_id)
+    
+    # Selection for the nodes yielded by iter_sub_issue_tree()
+    _TREE_FIELDS = """
+        id
+        number
+        title
+        state
+        repository { nameWithOwner }
+        labels(first: 100) {
+            nodes { name }
+            pageInfo { hasNextPage endCursor }
+        }
+    """
+
+    def iter_sub_issue_tree(self, repo: str, issue_number: int,
+                            fields: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Stream the sub-issues of an issue at any depth, level by level.
+
+        Every node is annotated with 'parent' (the node ID of the issue it is
+        a sub-issue of) and 'depth' (1 for direct sub-issues). Issues reachable
+        along several paths are yielded once.
+
+        Args:
+            repo: Repository in format 'owner/repo'
+            issue_number: Number of the root issue
+            fields: GraphQL selection for each sub-issue; must include `id`
+                    (defaults to id, number, title, state, repository and labels)
+
+        Yields:
+            Sub-issue nodes, all of one depth before any of the next
+
+        Raises:
+            GraphQLError: If a query fails
+        """
+        repo_owner, repo_name = repo.split('/')
+        root_id = self.graphql.get_node_id(repo_owner, repo_name, issue_number)
+        seen = {root_id}
+        level = [root_id]
+        depth = 0
+        while level:
+            depth += 1
+            next_level = []
+            for parent_id in level:
+                for node in self.graphql.iter_sub_issues(parent_id, fields or self._TREE_FIELDS):
+                    if node['id'] in seen:
+                        continue
+                    seen.add(node['id'])
+                    node['parent'] = parent_id
+                    node['depth'] = depth
+                    next_level.append(node['id'])
+                    yield node
+            level = next_level
+    
     def get_sub_issues_summary(self, repo: str, issue_number: int) -> Dict[str, Any]:
         """Get summary statistics for sub-issues using GraphQL.
         
@@ -1453,6 +2687,12 @@ class GitHubClient:
                            field_name: str, field_value: str) -> Dict[str, Any]:
         """Update a project field for an issue using GraphQL.
         
+        The project's fields and options and the issue's item ID come from
+        the project cache (see ProjectCache), so once they are cached the
+        update is a single mutation. The schema is fetched again when the
+        field or option is missing from it, but only once per missing value
+        until the cached schema expires.
+        
         **Fallback Strategy**: If Projects V2 GraphQL operations are not available,
         applications should fall back to using labels for status tracking:
         
@@ -1461,17 +2701,18 @@ class GitHubClient:
         3. Document the mapping in your configuration
         
         Args:
-            project_id: GraphQL node ID of the project
+            project_id: GraphQL node ID of the project, or its URL
             repo: Repository in format 'owner/repo'
             issue_number: Issue number
             field_name: Name of the field to update
-            field_value: New value for the field
+            field_value: New value for the field (option name for single-select fields)
             
         Returns:
             Dictionary containing the mutation result
             
         Raises:
-            GraphQLError: If the mutation fails
+            GraphQLError: If the field or option doesn't exist, the issue is not
+                          in the project, or the mutation fails
             
         Example:
             ```python
@@ -1488,26 +2729,140 @@ class GitHubClient:
                 issue.add_to_labels('status:done')
             ```
         """
-        repo_owner, repo_name = repo.split('/')
+        key = self._project_key(project_id)[0]
+        missing = f"{field_name}={field_value}"
+        fresh = self.projects.get(key) is None
+        project = self.get_project(project_id)
+        try:
+            field_id, value = self._project_field_value(project, field_name, field_value)
+        except GraphQLError:
+            # The field or option may have been added since the schema was
+            # cached, unless it was just fetched or already found missing
+            if fresh or self.projects.is_missing(key, missing):
+                self.projects.put_missing(key, missing)
+                raise
+            project = self.get_project(project_id, refresh=True)
+            try:
+                field_id, value = self._project_field_value(project, field_name, field_value)
+            except GraphQLError:
+                self.projects.put_missing(key, missing)
+                raise
+        
+        item_id = self.get_project_item_ids(project_id, repo, [issue_number]).get(issue_number)
+        if not item_id:
+            raise GraphQLError(
+                f"Issue #{issue_number} is not in project '{project['project_title']}'. Add it to the project board first."
+            )
         
-        # Get project fields to find field ID and value ID
-        project_info = self.graphql.get_project_fields(project_id)
-        if field_name not in project_info['fields']:
-            raise GraphQLError(f"Field '{field_name}' not found in project")
+        try:
+            return self.graphql.update_project_field(project['project_id'], item_id, field_id, value)
+        except GraphQLError:
+            # The item may have been removed from the board since it was cached
+            self.projects.forget_item(key, f"{repo}#{issue_number}")
+            raise
+    
+    def get_project(self, project: str, refresh: bool = False) -> Dict[str, Any]:
+        """Get the ID and fields of a Projects V2 project.
         
-        field_info = project_info['fields'][field_name]
-        field_id = field_info['id']
+        The schema is cached on disk (see ProjectCache) and fetched again
+        after a day or when refresh is set.
         
-        # For single-select fields, convert value name to option ID
-        if 'options' in field_info and field_value in field_info['options']:
-            value_to_use = field_info['options'][field_value]
-        else:
-            value_to_use = field_value
+        Args:
+            project: Project URL (https://github.com/orgs/<owner>/projects/<n>)
+                     or GraphQL node ID
+            refresh: Fetch the schema even if it is cached
+            
+        Returns:
+            Dictionary with 'project_id', 'project_title' and 'fields'
+            (see GraphQLClient.get_project_fields())
+            
+        Raises:
+            GraphQLError: If the project cannot be fetched
+        """
+        key, url_parts = self._project_key(project)
+        schema = None if refresh else self.projects.get(key)
+        if schema is None:
+            if url_parts:
+                schema = self.graphql.get_project_schema(*url_parts)
+            else:
+                schema = self.graphql.get_project_fields(project)
+            self.projects.put(key, schema)
+        return schema
+    
+    def get_project_item_ids(self, project: str, repo: str, issue_numbers: Iterable[int]) -> Dict[int, Optional[str]]:
+        """Resolve the project items of many issues, memoized in the project cache.
+        
+        Issues whose item ID isn't cached are resolved together with batched
+        projectItems queries.
+        
+        Args:
+            project: Project URL or GraphQL node ID
+            repo: Repository in format 'owner/repo'
+            issue_numbers: Issue numbers
+            
+        Returns:
+            Dictionary mapping each issue number to its item ID, or to None
+            if the issue isn't in the project
+            
+        Raises:
+            GraphQLError: If the project or the items cannot be fetched
+        """
+        key = self._project_key(project)[0]
+        project_id = self.get_project(project)['project_id']
+        
+        item_ids: Dict[int, Optional[str]] = {}
+        missing = []
+        for number in dict.fromkeys(int(number) for number in issue_numbers):
+            item_ids[number] = self.projects.get_item(key, f"{repo}#{number}")
+            if item_ids[number] is None:
+                missing.append(number)
+        
+        if missing:
+            repo_owner, repo_name = repo.split('/')
+            resolved = self.graphql.get_project_item_ids(repo_owner, repo_name, project_id, missing)
+            self.projects.put_items(key, {
+                f"{repo}#{number}": item_id for number, item_id in resolved.items() if item_id
+            })
+            item_ids.update(resolved)
+        return item_ids
+    
+    def _project_key(self, project: str) -> Tuple[str, Optional[Tuple[str, str, int]]]:
+        """Return the cache key of a project and, for URLs, its owner type, owner and number."""
+        match = ConfigLoader.PROJECT_URL_PATTERN.match(project)
+        if match:
+            owner_type, owner, number = match.group(1), match.group(2), int(match.group(3))
+            return f"{owner_type}/{owner}/{number}", (owner_type, owner, number)
+        return project, None
+    
+    def _project_field_value(self, project: Dict[str, Any], field_name: str, field_value: Any) -> Tuple[str, Any]:
+        """Return the field ID and the mutation value that sets a field to a value.
         
-        # We need to get the project item ID for this issue
-        # This is a complex operation that would typically require additional queries
-        # For now, we'll assume the caller provides the item_id directly
-        raise NotImplementedError("Project item ID resolution not yet implemented")
+        Raises:
+            GraphQLError: If the field, or the option of a single-select field, doesn't exist
+        """
+        field = next(
+            (field for name, field in project['fields'].items() if name.lower() == field_name.lower()),
+            None
+        )
+        if field is None:
+            raise GraphQLError(f"Field '{field_name}' not found in project '{project['project_title']}'")
+        
+        if 'options' in field:
+            option_id = next(
+                (option_id for name, option_id in field['options'].items()
+                 if name.lower() == str(field_value).lower()),
+                None
+            )
+            if option_id is None:
+                raise GraphQLError(
+                    f"Option '{field_value}' not found in field '{field['name']}' of project '{project['project_title']}'"
+                )
+            return field['id'], option_id
+        if field['dataType'] == 'NUMBER':
+            return field['id'], {'number': float(field_value)}
+        if field['dataType'] == 'DATE':
+            return field['id'], {'date': str(field_value)}
+        return field['id'], {'text': str(field_value)}
     
     def supports_custom_issue_types(self, repo: str) -> bool:
         """Check if custom issue types are supported for a repository.
@@ -1588,6 +2943,7 @@ class GitHubClient:
             FeatureUnavailableError: If custom issue types are not available
         """
         owner, repo_name = repo.split('/')
+        body = BodyIndex.refresh(body, enabled=self.body_index)
         
         # Check configuration for issue type method
         if self.config and self.config.issue_type_method == "labels":
@@ -1676,6 +3032,7 @@ class GitHubClient:
             if labels or assignees or milestone:
                 self._post_process_created_issue(repo, issue_data['number'], labels, assignees, milestone)
                 # Re-fetch to get updated data
+                self.invalidate_issue(repo, issue_data['number'])
                 github_repo = self.github.get_repo(repo)
                 updated_issue = github_repo.get_issue(issue_data['number'])
                 
@@ -1858,12 +3215,46 @@ class GitHubClient:
             GithubException: If issue update fails
             ValueError: If the updated body would exceed GitHub's size limit
         """
-        from .models import LogEntry, LogSubEntry
-        from datetime import datetime, timezone
-        
         # Get the current issue
         github_repo = self.github.get_repo(repo)
         issue = github_repo.get_issue(issue_number)
+        
+        # Update the issue
+        issue.edit(body=self.build_log_entry_body(
+            issue, to_state, author, message, sub_entries, from_state
+        ))
+    
+    def build_log_entry_body(
+        self,
+        issue,
+        to_state: str,
+        author: str,
+        message: Optional[str] = None,
+        sub_entries: Optional[List] = None,
+        from_state: Optional[str] = None
+    ) -> str:
+        """Return an issue's body with a new log entry appended, without saving it.
+        
+        Entries rotated out of the body are archived to comments right away.
+        
+        Args:
+            issue: PyGithub Issue to append the log entry to
+            to_state: The workflow state being transitioned to
+            author: Username of the person who triggered the transition
+            message: Optional message describing the transition
+            sub_entries: Optional list of LogSubEntry objects
+            from_state: Optional workflow state being transitioned from
+            
+        Returns:
+            str: The updated body
+            
+        Raises:
+            GithubException: If archiving rotated entries fails
+            ValueError: If the updated body would exceed GitHub's size limit
+        """
+        from .models import LogEntry, LogSubEntry
+        from datetime import datetime, timezone
+        
         current_body = issue.body or ""
         
         # Create the new log entry
@@ -1876,15 +3267,87 @@ class GitHubClient:
             from_state=from_state
         )
         
+        # The entry always adds a blank line and its markdown, so whether the
+        # body would be too large is known before building it
+        log_markdown = log_entry.to_markdown()
+        if self._ends_with_log_entry(current_body):
+            appended_length = len(current_body) + 2 + len(log_markdown)
+        else:
+            appended_length = len(self._ensure_log_section(current_body)) + 2 + len(log_markdown)
+        
         # Append to the log section
-        updated_body = self._append_to_log_section(current_body, log_entry)
+        updated_body = self._append_to_log_section(current_body, log_entry, log_markdown)
+        
+        # Move the oldest entries to archive comments when the log is longer
+        # than configured, or when the body would otherwise be too large
+        keep_entries = self.config.log_keep_entries if self.config else None
+        if appended_length > GITHUB_BODY_LIMIT or (
+            keep_entries is not None and self._count_log_entries(updated_body) > keep_entries
+        ):
+            updated_body = self._rotate_log(
+                issue, updated_body, keep_entries or self.DEFAULT_LOG_KEEP_ENTRIES
+            )
+        
+        updated_body = BodyIndex.refresh(updated_body, current_body, self.body_index)
         
         # Check GitHub's body size limit (65536 characters)
-        if len(updated_body) > 65536:
+        if len(updated_body) > GITHUB_BODY_LIMIT:
             raise ValueError(f"Updated issue body would exceed GitHub's 65536 character limit (would be {len(updated_body)} characters)")
         
-        # Update the issue
-        issue.edit(body=updated_body)
+        return updated_body
+    
+    @staticmethod
+    def _count_log_entries(body: str) -> int:
+        """Count the log entry headers in a body without parsing it.
+        
+        Rotation parses the whole document, so appends only pay for it once
+        the log holds more entries than it keeps.
+        """
+        return body.count('\n---\n### → ') + body.count('\n---\r\n### → ')
+    
+    def _rotate_log(self, issue, body: str, keep_entries: int) -> str:
+        """Move all but the newest log entries of a body to archive comments.
+        
+        Entries are appended to the issue's latest archive comment while it
+        has room, otherwise new archive comments are created. The index line
+        below the ## Log header is updated to count and link them.
+        
+        Args:
+            issue: PyGithub Issue the body belongs to
+            body: Issue body with a ## Log section
+            keep_entries: Number of entries to keep in the body
+            
+        Returns:
+            str: Body without the archived entries (unchanged if there's
+            nothing to archive)
+            
+        Raises:
+            GithubException: If an archive comment can't be written
+        """
+        document = IssueParser.parse_document(body)
+        blocks = document.rotate_log(keep_entries)
+        if not blocks:
+            return body
+        
+        index = document.log_index() or LogArchiveIndex()
+        latest = None
+        if index.comment_ids:
+            try:
+                latest = issue.get_comment(index.comment_ids[-1])
+            except GithubException:
+                # Deleted or inaccessible; start a new archive comment
+                latest = None
+        
+        updated, created = pack_archive(blocks, latest.body if latest else None)
+        if updated is not None:
+            latest.edit(updated)
+        for comment_body in created:
+            comment = issue.create_comment(comment_body)
+            index.urls.append(comment.html_url)
+        
+        index.count += len(blocks)
+        document.set_log_index(index.render())
+        return document.text
     
     def _ensure_log_section(self, body: str) -> str:
         """Ensure the body has a Log section, adding one if needed.
@@ -1908,22 +3371,55 @@ class GitHubClient:
         else:
             return body + "\n\n## Log"
     
-    def _append_to_log_section(self, body: str, log_entry) -> str:
+    def _ends_with_log_entry(self, body: str) -> bool:
+        """Check whether a body ends with an entry of its Log section.
+        
+        Only the tail of the body is examined: the last '---' separator must
+        be followed by a log entry header and no further section.
+        
+        Args:
+            body: The current issue body
+            
+        Returns:
+            bool: True if a new entry can simply be appended to the body
+        """
+        separator = body.rfind('\n---\n')
+        if separator == -1:
+            return False
+        
+        tail = body[separator + 5:]
+        header_end = tail.find('\n')
+        header = tail if header_end == -1 else tail[:header_end]
+        if not IssueParser._LOG_HEADER_PATTERN.match(header):
+            return False
+        
+        # Sub-entries use '####', so a shallower header starts another section
+        return '\n## ' not in tail and '\n# ' not in tail
+    
+    def _append_to_log_section(self, body: str, log_entry, log_markdown: Optional[str] = None) -> str:
         """Append a log entry to the Log section of the body.
         
+        When the body already ends with a log entry, the new one is
+        concatenated to it without looking at the rest of the body.
+        
         Args:
             body: The current issue body
             log_entry: LogEntry object to append
+            log_markdown: log_entry.to_markdown(), if already generated
             
         Returns:
             str: Updated body with the new log entry appended
         """
+        # Generate the log entry markdown
+        if log_markdown is None:
+            log_markdown = log_entry.to_markdown()
+        
+        if self._ends_with_log_entry(body):
+            return body + "\n\n" + log_markdown
+        
         # Ensure Log section exists
         body_with_log = self._ensure_log_section(body)
         
-        # Generate the log entry markdown
-        log_markdown = log_entry.to_markdown()
-        
         # Find the Log section and append the entry
         lines = body_with_log.split('\n')
         log_section_index = -1
@@ -1945,6 +3441,9 @@ class GitHubClient:
         # Look for existing log entries (lines starting with ---)
         for i in range(log_content_start, len(lines)):
             line = lines[i].strip()
+            if LogArchiveIndex.parse(line):
+                # Entries follow the index of archived ones
+                continue
             if line and not line.startswith('#'):  # Found non-empty, non-header content
                 if line == '---':
                     has_existing_entries = True
@@ -2100,12 +3599,51 @@ class ConfigLoader:
                         ['list of string section names']
                     )
         
+        # Validate log_keep_entries if provided
+        log_keep_entries = data.get('log_keep_entries')
+        if log_keep_entries is not None and (
+            isinstance(log_keep_entries, bool)
+            or not isinstance(log_keep_entries, int)
+            or log_keep_entries < 1
+        ):
+            raise InvalidFieldValueError(
+                'log_keep_entries',
+                log_keep_entries,
+                ['positive integer']
+            )
+        
+        # Validate body_index if provided
+        body_index = data.get('body_index', False)
+        if not isinstance(body_index, bool):
+            raise InvalidFieldValueError('body_index', body_index, ['true', 'false'])
+        
+        # Validate status_field_options if provided
+        status_field_options = data.get('status_field_options') or {}
+        if not isinstance(status_field_options, dict):
+            raise InvalidFieldValueError(
+                'status_field_options',
+                type(status_field_options).__name__,
+                ['dictionary mapping workflow states to Status options']
+            )
+        for state, option in status_field_options.items():
+            if state not in DEFAULT_STATUS_FIELD_OPTIONS:
+                raise InvalidFieldValueError(
+                    'status_field_options', state, list(DEFAULT_STATUS_FIELD_OPTIONS)
+                )
+            if option is not None and not isinstance(option, str):
+                raise InvalidFieldValueError(
+                    f'status_field_options.{state}', option, ['Status option name', 'null']
+                )
+        
         # Create Config instance
         config = Config(
             project_url=project_url,
             status_method=status_method,
             issue_type_method=issue_type_method,
-            required_sections=required_sections if required_sections else {}
+            required_sections=required_sections if required_sections else {},
+            log_keep_entries=log_keep_entries,
+            body_index=body_index,
+            status_field_options=status_field_options
         )
         
         return config
@@ -2531,25 +4069,53 @@ class IssueParser:
     Limitations:
     - Complex nested structures may not be fully preserved
     - Unicode and special characters are supported but may affect parsing
-    - Performance is optimized for typical issue sizes (<50KB)
+    - Performance is optimized for typical issue sizes (<50KB); benchmarks/parser_suite.py
+      checks it against larger and pathological bodies
     """
     
+    # Patterns are compiled once; cheap prefix checks decide which of them a
+    # line needs to be matched against.
+    _SECTION_PATTERN = re.compile(r'^## (.+)$')
+    _CONDITION_PATTERN = re.compile(r'^### CONDITION: (.+)$', re.IGNORECASE)
+    _TODO_PATTERN = re.compile(r'^- \[([x\s])\] (.+)$', re.IGNORECASE)
+    _VERIFIED_PATTERN = re.compile(r'^- \[([x\s])\] VERIFIED$', re.IGNORECASE)
+    _SIGNED_OFF_PATTERN = re.compile(r'^- \*\*Signed-off by:\*\* (.+)$', re.IGNORECASE)
+    _REQUIREMENTS_PATTERN = re.compile(r'^- \*\*Requirements:\*\* (.+)$', re.IGNORECASE)
+    _EVIDENCE_PATTERN = re.compile(r'^- \*\*Evidence:\*\* (.+)$', re.IGNORECASE)
+    _LOG_HEADER_PATTERN = re.compile(r'^### → ([^\[]+) \[([^\]]+)\]$')
+    _LOG_AUTHOR_PATTERN = re.compile(r'^\*by @([^*]+)\*$')
+    _LOG_MESSAGE_PATTERN = re.compile(r'^\*\*Message\*\*: (.+)$')
+    _LOG_SUBENTRY_PATTERN = re.compile(r'^#### (.+)$')
+    _TIMESTAMP_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})(?: UTC)?$')
+
+    # Section kinds tracked by the tokenizer
+    _REGULAR, _CONDITION, _LOG = range(3)
+
+    # Results of parse_body_cached(); GitHubClient adds the on-disk layer
+    parse_cache = ParseCache()
+
+    # parse_many() parses smaller batches in the calling process, where
+    # starting a process pool would cost more than it saves
+    PARALLEL_THRESHOLD = 64
+
     @staticmethod
     def parse_body(body: str) -> Dict[str, Any]:
         """Parse an issue body to extract structured data.
-        
+
+        The body is tokenized in a single pass over its lines: section and
+        condition headers, todos, condition fields and log entries are all
+        recognised as the lines are traversed.
+
         Args:
             body: Raw markdown body of the issue
-            
+
         Returns:
             Dictionary with parsed sections and todos, including:
             - 'pre_section_description': Text before first section
             - 'sections': List of Section objects
             - 'log_entries': List of LogEntry objects from ## Log section
+            - 'conditions': List of Condition objects from ### CONDITION sections
         """
-        from .models import Section, Todo
-        import re
-        
         if not body or not body.strip():
             return {
                 'pre_section_description': '',
@@ -2557,514 +4123,1337 @@ class IssueParser:
                 'log_entries': [],
                 'conditions': []
             }
-        
-        lines = body.split('\n')
+
+        parser = IssueParser
+        section_match = parser._SECTION_PATTERN.match
+        condition_match = parser._CONDITION_PATTERN.match
+        todo_match = parser._TODO_PATTERN.match
+        regular, condition, log = parser._REGULAR, parser._CONDITION, parser._LOG
+
         sections = []
+        conditions = []
         log_entries = []
-        pre_section_description = ""
-        current_section = None
-        current_section_lines = []
         pre_section_lines = []
-        found_first_section = False
-        
-        # Regex patterns
-        section_pattern = re.compile(r'^## (.+)$')
-        condition_pattern = re.compile(r'^### CONDITION: (.+)$', re.IGNORECASE)
-        todo_pattern = re.compile(r'^- \[([x\s])\] (.+)$', re.IGNORECASE)
-        
-        for line_number, line in enumerate(lines, 1):
+
+        # State of the section currently being read (None before the first header)
+        kind = None
+        title = None
+        section_lines = pre_section_lines
+        todos = []
+        fields = None
+        log_entry = None
+
+        def finish_section():
+            nonlocal log_entry
+            if kind == log:
+                if log_entry is not None:
+                    parser._append_log_entry(log_entries, log_entry)
+                    log_entry = None
+                return
+
+            section_body = '\n'.join(section_lines).strip()
+            if kind == condition:
+                sections.append(Section(title=title, body=section_body, todos=[]))
+                if section_body:
+                    conditions.append(fields.build(title[11:]))  # Remove "CONDITION: " prefix
+            else:
+                sections.append(Section(title=title, body=section_body, todos=todos))
+                if title.startswith("CONDITION: "):
+                    # An H2 section titled like a condition is read as one too
+                    parsed = parser._parse_condition_from_section_body(title[11:], section_body)
+                    if parsed:
+                        conditions.append(parsed)
+
+        for line_number, line in enumerate(body.split('\n'), 1):
             line = line.rstrip()
-            
-            # Check if this is a section header (H2) or condition header (H3)
-            section_match = section_pattern.match(line)
-            condition_match = condition_pattern.match(line)
-            
-            if section_match or condition_match:
-                # Save previous section if it exists
-                if current_section is not None:
-                    current_section['body'] = '\n'.join(current_section_lines).strip()
-                    
-                    # Handle different section types
-                    if current_section['title'] == 'Log':
-                        log_entries = IssueParser._parse_log_section(current_section['body'])
-                    elif current_section.get('is_condition', False):
-                        # Condition section - store as-is, don't extract todos
-                        sections.append(Section(
-                            title=current_section['title'],
-                            body=current_section['body'],
-                            todos=[]  # Conditions don't have todos in the traditional sense
-                        ))
+
+            if line.startswith('##'):
+                header = section_match(line) or condition_match(line)
+                if header is not None:
+                    if kind is not None:
+                        finish_section()
+
+                    section_lines = []
+                    if header.re is parser._SECTION_PATTERN:
+                        title = header.group(1).strip()
+                        if title == 'Log':
+                            kind = log
+                            log_entries = []
+                            log_entry = _LogEntryBuilder()
+                        else:
+                            kind = regular
+                            todos = []
                     else:
-                        # Regular section
-                        current_section['todos'] = IssueParser._extract_todos_from_lines(
-                            current_section_lines, 
-                            line_number - len(current_section_lines)
-                        )
-                        sections.append(Section(
-                            title=current_section['title'],
-                            body=current_section['body'],
-                            todos=current_section['todos']
+                        title = f"CONDITION: {header.group(1).strip()}"
+                        kind = condition
+                        fields = _ConditionFields()
+                    continue
+
+            if kind == log:
+                stripped = line.lstrip()
+                if stripped == '---':
+                    parser._append_log_entry(log_entries, log_entry)
+                    log_entry = _LogEntryBuilder()
+                elif stripped:
+                    log_entry.feed(stripped)
+                continue
+
+            if kind is None and line.startswith(BodyIndex.PREFIX):
+                # Hidden ghoo:index line, not part of the description
+                continue
+
+            section_lines.append(line)
+
+            if kind == regular:
+                stripped = line.lstrip()
+                if stripped.startswith('- ['):
+                    match = todo_match(stripped)
+                    if match:
+                        todos.append(Todo(
+                            text=match.group(2).strip(),
+                            checked=match.group(1).lower() == 'x',
+                            line_number=line_number
                         ))
-                
-                # Handle pre-section description
-                if not found_first_section:
-                    pre_section_description = '\n'.join(pre_section_lines).strip()
-                    found_first_section = True
-                
-                # Start new section
-                if section_match:
-                    # Regular H2 section
-                    current_section = {
-                        'title': section_match.group(1).strip(),
-                        'body': '',
-                        'todos': [],
-                        'is_condition': False
-                    }
-                else:
-                    # H3 condition section
-                    current_section = {
-                        'title': f"CONDITION: {condition_match.group(1).strip()}",
-                        'body': '',
-                        'todos': [],
-                        'is_condition': True
-                    }
-                current_section_lines = []
-            else:
-                # Add line to appropriate container
-                if found_first_section:
-                    current_section_lines.append(line)
-                else:
-                    pre_section_lines.append(line)
-        
-        # Handle final section
-        if current_section is not None:
-            current_section['body'] = '\n'.join(current_section_lines).strip()
-            
-            # Handle different section types
-            if current_section['title'] == 'Log':
-                log_entries = IssueParser._parse_log_section(current_section['body'])
-            elif current_section.get('is_condition', False):
-                # Condition section - store as-is, don't extract todos
-                sections.append(Section(
-                    title=current_section['title'],
-                    body=current_section['body'],
-                    todos=[]  # Conditions don't have todos in the traditional sense
-                ))
-            else:
-                # Regular section
-                current_section['todos'] = IssueParser._extract_todos_from_lines(
-                    current_section_lines, 
-                    len(lines) - len(current_section_lines) + 1
-                )
-                sections.append(Section(
-                    title=current_section['title'],
-                    body=current_section['body'],
-                    todos=current_section['todos']
-                ))
-        elif not found_first_section:
-            # No sections found, everything is pre-section description
-            pre_section_description = '\n'.join(pre_section_lines).strip()
-        
-        # Extract conditions from condition sections
-        conditions = []
-        for section in sections:
-            if section.title.startswith("CONDITION: "):
-                # Parse condition from section body
-                condition = IssueParser._parse_condition_from_section_body(
-                    section.title[11:],  # Remove "CONDITION: " prefix
-                    section.body
-                )
-                if condition:
-                    conditions.append(condition)
-        
+            elif kind == condition:
+                fields.feed(line.lstrip())
+
+        if kind is not None:
+            finish_section()
+
         return {
-            'pre_section_description': pre_section_description,
+            'pre_section_description': '\n'.join(pre_section_lines).strip(),
             'sections': sections,
             'log_entries': log_entries,
             'conditions': conditions
         }
-    
+
     @staticmethod
-    def _parse_condition_from_section_body(condition_text: str, section_body: str) -> Optional['Condition']:
-        """Parse a condition from section body content.
-        
-        Args:
+    def parse_body_cached(body: str, cache: Optional[ParseCache] = None) -> Dict[str, Any]:
+        """Parse an issue body, reusing the result for a body seen before.
+
+        Results are keyed by the SHA-256 of the body, so an edited body is
+        always parsed afresh. The returned objects are never shared with the
+        cache or other callers and may be modified.
+
+        Args:
+            body: Raw markdown body of the issue
+            cache: Cache to use instead of IssueParser.parse_cache
+
+        Returns:
+            Same dictionary as parse_body()
+        """
+        if not body or not body.strip():
+            return IssueParser.parse_body(body)
+
+        cache = cache or IssueParser.parse_cache
+        parsed = cache.get(body)
+        if parsed is None:
+            parsed = IssueParser.parse_body(body)
+            cache.put(body, parsed)
+        return parsed
+
+    @staticmethod
+    def parse_many(bodies: Iterable[str], workers: Optional[int] = None,
+                   chunk_size: Optional[int] = None,
+                   transform: Optional[Callable[[Dict[str, Any]], Any]] = None) -> List[Any]:
+        """Parse many issue bodies across a process pool.
+
+        Args:
+            bodies: Raw markdown bodies
+            workers: Number of worker processes (default: one per CPU)
+            chunk_size: Bodies sent to a worker at a time (default: enough
+                for about four chunks per worker)
+            transform: Module-level function applied to each result in the
+                worker; see iter_parse_many()
+
+        Returns:
+            parse_body() results (or what transform returned for them), in
+            the order of the bodies
+        """
+        return [parsed for _, parsed in
+                IssueParser.iter_parse_many(bodies, workers, chunk_size, transform=transform)]
+
+    @staticmethod
+    def iter_parse_many(bodies: Iterable[str], workers: Optional[int] = None,
+                        chunk_size: Optional[int] = None,
+                        ordered: bool = True,
+                        transform: Optional[Callable[[Dict[str, Any]], Any]] = None
+                        ) -> Iterator[Tuple[int, Any]]:
+        """Parse many issue bodies across a process pool, yielding results.
+
+        Bodies are sent to the workers in chunks and come back in the compact
+        parse cache form, which is cheaper to transfer than model objects.
+        Batches smaller than PARALLEL_THRESHOLD, or a single worker, are
+        parsed in the calling process.
+
+        Rebuilding the model objects in the calling process costs about half
+        as much as parsing, which limits the speedup. Callers that only need
+        part of each result, e.g. BodyIndex.from_parsed, should pass it as
+        transform: it runs in the workers and only its (picklable) return
+        value is sent back.
+
+        Args:
+            bodies: Raw markdown bodies
+            workers: Number of worker processes (default: one per CPU)
+            chunk_size: Bodies sent to a worker at a time (default: enough
+                for about four chunks per worker)
+            ordered: Yield in the order of the bodies; if False, each chunk
+                is yielded as soon as it completes
+            transform: Module-level function applied to each parse_body()
+                result; its return value is yielded instead
+
+        Yields:
+            (index of the body, parse_body() or transform result) tuples
+        """
+        bodies = list(bodies)
+        if not workers:
+            # CPUs this process may run on, which can be fewer than the machine has
+            workers = (len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity')
+                       else os.cpu_count() or 1)
+        if workers == 1 or len(bodies) < IssueParser.PARALLEL_THRESHOLD:
+            for index, body in enumerate(bodies):
+                parsed = IssueParser.parse_body(body)
+                yield index, transform(parsed) if transform else parsed
+            return
+
+        chunk_size = chunk_size or -(-len(bodies) // (workers * 4))
+        starts = range(0, len(bodies), chunk_size)
+        pool = ProcessPoolExecutor(max_workers=min(workers, len(starts)))
+        try:
+            futures = {
+                pool.submit(_parse_chunk, bodies[start:start + chunk_size], transform): start
+                for start in starts
+            }
+            for future in (futures if ordered else as_completed(futures)):
+                start = futures[future]
+                for offset, data in enumerate(future.result()):
+                    yield start + offset, data if transform else load_parsed(data)
+        finally:
+            # Don't parse the rest if the caller stopped iterating early
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def index_sections(body: str) -> 'SectionIndex':
+        """Locate the section headers of an issue body without parsing it.
+
+        Use this to read one section: only the headers are located, and
+        SectionIndex.section() parses just the requested section.
+
+        Args:
+            body: Raw markdown body of the issue
+
+        Returns:
+            SectionIndex for the body
+        """
+        return SectionIndex(body or '')
+
+    @staticmethod
+    def parse_document(body: str) -> 'BodyDocument':
+        """Parse an issue body into a lossless BodyDocument.
+
+        Use this instead of parse_body() to edit a body: the document records
+        the line span of every section, todo, condition field and log entry,
+        and its edits leave the rest of the body untouched.
+
+        Args:
+            body: Raw markdown body of the issue
+
+        Returns:
+            BodyDocument for the body
+        """
+        return BodyDocument(body or '')
+
+    @staticmethod
+    def _append_log_entry(log_entries: List['LogEntry'], builder: '_LogEntryBuilder') -> None:
+        """Finish a log entry block and append it if it is complete.
+
+        Blocks that fail to parse are skipped with a warning on stderr.
+        """
+        if builder.empty:
+            return
+        try:
+            log_entry = builder.build()
+        except Exception as e:
+            # Log warning but don't crash - skip malformed entries
+            print(f"Warning: Failed to parse log entry: {e}", file=sys.stderr)
+            return
+        if log_entry:
+            log_entries.append(log_entry)
+
+    @staticmethod
+    def _parse_condition_from_section_body(condition_text: str, section_body: str) -> Optional['Condition']:
+        """Parse a condition from section body content.
+
+        Args:
             condition_text: The condition text (title after "CONDITION: ")
             section_body: The body content of the condition section
-            
+
         Returns:
             Condition object if parsed successfully, None otherwise
         """
-        from .models import Condition
-        import re
-        
         if not section_body or not section_body.strip():
             return None
-        
-        lines = section_body.split('\n')
-        
-        # Initialize condition fields
-        verified = False
-        signed_off_by = None
-        requirements = ""
-        evidence = None
-        
-        # Parse the condition fields from section body
-        for line in lines:
-            line = line.strip()
-            
-            # Parse VERIFIED checkbox
-            verified_match = re.match(r'^- \[([x\s])\] VERIFIED$', line, re.IGNORECASE)
-            if verified_match:
-                verified = verified_match.group(1).lower() == 'x'
-                continue
-            
-            # Parse Signed-off by field
-            signed_off_match = re.match(r'^- \*\*Signed-off by:\*\* (.+)$', line, re.IGNORECASE)
-            if signed_off_match:
-                signed_off_text = signed_off_match.group(1).strip()
-                if signed_off_text not in ['_Not yet verified_', '', 'None']:
-                    signed_off_by = signed_off_text
-                continue
-            
-            # Parse Requirements field
-            requirements_match = re.match(r'^- \*\*Requirements:\*\* (.+)$', line, re.IGNORECASE)
-            if requirements_match:
-                requirements = requirements_match.group(1).strip()
-                continue
-            
-            # Parse Evidence field
-            evidence_match = re.match(r'^- \*\*Evidence:\*\* (.+)$', line, re.IGNORECASE)
-            if evidence_match:
-                evidence_text = evidence_match.group(1).strip()
-                if evidence_text not in ['_Not yet provided_', '', 'None']:
-                    evidence = evidence_text
-                continue
-        
-        return Condition(
-            text=condition_text,
-            verified=verified,
-            signed_off_by=signed_off_by,
-            requirements=requirements,
-            evidence=evidence
-        )
-    
+
+        fields = _ConditionFields()
+        for line in section_body.split('\n'):
+            fields.feed(line.strip())
+        return fields.build(condition_text)
+
     @staticmethod
     def _extract_todos_from_lines(lines: List[str], start_line_number: int) -> List['Todo']:
         """Extract todos from a list of lines.
-        
+
         Args:
             lines: List of lines to search for todos
             start_line_number: Starting line number for tracking
-            
+
         Returns:
             List of Todo objects
         """
-        from .models import Todo
-        import re
-        
         todos = []
-        todo_pattern = re.compile(r'^- \[([x\s])\] (.+)$', re.IGNORECASE)
-        
+        todo_match = IssueParser._TODO_PATTERN.match
+
         for i, line in enumerate(lines):
-            line = line.strip()
-            todo_match = todo_pattern.match(line)
-            
-            if todo_match:
-                checked = todo_match.group(1).lower() == 'x'
-                text = todo_match.group(2).strip()
-                line_number = start_line_number + i
-                
+            match = todo_match(line.strip())
+            if match:
                 todos.append(Todo(
-                    text=text,
-                    checked=checked,
-                    line_number=line_number
+                    text=match.group(2).strip(),
+                    checked=match.group(1).lower() == 'x',
+                    line_number=start_line_number + i
                 ))
-        
+
         return todos
-    
+
     @staticmethod
     def _parse_log_section(content: str) -> List['LogEntry']:
         """Parse a Log section content into LogEntry objects.
-        
+
         Args:
             content: Raw content of the ## Log section
-            
+
         Returns:
             List of LogEntry objects parsed from the content
         """
-        from .models import LogEntry
-        import re
-        
         if not content or not content.strip():
             return []
-        
+
         log_entries = []
-        
-        # Split by horizontal rules to get individual log entries
-        entry_blocks = re.split(r'^\s*---\s*$', content, flags=re.MULTILINE)
-        
-        for block in entry_blocks:
-            block = block.strip()
-            if not block:
-                continue
-                
-            try:
-                log_entry = IssueParser._parse_single_log_entry(block)
-                if log_entry:
-                    log_entries.append(log_entry)
-            except Exception as e:
-                # Log warning but don't crash - skip malformed entries
-                import sys
-                print(f"Warning: Failed to parse log entry: {e}", file=sys.stderr)
-                continue
-        
+        builder = _LogEntryBuilder()
+
+        # Entries are separated by horizontal rules
+        for line in content.split('\n'):
+            line = line.strip()
+            if line == '---':
+                IssueParser._append_log_entry(log_entries, builder)
+                builder = _LogEntryBuilder()
+            elif line:
+                builder.feed(line)
+
+        IssueParser._append_log_entry(log_entries, builder)
         return log_entries
-    
+
+    @staticmethod
+    def parse_log_archive(comment_bodies: Iterable[str]) -> List['LogEntry']:
+        """Parse the entries moved out of a ## Log section into archive comments.
+
+        Args:
+            comment_bodies: Bodies of the log archive comments, oldest first
+
+        Returns:
+            List of archived LogEntry objects, oldest first
+        """
+        log_entries = []
+        for body in comment_bodies:
+            log_entries.extend(IssueParser._parse_log_section(body))
+        return log_entries
+
     @staticmethod
     def _parse_single_log_entry(entry_block: str) -> 'LogEntry':
         """Parse a single log entry block into a LogEntry object.
-        
+
         Args:
             entry_block: A single log entry block (between --- separators)
-            
+
         Returns:
             LogEntry object or None if parsing fails
+
+        Raises:
+            ValueError: If the entry header has an unparseable timestamp
         """
-        from .models import LogEntry, LogSubEntry
-        import re
-        
         if not entry_block or not entry_block.strip():
             return None
-        
-        lines = [line.rstrip() for line in entry_block.split('\n')]
-        
-        # Patterns for parsing
-        header_pattern = re.compile(r'^### → ([^\[]+) \[([^\]]+)\]$')
-        author_pattern = re.compile(r'^\*by @([^*]+)\*$')
-        message_pattern = re.compile(r'^\*\*Message\*\*: (.+)$')
-        subentry_header_pattern = re.compile(r'^#### (.+)$')
-        
-        to_state = None
-        timestamp = None
-        author = None
-        message = None
-        sub_entries = []
-        
-        current_subentry_title = None
-        current_subentry_lines = []
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            if not line:
-                i += 1
-                continue
-            
-            # Parse header (### → state [timestamp])
-            header_match = header_pattern.match(line)
-            if header_match:
-                to_state = header_match.group(1).strip()
-                timestamp_str = header_match.group(2).strip()
-                timestamp = IssueParser._parse_timestamp(timestamp_str)
-                i += 1
-                continue
-            
-            # Parse author (*by @username*)
-            author_match = author_pattern.match(line)
-            if author_match:
-                author = author_match.group(1).strip()
-                i += 1
-                continue
-            
-            # Parse message (**Message**: text)
-            message_match = message_pattern.match(line)
-            if message_match:
-                message = message_match.group(1).strip()
-                i += 1
-                continue
-            
-            # Parse sub-entry header (#### title)
-            subentry_match = subentry_header_pattern.match(line)
-            if subentry_match:
-                # Save previous sub-entry if exists
-                if current_subentry_title and current_subentry_lines:
-                    sub_entries.append(LogSubEntry(
-                        title=current_subentry_title,
-                        content='\n'.join(current_subentry_lines).strip()
-                    ))
-                
-                # Start new sub-entry
-                current_subentry_title = subentry_match.group(1).strip()
-                current_subentry_lines = []
-                i += 1
-                continue
-            
-            # Add line to current sub-entry content
-            if current_subentry_title:
-                current_subentry_lines.append(line)
-            
-            i += 1
-        
-        # Handle final sub-entry
-        if current_subentry_title and current_subentry_lines:
-            sub_entries.append(LogSubEntry(
-                title=current_subentry_title,
-                content='\n'.join(current_subentry_lines).strip()
-            ))
-        
-        # Validate required fields
-        if not to_state or not timestamp or not author:
-            return None
-        
-        return LogEntry(
-            to_state=to_state,
-            timestamp=timestamp,
-            author=author,
-            message=message,
-            sub_entries=sub_entries
-        )
-    
+
+        builder = _LogEntryBuilder()
+        for line in entry_block.split('\n'):
+            line = line.strip()
+            if line:
+                builder.feed(line)
+        return builder.build()
+
     @staticmethod
     def _parse_timestamp(timestamp_str: str) -> 'datetime':
         """Parse a timestamp string into a datetime object.
-        
+
         Args:
             timestamp_str: Timestamp in format 'YYYY-MM-DD HH:MM:SS UTC'
-            
+                           (the UTC suffix is optional)
+
         Returns:
             datetime object with UTC timezone
+
+        Raises:
+            ValueError: If the timestamp can't be parsed
         """
-        from datetime import datetime, timezone
-        import re
-        
-        # Primary format: YYYY-MM-DD HH:MM:SS UTC
-        primary_pattern = re.compile(r'^(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2}) UTC$')
-        match = primary_pattern.match(timestamp_str.strip())
-        
-        if match:
-            year, month, day, hour, minute, second = map(int, match.groups())
-            return datetime(year, month, day, hour, minute, second, tzinfo=timezone.utc)
-        
-        # Fallback: try parsing without UTC suffix
-        fallback_pattern = re.compile(r'^(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}):(\d{2})$')
-        match = fallback_pattern.match(timestamp_str.strip())
-        
-        if match:
-            year, month, day, hour, minute, second = map(int, match.groups())
-            return datetime(year, month, day, hour, minute, second, tzinfo=timezone.utc)
-        
-        # If all parsing fails, raise an error
-        raise ValueError(f"Unable to parse timestamp: {timestamp_str}")
-    
+        match = IssueParser._TIMESTAMP_PATTERN.match(timestamp_str.strip())
+        if not match:
+            raise ValueError(f"Unable to parse timestamp: {timestamp_str}")
+
+        year, month, day, hour, minute, second = map(int, match.groups())
+        return datetime(year, month, day, hour, minute, second, tzinfo=timezone.utc)
+
     @staticmethod
     def _extract_conditions_from_body(body: str) -> List['Condition']:
         """Extract conditions from issue body.
-        
+
         Conditions are H3 headings starting with "CONDITION:" followed by 4 fields:
         1. [ ] VERIFIED checkbox
         2. **Signed-off by:** field
-        3. **Requirements:** field  
+        3. **Requirements:** field
         4. **Evidence:** field
-        
+
+        Unlike parse_body(), the fields are read only up to the first empty
+        line or heading after the condition header, and each Condition records
+        the line number of its header.
+
         Args:
             body: Raw markdown body of the issue
-            
+
         Returns:
             List of Condition objects
         """
-        from .models import Condition
-        import re
-        
-        if not body or not body.strip():
-            return []
-        
-        conditions = []
-        lines = body.split('\n')
-        
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # Look for condition headers: ### CONDITION: text
-            condition_match = re.match(r'^### CONDITION: (.+)$', line, re.IGNORECASE)
-            if condition_match:
-                condition_text = condition_match.group(1).strip()
-                condition_line_number = i + 1
-                
-                # Parse the 4 fields that should follow
-                verified = False
-                signed_off_by = None
-                requirements = ""
-                evidence = None
-                
-                # Look ahead to parse the condition fields
-                j = i + 1
-                field_count = 0
-                
-                while j < len(lines) and field_count < 4:
-                    field_line = lines[j].strip()
-                    
-                    # Stop if we hit another heading or empty line
-                    if not field_line or field_line.startswith('#'):
-                        break
-                    
-                    # Parse VERIFIED checkbox
-                    verified_match = re.match(r'^- \[([x\s])\] VERIFIED$', field_line, re.IGNORECASE)
-                    if verified_match:
-                        verified = verified_match.group(1).lower() == 'x'
-                        field_count += 1
-                        j += 1
-                        continue
-                    
-                    # Parse Signed-off by field
-                    signed_off_match = re.match(r'^- \*\*Signed-off by:\*\* (.+)$', field_line, re.IGNORECASE)
-                    if signed_off_match:
-                        signed_off_text = signed_off_match.group(1).strip()
-                        if signed_off_text not in ['_Not yet verified_', '', 'None']:
-                            signed_off_by = signed_off_text
-                        field_count += 1
-                        j += 1
-                        continue
-                    
-                    # Parse Requirements field
-                    requirements_match = re.match(r'^- \*\*Requirements:\*\* (.+)$', field_line, re.IGNORECASE)
-                    if requirements_match:
-                        requirements = requirements_match.group(1).strip()
-                        field_count += 1
-                        j += 1
-                        continue
-                    
-                    # Parse Evidence field
-                    evidence_match = re.match(r'^- \*\*Evidence:\*\* (.+)$', field_line, re.IGNORECASE)
-                    if evidence_match:
-                        evidence_text = evidence_match.group(1).strip()
-                        if evidence_text not in ['_Not yet provided_', '', 'None']:
-                            evidence = evidence_text
-                        field_count += 1
-                        j += 1
-                        continue
-                    
-                    # If we reach here, the line didn't match any expected pattern
-                    j += 1
-                
-                # Create condition object even if some fields are missing
-                conditions.append(Condition(
-                    text=condition_text,
-                    verified=verified,
-                    signed_off_by=signed_off_by,
-                    requirements=requirements,
-                    evidence=evidence,
-                    line_number=condition_line_number
-                ))
-                
-                # Continue from where we left off
-                i = j
-            else:
-                i += 1
-        
-        return conditions
+        if not body or not body.strip():
+            return []
+
+        conditions = []
+        condition_match = IssueParser._CONDITION_PATTERN.match
+        length = len(body)
+
+        # Jump between '###' occurrences instead of visiting every line
+        line_number = 1
+        counted = 0
+        position = body.find('###')
+        while position != -1:
+            line_start = body.rfind('\n', 0, position) + 1
+            line_end = body.find('\n', position)
+            if line_end == -1:
+                line_end = length
+
+            # Look for condition headers: ### CONDITION: text
+            line = body[line_start:line_end].strip()
+            header = condition_match(line) if line.startswith('###') else None
+            if header is None:
+                position = body.find('###', line_end)
+                continue
+
+            line_number += body.count('\n', counted, line_start)
+            counted = line_start
+
+            # Parse up to 4 fields following the header
+            fields = _ConditionFields()
+            while line_end < length and fields.count < 4:
+                field_start = line_end + 1
+                field_end = body.find('\n', field_start)
+                if field_end == -1:
+                    field_end = length
+                field_line = body[field_start:field_end].strip()
+
+                # Stop if we hit another heading or empty line
+                if not field_line or field_line.startswith('#'):
+                    break
+
+                fields.feed(field_line)
+                line_end = field_end
+
+            # Create condition object even if some fields are missing
+            conditions.append(fields.build(header.group(1).strip(), line_number=line_number))
+
+            # Continue from where we left off
+            position = body.find('###', line_end)
+
+        return conditions
+
+
+def _parse_chunk(bodies: List[str], transform: Optional[Callable[[Dict[str, Any]], Any]]) -> List[Any]:
+    """Parse a chunk of bodies in an IssueParser.parse_many() worker."""
+    if transform:
+        return [transform(IssueParser.parse_body(body)) for body in bodies]
+    return [dump_parsed(IssueParser.parse_body(body)) for body in bodies]
+
+
+class _ConditionFields:
+    """Accumulates the fields of a condition from its lines."""
+
+    __slots__ = ('verified', 'signed_off_by', 'requirements', 'evidence', 'count')
+
+    def __init__(self):
+        self.verified = False
+        self.signed_off_by = None
+        self.requirements = ""
+        self.evidence = None
+        self.count = 0
+
+    def feed(self, line: str) -> None:
+        """Apply one stripped line; lines that aren't condition fields are ignored."""
+        if not line.startswith('- '):
+            return
+
+        match = IssueParser._VERIFIED_PATTERN.match(line)
+        if match:
+            self.verified = match.group(1).lower() == 'x'
+            self.count += 1
+            return
+
+        match = IssueParser._SIGNED_OFF_PATTERN.match(line)
+        if match:
+            signed_off_text = match.group(1).strip()
+            if signed_off_text not in ('_Not yet verified_', '', 'None'):
+                self.signed_off_by = signed_off_text
+            self.count += 1
+            return
+
+        match = IssueParser._REQUIREMENTS_PATTERN.match(line)
+        if match:
+            self.requirements = match.group(1).strip()
+            self.count += 1
+            return
+
+        match = IssueParser._EVIDENCE_PATTERN.match(line)
+        if match:
+            evidence_text = match.group(1).strip()
+            if evidence_text not in ('_Not yet provided_', '', 'None'):
+                self.evidence = evidence_text
+            self.count += 1
+
+    def build(self, text: str, line_number: Optional[int] = None) -> Condition:
+        """Return the Condition described by the fields seen so far."""
+        return Condition(
+            text=text,
+            verified=self.verified,
+            signed_off_by=self.signed_off_by,
+            requirements=self.requirements,
+            evidence=self.evidence,
+            line_number=line_number
+        )
+
+
+class _LogEntryBuilder:
+    """Accumulates one log entry block (between --- separators) line by line."""
+
+    __slots__ = ('to_state', 'timestamp', 'author', 'message', 'sub_entries',
+                 'subentry_title', 'subentry_lines', 'error', 'empty')
+
+    def __init__(self):
+        self.to_state = None
+        self.timestamp = None
+        self.author = None
+        self.message = None
+        self.sub_entries = []
+        self.subentry_title = None
+        self.subentry_lines = []
+        self.error = None
+        self.empty = True
+
+    def feed(self, line: str) -> None:
+        """Apply one non-empty, stripped line of the block."""
+        self.empty = False
+        if self.error is not None:
+            return
+
+        first = line[0]
+        if first == '#':
+            match = IssueParser._LOG_HEADER_PATTERN.match(line)
+            if match:
+                # Header: ### → state [timestamp]
+                self.to_state = match.group(1).strip()
+                try:
+                    self.timestamp = IssueParser._parse_timestamp(match.group(2).strip())
+                except ValueError as e:
+                    self.error = e
+                return
+        elif first == '*':
+            match = IssueParser._LOG_AUTHOR_PATTERN.match(line)
+            if match:
+                # Author: *by @username*
+                self.author = match.group(1).strip()
+                return
+            match = IssueParser._LOG_MESSAGE_PATTERN.match(line)
+            if match:
+                # Message: **Message**: text
+                self.message = match.group(1).strip()
+                return
+
+        if first == '#':
+            match = IssueParser._LOG_SUBENTRY_PATTERN.match(line)
+            if match:
+                # Sub-entry header: #### title
+                self._finish_subentry()
+                self.subentry_title = match.group(1).strip()
+                self.subentry_lines = []
+                return
+
+        if self.subentry_title:
+            self.subentry_lines.append(line)
+
+    def _finish_subentry(self) -> None:
+        if self.subentry_title and self.subentry_lines:
+            self.sub_entries.append(LogSubEntry(
+                title=self.subentry_title,
+                content='\n'.join(self.subentry_lines).strip()
+            ))
+
+    def build(self) -> Optional[LogEntry]:
+        """Return the LogEntry, or None if required fields are missing.
+
+        Raises:
+            ValueError: If the header's timestamp couldn't be parsed
+        """
+        if self.error is not None:
+            raise self.error
+
+        self._finish_subentry()
+        self.subentry_title = None
+
+        # Validate required fields
+        if not self.to_state or not self.timestamp or not self.author:
+            return None
+
+        return LogEntry(
+            to_state=self.to_state,
+            timestamp=self.timestamp,
+            author=self.author,
+            message=self.message,
+            sub_entries=self.sub_entries
+        )
+
+
+class TodoNode:
+    """A todo line of a BodyDocument.
+
+    Attributes:
+        line: Index of the todo's line in the document
+        text: Todo text (stripped)
+        checked: Whether the checkbox is ticked
+        mark: Column of the checkbox character within the line
+    """
+
+    __slots__ = ('line', 'text', 'checked', 'mark')
+
+    def __init__(self, line: int, text: str, checked: bool, mark: int):
+        self.line = line
+        self.text = text
+        self.checked = checked
+        self.mark = mark
+
+
+class SectionNode:
+    """A section, condition or log block of a BodyDocument.
+
+    Spans are half-open ranges of line indexes: the section covers
+    lines[start:end], starting with its header line.
+
+    Attributes:
+        kind: 'section', 'condition' (### CONDITION: header) or 'log'
+        title: Section title; conditions are titled "CONDITION: <text>"
+        start: Index of the header line
+        end: Index of the first line after the section
+        todos: TodoNode objects of a regular section
+        fields: Condition field name ('verified', 'signed_off_by',
+            'requirements', 'evidence') to the index of its line
+        entries: [start, end) line spans of the log entry blocks, each
+            starting at its --- separator
+    """
+
+    __slots__ = ('kind', 'title', 'start', 'end', 'todos', 'fields', 'entries')
+
+    def __init__(self, kind: str, title: str, start: int):
+        self.kind = kind
+        self.title = title
+        self.start = start
+        self.end = start + 1
+        self.todos = []
+        self.fields = {}
+        self.entries = []
+
+    def _shift(self, index: int, delta: int) -> None:
+        """Move every position at or after index by delta lines."""
+        if self.start >= index:
+            self.start += delta
+        if self.end >= index:
+            self.end += delta
+        for todo in self.todos:
+            if todo.line >= index:
+                todo.line += delta
+        for name, line in self.fields.items():
+            if line >= index:
+                self.fields[name] = line + delta
+        self.entries = [
+            (start + delta if start >= index else start, end + delta if end >= index else end)
+            for start, end in self.entries
+        ]
+
+
+class BodyDocument:
+    """Lossless concrete syntax tree of an issue body.
+
+    The document keeps the body's raw lines and records, for every section,
+    todo, condition field and log entry, the line span it occupies. Edits
+    rewrite or insert only the affected lines, so every other byte of the
+    body comes back unchanged from text, unlike rebuilding the body from the
+    parsed model.
+
+    Sections are recognised exactly like IssueParser.parse_body() does.
+
+    Attributes:
+        lines: Raw lines of the body; '\\n'.join(lines) is the body
+        sections: SectionNode objects in document order, including the log
+        newline: The body's line ending ('\\n' or '\\r\\n'), used for inserted lines
+    """
+
+    # Condition field prefixes, in the order they're written
+    FIELD_PREFIXES = {
+        'signed_off_by': '- **Signed-off by:** ',
+        'requirements': '- **Requirements:** ',
+        'evidence': '- **Evidence:** ',
+    }
+
+    def __init__(self, body: str):
+        self.lines = body.split('\n') if body else []
+        self.sections = []
+        self._offsets = None
+        self._scan()
+
+    @property
+    def text(self) -> str:
+        """The current body text."""
+        return '\n'.join(self.lines)
+
+    @property
+    def preamble_end(self) -> int:
+        """Index of the first line after the pre-section description."""
+        return self.sections[0].start if self.sections else len(self.lines)
+
+    @property
+    def log(self) -> Optional[SectionNode]:
+        """The ## Log section, if the body has one."""
+        for section in self.sections:
+            if section.kind == 'log':
+                return section
+        return None
+
+    def _scan(self) -> None:
+        # Lines are split on '\n', so with CRLF endings each keeps its '\r'
+        crlf = len(self.lines) > 1 and self.lines[0].endswith('\r')
+        self.newline = '\r\n' if crlf else '\n'
+
+        parser = IssueParser
+        section_match = parser._SECTION_PATTERN.match
+        condition_match = parser._CONDITION_PATTERN.match
+        index_item = self._index_item
+
+        current = None
+        entry_start = None
+        for index, raw in enumerate(self.lines):
+            line = raw.rstrip()
+
+            if line.startswith('##'):
+                header = section_match(line) or condition_match(line)
+                if header is not None:
+                    if current is not None:
+                        self._close(current, index, entry_start)
+                    if header.re is parser._SECTION_PATTERN:
+                        title = header.group(1).strip()
+                        kind = 'log' if title == 'Log' else 'section'
+                    else:
+                        title = f"CONDITION: {header.group(1).strip()}"
+                        kind = 'condition'
+                    current = SectionNode(kind, title, index)
+                    entry_start = None
+                    self.sections.append(current)
+                    continue
+
+            if current is None:
+                continue
+
+            stripped = line.lstrip()
+            if current.kind == 'log':
+                if stripped == '---':
+                    if entry_start is not None:
+                        current.entries.append((entry_start, index))
+                    entry_start = index
+                elif stripped and entry_start is None:
+                    entry_start = index
+                continue
+
+            if stripped.startswith('- '):
+                index_item(current, index, line, stripped)
+
+        if current is not None:
+            self._close(current, len(self.lines), entry_start)
+
+    @staticmethod
+    def _index_item(section: SectionNode, index: int, line: str, stripped: str) -> None:
+        """Record the todo or condition field on a '- ' line of a section."""
+        parser = IssueParser
+        if section.kind == 'section' and stripped.startswith('- ['):
+            match = parser._TODO_PATTERN.match(stripped)
+            if match:
+                section.todos.append(TodoNode(
+                    index,
+                    match.group(2).strip(),
+                    match.group(1).lower() == 'x',
+                    len(line) - len(stripped) + 3,
+                ))
+        if section.kind == 'condition' or section.title.startswith('CONDITION: '):
+            for name, pattern in (
+                ('verified', parser._VERIFIED_PATTERN),
+                ('signed_off_by', parser._SIGNED_OFF_PATTERN),
+                ('requirements', parser._REQUIREMENTS_PATTERN),
+                ('evidence', parser._EVIDENCE_PATTERN),
+            ):
+                if pattern.match(stripped):
+                    section.fields[name] = index
+                    break
+
+    def _index_items(self, section: SectionNode, start: int, end: int) -> None:
+        """Record the todos and condition fields of lines[start:end] of a section."""
+        for index in range(start, end):
+            line = self.lines[index].rstrip()
+            stripped = line.lstrip()
+            if stripped.startswith('- '):
+                self._index_item(section, index, line, stripped)
+        section.todos.sort(key=lambda todo: todo.line)
+
+    @staticmethod
+    def _close(section: SectionNode, end: int, entry_start: Optional[int]) -> None:
+        section.end = end
+        if entry_start is not None:
+            section.entries.append((entry_start, end))
+
+    def line_offset(self, index: int) -> int:
+        """Return the character offset in text at which a line starts.
+
+        Args:
+            index: Line index (len(lines) gives the length of the text plus one)
+
+        Returns:
+            Offset of the line's first character
+        """
+        if self._offsets is None:
+            offsets = [0]
+            for line in self.lines:
+                offsets.append(offsets[-1] + len(line) + 1)
+            self._offsets = offsets
+        return self._offsets[index]
+
+    def span_offsets(self, start: int, end: int) -> Tuple[int, int]:
+        """Return the [start, end) character span of a range of lines.
+
+        The span excludes the newline that ends the last line.
+        """
+        return self.line_offset(start), self.line_offset(end) - 1
+
+    def section_titles(self) -> List[str]:
+        """Return the titles of all sections except the log."""
+        return [section.title for section in self.sections if section.kind != 'log']
+
+    def find_section(self, name: str) -> Optional[SectionNode]:
+        """Find a section (or condition) by title, case-insensitively."""
+        name = name.lower().strip()
+        for section in self.sections:
+            if section.kind != 'log' and section.title.lower().strip() == name:
+                return section
+        return None
+
+    def find_condition(self, match_text: str) -> Optional[SectionNode]:
+        """Find the first condition whose title contains match_text (case-insensitive)."""
+        match_text = match_text.lower()
+        for section in self.sections:
+            if section.title.startswith('CONDITION: ') and match_text in section.title.lower():
+                return section
+        return None
+
+    def field_value(self, section: SectionNode, name: str) -> Optional[str]:
+        """Return the text of a condition's Signed-off by/Requirements/Evidence field.
+
+        Returns:
+            Stripped field text, or None if the condition doesn't have the field
+        """
+        index = section.fields.get(name)
+        if index is None:
+            return None
+        line = self.lines[index].strip()
+        return line[len(self.FIELD_PREFIXES[name]) - 1:].strip()
+
+    def is_verified(self, section: SectionNode) -> bool:
+        """Return whether a condition's VERIFIED checkbox is ticked."""
+        index = section.fields.get('verified')
+        return index is not None and self.lines[index].lstrip()[3].lower() == 'x'
+
+    def set_todo_checked(self, todo: TodoNode, checked: bool) -> None:
+        """Tick or clear a todo's checkbox, leaving the rest of its line alone."""
+        line = self.lines[todo.line]
+        self.lines[todo.line] = line[:todo.mark] + ('x' if checked else ' ') + line[todo.mark + 1:]
+        todo.checked = checked
+        self._offsets = None
+
+    def set_verified(self, section: SectionNode, verified: bool = True) -> None:
+        """Tick or clear a condition's VERIFIED checkbox."""
+        index = section.fields.get('verified')
+        if index is None:
+            self._insert_field(section, 'verified', f"- [{'x' if verified else ' '}] VERIFIED")
+            return
+        line = self.lines[index]
+        mark = len(line) - len(line.lstrip()) + 3
+        self.lines[index] = line[:mark] + ('x' if verified else ' ') + line[mark + 1:]
+        self._offsets = None
+
+    def set_field(self, section: SectionNode, name: str, value: str) -> None:
+        """Rewrite a condition's Signed-off by/Requirements/Evidence field.
+
+        The line keeps its indentation and line ending. A missing field is
+        added after the condition's other fields.
+        """
+        index = section.fields.get(name)
+        if index is None:
+            self._insert_field(section, name, self.FIELD_PREFIXES[name] + value)
+            return
+        line = self.lines[index]
+        indent = line[:len(line) - len(line.lstrip())]
+        suffix = line[len(line.rstrip()):]
+        self.lines[index] = indent + self.FIELD_PREFIXES[name] + value + suffix
+        self._offsets = None
+
+    def _insert_field(self, section: SectionNode, name: str, line: str) -> None:
+        index = max(section.fields.values(), default=section.start) + 1
+        self._splice(index, index, [line])
+        section.fields[name] = index
+
+    def add_todo(self, section: SectionNode, text: str) -> TodoNode:
+        """Append an unchecked todo to a section.
+
+        The todo goes right after the section's last todo, or after its last
+        non-blank line if it has none.
+
+        Returns:
+            The new TodoNode
+        """
+        if section.todos:
+            index = section.todos[-1].line + 1
+        else:
+            index = self._content_end(section)
+        self._splice(index, index, [f'- [ ] {text}'])
+        todo = TodoNode(index, text, False, 3)
+        section.todos.append(todo)
+        return todo
+
+    def add_section(
+        self,
+        header: str,
+        body_lines: Sequence[str],
+        kind: str = 'section',
+        before: Optional[SectionNode] = None
+    ) -> SectionNode:
+        """Add a section before another one, the ## Log section, or at the end of the body.
+
+        A blank line separates the new section from the content around it.
+
+        Args:
+            header: Header line, e.g. '## Notes' or '### CONDITION: Deployed'
+            body_lines: Lines of the section below its header
+            kind: 'section' or 'condition'
+            before: Section to insert the new one in front of; by default
+                it goes before the log
+
+        Returns:
+            The new SectionNode
+        """
+        if before is None:
+            before = self.log
+        index = before.start if before is not None else len(self.lines)
+        while index > 0 and not self.lines[index - 1].strip():
+            index -= 1
+
+        # Blank lines already between the previous content and the log stay
+        # below the new section; otherwise add the separators it needs
+        block = [header, *body_lines]
+        if index > 0:
+            block.insert(0, '')
+        if index < len(self.lines) and self.lines[index].strip():
+            block.append('')
+        self._splice(index, index, block)
+
+        start = index + 1 if index > 0 else index
+        for existing in self.sections:
+            if existing.end > start and existing.start < start:
+                existing.end = start
+        section = SectionNode(kind, header.lstrip('#').strip(), start)
+        position = sum(1 for existing in self.sections if existing.start < start)
+        following = self.sections[position] if position < len(self.sections) else None
+        section.end = following.start if following is not None else len(self.lines)
+        self.sections.insert(position, section)
+        self._index_items(section, start + 1, start + 1 + len(body_lines))
+        return section
+
+    def section_body(self, section: SectionNode) -> str:
+        """Return the text below a section's header, without surrounding blank lines."""
+        lines = self.lines[section.start + 1:self._content_end(section)]
+        return '\n'.join(line.rstrip('\r') for line in lines).strip()
+
+    def set_section_body(self, section: SectionNode, body_lines: Sequence[str]) -> None:
+        """Replace the text below a section's header.
+
+        Blank lines around the old text are kept, so the section stays
+        separated from its neighbours as before. The section's todos and
+        condition fields are indexed again from the new lines.
+
+        Args:
+            section: Section to rewrite
+            body_lines: New lines of the section below its header
+        """
+        start = section.start + 1
+        end = self._content_end(section)
+        while start < end and not self.lines[start].strip():
+            start += 1
+        if start == end:
+            # An empty section gets its text right below the header
+            start = end = section.start + 1
+
+        section.todos = [todo for todo in section.todos if not start <= todo.line < end]
+        section.fields = {name: line for name, line in section.fields.items() if not start <= line < end}
+        self._splice(start, end, body_lines)
+        self._index_items(section, start, start + len(body_lines))
+
+    def log_index(self) -> Optional[LogArchiveIndex]:
+        """Return the index of archived log entries, if the log has one."""
+        line = self._log_index_line()
+        return LogArchiveIndex.parse(self.lines[line]) if line is not None else None
+
+    def set_log_index(self, line: str) -> None:
+        """Write the archived entries index line right below the ## Log header."""
+        log = self.log
+        index = self._log_index_line()
+        if index is not None:
+            old = self.lines[index]
+            self.lines[index] = line + old[len(old.rstrip('\r')):]
+            self._offsets = None
+            return
+        first_entry = log.entries[0][0] if log.entries else log.end
+        self._splice(log.start + 1, log.start + 1, [line])
+        log.entries.insert(0, (log.start + 1, first_entry + 1))
+
+    def rotate_log(self, keep: int) -> List[str]:
+        """Remove all but the newest log entries.
+
+        Args:
+            keep: Number of entries to keep
+
+        Returns:
+            Markdown of the removed entries, oldest first, without the blank
+            lines that followed them
+        """
+        log = self.log
+        if log is None:
+            return []
+        entries = [span for span in log.entries if self.lines[span[0]].strip() == '---']
+        if len(entries) <= keep:
+            return []
+
+        removed = entries[:len(entries) - keep]
+        blocks = ['\n'.join(self.lines[start:end]).rstrip() for start, end in removed]
+        log.entries = [span for span in log.entries if span not in removed]
+        self._splice(removed[0][0], removed[-1][1], [])
+        return blocks
+
+    def _log_index_line(self) -> Optional[int]:
+        log = self.log
+        if log is None:
+            return None
+        for index in range(log.start + 1, log.end):
+            line = self.lines[index].strip()
+            if line:
+                return index if LogArchiveIndex.parse(line) else None
+        return None
+
+    def _content_end(self, section: SectionNode) -> int:
+        """Return the index after the section's last non-blank line."""
+        index = section.end
+        while index > section.start + 1 and not self.lines[index - 1].strip():
+            index -= 1
+        return index
+
+    def _splice(self, start: int, end: int, new_lines: Sequence[str]) -> None:
+        """Replace lines[start:end] and move the spans after it.
+
+        New lines get the document's line ending, including the line before
+        them when they are appended after the last one.
+        """
+        self.lines[start:end] = new_lines
+        if self.newline == '\r\n':
+            # Every line but the last one ends with '\r'
+            stop = start + len(new_lines)
+            first = start - 1 if stop == len(self.lines) and start > 0 else start
+            for index in range(first, stop):
+                line = self.lines[index].rstrip('\r')
+                self.lines[index] = line + '\r' if index < len(self.lines) - 1 else line
+        delta = len(new_lines) - (end - start)
+        if delta:
+            for section in self.sections:
+                section._shift(end, delta)
+        self._offsets = None
+
+
+class SectionIndex:
+    """Header offsets of an issue body, for reading a single section.
+
+    The index is built from one regex search for header line starts, so
+    locating a section costs a scan for headers rather than a full parse.
+    Sections are recognised exactly like IssueParser.parse_body() does, and
+    section() parses only the requested one.
+
+    Attributes:
+        body: The indexed body
+        entries: SectionEntry objects in document order, including the log
+    """
+
+    # Starts of lines that can be headers. The literal prefix lets the regex
+    # engine skip between candidates, passing over log entry headers
+    _CANDIDATE_PATTERN = re.compile(r'\n(?:## |### (?i:condition):)')
+
+    def __init__(self, body: str):
+        self.body = body
+        self.entries = []
+
+        section_match = IssueParser._SECTION_PATTERN.match
+        condition_match = IssueParser._CONDITION_PATTERN.match
+        length = len(body)
+
+        starts = [match.start() + 1 for match in self._CANDIDATE_PATTERN.finditer(body)]
+        if body.startswith('##'):
+            starts.insert(0, 0)
+
+        for start in starts:
+            end = body.find('\n', start)
+            if end == -1:
+                end = length
+            line = body[start:end].rstrip()
+            header = section_match(line) or condition_match(line)
+            if header is None:
+                continue
+            if header.re is IssueParser._SECTION_PATTERN:
+                title = header.group(1).strip()
+                kind = 'log' if title == 'Log' else 'section'
+            else:
+                title = f"CONDITION: {header.group(1).strip()}"
+                kind = 'condition'
+            if self.entries:
+                self.entries[-1].end = start
+            self.entries.append(SectionEntry(kind, title, start, length))
+
+    def titles(self) -> List[str]:
+        """Return the titles of all sections except the log."""
+        return [entry.title for entry in self.entries if entry.kind != 'log']
+
+    def find(self, title: str) -> Optional['SectionEntry']:
+        """Find a section (or condition) by title, case-insensitively."""
+        title = title.lower()
+        for entry in self.entries:
+            if entry.kind != 'log' and entry.title.lower() == title:
+                return entry
+        return None
+
+    def section(self, entry: 'SectionEntry') -> Section:
+        """Parse one indexed section.
+
+        Returns:
+            The same Section that parse_body() returns for it, with todo line
+            numbers counted from the start of the body
+        """
+        section = IssueParser.parse_body(self.body[entry.start:entry.end])['sections'][0]
+        offset = self.body.count('\n', 0, entry.start)
+        for todo in section.todos:
+            todo.line_number += offset
+        return section
+
+
+class SectionEntry:
+    """Location of one section header in a SectionIndex.
+
+    Attributes:
+        kind: 'section', 'condition' or 'log'
+        title: Section title; conditions are titled "CONDITION: <text>"
+        start: Offset of the header line in the body
+        end: Offset of the next header, or the length of the body
+    """
+
+    __slots__ = ('kind', 'title', 'start', 'end')
+
+    def __init__(self, kind: str, title: str, start: int, end: int):
+        self.kind = kind
+        self.title = title
+        self.start = start
+        self.end = end
+
+
+class BodyIndex:
+    """Summary of an issue body, embedded in the body as a hidden comment.
+
+    The index is the first line of the body:
+
+        <!-- ghoo:index {"v":1,"h":"...","s":[...],"c":[...],"l":[...]} -->
+
+    It holds the todo counts of every section, the condition states and the
+    state history of the log, so readers that only need those can decode one
+    line instead of parsing the body. 'h' is a checksum of the rest of the
+    body; if the markdown was edited without refreshing the index, read()
+    returns None and callers parse the body instead.
+
+    Attributes:
+        sections: (title, total todos, completed todos) of each section
+        conditions: Condition objects
+        log: (to_state, from_state, ISO timestamp, author) of each log entry
+    """
+
+    PREFIX = '<!-- ghoo:index '
+    SUFFIX = ' -->'
+
+    # Bump when the encoded form changes; other versions are ignored
+    VERSION = 1
+
+    __slots__ = ('sections', 'conditions', 'log')
+
+    def __init__(self, sections: List[Tuple[str, int, int]], conditions: List[Condition],
+                 log: List[Tuple[str, Optional[str], str, str]]):
+        self.sections = sections
+        self.conditions = conditions
+        self.log = log
+
+    @classmethod
+    def from_parsed(cls, parsed: Dict[str, Any]) -> 'BodyIndex':
+        """Build the index of a parse_body() result."""
+        return cls(
+            [(section.title, section.total_todos, section.completed_todos)
+             for section in parsed['sections']],
+            parsed['conditions'],
+            [(entry.to_state, entry.from_state, entry.timestamp.isoformat(), entry.author)
+             for entry in parsed['log_entries']],
+        )
+
+    @property
+    def section_titles(self) -> List[str]:
+        """Titles of all sections, including conditions."""
+        return [title for title, _, _ in self.sections]
+
+    @property
+    def has_open_todos(self) -> bool:
+        """Whether any section has an unchecked todo."""
+        return any(completed < total for _, total, completed in self.sections)
+
+    @property
+    def has_open_conditions(self) -> bool:
+        """Whether any condition isn't verified."""
+        return any(not condition.verified for condition in self.conditions)
+
+    @staticmethod
+    def checksum(content: str) -> str:
+        """Return the checksum of a body without its index line."""
+        return hashlib.blake2b(content.encode('utf-8'), digest_size=8).hexdigest()
+
+    @classmethod
+    def split(cls, body: str) -> Tuple[Optional[str], str]:
+        """Split a body into its index line (or None) and the rest."""
+        if not body or not body.startswith(cls.PREFIX):
+            return None, body or ''
+        end = body.find('\n')
+        if end == -1:
+            return body, ''
+        return body[:end], body[end + 1:]
+
+    @classmethod
+    def read(cls, body: str) -> Optional['BodyIndex']:
+        """Decode the index of a body.
+
+        Returns:
+            The BodyIndex, or None if the body has none, it can't be decoded
+            or the body changed since it was written
+        """
+        if not isinstance(body, str):
+            return None
+        line, content = cls.split(body)
+        if line is None or not line.rstrip().endswith(cls.SUFFIX):
+            return None
+        try:
+            data = json.loads(line.rstrip()[len(cls.PREFIX):-len(cls.SUFFIX)])
+            if data['v'] != cls.VERSION or data['h'] != cls.checksum(content):
+                return None
+            return cls(
+                [(title, total, completed) for title, total, completed in data['s']],
+                [Condition(text=text, verified=verified, signed_off_by=signed_off_by,
+                           requirements=requirements, evidence=evidence)
+                 for text, verified, signed_off_by, requirements, evidence in data['c']],
+                [(to_state, from_state, timestamp, author)
+                 for to_state, from_state, timestamp, author in data['l']],
+            )
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    @classmethod
+    def attach(cls, body: str) -> str:
+        """Return a body with a freshly computed index line."""
+        _, content = cls.split(body)
+        index = cls.from_parsed(IssueParser.parse_body_cached(content))
+        data = {
+            'v': cls.VERSION,
+            'h': cls.checksum(content),
+            's': [list(section) for section in index.sections],
+            'c': [[condition.text, condition.verified, condition.signed_off_by,
+                   condition.requirements, condition.evidence]
+                  for condition in index.conditions],
+            'l': [list(entry) for entry in index.log],
+        }
+        # '--' can't appear inside an HTML comment
+        encoded = json.dumps(data, separators=(',', ':'), ensure_ascii=False).replace('--', '-\\u002d')
+        return f"{cls.PREFIX}{encoded}{cls.SUFFIX}\n{content}"
+
+    @classmethod
+    def refresh(cls, body: str, previous: Optional[str] = None, enabled: bool = False) -> str:
+        """Prepare a body for writing, keeping its index up to date.
+
+        The index is written if indexing is enabled or if the body (or the
+        body it replaces) already has one; otherwise the body is returned
+        unchanged.
+
+        Args:
+            body: Body about to be written
+            previous: Body it replaces, if known
+            enabled: Whether to add an index to a body that doesn't have one
+                yet (see enabled_for())
+
+        Returns:
+            The body to write
+        """
+        indexed = (enabled
+                   or body.startswith(cls.PREFIX)
+                   or (isinstance(previous, str) and previous.startswith(cls.PREFIX)))
+        return cls.attach(body) if indexed else body
+
+    @staticmethod
+    def enabled_for(github_client: Any) -> bool:
+        """Return whether a client's body_index option asks for new indexes.
+
+        The option belongs to each GitHubClient's config, so clients for
+        different repositories in one process (e.g. the daemon) don't share it.
+        """
+        return getattr(github_client, 'body_index', False) is True
 
 
 class BaseCreateCommand(ABC):
@@ -3135,7 +5524,7 @@ class BaseCreateCommand(ABC):
             return  # No required sections for this issue type
         
         # Parse sections from body
-        parsed_data = IssueParser.parse_body(body)
+        parsed_data = IssueParser.parse_body_cached(body)
         sections = parsed_data.get('sections', [])
         section_names = [section.title for section in sections]
         
@@ -4205,15 +6594,15 @@ class TodoCommand:
         self.github = github_client
         self.set_body_command = SetBodyCommand(github_client)
     
-    def _get_issue_and_parsed_body(self, repo: str, issue_number: int) -> Dict[str, Any]:
-        """Get issue and parse its body content.
+    def _get_issue(self, repo: str, issue_number: int) -> Any:
+        """Validate the repository name and get the issue.
         
         Args:
             repo: Repository in format 'owner/repo'
             issue_number: Issue number to retrieve
             
         Returns:
-            Dictionary containing issue object and parsed body data
+            PyGithub Issue object
             
         Raises:
             GithubException: If issue not found or permission denied
@@ -4230,100 +6619,71 @@ class TodoCommand:
         
         # Get repository and issue
         github_repo = self.github.github.get_repo(repo)
-        issue = github_repo.get_issue(issue_number)
+        return github_repo.get_issue(issue_number)
+    
+    def _get_issue_and_parsed_body(self, repo: str, issue_number: int) -> Dict[str, Any]:
+        """Get issue and parse its body content.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            issue_number: Issue number to retrieve
+            
+        Returns:
+            Dictionary containing issue object and parsed body data
+            
+        Raises:
+            GithubException: If issue not found or permission denied
+            ValueError: If repository format is invalid
+        """
+        issue = self._get_issue(repo, issue_number)
         
         # Parse issue body
-        parsed_body = IssueParser.parse_body(issue.body or "")
+        parsed_body = IssueParser.parse_body_cached(issue.body or "")
         
         return {
             'issue': issue,
             'parsed_body': parsed_body
         }
     
-    def _find_section(self, parsed_body: Dict[str, Any], section_name: str) -> Optional[Any]:
-        """Find a section by name (case-insensitive).
+    def _get_issue_and_document(self, repo: str, issue_number: int) -> Dict[str, Any]:
+        """Get issue and parse its body into an editable BodyDocument.
         
         Args:
-            parsed_body: Parsed body data from IssueParser
-            section_name: Name of section to find
+            repo: Repository in format 'owner/repo'
+            issue_number: Issue number to retrieve
             
         Returns:
-            Section object if found, None otherwise
+            Dictionary containing the issue object ('issue') and its body
+            document ('document')
+            
+        Raises:
+            GithubException: If issue not found or permission denied
+            ValueError: If repository format is invalid
         """
-        from .models import Section
+        issue = self._get_issue(repo, issue_number)
         
-        for section in parsed_body.get('sections', []):
-            if section.title.lower().strip() == section_name.lower().strip():
-                return section
-        return None
+        return {
+            'issue': issue,
+            'document': IssueParser.parse_document(issue.body or "")
+        }
     
-    def _reconstruct_body(self, parsed_body: Dict[str, Any]) -> str:
-        """Reconstruct the full issue body from parsed data.
-        
-        This method reconstructs the markdown body while preserving structure and
-        updating todo states. It handles both existing todos (by updating their
-        checkbox state in place) and new todos (by appending them).
+    def _find_condition_section(self, document: 'BodyDocument', condition_match: str) -> 'SectionNode':
+        """Find the condition whose text contains condition_match.
         
         Args:
-            parsed_body: Parsed body data from IssueParser
+            document: Body document of the issue
+            condition_match: Text to match against condition text (case-insensitive)
             
         Returns:
-            Reconstructed markdown body string
-        """
-        import re
-        
-        lines = []
-        
-        # Add pre-section description
-        pre_section = parsed_body.get('pre_section_description', '').strip()
-        if pre_section:
-            lines.extend(pre_section.split('\n'))
-            if parsed_body.get('sections'):  # Only add blank line if we have sections
-                lines.append('')
-        
-        # Add each section
-        for section_idx, section in enumerate(parsed_body.get('sections', [])):
-            # Handle condition sections with H3, regular sections with H2
-            if section.title.startswith("CONDITION: "):
-                lines.append(f'### {section.title}')
-            else:
-                lines.append(f'## {section.title}')
-            
-            if section.body.strip():
-                # Process section body line by line, updating todos in place
-                section_lines = section.body.split('\n')
-                todo_pattern = re.compile(r'^- \[([x\s])\] (.+)$', re.IGNORECASE)
-                
-                # Create a mapping of todo text to updated state
-                todo_updates = {todo.text: todo.checked for todo in section.todos}
-                
-                for line in section_lines:
-                    todo_match = todo_pattern.match(line.strip())
-                    if todo_match:
-                        todo_text = todo_match.group(2).strip()
-                        if todo_text in todo_updates:
-                            # Update the checkbox state
-                            new_checkbox = '[x]' if todo_updates[todo_text] else '[ ]'
-                            updated_line = f'- {new_checkbox} {todo_text}'
-                            lines.append(updated_line)
-                        else:
-                            # Keep original todo line unchanged
-                            lines.append(line)
-                    else:
-                        # Non-todo line, keep as is
-                        lines.append(line)
-            
-            # Add new todos (those without line numbers)
-            new_todos = [todo for todo in section.todos if todo.line_number is None]
-            for todo in new_todos:
-                checkbox = '[x]' if todo.checked else '[ ]'
-                lines.append(f'- {checkbox} {todo.text}')
+            SectionNode of the first matching condition
             
-            # Add blank line after section (except for the last one)
-            if section_idx < len(parsed_body.get('sections', [])) - 1:
-                lines.append('')
-        
-        return '\n'.join(lines)
+        Raises:
+            ValueError: If no condition matches
+        """
+        section = document.find_condition(condition_match)
+        if section is None:
+            raise ValueError(f"No condition found matching '{condition_match}'")
+        return section
 
 
 class ConditionCommand:
@@ -4342,15 +6702,15 @@ class ConditionCommand:
         self.github = github_client
         self.set_body_command = SetBodyCommand(github_client)
     
-    def _get_issue_and_parsed_body(self, repo: str, issue_number: int) -> Dict[str, Any]:
-        """Get issue and parse its body content.
+    def _get_issue(self, repo: str, issue_number: int) -> Any:
+        """Get an issue without parsing its body.
         
         Args:
             repo: Repository in format 'owner/repo'
             issue_number: Issue number
             
         Returns:
-            Dictionary with 'issue' and 'parsed_body' keys
+            GitHub issue object
             
         Raises:
             GithubException: If issue not found or permission denied
@@ -4360,19 +6720,31 @@ class ConditionCommand:
             raise ValueError(f"Invalid repository format '{repo}'. Expected 'owner/repo'")
         
         try:
-            issue = self.github.get_issue(repo, issue_number)
-            parser = IssueParser()
-            parsed_body = parser.parse_body(issue.body or "")
-            
-            return {
-                'issue': issue,
-                'parsed_body': parsed_body
-            }
+            return self.github.get_issue(repo, issue_number)
         except Exception as e:
             if "404" in str(e):
                 raise ValueError(f"Issue #{issue_number} not found in repository {repo}")
             raise
     
+    def _get_issue_and_parsed_body(self, repo: str, issue_number: int) -> Dict[str, Any]:
+        """Get issue and parse its body content.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            issue_number: Issue number
+            
+        Returns:
+            Dictionary with 'issue' and 'parsed_body' keys
+            
+        Raises:
+            GithubException: If issue not found or permission denied
+        """
+        issue = self._get_issue(repo, issue_number)
+        return {
+            'issue': issue,
+            'parsed_body': IssueParser.parse_body_cached(issue.body or "")
+        }
+    
     def _find_condition(self, conditions: List[Any], condition_match: str) -> Any:
         """Find a condition by matching text.
         
@@ -4542,30 +6914,29 @@ class CreateTodoCommand(TodoCommand):
             GithubException: If issue not found or permission denied
             ValueError: If validation fails
         """
-        from .models import Section, Todo
-        
         # Validate todo text
         if not todo_text or not todo_text.strip():
             raise ValueError("Todo text cannot be empty")
         
         todo_text = todo_text.strip()
         
-        # Get issue and parsed body
-        issue_data = self._get_issue_and_parsed_body(repo, issue_number)
+        # Get issue and body document
+        issue_data = self._get_issue_and_document(repo, issue_number)
         issue = issue_data['issue']
-        parsed_body = issue_data['parsed_body']
+        document = issue_data['document']
         
         # Find target section
-        section = self._find_section(parsed_body, section_name)
+        section = document.find_section(section_name)
+        section_created = False
         
         if section is None:
             if create_section:
-                # Create new section
-                section = Section(title=section_name, body='', todos=[])
-                parsed_body['sections'].append(section)
+                # Create new section holding just the new todo
+                section = document.add_section(f'## {section_name}', [])
+                section_created = True
             else:
                 # List available sections for user
-                available_sections = [s.title for s in parsed_body.get('sections', [])]
+                available_sections = document.section_titles()
                 if available_sections:
                     sections_list = ', '.join(f'"{s}"' for s in available_sections)
                     raise ValueError(
@@ -4582,20 +6953,16 @@ class CreateTodoCommand(TodoCommand):
         if todo_text.lower().strip() in existing_todo_texts:
             raise ValueError(f'Todo "{todo_text}" already exists in section "{section_name}"')
         
-        # Add new todo to section
-        new_todo = Todo(text=todo_text, checked=False)
-        section.todos.append(new_todo)
-        
-        # Reconstruct and update body
-        new_body = self._reconstruct_body(parsed_body)
-        update_result = self.set_body_command.execute(repo, issue_number, new_body)
+        # Insert the todo line; the rest of the body is left as it was
+        document.add_todo(section, todo_text)
+        update_result = self.set_body_command.execute(repo, issue_number, document.text)
         
         return {
             'issue_number': issue.number,
             'issue_title': issue.title,
             'section_name': section_name,
             'todo_text': todo_text,
-            'section_created': section not in parsed_body['sections'][:-1] if create_section else False,
+            'section_created': section_created,
             'total_todos_in_section': len(section.todos),
             'url': issue.html_url
         }
@@ -4632,16 +6999,16 @@ class CheckTodoCommand(TodoCommand):
         
         match_text = match_text.strip().lower()
         
-        # Get issue and parsed body
-        issue_data = self._get_issue_and_parsed_body(repo, issue_number)
+        # Get issue and body document
+        issue_data = self._get_issue_and_document(repo, issue_number)
         issue = issue_data['issue']
-        parsed_body = issue_data['parsed_body']
+        document = issue_data['document']
         
         # Find target section
-        section = self._find_section(parsed_body, section_name)
+        section = document.find_section(section_name)
         
         if section is None:
-            available_sections = [s.title for s in parsed_body.get('sections', [])]
+            available_sections = document.section_titles()
             if available_sections:
                 sections_list = ', '.join(f'"{s}"' for s in available_sections)
                 raise ValueError(f'Section "{section_name}" not found. Available sections: {sections_list}')
@@ -4678,15 +7045,13 @@ class CheckTodoCommand(TodoCommand):
                 f'Please use more specific text to match exactly one todo.'
             )
         
-        # Toggle the matched todo
+        # Toggle the matched todo by rewriting its checkbox only
         todo_index, matched_todo = matching_todos[0]
         old_state = matched_todo.checked
-        matched_todo.checked = not matched_todo.checked
+        document.set_todo_checked(matched_todo, not old_state)
         new_state = matched_todo.checked
         
-        # Reconstruct and update body
-        new_body = self._reconstruct_body(parsed_body)
-        update_result = self.set_body_command.execute(repo, issue_number, new_body)
+        update_result = self.set_body_command.execute(repo, issue_number, document.text)
         
         return {
             'issue_number': issue.number,
@@ -4742,32 +7107,24 @@ class CreateSectionCommand(TodoCommand):
         if position not in ['end', 'before', 'after']:
             raise ValueError(f"Position must be 'end', 'before', or 'after', got '{position}'")
         
-        # Get issue and parsed body
-        issue_data = self._get_issue_and_parsed_body(repo, issue_number)
+        # Get issue and body document
+        issue_data = self._get_issue_and_document(repo, issue_number)
         issue = issue_data['issue']
-        parsed_body = issue_data['parsed_body']
+        document = issue_data['document']
         
         # Check if section already exists (case-insensitive with normalization)
-        normalized_section_name = section_name.lower().strip()
-        existing_sections = [s.title.lower().strip() for s in parsed_body.get('sections', [])]
-        if normalized_section_name in existing_sections:
-            available_sections = [s.title for s in parsed_body.get('sections', [])]
-            sections_list = ', '.join(f'"{s}"' for s in available_sections)
+        if document.find_section(section_name) is not None:
+            sections_list = ', '.join(f'"{s}"' for s in document.section_titles())
             raise ValueError(f'Section "{section_name}" already exists. Available sections: {sections_list}')
         
-        # Create new section object
-        from .models import Section
-        new_section = Section(title=section_name, body=content or '', todos=[])
-        
-        # Add section to parsed body at appropriate position
-        sections = parsed_body.get('sections', [])
+        # Insert the section at the requested position; the rest of the body is unchanged
+        sections = [section for section in document.sections if section.kind != 'log']
         insert_position = self._calculate_insert_position(sections, position, relative_to)
-        sections.insert(insert_position, new_section)
-        parsed_body['sections'] = sections
+        before = sections[insert_position] if insert_position < len(sections) else None
+        body_lines = content.strip().split('\n') if content and content.strip() else []
+        document.add_section(f'## {section_name}', body_lines, before=before)
         
-        # Reconstruct and update body
-        new_body = self._reconstruct_body(parsed_body)
-        update_result = self.set_body_command.execute(repo, issue_number, new_body)
+        update_result = self.set_body_command.execute(repo, issue_number, document.text)
         
         return {
             'issue_number': issue.number,
@@ -4777,7 +7134,7 @@ class CreateSectionCommand(TodoCommand):
             'position': position,
             'relative_to': relative_to,
             'insert_position': insert_position,
-            'total_sections': len(sections),
+            'total_sections': len(sections) + 1,
             'url': issue.html_url
         }
     
@@ -4900,37 +7257,34 @@ class UpdateSectionCommand(TodoCommand):
         if clear:
             content = ""
         
-        # Get issue and parsed body
-        issue_data = self._get_issue_and_parsed_body(repo, issue_number)
+        # Get issue and body document
+        issue_data = self._get_issue_and_document(repo, issue_number)
         issue = issue_data['issue']
-        parsed_body = issue_data['parsed_body']
+        document = issue_data['document']
         
         # Find target section
-        section = self._find_section(parsed_body, section_name)
+        section = document.find_section(section_name)
         if section is None:
-            available_sections = [s.title for s in parsed_body.get('sections', [])]
+            available_sections = document.section_titles()
             sections_list = ', '.join(f'"{s}"' for s in available_sections)
             if available_sections:
                 raise ValueError(f'Section "{section_name}" not found. Available sections: {sections_list}')
             else:
                 raise ValueError('No sections found in issue')
         
-        # Store original todos if preserving
-        original_todos = section.todos.copy() if preserve_todos else []
-        
         # Update section content based on mode
-        new_content = self._apply_content_update(section.body, content, mode)
-        
-        # Update section
-        section.body = new_content
+        original_todos = list(section.todos)
+        new_content = self._apply_content_update(document.section_body(section), content, mode)
+        body_lines = new_content.strip().split('\n') if new_content.strip() else []
         if preserve_todos:
-            section.todos = original_todos
-        else:
-            section.todos = []
+            body_lines = self._preserve_todos(body_lines, original_todos)
+        
+        # Rewrite only the section's text; the rest of the body is unchanged
+        document.set_section_body(section, body_lines)
+        update_result = self.set_body_command.execute(repo, issue_number, document.text)
         
-        # Reconstruct and update body
-        new_body = self._reconstruct_body(parsed_body)
-        update_result = self.set_body_command.execute(repo, issue_number, new_body)
+        kept = {todo.text.lower() for todo in section.todos}
+        removed = [todo for todo in original_todos if todo.text.lower() not in kept]
         
         return {
             'issue_number': issue.number,
@@ -4939,12 +7293,44 @@ class UpdateSectionCommand(TodoCommand):
             'mode': mode,
             'content_length': len(content or ''),
             'content_file': content_file,
-            'todos_preserved': len(original_todos),
-            'todos_removed': len(section.todos) - len(original_todos) if not preserve_todos else 0,
+            'todos_preserved': len(original_todos) if preserve_todos else 0,
+            'todos_removed': len(removed) if not preserve_todos else 0,
             'cleared': clear,
             'url': issue.html_url
         }
     
+    @staticmethod
+    def _preserve_todos(body_lines: List[str], todos: List['TodoNode']) -> List[str]:
+        """Keep a section's todos in its new text.
+
+        Todos the new text repeats keep their checkbox state; the others are
+        appended after it.
+
+        Args:
+            body_lines: New lines of the section
+            todos: The section's todos before the update
+
+        Returns:
+            Lines of the section with its todos
+        """
+        if not todos:
+            return body_lines
+        states = {todo.text.lower(): todo.checked for todo in todos}
+        lines = []
+        for line in body_lines:
+            match = IssueParser._TODO_PATTERN.match(line.strip())
+            if match and match.group(2).strip().lower() in states:
+                text = match.group(2).strip()
+                checked = states.pop(text.lower())
+                indent = line[:len(line) - len(line.lstrip())]
+                line = f"{indent}- [{'x' if checked else ' '}] {text}"
+            lines.append(line)
+        missing = [todo for todo in todos if todo.text.lower() in states]
+        if missing and lines:
+            lines.append('')
+        lines.extend(f"- [{'x' if todo.checked else ' '}] {todo.text}" for todo in missing)
+        return lines
+    
     def _apply_content_update(self, original_content: str, new_content: str, mode: str) -> str:
         """Apply content update based on the specified mode.
         
@@ -5011,43 +7397,28 @@ class CreateConditionCommand(TodoCommand):
         
         condition_text = condition_text.strip()
         
-        # Get issue and parsed body
-        issue_data = self._get_issue_and_parsed_body(repo, issue_number)
+        # Get issue and body document
+        issue_data = self._get_issue_and_document(repo, issue_number)
         issue = issue_data['issue']
-        parsed_body = issue_data['parsed_body']
+        document = issue_data['document']
         
         # Check if condition already exists (check condition sections)
-        existing_sections = parsed_body.get('sections', [])
         condition_title = f"CONDITION: {condition_text}"
-        for section in existing_sections:
+        for section in document.sections:
             if section.title.lower() == condition_title.lower():
                 raise ValueError(f'Condition "{condition_text}" already exists')
         
-        # Create new condition section
-        from .models import Section
+        # Insert the condition block before the log; the rest of the body is unchanged
         condition_body_lines = [
             "- [ ] VERIFIED",
             "- **Signed-off by:** _Not yet verified_",
             f"- **Requirements:** {requirements or '_No requirements specified_'}",
             "- **Evidence:** _Not yet provided_"
         ]
-        condition_body = '\n'.join(condition_body_lines)
-        
-        new_condition_section = Section(
-            title=condition_title,
-            body=condition_body,
-            todos=[]  # Conditions don't use todos
-        )
-        
-        # Add condition section to sections list
-        updated_sections = existing_sections + [new_condition_section]
-        parsed_body['sections'] = updated_sections
-        
-        # Reconstruct body using the standard method
-        new_body = self._reconstruct_body(parsed_body)
+        document.add_section(f"### {condition_title}", condition_body_lines, kind='condition')
         
         # Update issue body
-        self.set_body_command.execute(repo, issue_number, new_body)
+        self.set_body_command.execute(repo, issue_number, document.text)
         
         return {
             'issue_number': issue.number,
@@ -5089,43 +7460,20 @@ class UpdateConditionCommand(TodoCommand):
         
         new_requirements = new_requirements.strip()
         
-        # Get issue and parse body
-        github_repo = self.github.github.get_repo(repo)
-        issue = github_repo.get_issue(issue_number)
-        parsed_body = IssueParser.parse_body(issue.body)
+        # Get issue and body document
+        issue_data = self._get_issue_and_document(repo, issue_number)
+        issue = issue_data['issue']
+        document = issue_data['document']
         
         # Find the condition section
-        condition_title = f"CONDITION: {condition_match}"
-        target_section = None
-        old_requirements = None
-        
-        for section in parsed_body['sections']:
-            if (section.title.startswith("CONDITION: ") and 
-                condition_match.lower() in section.title.lower()):
-                target_section = section
-                break
-        
-        if not target_section:
-            raise ValueError(f"No condition found matching '{condition_match}'")
-        
-        # Parse current requirements from section body
-        lines = target_section.body.split('\n')
-        updated_lines = []
-        for line in lines:
-            if line.strip().startswith('- **Requirements:**'):
-                old_requirements = line.split('- **Requirements:**')[1].strip()
-                updated_lines.append(f'- **Requirements:** {new_requirements}')
-            else:
-                updated_lines.append(line)
-        
-        # Update section body
-        target_section.body = '\n'.join(updated_lines)
+        target_section = self._find_condition_section(document, condition_match)
         
-        # Reconstruct full body using base class method
-        new_body = self._reconstruct_body(parsed_body)
+        # Rewrite the requirements line only
+        old_requirements = document.field_value(target_section, 'requirements')
+        document.set_field(target_section, 'requirements', new_requirements)
         
         # Update issue body
-        issue.edit(body=new_body)
+        issue.edit(body=BodyIndex.refresh(document.text, issue.body, BodyIndex.enabled_for(self.github)))
         
         return {
             'issue_number': issue.number,
@@ -5167,45 +7515,24 @@ class CompleteConditionCommand(TodoCommand):
         
         evidence = evidence.strip()
         
-        # Get issue and parse body
-        github_repo = self.github.github.get_repo(repo)
-        issue = github_repo.get_issue(issue_number)
-        parsed_body = IssueParser.parse_body(issue.body)
+        # Get issue and body document
+        issue_data = self._get_issue_and_document(repo, issue_number)
+        issue = issue_data['issue']
+        document = issue_data['document']
         
         # Find the condition section
-        target_section = None
-        old_evidence = None
-        
-        for section in parsed_body['sections']:
-            if (section.title.startswith("CONDITION: ") and 
-                condition_match.lower() in section.title.lower()):
-                target_section = section
-                break
-        
-        if not target_section:
-            raise ValueError(f"No condition found matching '{condition_match}'")
-        
-        # Parse current evidence from section body
-        lines = target_section.body.split('\n')
-        updated_lines = []
-        for line in lines:
-            if line.strip().startswith('- **Evidence:**'):
-                evidence_text = line.split('- **Evidence:**')[1].strip()
-                # Only capture old evidence if it's not a placeholder
-                if evidence_text not in ['_Not yet provided_', '']:
-                    old_evidence = evidence_text
-                updated_lines.append(f'- **Evidence:** {evidence}')
-            else:
-                updated_lines.append(line)
+        target_section = self._find_condition_section(document, condition_match)
         
-        # Update section body
-        target_section.body = '\n'.join(updated_lines)
+        # Only capture old evidence if it's not a placeholder
+        old_evidence = document.field_value(target_section, 'evidence')
+        if old_evidence in ('_Not yet provided_', ''):
+            old_evidence = None
         
-        # Reconstruct full body using base class method
-        new_body = self._reconstruct_body(parsed_body)
+        # Rewrite the evidence line only
+        document.set_field(target_section, 'evidence', evidence)
         
         # Update issue body
-        issue.edit(body=new_body)
+        issue.edit(body=BodyIndex.refresh(document.text, issue.body, BodyIndex.enabled_for(self.github)))
         
         return {
             'issue_number': issue.number,
@@ -5241,67 +7568,35 @@ class VerifyConditionCommand(TodoCommand):
             GithubException: If issue not found or permission denied
             ValueError: If validation fails or condition not found
         """
-        # Get issue and parse body
-        github_repo = self.github.github.get_repo(repo)
-        issue = github_repo.get_issue(issue_number)
-        parsed_body = IssueParser.parse_body(issue.body)
+        # Get issue and body document
+        issue_data = self._get_issue_and_document(repo, issue_number)
+        issue = issue_data['issue']
+        document = issue_data['document']
         
         # Find the condition section
-        target_section = None
-        current_evidence = None
-        
-        for section in parsed_body['sections']:
-            if (section.title.startswith("CONDITION: ") and 
-                condition_match.lower() in section.title.lower()):
-                target_section = section
-                break
-        
-        if not target_section:
-            raise ValueError(f"No condition found matching '{condition_match}'")
-        
-        # Parse current evidence and check it exists
-        lines = target_section.body.split('\n')
-        for line in lines:
-            if line.strip().startswith('- **Evidence:**'):
-                evidence_text = line.split('- **Evidence:**')[1].strip()
-                if evidence_text not in ['_Not yet provided_', '']:
-                    current_evidence = evidence_text
-                    break
+        target_section = self._find_condition_section(document, condition_match)
         
         # Check that evidence exists
-        if not current_evidence:
+        current_evidence = document.field_value(target_section, 'evidence')
+        if current_evidence in (None, '_Not yet provided_', ''):
             raise ValueError(f'Cannot verify condition "{condition_match}": no evidence provided. Use complete-condition first.')
         
         # Determine sign-off user
         if not signed_off_by:
             try:
-                user = self.github.github.get_user()
-                signed_off_by = user.login
+                signed_off_by = self.github.get_authenticated_login()
+            except (MissingTokenError, InvalidTokenError):
+                raise
             except Exception:
                 signed_off_by = "unknown-user"
         
-        # Update section body to mark as verified
-        updated_lines = []
-        was_verified = False
-        for line in lines:
-            if line.strip().startswith('- [ ] VERIFIED'):
-                updated_lines.append('- [x] VERIFIED')
-            elif line.strip().startswith('- [x] VERIFIED'):
-                was_verified = True
-                updated_lines.append('- [x] VERIFIED')
-            elif line.strip().startswith('- **Signed-off by:**'):
-                updated_lines.append(f'- **Signed-off by:** {signed_off_by}')
-            else:
-                updated_lines.append(line)
-        
-        # Update section body
-        target_section.body = '\n'.join(updated_lines)
-        
-        # Reconstruct full body using base class method
-        new_body = self._reconstruct_body(parsed_body)
+        # Tick the VERIFIED checkbox and record the sign-off in place
+        was_verified = document.is_verified(target_section)
+        document.set_verified(target_section)
+        document.set_field(target_section, 'signed_off_by', signed_off_by)
         
         # Update issue body
-        issue.edit(body=new_body)
+        issue.edit(body=BodyIndex.refresh(document.text, issue.body, BodyIndex.enabled_for(self.github)))
         
         return {
             'issue_number': issue.number,
@@ -5333,13 +7628,15 @@ class GetConditionsCommand(ConditionCommand):
             GithubException: If issue not found or permission denied
             ValueError: If validation fails
         """
-        # Get issue and parsed body
-        issue_data = self._get_issue_and_parsed_body(repo, issue_number)
-        issue = issue_data['issue']
-        parsed_body = issue_data['parsed_body']
+        issue = self._get_issue(repo, issue_number)
         
-        # Get conditions
-        conditions = parsed_body.get('conditions', [])
+        # Decode the conditions from the ghoo:index if it's current,
+        # otherwise parse the body
+        index = BodyIndex.read(issue.body)
+        if index is not None:
+            conditions = index.conditions
+        else:
+            conditions = IssueParser.parse_body_cached(issue.body or "").get('conditions', [])
         
         # Format conditions for output
         conditions_data = []
@@ -5372,8 +7669,22 @@ class BaseWorkflowCommand(ABC):
     - Projects V2 field updates (when configured)
     - Audit trail comment creation
     - User extraction from GitHub token
+    
+    Where the issue's and labels' node IDs are known, the label swap, the
+    audit trail and closing the issue are applied with a single GraphQL
+    request; otherwise each is a separate REST request.
     """
     
+    # Whether the transition also closes the issue
+    closes_issue = False
+
+    # Transitions execute_bulk() runs at once; their requests share the
+    # client's rate-limit budget however many run
+    BULK_WORKERS = 8
+    
+    # Projects V2 field holding the workflow state with the status_field method
+    STATUS_FIELD_NAME = "Status"
+    
     def __init__(self, github_client: GitHubClient, config: Optional[Config] = None):
         """Initialize the command with GitHub client and optional configuration.
         
@@ -5399,91 +7710,231 @@ class BaseWorkflowCommand(ABC):
         """Validate that this transition is allowed for the given issue.
         
         Args:
-            issue_number: GitHub issue number
-            repo_owner: Repository owner
-            repo_name: Repository name
-            **kwargs: Additional arguments (subclasses may use specific parameters)
-            
-        Raises:
-            ValueError: If transition validation fails
+            issue_number: GitHub issue number
+            repo_owner: Repository owner
+            repo_name: Repository name
+            **kwargs: Additional arguments (subclasses may use specific parameters)
+            
+        Raises:
+            ValueError: If transition validation fails
+        """
+        pass
+    
+    def execute_transition(self, repo: str, issue_number: int, message: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """Execute the workflow state transition.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            issue_number: GitHub issue number
+            message: Optional message to include in audit trail
+            **kwargs: Additional arguments to pass to validate_transition (e.g., force_unclean_git)
+            
+        Returns:
+            Dict with transition result information
+            
+        Raises:
+            ValueError: If repository format is invalid or transition fails
+        """
+        self._validate_repository_format(repo)
+        repo_owner, repo_name = repo.split('/')
+        
+        # Validate the transition - pass any additional kwargs
+        self.validate_transition(issue_number, repo_owner, repo_name, **kwargs)
+        
+        return self._apply_transition(repo, issue_number, message)
+    
+    def _apply_transition(self, repo: str, issue_number: int, message: Optional[str] = None) -> Dict[str, Any]:
+        """Apply an already validated transition.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            issue_number: GitHub issue number
+            message: Optional message to include in audit trail
+            
+        Returns:
+            Dict with transition result information
+        """
+        # Get the issue
+        repo_obj = self.github.github.get_repo(repo)
+        issue = repo_obj.get_issue(issue_number)
+        
+        old_status = self._get_current_status(issue)
+        user = self._get_authenticated_user()
+        
+        # Determine audit method from configuration (default to log_entries)
+        audit_method = "log_entries"
+        if self.config and hasattr(self.config, 'audit_method'):
+            audit_method = self.config.audit_method
+        
+        # Apply the label swap, audit trail and close with one GraphQL
+        # request where possible, otherwise with separate REST requests
+        actual_audit_method = self._apply_transition_graphql(repo, issue, old_status, user, message, audit_method)
+        if actual_audit_method is None:
+            actual_audit_method = self._apply_transition_rest(repo, issue, old_status, user, message, audit_method)
+        self._sync_status_field(repo, issue, self.get_to_state())
+        
+        result = {
+            'success': True,
+            'repository': repo,
+            'issue_number': issue_number,
+            'issue_title': issue.title,
+            'from_state': old_status,
+            'to_state': self.get_to_state(),
+            'user': user,
+            'message': message,
+            'url': issue.html_url,
+            'audit_method': actual_audit_method
+        }
+        if self.closes_issue:
+            result['issue_closed'] = True
+        return result
+    
+    def execute_bulk(self, repo: str, issue_numbers: Iterable[int], message: Optional[str] = None,
+                     workers: Optional[int] = None, **kwargs) -> List[Dict[str, Any]]:
+        """Execute the transition for many issues concurrently.
+        
+        Each issue is validated and transitioned on its own, so one issue
+        failing doesn't stop the others. Requests from all workers are paced
+        by the client's shared rate-limit scheduler.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            issue_numbers: Issue numbers to transition (duplicates run once)
+            message: Optional message to include in every audit trail
+            workers: Number of transitions run at once (defaults to BULK_WORKERS)
+            **kwargs: Additional arguments to pass to validate_transition
+        
+        Returns:
+            One result per issue in the given order. Successful transitions
+            return the dict of execute_transition(); failed ones return
+            'success': False, 'issue_number' and 'error'.
+        
+        Raises:
+            ValueError: If repository format is invalid
+            MissingTokenError, InvalidTokenError: If GitHub rejects the token
+        """
+        self._validate_repository_format(repo)
+        numbers = list(dict.fromkeys(int(number) for number in issue_numbers))
+        if not numbers:
+            return []
+        
+        self._warm_caches(repo, numbers)
+        return self._run_concurrently(
+            repo, numbers, lambda number: self.execute_transition(repo, number, message, **kwargs), workers
+        )
+    
+    def _warm_caches(self, repo: str, numbers: List[int]) -> None:
+        """Fill the caches every transition reads before concurrent transitions start.
+        
+        With the status_field method, the project items of all issues are
+        resolved here in batches rather than one query per issue.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            numbers: Issue numbers about to be transitioned
         """
-        pass
+        self._get_authenticated_user()
+        try:
+            self.github.get_label_ids(repo, [f"status:{self.get_to_state()}"])
+        except Exception:
+            pass
+        if self.config and self.config.status_method == "status_field":
+            try:
+                self.github.get_project_item_ids(self.config.project_url, repo, numbers)
+            except Exception:
+                pass
     
-    def execute_transition(self, repo: str, issue_number: int, message: Optional[str] = None, **kwargs) -> Dict[str, Any]:
-        """Execute the workflow state transition.
+    def _run_concurrently(self, repo: str, numbers: List[int], transition: Callable[[int], Dict[str, Any]],
+                          workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Run a transition for several issues in a thread pool.
         
         Args:
             repo: Repository in format 'owner/repo'
-            issue_number: GitHub issue number
-            message: Optional message to include in audit trail
-            **kwargs: Additional arguments to pass to validate_transition (e.g., force_unclean_git)
+            numbers: Issue numbers to transition
+            transition: Callable transitioning one issue and returning its result
+            workers: Number of transitions run at once (defaults to BULK_WORKERS)
             
         Returns:
-            Dict with transition result information
+            One result per issue in the given order; failures are reported as
+            results with 'success': False and 'error'
             
         Raises:
-            ValueError: If repository format is invalid or transition fails
+            MissingTokenError, InvalidTokenError: If GitHub rejects the token
         """
-        self._validate_repository_format(repo)
-        repo_owner, repo_name = repo.split('/')
-        
-        # Validate the transition - pass any additional kwargs
-        self.validate_transition(issue_number, repo_owner, repo_name, **kwargs)
-        
-        # Get the issue
-        repo_obj = self.github.github.get_repo(f"{repo_owner}/{repo_name}")
-        issue = repo_obj.get_issue(issue_number)
-        
-        # Update status (labels or Projects V2)
-        old_status = self._get_current_status(issue)
-        self._update_status(issue, self.get_to_state())
-        
-        # Create audit trail (log entry or comment based on configuration)
-        user = self._get_authenticated_user()
-        
-        # Determine audit method from configuration (default to log_entries)
-        audit_method = "log_entries"
-        if self.config and hasattr(self.config, 'audit_method'):
-            audit_method = self.config.audit_method
-        
-        audit_success = False
-        actual_audit_method = audit_method  # Track what was actually used
-        if audit_method == "log_entries":
-            # Try log entry first
+        def run(issue_number: int) -> Dict[str, Any]:
             try:
-                self.github.append_log_entry(
-                    repo=repo,
-                    issue_number=issue_number,
-                    to_state=self.get_to_state(),
-                    author=user,
-                    message=message,
-                    from_state=old_status
-                )
-                audit_success = True
+                return transition(issue_number)
+            except (MissingTokenError, InvalidTokenError):
+                raise
             except Exception as e:
-                # Fallback to comment if log entry fails
-                print(f"Warning: Failed to append log entry, falling back to comment: {e}")
-                self._create_audit_comment(issue, old_status, self.get_to_state(), user, message)
-                actual_audit_method = "comments"  # Record that we fell back to comments
-                audit_success = True
-        else:
-            # Use comments directly when configured
-            self._create_audit_comment(issue, old_status, self.get_to_state(), user, message)
-            audit_success = True
+                return self._failed_result(repo, issue_number, str(e))
         
+        with ThreadPoolExecutor(max_workers=min(workers or self.BULK_WORKERS, len(numbers))) as executor:
+            return list(executor.map(run, numbers))
+    
+    def _failed_result(self, repo: str, issue_number: int, error: str) -> Dict[str, Any]:
+        """Return the result of a transition that was not applied."""
         return {
-            'success': True,
+            'success': False,
             'repository': repo,
             'issue_number': issue_number,
-            'issue_title': issue.title,
-            'from_state': old_status,
             'to_state': self.get_to_state(),
-            'user': user,
-            'message': message,
-            'url': issue.html_url,
-            'audit_method': actual_audit_method
+            'error': error
         }
     
+    def select_issues(self, repo: str, parent: Optional[int] = None, labels: Optional[List[str]] = None,
+                      status: Optional[str] = None) -> List[int]:
+        """Select the open issues a bulk transition applies to.
+        
+        With a parent, the candidates are its sub-issues at any depth in the
+        same repository (e.g. every sub-task of an epic); otherwise they are
+        the repository's open issues. Candidates must carry all given labels
+        and be in the given workflow state.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            parent: Issue whose sub-issue tree to select from
+            labels: Labels every selected issue must carry
+            status: Workflow state to select (defaults to get_from_state())
+        
+        Returns:
+            Numbers of the selected issues
+        
+        Raises:
+            ValueError: If neither a parent nor a label is given
+            GraphQLError: If the sub-issue tree cannot be fetched
+        """
+        self._validate_repository_format(repo)
+        status = status or self.get_from_state()
+        labels = list(labels or [])
+        
+        if parent is not None:
+            candidates = (
+                (node['number'], [label['name'] for label in node['labels']['nodes']])
+                for node in self.github.iter_sub_issue_tree(repo, parent)
+                if node.get('state') == 'OPEN'
+                and node['repository']['nameWithOwner'].lower() == repo.lower()
+            )
+        elif labels:
+            # Let GitHub filter by the status label too, except for the
+            # backlog state, which issues without a status label are in
+            query_labels = labels + ([f"status:{status}"] if status != 'backlog' else [])
+            github_repo = self.github.github.get_repo(repo)
+            candidates = (
+                (issue.number, [label.name for label in issue.labels])
+                for issue in github_repo.get_issues(state='open', labels=query_labels)
+                if issue.pull_request is None
+            )
+        else:
+            raise ValueError("Select issues with a parent issue or at least one label")
+        
+        selected = []
+        for number, names in candidates:
+            current_status = next((name[7:] for name in names if name.startswith('status:')), 'backlog')
+            if current_status == status and all(label in names for label in labels):
+                selected.append(number)
+        return selected
+    
     def _validate_repository_format(self, repo: str) -> None:
         """Validate repository format is 'owner/repo'.
         
@@ -5513,8 +7964,132 @@ class BaseWorkflowCommand(ABC):
         # Default to 'backlog' if no status label found
         return 'backlog'
     
+    def _apply_transition_graphql(self, repo: str, issue, old_status: str, user: str,
+                                  message: Optional[str], audit_method: str) -> Optional[str]:
+        """Apply a transition's label swap, audit trail and close in one GraphQL request.
+        
+        Changes that GitHub rejects individually are retried through REST, so
+        once the request was sent the transition is complete.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            issue: GitHub issue object
+            old_status: Current workflow status
+            user: GitHub user making the transition
+            message: Optional message to include in the audit trail
+            audit_method: Configured audit method ('log_entries' or 'comments')
+            
+        Returns:
+            The audit method used, or None if nothing was changed because the
+            issue's or the status label's node ID is unknown
+        """
+        to_state = self.get_to_state()
+        new_label = f"status:{to_state}"
+        if not isinstance(getattr(issue, 'node_id', None), str):
+            return None
+        
+        # Labels that don't exist yet are created by the REST path
+        try:
+            label_ids = self.github.get_label_ids(repo, [new_label])
+        except GraphQLError:
+            return None
+        if new_label not in label_ids:
+            return None
+        remove_label_ids = [
+            label.node_id for label in issue.labels
+            if label.name.startswith('status:') and label.name != new_label
+        ]
+        
+        body = None
+        comment = None
+        actual_audit_method = audit_method
+        if audit_method == "log_entries":
+            try:
+                body = self.github.build_log_entry_body(issue, to_state, user, message, from_state=old_status)
+            except Exception as e:
+                print(f"Warning: Failed to append log entry, falling back to comment: {e}", file=sys.stderr)
+                actual_audit_method = "comments"
+        if actual_audit_method != "log_entries":
+            comment = self._format_audit_comment(old_status, to_state, user, message)
+        
+        try:
+            results = self.github.apply_issue_mutations(
+                repo, issue,
+                remove_label_ids=remove_label_ids,
+                add_label_ids=[label_ids[new_label]],
+                body=body,
+                comment=comment,
+                close=self.closes_issue
+            )
+        except GraphQLError as e:
+            print(f"Warning: GraphQL transition failed, retrying with REST: {e}", file=sys.stderr)
+            results = {}
+        
+        def failed(key: str) -> bool:
+            return not results.get(key, {}).get('success')
+        
+        if failed('add_labels') or (remove_label_ids and failed('remove_labels')):
+            self._update_status(issue, to_state)
+        if body is not None and failed('body'):
+            try:
+                issue.edit(body=body)
+            except Exception as e:
+                print(f"Warning: Failed to append log entry, falling back to comment: {e}", file=sys.stderr)
+                comment = self._format_audit_comment(old_status, to_state, user, message)
+                actual_audit_method = "comments"
+                issue.create_comment(comment)
+        elif comment is not None and failed('comment'):
+            issue.create_comment(comment)
+        if self.closes_issue and failed('close'):
+            issue.edit(state="closed")
+        
+        return actual_audit_method
+    
+    def _apply_transition_rest(self, repo: str, issue, old_status: str, user: str,
+                               message: Optional[str], audit_method: str) -> str:
+        """Apply a transition's label swap, audit trail and close with REST requests.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            issue: GitHub issue object
+            old_status: Current workflow status
+            user: GitHub user making the transition
+            message: Optional message to include in the audit trail
+            audit_method: Configured audit method ('log_entries' or 'comments')
+            
+        Returns:
+            The audit method used
+        """
+        self._update_status(issue, self.get_to_state())
+        
+        actual_audit_method = audit_method  # Track what was actually used
+        if audit_method == "log_entries":
+            # Try log entry first
+            try:
+                self.github.append_log_entry(
+                    repo=repo,
+                    issue_number=issue.number,
+                    to_state=self.get_to_state(),
+                    author=user,
+                    message=message,
+                    from_state=old_status
+                )
+            except Exception as e:
+                # Fallback to comment if log entry fails
+                print(f"Warning: Failed to append log entry, falling back to comment: {e}", file=sys.stderr)
+                self._create_audit_comment(issue, old_status, self.get_to_state(), user, message)
+                actual_audit_method = "comments"  # Record that we fell back to comments
+        else:
+            # Use comments directly when configured
+            self._create_audit_comment(issue, old_status, self.get_to_state(), user, message)
+        
+        if self.closes_issue:
+            issue.edit(state="closed")
+        
+        return actual_audit_method
+    
     def _update_status(self, issue, new_status: str) -> None:
-        """Update the status of an issue.
+        """Replace the status label of an issue with a REST request.
         
         Args:
             issue: GitHub issue object
@@ -5532,26 +8107,47 @@ class BaseWorkflowCommand(ABC):
         
         # Update issue labels
         issue.edit(labels=current_labels)
+    
+    def _sync_status_field(self, repo: str, issue, new_status: str) -> None:
+        """Update the Projects V2 status field too when it is configured.
         
-        # If using Projects V2, also update the field
+        Args:
+            repo: Repository in format 'owner/repo'
+            issue: GitHub issue object
+            new_status: New status value (without 'status:' prefix)
+        """
         if self.config and self.config.status_method == "status_field":
             try:
-                self._update_projects_v2_status(issue, new_status)
+                self._update_projects_v2_status(repo, issue, new_status)
             except Exception as e:
                 # Fallback to labels method if Projects V2 fails
-                print(f"Warning: Could not update Projects V2 status field: {e}")
+                print(f"Warning: Could not update Projects V2 status field: {e}", file=sys.stderr)
     
-    def _update_projects_v2_status(self, issue, new_status: str) -> None:
+    def _update_projects_v2_status(self, repo: str, issue, new_status: str) -> None:
         """Update Projects V2 status field for an issue.
         
+        The option is looked up in the status_field_options config (see
+        DEFAULT_STATUS_FIELD_OPTIONS); states mapped to None leave the field
+        alone. The project's fields and the issue's item ID are cached, so
+        this is usually a single mutation.
+        
         Args:
+            repo: Repository in format 'owner/repo'
             issue: GitHub issue object
             new_status: New status value
-        """
-        # This would use GraphQL to update Projects V2 field
-        # Implementation would go here when needed
-        # For now, we'll rely on labels as the primary method
-        pass
+            
+        Raises:
+            ValueError: If project_url is not a project board URL
+            GraphQLError: If the issue is not in the project or the update fails
+        """
+        if not ConfigLoader.PROJECT_URL_PATTERN.match(self.config.project_url):
+            raise ValueError("status_method 'status_field' requires project_url to be a project board URL")
+        option = self.config.status_field_option(new_status)
+        if option is None:
+            return
+        self.github.update_project_field(
+            self.config.project_url, repo, issue.number, self.STATUS_FIELD_NAME, option
+        )
     
     def _create_audit_comment(self, issue, from_state: str, to_state: str, user: str, message: Optional[str]) -> None:
         """Create an audit trail comment for the state transition.
@@ -5563,23 +8159,38 @@ class BaseWorkflowCommand(ABC):
             user: GitHub user who made the transition
             message: Optional message to include
         """
+        issue.create_comment(self._format_audit_comment(from_state, to_state, user, message))
+    
+    def _format_audit_comment(self, from_state: str, to_state: str, user: str, message: Optional[str]) -> str:
+        """Return the body of an audit trail comment for the state transition.
+        
+        Args:
+            from_state: Previous workflow state
+            to_state: New workflow state
+            user: GitHub user who made the transition
+            message: Optional message to include
+        """
         comment_body = f"**Workflow Transition**: `{from_state}` → `{to_state}`\n"
         comment_body += f"**Changed by**: @{user}\n"
         
         if message:
             comment_body += f"**Message**: {message}\n"
         
-        issue.create_comment(comment_body)
+        return comment_body
     
     def _get_authenticated_user(self) -> str:
         """Get the login of the authenticated GitHub user.
         
         Returns:
             GitHub user login
+            
+        Raises:
+            MissingTokenError, InvalidTokenError: If GitHub rejects the token
         """
         try:
-            user = self.github.github.get_user()
-            return user.login
+            return self.github.get_authenticated_login()
+        except (MissingTokenError, InvalidTokenError):
+            raise
         except Exception:
             return "unknown-user"
 
@@ -5671,33 +8282,20 @@ class SubmitPlanCommand(BaseWorkflowCommand):
                 )
             if issue_type and issue_type in self.config.required_sections:
                 required_sections = self.config.required_sections[issue_type]
-                parser = IssueParser()
-                parsed_data = parser.parse_body(issue.body)
-                sections = parsed_data.get('sections', [])
-                conditions = parsed_data.get('conditions', [])
-                
-                # Check for open todos  
-                has_open_todos = any(
-                    any(not todo.checked for todo in section.todos)
-                    for section in sections
-                )
-                
-                # Check for unverified conditions (not required for plan submission, just for awareness)
-                has_open_conditions = any(not condition.verified for condition in conditions)
                 
-                # Create a simple object to hold parsed data
-                parsed = type('ParsedIssue', (), {
-                    'sections': sections,
-                    'has_open_todos': has_open_todos,
-                    'conditions': conditions,
-                    'has_open_conditions': has_open_conditions
-                })()
+                # A current ghoo:index lists the section titles without a parse
+                index = BodyIndex.read(issue.body)
+                if index is not None:
+                    section_titles = index.section_titles
+                else:
+                    parsed_data = IssueParser.parse_body_cached(issue.body)
+                    section_titles = [section.title for section in parsed_data.get('sections', [])]
                 
                 missing_sections = []
                 for section_name in required_sections:
                     section_found = any(
-                        section.title.lower() == section_name.lower() 
-                        for section in parsed.sections
+                        title.lower() == section_name.lower()
+                        for title in section_titles
                     )
                     if not section_found:
                         missing_sections.append(section_name)
@@ -5855,6 +8453,38 @@ class SubmitWorkCommand(BaseWorkflowCommand):
             # If git is not available or command fails, allow operation to proceed
             return True, []
     
+    def _require_clean_git(self) -> None:
+        """Fail unless the git working directory is clean.
+        
+        Raises:
+            ValueError: If the working directory has uncommitted changes
+        """
+        is_clean, changes = self.check_git_status()
+        if not is_clean:
+            change_summary = '\n'.join(f'  {change}' for change in changes[:10])  # Show first 10 changes
+            if len(changes) > 10:
+                change_summary += f'\n  ... and {len(changes) - 10} more changes'
+            
+            raise ValueError(
+                f"Cannot submit work: git working directory has uncommitted changes:\n"
+                f"{change_summary}\n\n"
+                f"Please commit or stash your changes first, or use --force-submit-with-unclean-git to override."
+            )
+    
+    def execute_bulk(self, repo: str, issue_numbers: Iterable[int], message: Optional[str] = None,
+                     workers: Optional[int] = None, force_unclean_git: bool = False) -> List[Dict[str, Any]]:
+        """Execute the transition for many issues concurrently.
+        
+        The git working directory is checked once for all issues rather
+        than once per issue.
+        
+        Raises:
+            ValueError: If the working directory has uncommitted changes
+        """
+        if not force_unclean_git:
+            self._require_clean_git()
+        return super().execute_bulk(repo, issue_numbers, message, workers, force_unclean_git=True)
+    
     def validate_transition(self, issue_number: int, repo_owner: str, repo_name: str, force_unclean_git: bool = False) -> None:
         """Validate that this transition is allowed for the given issue.
         
@@ -5869,17 +8499,7 @@ class SubmitWorkCommand(BaseWorkflowCommand):
         """
         # Check git status first (unless forced to skip)
         if not force_unclean_git:
-            is_clean, changes = self.check_git_status()
-            if not is_clean:
-                change_summary = '\n'.join(f'  {change}' for change in changes[:10])  # Show first 10 changes
-                if len(changes) > 10:
-                    change_summary += f'\n  ... and {len(changes) - 10} more changes'
-                
-                raise ValueError(
-                    f"Cannot submit work: git working directory has uncommitted changes:\n"
-                    f"{change_summary}\n\n"
-                    f"Please commit or stash your changes first, or use --force-submit-with-unclean-git to override."
-                )
+            self._require_clean_git()
         
         # Get the issue to check current state
         repo = self.github.github.get_repo(f"{repo_owner}/{repo_name}")
@@ -5898,6 +8518,8 @@ class SubmitWorkCommand(BaseWorkflowCommand):
 class ApproveWorkCommand(BaseWorkflowCommand):
     """Command for transitioning issues from awaiting-completion-approval to closed state."""
     
+    closes_issue = True
+    
     def get_from_state(self) -> str:
         """Return the expected current workflow state for this transition."""
         return "awaiting-completion-approval"
@@ -5944,66 +8566,183 @@ class ApproveWorkCommand(BaseWorkflowCommand):
         Raises:
             ValueError: If completion requirements are not met
         """
+        unchecked_todos, unverified_conditions = self._find_open_items(issue.body)
         
-        # Parse issue body to check for unchecked todos and unverified conditions
-        parser = IssueParser()
-        parsed_data = parser.parse_body(issue.body)
-        sections = parsed_data.get('sections', [])
-        conditions = parsed_data.get('conditions', [])
-        
-        # Check for open todos  
-        has_open_todos = any(
-            any(not todo.checked for todo in section.todos)
-            for section in sections
-        )
+        # Check for unchecked todos
+        if unchecked_todos:
+            todos_str = "\n  - " + "\n  - ".join(unchecked_todos[:5])  # Show first 5
+            if len(unchecked_todos) > 5:
+                todos_str += f"\n  - ... and {len(unchecked_todos) - 5} more"
+            raise ValueError(
+                f"Cannot approve work: issue has unchecked todos that must be completed first:{todos_str}\n\n"
+                f"Use 'ghoo check-todo --issue-id {issue.number} --section <section> --match <text>' to mark todos as completed."
+            )
         
         # Check for unverified conditions
-        has_open_conditions = any(not condition.verified for condition in conditions)
+        if unverified_conditions:
+            conditions_str = "\n  - " + "\n  - ".join(unverified_conditions[:5])  # Show first 5
+            if len(unverified_conditions) > 5:
+                conditions_str += f"\n  - ... and {len(unverified_conditions) - 5} more"
+            raise ValueError(
+                f"Cannot approve work: issue has unverified conditions that must be verified first:{conditions_str}\n\n"
+                f"Use 'ghoo complete-condition {issue.number} <condition_match> <evidence>' to add evidence, then "
+                f"'ghoo verify-condition {issue.number} <condition_match>' to verify."
+            )
         
-        # Create a simple object to hold parsed data
-        parsed = type('ParsedIssue', (), {
-            'sections': sections,
-            'has_open_todos': has_open_todos,
-            'conditions': conditions,
-            'has_open_conditions': has_open_conditions
-        })()
+        # Check for open sub-issues
+        self._validate_open_sub_issues(issue)
+    
+    def _find_open_items(self, body: Optional[str]) -> Tuple[List[str], List[str]]:
+        """Find the unchecked todos and unverified conditions of an issue body.
         
-        # Check for unchecked todos
-        if parsed.has_open_todos:
-            unchecked_todos = []
-            for section in parsed.sections:
-                for todo in section.todos:
-                    if not todo.checked:
-                        unchecked_todos.append(f"[{section.title}] {todo.text}")
+        Args:
+            body: Issue body
             
-            if unchecked_todos:
-                todos_str = "\n  - " + "\n  - ".join(unchecked_todos[:5])  # Show first 5
-                if len(unchecked_todos) > 5:
-                    todos_str += f"\n  - ... and {len(unchecked_todos) - 5} more"
-                raise ValueError(
-                    f"Cannot approve work: issue has unchecked todos that must be completed first:{todos_str}\n\n"
-                    f"Use 'ghoo check-todo --issue-id {issue.number} --section <section> --match <text>' to mark todos as completed."
-                )
+        Returns:
+            Tuple of (unchecked todos as "[Section] text",
+            unverified conditions as quoted text)
+        """
+        # A current ghoo:index shows that nothing is open without a parse
+        index = BodyIndex.read(body)
+        if index is not None and not index.has_open_todos and not index.has_open_conditions:
+            return [], []
+        
+        parsed_data = IssueParser.parse_body_cached(body)
+        unchecked_todos = [
+            f"[{section.title}] {todo.text}"
+            for section in parsed_data.get('sections', [])
+            for todo in section.todos
+            if not todo.checked
+        ]
+        unverified_conditions = [
+            f'"{condition.text}"'
+            for condition in parsed_data.get('conditions', [])
+            if not condition.verified
+        ]
+        return unchecked_todos, unverified_conditions
+    
+    # Selection for the nodes of the tree approved by execute_recursive()
+    _TREE_FIELDS = """
+        id
+        number
+        title
+        state
+        body
+        repository { nameWithOwner }
+        labels(first: 100) {
+            nodes { name }
+            pageInfo { hasNextPage endCursor }
+        }
+    """
+    
+    def execute_recursive(self, repo: str, issue_number: int, message: Optional[str] = None,
+                          workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Approve an issue together with all of its open sub-issues at any depth.
         
-        # Check for unverified conditions
-        if parsed.has_open_conditions:
-            unverified_conditions = []
-            for condition in parsed.conditions:
-                if not condition.verified:
-                    unverified_conditions.append(f'"{condition.text}"')
-            
-            if unverified_conditions:
-                conditions_str = "\n  - " + "\n  - ".join(unverified_conditions[:5])  # Show first 5
-                if len(unverified_conditions) > 5:
-                    conditions_str += f"\n  - ... and {len(unverified_conditions) - 5} more"
-                raise ValueError(
-                    f"Cannot approve work: issue has unverified conditions that must be verified first:{conditions_str}\n\n"
-                    f"Use 'ghoo complete-condition {issue.number} <condition_match> <evidence>' to add evidence, then "
-                    f"'ghoo verify-condition {issue.number} <condition_match>' to verify."
+        The tree is fetched once. Every open issue in it is validated locally
+        from the fetched labels and body, and all blockers are reported
+        together before anything is changed. The issues are then closed
+        bottom-up, one level at a time, with the issues of a level closed
+        concurrently. An issue is skipped when one of its sub-issues failed
+        to close.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            issue_number: Number of the root issue (e.g. an epic)
+            message: Optional message to include in every audit trail
+            workers: Number of transitions run at once (defaults to BULK_WORKERS)
+            
+        Returns:
+            One result per approved issue, deepest issues first; failures are
+            reported as results with 'success': False and 'error'
+            
+        Raises:
+            ValueError: If the root issue is closed or any issue is blocked
+            GraphQLError: If the tree cannot be fetched
+            MissingTokenError, InvalidTokenError: If GitHub rejects the token
+        """
+        self._validate_repository_format(repo)
+        root = self.github.github.get_repo(repo).get_issue(issue_number)
+        if root.state != "open":
+            raise ValueError(f"Cannot approve work: issue #{issue_number} is {root.state}")
+        
+        # Open issues of the tree in this repository, keyed by number
+        nodes = {issue_number: {
+            'title': root.title,
+            'body': root.body,
+            'labels': [label.name for label in root.labels],
+            'parent': None,
+            'depth': 0,
+        }}
+        # Nearest issue in nodes at or above every tree node, by node ID, so
+        # closed and other-repository issues are attributed to an open issue
+        # of this repository. The root's node ID is the only parent that isn't
+        # in here
+        anchors: Dict[str, int] = {}
+        blockers: Dict[int, List[str]] = {}
+        for node in self.github.iter_sub_issue_tree(repo, issue_number, fields=self._TREE_FIELDS):
+            parent_number = anchors.get(node['parent'], issue_number)
+            anchors[node['id']] = parent_number
+            if node.get('state') != 'OPEN':
+                continue
+            node_repo = node['repository']['nameWithOwner']
+            if node_repo.lower() != repo.lower():
+                # Issues of other repositories are approved there
+                blockers.setdefault(parent_number, []).append(
+                    f"open sub-issue {node_repo}#{node['number']} is in another repository"
                 )
+                continue
+            anchors[node['id']] = node['number']
+            nodes[node['number']] = {
+                'title': node['title'],
+                'body': node['body'],
+                'labels': [label['name'] for label in node['labels']['nodes']],
+                'parent': parent_number,
+                'depth': node['depth'],
+            }
         
-        # Check for open sub-issues
-        self._validate_open_sub_issues(issue)
+        for number, node in nodes.items():
+            reasons = blockers.setdefault(number, [])
+            current_status = next((name[7:] for name in node['labels'] if name.startswith('status:')), 'backlog')
+            if current_status != self.get_from_state():
+                reasons.insert(0, f"is in '{current_status}' state, expected '{self.get_from_state()}'")
+            unchecked_todos, unverified_conditions = self._find_open_items(node['body'])
+            reasons.extend(f"unchecked todo {todo}" for todo in unchecked_todos)
+            reasons.extend(f"unverified condition {condition}" for condition in unverified_conditions)
+        blockers = {number: reasons for number, reasons in blockers.items() if reasons}
+        if blockers:
+            blockers_str = "".join(
+                f"\n  #{number}: {nodes[number]['title']}" + "".join(f"\n    - {reason}" for reason in reasons)
+                for number, reasons in sorted(blockers.items())
+            )
+            raise ValueError(
+                f"Cannot approve work: {len(blockers)} issue(s) in the tree of #{issue_number} "
+                f"are not ready to be closed:{blockers_str}"
+            )
+        
+        # Close the deepest level first so that every issue's sub-issues are
+        # closed by the time it is approved
+        self._warm_caches(repo, list(nodes))
+        # Sub-issue that failed to close, keyed by the issue it blocks
+        failed: Dict[int, int] = {}
+        results = []
+        for depth in range(max(node['depth'] for node in nodes.values()), -1, -1):
+            level = [number for number, node in nodes.items() if node['depth'] == depth]
+            level_results = [
+                self._failed_result(repo, number, f"Cannot approve work: sub-issue #{failed[number]} was not closed")
+                for number in level if number in failed
+            ]
+            ready = [number for number in level if number not in failed]
+            if ready:
+                level_results.extend(self._run_concurrently(
+                    repo, ready, lambda number: self._apply_transition(repo, number, message), workers
+                ))
+            for result in level_results:
+                parent = nodes[result['issue_number']]['parent']
+                if not result.get('success') and parent is not None:
+                    failed.setdefault(parent, result['issue_number'])
+            results.extend(level_results)
+        return results
     
     def _validate_open_sub_issues(self, issue) -> None:
         """Validate that there are no open sub-issues blocking closure.
@@ -6035,25 +8774,22 @@ class ApproveWorkCommand(BaseWorkflowCommand):
                 # If we can't get node ID, fall back to body parsing
                 raise Exception("Could not get issue node ID")
                 
-            sub_issues_data = self.github.graphql.get_issue_with_sub_issues(issue_node_id)
-            
-            if sub_issues_data and 'node' in sub_issues_data and sub_issues_data['node'] and 'subIssues' in sub_issues_data['node']:
-                # Extract only open sub-issues with optimized list comprehension
-                open_sub_issues = [
-                    f"#{sub_issue['number']}: {sub_issue['title'][:50]}{'...' if len(sub_issue['title']) > 50 else ''}"
-                    for sub_issue in sub_issues_data['node']['subIssues']['nodes']
-                    if sub_issue.get('state') == 'OPEN'
-                ]
-                
-                if open_sub_issues:
-                    sub_issues_str = "\n  - " + "\n  - ".join(open_sub_issues[:5])  # Show first 5
-                    if len(open_sub_issues) > 5:
-                        sub_issues_str += f"\n  - ... and {len(open_sub_issues) - 5} more"
-                    raise ValueError(
-                        f"Cannot approve work: issue has open sub-issues that must be completed first:{sub_issues_str}\n\n"
-                        f"Please complete or close these sub-issues before approving this work."
-                    )
-                return
+            # Stream every page of sub-issues; only the fields shown below are needed
+            open_sub_issues = [
+                f"#{sub_issue['number']}: {sub_issue['title'][:50]}{'...' if len(sub_issue['title']) > 50 else ''}"
+                for sub_issue in self.github.graphql.iter_sub_issues(issue_node_id, fields="number title state")
+                if sub_issue.get('state') == 'OPEN'
+            ]
+            
+            if open_sub_issues:
+                sub_issues_str = "\n  - " + "\n  - ".join(open_sub_issues[:5])  # Show first 5
+                if len(open_sub_issues) > 5:
+                    sub_issues_str += f"\n  - ... and {len(open_sub_issues) - 5} more"
+                raise ValueError(
+                    f"Cannot approve work: issue has open sub-issues that must be completed first:{sub_issues_str}\n\n"
+                    f"Please complete or close these sub-issues before approving this work."
+                )
+            return
                 
         except ValueError:
             # Re-raise validation errors
@@ -6065,29 +8801,6 @@ class ApproveWorkCommand(BaseWorkflowCommand):
                 "Enable custom issue types in repository settings to use approval workflow."
             )
 
-    def execute_transition(self, repo: str, issue_number: int, message: Optional[str] = None) -> Dict[str, Any]:
-        """Execute the workflow state transition and close the issue.
-        
-        Args:
-            repo: Repository in format 'owner/repo'
-            issue_number: GitHub issue number
-            message: Optional message to include in audit trail
-            
-        Returns:
-            Dict with transition result information
-        """
-        # Execute the standard transition
-        result = super().execute_transition(repo, issue_number, message)
-        
-        # Close the issue
-        repo_owner, repo_name = repo.split('/')
-        repo_obj = self.github.github.get_repo(f"{repo_owner}/{repo_name}")
-        issue = repo_obj.get_issue(issue_number)
-        issue.edit(state="closed")
-        
-        result['issue_closed'] = True
-        return result
-
 
 class SetBodyCommand:
     """Command for updating the body of an existing GitHub issue.
@@ -6133,6 +8846,9 @@ class SetBodyCommand:
             github_repo = self.github.github.get_repo(repo)
             issue = github_repo.get_issue(issue_number)
             
+            # Keep the ghoo:index line in step with the new markdown
+            new_body = BodyIndex.refresh(new_body, issue.body, BodyIndex.enabled_for(self.github))
+            
             # Validate body size (GitHub's limit is 65536 characters)
             if len(new_body) > 65536:
                 raise ValueError("Issue body exceeds GitHub's 65536 character limit")
@@ -6243,10 +8959,14 @@ class PostCommentCommand:
         
         Returns:
             GitHub user login
+            
+        Raises:
+            MissingTokenError, InvalidTokenError: If GitHub rejects the token
         """
         try:
-            user = self.github.github.get_user()
-            return user.login
+            return self.github.get_authenticated_login()
+        except (MissingTokenError, InvalidTokenError):
+            raise
         except Exception:
             return "unknown-user"
 
@@ -0,0 +1,517 @@
+"""Optional long-lived ghoo process that serves CLI invocations over a Unix socket.
+
+A cold ghoo invocation imports PyGithub, loads ghoo.yaml, creates a new
+GitHubClient, validates the token and opens fresh TLS connections before it
+does any work. `ghoo serve` keeps one process running instead: it holds warm
+GitHubClient/GraphQLClient instances (with their connection pools, feature
+caches and rate-limit state) and runs each forwarded command in-process.
+
+The `ghoo` entry point first tries to forward its arguments, working directory,
+environment and (on demand) standard input to the daemon and prints the
+captured output. When no daemon is running it runs the command itself.
+
+Protocol: newline-delimited JSON messages over one connection per command.
+The client sends a 'run' request and the daemon answers 'ready' when it picks
+the request up. Until the client confirms with 'start' the command has not
+run, so a client that gave up waiting can safely run it in-process; after
+that it never does. The daemon may ask for standard input with a 'stdin'
+message before it answers with a 'result' message.
+"""
+
+import contextlib
+import hashlib
+import importlib
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+import threading
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .utils.cache import get_cache_dir
+
+
+# Environment variable overriding the daemon socket location
+SOCKET_ENV = "GHOO_SOCKET"
+
+# Environment variable that disables forwarding to a running daemon
+NO_DAEMON_ENV = "GHOO_NO_DAEMON"
+
+# Socket file name inside the cache directory
+SOCKET_NAME = "daemon.sock"
+
+# Bumped whenever the message format changes; mismatched clients run locally
+PROTOCOL_VERSION = 2
+
+# Seconds without requests after which the daemon exits (0 to run forever)
+DEFAULT_IDLE_TIMEOUT = 3600
+
+# Seconds a client waits to connect before running the command itself
+CONNECT_TIMEOUT = 0.5
+
+# Seconds a client waits for a busy daemon to pick up its command before
+# running the command itself
+ACCEPT_TIMEOUT = 2.0
+
+# Seconds a forwarded command may run before the daemon aborts it (0 for no limit)
+DEFAULT_REQUEST_TIMEOUT = 300
+
+# Seconds the daemon waits for a client message, e.g. requested standard input
+IO_TIMEOUT = 30.0
+
+
+def get_socket_path() -> Path:
+    """Return the Unix socket path the daemon listens on."""
+    override = os.getenv(SOCKET_ENV)
+    if override:
+        return Path(override).expanduser()
+    return get_cache_dir() / SOCKET_NAME
+
+
+def daemon_enabled() -> bool:
+    """Return False if forwarding was disabled via GHOO_NO_DAEMON."""
+    if not hasattr(socket, 'AF_UNIX'):
+        return False
+    return os.getenv(NO_DAEMON_ENV, "").lower() not in ("1", "true", "yes")
+
+
+def _send(stream, message: Dict[str, Any]) -> None:
+    stream.write(json.dumps(message).encode() + b'\n')
+    stream.flush()
+
+
+def _receive(stream) -> Optional[Dict[str, Any]]:
+    line = stream.readline()
+    if not line:
+        return None
+    return json.loads(line)
+
+
+def forward_to_daemon(argv: List[str], socket_path: Optional[Path] = None) -> Optional[int]:
+    """Run a ghoo command in the daemon if one is running.
+
+    Args:
+        argv: Command line arguments (without the program name)
+        socket_path: Socket to connect to (defaults to get_socket_path())
+
+    Returns:
+        The command's exit code, or None if no daemon took the command and it
+        should be run in-process
+    """
+    if not daemon_enabled():
+        return None
+
+    path = socket_path or get_socket_path()
+    if not path.exists():
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+
+    with sock, sock.makefile('rwb') as stream:
+        try:
+            sock.settimeout(ACCEPT_TIMEOUT)
+            _send(stream, {
+                'type': 'run',
+                'protocol': PROTOCOL_VERSION,
+                'argv': argv,
+                'cwd': os.getcwd(),
+                'env': dict(os.environ),
+                'stdin_isatty': sys.stdin is not None and sys.stdin.isatty(),
+            })
+            reply = _receive(stream)
+        except (OSError, ValueError):
+            # Daemon is busy or gone; it won't run the command without 'start'
+            return None
+        if not reply or reply.get('type') != 'ready':
+            # Daemon closed the connection or speaks another protocol
+            return None
+
+        # From here on the daemon may run the command, so it must never also
+        # run in-process
+        request_timeout = reply.get('timeout') or 0
+        sock.settimeout(request_timeout + IO_TIMEOUT if request_timeout else None)
+        try:
+            _send(stream, {'type': 'start'})
+            while True:
+                message = _receive(stream)
+                if message is None:
+                    raise ConnectionError("connection closed by the daemon")
+                if message.get('type') == 'stdin':
+                    _send(stream, {'type': 'stdin', 'data': sys.stdin.read() if sys.stdin else ''})
+                    continue
+                if message.get('type') == 'result':
+                    exit_code = int(message.get('exit_code', 1))
+                    sys.stdout.write(message.get('stdout', ''))
+                    sys.stdout.flush()
+                    sys.stderr.write(message.get('stderr', ''))
+                    sys.stderr.flush()
+                    return exit_code
+        except (OSError, ValueError) as e:
+            sys.stderr.write(
+                f"❌ Lost the result of the command from the ghoo daemon ({e}); "
+                "it may have been partly or fully applied\n"
+            )
+            sys.stderr.flush()
+            return 1
+
+
+def stop_daemon(socket_path: Optional[Path] = None) -> bool:
+    """Ask a running daemon to exit.
+
+    Args:
+        socket_path: Socket to connect to (defaults to get_socket_path())
+
+    Returns:
+        True if a daemon acknowledged the request
+    """
+    path = socket_path or get_socket_path()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(CONNECT_TIMEOUT * 4)
+            sock.connect(str(path))
+            with sock.makefile('rwb') as stream:
+                _send(stream, {'type': 'shutdown', 'protocol': PROTOCOL_VERSION})
+                reply = _receive(stream)
+                return bool(reply and reply.get('type') == 'ok')
+    except (OSError, ValueError):
+        return False
+
+
+class ClientPool:
+    """Warm GitHubClient instances reused across forwarded commands.
+
+    Clients are keyed by everything that determines their token and
+    configuration, so a command never receives a client created for
+    different credentials.
+    """
+
+    def __init__(self):
+        """Initialize an empty pool."""
+        from .core import GitHubClient
+
+        self._factory = GitHubClient
+        self._clients: Dict[tuple, Any] = {}
+
+    def get(self, token: Optional[str] = None, use_testing_token: bool = False,
+            config: Any = None, config_dir: Optional[Path] = None):
+        """Return a warm client for the given arguments, creating it if needed.
+
+        Accepts the same arguments as GitHubClient.
+
+        Returns:
+            GitHubClient instance
+        """
+        key = self._key(token, use_testing_token, config, config_dir)
+        client = self._clients.get(key)
+        if client is None:
+            client = self._factory(token=token, use_testing_token=use_testing_token,
+                                   config=config, config_dir=config_dir)
+            self._clients[key] = client
+        elif getattr(client, 'session', None) is not None:
+            # Each forwarded command is a new unit of work
+            client.session.clear()
+        return client
+
+    __call__ = get
+
+    @staticmethod
+    def _key(token: Optional[str], use_testing_token: bool, config: Any, config_dir: Optional[Path]) -> tuple:
+        env_file_mtime = None
+        if config_dir:
+            try:
+                env_file_mtime = (Path(config_dir) / ".env").stat().st_mtime
+            except OSError:
+                pass
+
+        credentials = '\0'.join([
+            token or '',
+            os.getenv('GITHUB_TOKEN', ''),
+            os.getenv('TESTING_GITHUB_TOKEN', ''),
+        ])
+        return (
+            hashlib.sha256(credentials.encode()).hexdigest(),
+            use_testing_token,
+            str(config_dir) if config_dir else None,
+            env_file_mtime,
+            repr(config),
+        )
+
+
+class _ForwardedStdin(io.TextIOBase):
+    """Standard input of the client, fetched from it only when read."""
+
+    def __init__(self, rfile, wfile, is_tty: bool):
+        self._rfile = rfile
+        self._wfile = wfile
+        self._is_tty = is_tty
+        self._buffer: Optional[io.StringIO] = None
+
+    def isatty(self) -> bool:
+        return self._is_tty
+
+    def readable(self) -> bool:
+        return True
+
+    def _data(self) -> io.StringIO:
+        if self._buffer is None:
+            try:
+                _send(self._wfile, {'type': 'stdin'})
+                reply = _receive(self._rfile) or {}
+            except (OSError, ValueError) as e:
+                raise OSError(f"ghoo client did not send its standard input: {e}") from e
+            self._buffer = io.StringIO(reply.get('data', ''))
+        return self._buffer
+
+    def read(self, size: int = -1) -> str:
+        return self._data().read(size)
+
+    def readline(self, size: int = -1) -> str:
+        return self._data().readline(size)
+
+
+class _RequestTimeout(BaseException):
+    """Raised in a forwarded command that outlived the request timeout.
+
+    Derives from BaseException so `except Exception` handlers in the
+    commands can't swallow it.
+    """
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """Runs one forwarded command per connection."""
+
+    # A client that stops responding fails its own command instead of
+    # blocking every other client
+    timeout = IO_TIMEOUT
+
+    def handle(self) -> None:
+        try:
+            request = _receive(self.rfile)
+        except (OSError, ValueError):
+            return
+        if not request:
+            return
+
+        if request.get('protocol') != PROTOCOL_VERSION:
+            _send(self.wfile, {'type': 'unsupported'})
+            return
+
+        self.server.last_activity = time.monotonic()
+
+        if request.get('type') == 'shutdown':
+            _send(self.wfile, {'type': 'ok'})
+            self.server.stopping = True
+            return
+
+        if request.get('type') != 'run':
+            _send(self.wfile, {'type': 'unsupported'})
+            return
+
+        # A client that stopped waiting runs the command itself and never
+        # confirms, so the command must not run here
+        try:
+            _send(self.wfile, {'type': 'ready', 'timeout': self.server.request_timeout})
+            confirmation = _receive(self.rfile)
+        except (OSError, ValueError):
+            return
+        if not confirmation or confirmation.get('type') != 'start':
+            return
+
+        exit_code, stdout, stderr = self.server.run_command(
+            request['argv'], request['cwd'], request['env'],
+            _ForwardedStdin(self.rfile, self.wfile, request.get('stdin_isatty', False)),
+        )
+        _send(self.wfile, {'type': 'result', 'exit_code': exit_code, 'stdout': stdout, 'stderr': stderr})
+        self.server.last_activity = time.monotonic()
+
+
+class GhooDaemon(socketserver.UnixStreamServer):
+    """Unix socket server running forwarded ghoo commands one at a time.
+
+    Commands run sequentially because each temporarily takes over the
+    process-wide working directory, environment and standard streams. Waiting
+    clients run their command themselves after ACCEPT_TIMEOUT, and a command
+    running longer than the request timeout is aborted.
+    """
+
+    def __init__(self, socket_path: Path, idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 request_timeout: float = DEFAULT_REQUEST_TIMEOUT):
+        """Bind the daemon socket.
+
+        Args:
+            socket_path: Path of the Unix socket to create
+            idle_timeout: Seconds without requests before exiting (0 to never exit)
+            request_timeout: Seconds a command may run before it is aborted (0 for no limit)
+
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket, or
+                its directory is writable by other users
+        """
+        self.socket_path = Path(socket_path)
+        self.idle_timeout = idle_timeout
+        self.request_timeout = request_timeout
+        self.last_activity = time.monotonic()
+        self.stopping = False
+        self.pool = ClientPool()
+
+        self._remove_stale_socket()
+        self._prepare_directory()
+        super().__init__(str(self.socket_path), DaemonRequestHandler)
+        os.chmod(self.socket_path, 0o600)
+        self.timeout = 1.0
+        self._use_pooled_clients()
+
+    def _prepare_directory(self) -> None:
+        """Make sure only the user can reach the socket's directory.
+
+        Directories ghoo creates or owns (the default cache directory) are
+        restricted to the user; any other directory is left alone and must not
+        be writable by other users, who could replace the socket.
+        """
+        directory = self.socket_path.parent
+        try:
+            directory.mkdir(parents=True, mode=0o700)
+            created = True
+        except FileExistsError:
+            created = False
+
+        info = directory.stat()
+        owned = info.st_uid == os.getuid() and directory == get_cache_dir()
+        if created or owned:
+            os.chmod(directory, 0o700)
+        elif info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise RuntimeError(
+                f"Refusing to listen in {directory}: it is writable by other users"
+            )
+
+    def _remove_stale_socket(self) -> None:
+        if not self.socket_path.exists():
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(self.socket_path))
+            except OSError:
+                self.socket_path.unlink()
+                return
+        raise RuntimeError(f"A ghoo daemon is already listening on {self.socket_path}")
+
+    def _use_pooled_clients(self) -> None:
+        """Make the CLI modules create GitHubClient instances through the pool."""
+        cli = importlib.import_module('.main', __package__)
+        get_commands = importlib.import_module('.commands.get_commands', __package__)
+
+        self._replaced = [(module, module.GitHubClient) for module in (cli, get_commands)]
+        for module, _ in self._replaced:
+            module.GitHubClient = self.pool
+
+    def server_close(self) -> None:
+        """Close the socket and restore the CLI modules' GitHubClient."""
+        super().server_close()
+        for module, original in getattr(self, '_replaced', []):
+            module.GitHubClient = original
+        self._replaced = []
+
+    def run_command(self, argv: List[str], cwd: str, env: Dict[str, str], stdin) -> tuple:
+        """Run the ghoo CLI in-process for a forwarded invocation.
+
+        Args:
+            argv: Command line arguments
+            cwd: Client working directory
+            env: Client environment
+            stdin: Replacement for sys.stdin
+
+        Returns:
+            Tuple of (exit code, captured stdout, captured stderr)
+        """
+        cli = importlib.import_module('.main', __package__)
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        saved_env = dict(os.environ)
+        saved_cwd = os.getcwd()
+        saved_stdin = sys.stdin
+        exit_code = 0
+
+        try:
+            os.environ.clear()
+            os.environ.update(env)
+            os.chdir(cwd)
+            sys.stdin = stdin
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    with self._time_limit():
+                        cli.app(args=argv, prog_name='ghoo')
+                except SystemExit as e:
+                    exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                except _RequestTimeout:
+                    stderr.write(
+                        f"❌ ghoo daemon aborted the command after {self.request_timeout:g} seconds; "
+                        "it may have been partly applied\n"
+                    )
+                    exit_code = 1
+                except Exception:
+                    traceback.print_exc()
+                    exit_code = 1
+        except OSError as e:
+            stderr.write(f"❌ ghoo daemon could not run the command: {e}\n")
+            exit_code = 1
+        finally:
+            sys.stdin = saved_stdin
+            os.environ.clear()
+            os.environ.update(saved_env)
+            try:
+                os.chdir(saved_cwd)
+            except OSError:
+                pass
+
+        return exit_code, stdout.getvalue(), stderr.getvalue()
+
+    @contextlib.contextmanager
+    def _time_limit(self):
+        """Abort the block with _RequestTimeout after request_timeout seconds.
+
+        The limit uses SIGALRM, so it applies only while serving from the main
+        thread, as `ghoo serve` does.
+        """
+        if (not self.request_timeout or not hasattr(signal, 'setitimer')
+                or threading.current_thread() is not threading.main_thread()):
+            yield
+            return
+
+        def expire(signum, frame):
+            raise _RequestTimeout()
+
+        previous = signal.signal(signal.SIGALRM, expire)
+        signal.setitimer(signal.ITIMER_REAL, self.request_timeout)
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+
+    def serve(self) -> None:
+        """Handle requests until stopped or idle for longer than idle_timeout."""
+        try:
+            while not self.stopping:
+                self.handle_request()
+                if self.idle_timeout and time.monotonic() - self.last_activity > self.idle_timeout:
+                    break
+        finally:
+            self.server_close()
+            try:
+                self.socket_path.unlink()
+            except OSError:
+                pass
@@ -1,20 +1,14 @@
 """Main CLI entry point for ghoo."""
 
 import typer
-from typing import Optional
+from typing import List, Optional
 from pathlib import Path
+import json
 import sys
 
-from .core import (
-    InitCommand, SetBodyCommand, CreateTodoCommand, CheckTodoCommand, CreateSectionCommand, UpdateSectionCommand,
-    CreateConditionCommand, UpdateConditionCommand, CompleteConditionCommand, VerifyConditionCommand, GetConditionsCommand,
-    CreateEpicCommand, CreateTaskCommand, CreateSubTaskCommand,
-    StartPlanCommand, SubmitPlanCommand, ApprovePlanCommand,
-    StartWorkCommand, SubmitWorkCommand, ApproveWorkCommand,
-    PostCommentCommand, GetLatestCommentTimestampCommand, GetCommentsCommand, SetMilestoneCommand, GitHubClient, ConfigLoader
-)
 from .commands import get_app
-from .utils.repository import resolve_repository
+from .daemon import DEFAULT_IDLE_TIMEOUT, DEFAULT_REQUEST_TIMEOUT, GhooDaemon, forward_to_daemon, get_socket_path, stop_daemon
+from .utils.lazy import lazy_importer, load_lazy_imports
 from .exceptions import (
     ConfigNotFoundError,
     InvalidYAMLError,
@@ -29,12 +23,41 @@ from .exceptions import (
     FeatureUnavailableError,
 )
 
+# Imported when a command needs them rather than at startup, so that simple
+# commands such as 'version' don't pay for loading PyGithub and ghoo.core
+_LAZY_IMPORTS = {
+    name: '.core' for name in (
+        'InitCommand', 'SetBodyCommand', 'CreateTodoCommand', 'CheckTodoCommand',
+        'CreateSectionCommand', 'UpdateSectionCommand',
+        'CreateConditionCommand', 'UpdateConditionCommand', 'CompleteConditionCommand',
+        'VerifyConditionCommand', 'GetConditionsCommand',
+        'CreateEpicCommand', 'CreateTaskCommand', 'CreateSubTaskCommand',
+        'StartPlanCommand', 'SubmitPlanCommand', 'ApprovePlanCommand',
+        'StartWorkCommand', 'SubmitWorkCommand', 'ApproveWorkCommand',
+        'PostCommentCommand', 'GetLatestCommentTimestampCommand', 'GetCommentsCommand',
+        'SetMilestoneCommand', 'GitHubClient', 'ConfigLoader',
+    )
+}
+_LAZY_IMPORTS['resolve_repository'] = '.utils.repository'
+
+__getattr__ = lazy_importer(globals(), _LAZY_IMPORTS, __package__)
+
+# Commands that don't use any of the lazily imported names
+_LIGHTWEIGHT_COMMANDS = {"version", "serve", "get"}
+
 app = typer.Typer(
     name="ghoo",
     help="A prescriptive CLI tool for GitHub repository and project management.",
     add_completion=False,
 )
 
+
+@app.callback()
+def _load_command_dependencies(ctx: typer.Context):
+    """Import the modules the invoked command depends on."""
+    if ctx.invoked_subcommand not in _LIGHTWEIGHT_COMMANDS:
+        load_lazy_imports(globals(), _LAZY_IMPORTS, __package__)
+
 # Add the new get subcommand group
 app.add_typer(get_app, name="get")
 
@@ -47,6 +70,73 @@ def display_audit_trail_info(result: dict) -> None:
         typer.echo(f"   💬 Audit trail: Comment created (configured method or fallback)", color=typer.colors.YELLOW)
 
 
+def _parse_issue_ids(value: str) -> List[int]:
+    """Parse a comma- or space-separated list of issue numbers such as '12,13 #14'."""
+    numbers = []
+    for part in value.replace(',', ' ').split():
+        try:
+            numbers.append(int(part.lstrip('#')))
+        except ValueError:
+            raise ValueError(f"Invalid issue number '{part}' in --ids")
+    return numbers
+
+
+def _validate_output_format(output_format: str) -> None:
+    """Reject output formats other than 'table' and 'ndjson' before any change is made."""
+    if output_format not in ("table", "ndjson"):
+        raise ValueError(f"Invalid format '{output_format}'. Expected 'table' or 'ndjson'")
+
+
+def _run_bulk_transition(command, repo: str, issue_number: Optional[int], ids: Optional[str],
+                         parent: Optional[int], labels: Optional[List[str]], status: Optional[str],
+                         message: Optional[str], workers: int, output_format: str, **kwargs) -> None:
+    """Transition every selected issue and print one result per issue.
+    
+    Exits with status 1 if any transition failed.
+    """
+    _validate_output_format(output_format)
+    
+    numbers = [issue_number] if issue_number is not None else []
+    if ids:
+        numbers += _parse_issue_ids(ids)
+    if parent is not None or labels:
+        numbers += command.select_issues(repo, parent=parent, labels=labels, status=status)
+    
+    if not numbers:
+        if output_format == "table":
+            typer.echo("No issues matched the selection")
+        return
+    
+    results = command.execute_bulk(repo, numbers, message, workers=workers, **kwargs)
+    _report_bulk_results(results, output_format)
+
+
+def _report_bulk_results(results: List[dict], output_format: str) -> None:
+    """Print one result per transitioned issue as a table or as NDJSON.
+    
+    Exits with status 1 if any transition failed.
+    """
+    failed = [result for result in results if not result.get('success')]
+    
+    if output_format == "ndjson":
+        for result in results:
+            typer.echo(json.dumps(result))
+    else:
+        typer.echo(f"{'ISSUE':<8} {'RESULT':<8} DETAIL")
+        for result in results:
+            issue = f"#{result['issue_number']}"
+            if result.get('success'):
+                detail = f"{result['from_state']} → {result['to_state']}: {result['issue_title']}"
+                typer.echo(f"{issue:<8} {'ok':<8} {detail}")
+            else:
+                error = result['error'].splitlines()[0] if result['error'] else "failed"
+                typer.echo(f"{issue:<8} {'failed':<8} {error}")
+        typer.echo(f"\n{len(results) - len(failed)} transitioned, {len(failed)} failed")
+    
+    if failed:
+        sys.exit(1)
+
+
 @app.command()
 def version():
     """Show the version of ghoo."""
@@ -1368,8 +1458,14 @@ def verify_condition(
 @app.command(name="start-plan")
 def start_plan(
     repo: Optional[str] = typer.Option(None, "--repo", help="Repository in format 'owner/repo' (uses config if not specified)"),
-    issue_number: int = typer.Argument(..., help="Issue number to transition"),
+    issue_number: Optional[int] = typer.Argument(None, help="Issue number to transition"),
     message: Optional[str] = typer.Option(None, "--message", "-m", help="Optional message for the audit trail"),
+    ids: Optional[str] = typer.Option(None, "--ids", help="Comma-separated issue numbers to transition together"),
+    parent: Optional[int] = typer.Option(None, "--parent", help="Transition the sub-issues of this issue at any depth"),
+    labels: Optional[List[str]] = typer.Option(None, "--label", help="Transition open issues carrying this label (repeatable)"),
+    status: Optional[str] = typer.Option(None, "--status", help="State of the issues --parent/--label select (default: the transition's starting state)"),
+    workers: Optional[int] = typer.Option(None, "--workers", help="Transitions to run at once (default: 8)"),
+    output_format: str = typer.Option("table", "--format", help="Output for several issues: 'table' or 'ndjson'"),
     config_path: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to ghoo.yaml configuration file")
 ):
     """Transition an issue from backlog to planning state."""
@@ -1390,6 +1486,16 @@ def start_plan(
         # Initialize GitHub client with config
         github_client = GitHubClient(config=config, config_dir=config_loader.get_config_dir())
         
+        # Transition several issues at once when a selection is given
+        if ids or parent is not None or labels:
+            _run_bulk_transition(
+                StartPlanCommand(github_client, config), repo, issue_number, ids, parent, labels,
+                status, message, workers, output_format
+            )
+            return
+        if issue_number is None:
+            raise ValueError("Provide an issue number, --ids, --parent or --label")
+        
         # Execute start-plan command
         start_plan_command = StartPlanCommand(github_client, config)
         result = start_plan_command.execute_transition(repo, issue_number, message)
@@ -1428,9 +1534,15 @@ def start_plan(
 @app.command(name="submit-plan")
 def submit_plan(
     repo: Optional[str] = typer.Option(None, "--repo", help="Repository in format 'owner/repo' (uses config if not specified)"),
-    issue_number: int = typer.Argument(..., help="Issue number to transition"),
+    issue_number: Optional[int] = typer.Argument(None, help="Issue number to transition"),
     message: Optional[str] = typer.Option(None, "--message", "-m", help="Optional message for the audit trail"),
     message_file: Optional[Path] = typer.Option(None, "--message-file", "-f", help="Read message from file"),
+    ids: Optional[str] = typer.Option(None, "--ids", help="Comma-separated issue numbers to transition together"),
+    parent: Optional[int] = typer.Option(None, "--parent", help="Transition the sub-issues of this issue at any depth"),
+    labels: Optional[List[str]] = typer.Option(None, "--label", help="Transition open issues carrying this label (repeatable)"),
+    status: Optional[str] = typer.Option(None, "--status", help="State of the issues --parent/--label select (default: the transition's starting state)"),
+    workers: Optional[int] = typer.Option(None, "--workers", help="Transitions to run at once (default: 8)"),
+    output_format: str = typer.Option("table", "--format", help="Output for several issues: 'table' or 'ndjson'"),
     config_path: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to ghoo.yaml configuration file")
 ):
     """Transition an issue from planning to awaiting-plan-approval state."""
@@ -1463,6 +1575,16 @@ def submit_plan(
             # No message provided - this is optional for workflow commands
             message_text = None
         
+        # Transition several issues at once when a selection is given
+        if ids or parent is not None or labels:
+            _run_bulk_transition(
+                SubmitPlanCommand(github_client, config), repo, issue_number, ids, parent, labels,
+                status, message_text, workers, output_format
+            )
+            return
+        if issue_number is None:
+            raise ValueError("Provide an issue number, --ids, --parent or --label")
+        
         # Execute submit-plan command
         submit_plan_command = SubmitPlanCommand(github_client, config)
         result = submit_plan_command.execute_transition(repo, issue_number, message_text)
@@ -1501,8 +1623,14 @@ def submit_plan(
 @app.command(name="approve-plan")
 def approve_plan(
     repo: Optional[str] = typer.Option(None, "--repo", help="Repository in format 'owner/repo' (uses config if not specified)"),
-    issue_number: int = typer.Argument(..., help="Issue number to transition"),
+    issue_number: Optional[int] = typer.Argument(None, help="Issue number to transition"),
     message: Optional[str] = typer.Option(None, "--message", "-m", help="Optional message for the audit trail"),
+    ids: Optional[str] = typer.Option(None, "--ids", help="Comma-separated issue numbers to transition together"),
+    parent: Optional[int] = typer.Option(None, "--parent", help="Transition the sub-issues of this issue at any depth"),
+    labels: Optional[List[str]] = typer.Option(None, "--label", help="Transition open issues carrying this label (repeatable)"),
+    status: Optional[str] = typer.Option(None, "--status", help="State of the issues --parent/--label select (default: the transition's starting state)"),
+    workers: Optional[int] = typer.Option(None, "--workers", help="Transitions to run at once (default: 8)"),
+    output_format: str = typer.Option("table", "--format", help="Output for several issues: 'table' or 'ndjson'"),
     config_path: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to ghoo.yaml configuration file")
 ):
     """Transition an issue from awaiting-plan-approval to plan-approved state."""
@@ -1523,6 +1651,16 @@ def approve_plan(
         # Initialize GitHub client with config
         github_client = GitHubClient(config=config, config_dir=config_loader.get_config_dir())
         
+        # Transition several issues at once when a selection is given
+        if ids or parent is not None or labels:
+            _run_bulk_transition(
+                ApprovePlanCommand(github_client, config), repo, issue_number, ids, parent, labels,
+                status, message, workers, output_format
+            )
+            return
+        if issue_number is None:
+            raise ValueError("Provide an issue number, --ids, --parent or --label")
+        
         # Execute approve-plan command
         approve_plan_command = ApprovePlanCommand(github_client, config)
         result = approve_plan_command.execute_transition(repo, issue_number, message)
@@ -1561,8 +1699,14 @@ def approve_plan(
 @app.command(name="start-work")
 def start_work(
     repo: Optional[str] = typer.Option(None, "--repo", help="Repository in format 'owner/repo' (uses config if not specified)"),
-    issue_number: int = typer.Argument(..., help="Issue number to transition"),
+    issue_number: Optional[int] = typer.Argument(None, help="Issue number to transition"),
     message: Optional[str] = typer.Option(None, "--message", "-m", help="Optional message for the audit trail"),
+    ids: Optional[str] = typer.Option(None, "--ids", help="Comma-separated issue numbers to transition together"),
+    parent: Optional[int] = typer.Option(None, "--parent", help="Transition the sub-issues of this issue at any depth"),
+    labels: Optional[List[str]] = typer.Option(None, "--label", help="Transition open issues carrying this label (repeatable)"),
+    status: Optional[str] = typer.Option(None, "--status", help="State of the issues --parent/--label select (default: the transition's starting state)"),
+    workers: Optional[int] = typer.Option(None, "--workers", help="Transitions to run at once (default: 8)"),
+    output_format: str = typer.Option("table", "--format", help="Output for several issues: 'table' or 'ndjson'"),
     config_path: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to ghoo.yaml configuration file")
 ):
     """Transition an issue from plan-approved to in-progress state."""
@@ -1583,6 +1727,16 @@ def start_work(
         # Initialize GitHub client with config
         github_client = GitHubClient(config=config, config_dir=config_loader.get_config_dir())
         
+        # Transition several issues at once when a selection is given
+        if ids or parent is not None or labels:
+            _run_bulk_transition(
+                StartWorkCommand(github_client, config), repo, issue_number, ids, parent, labels,
+                status, message, workers, output_format
+            )
+            return
+        if issue_number is None:
+            raise ValueError("Provide an issue number, --ids, --parent or --label")
+        
         # Execute start-work command
         start_work_command = StartWorkCommand(github_client, config)
         result = start_work_command.execute_transition(repo, issue_number, message)
@@ -1621,10 +1775,16 @@ def start_work(
 @app.command(name="submit-work")
 def submit_work(
     repo: Optional[str] = typer.Option(None, "--repo", help="Repository in format 'owner/repo' (uses config if not specified)"),
-    issue_number: int = typer.Argument(..., help="Issue number to transition"),
+    issue_number: Optional[int] = typer.Argument(None, help="Issue number to transition"),
     message: Optional[str] = typer.Option(None, "--message", "-m", help="Optional message for the audit trail"),
     message_file: Optional[Path] = typer.Option(None, "--message-file", "-f", help="Read message from file"),
     force_submit_with_unclean_git: bool = typer.Option(False, "--force-submit-with-unclean-git", help="Submit work even with uncommitted git changes"),
+    ids: Optional[str] = typer.Option(None, "--ids", help="Comma-separated issue numbers to transition together"),
+    parent: Optional[int] = typer.Option(None, "--parent", help="Transition the sub-issues of this issue at any depth"),
+    labels: Optional[List[str]] = typer.Option(None, "--label", help="Transition open issues carrying this label (repeatable)"),
+    status: Optional[str] = typer.Option(None, "--status", help="State of the issues --parent/--label select (default: the transition's starting state)"),
+    workers: Optional[int] = typer.Option(None, "--workers", help="Transitions to run at once (default: 8)"),
+    output_format: str = typer.Option("table", "--format", help="Output for several issues: 'table' or 'ndjson'"),
     config_path: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to ghoo.yaml configuration file")
 ):
     """Transition an issue from in-progress to awaiting-completion-approval state."""
@@ -1657,6 +1817,17 @@ def submit_work(
             # No message provided - this is optional for workflow commands
             message_text = None
         
+        # Transition several issues at once when a selection is given
+        if ids or parent is not None or labels:
+            _run_bulk_transition(
+                SubmitWorkCommand(github_client, config), repo, issue_number, ids, parent, labels,
+                status, message_text, workers, output_format,
+                force_unclean_git=force_submit_with_unclean_git
+            )
+            return
+        if issue_number is None:
+            raise ValueError("Provide an issue number, --ids, --parent or --label")
+        
         # Execute submit-work command
         submit_work_command = SubmitWorkCommand(github_client, config)
         result = submit_work_command.execute_transition(repo, issue_number, message_text, force_unclean_git=force_submit_with_unclean_git)
@@ -1695,8 +1866,15 @@ def submit_work(
 @app.command(name="approve-work")
 def approve_work(
     repo: Optional[str] = typer.Option(None, "--repo", help="Repository in format 'owner/repo' (uses config if not specified)"),
-    issue_number: int = typer.Argument(..., help="Issue number to transition"),
+    issue_number: Optional[int] = typer.Argument(None, help="Issue number to transition"),
     message: Optional[str] = typer.Option(None, "--message", "-m", help="Optional message for the audit trail"),
+    ids: Optional[str] = typer.Option(None, "--ids", help="Comma-separated issue numbers to transition together"),
+    parent: Optional[int] = typer.Option(None, "--parent", help="Transition the sub-issues of this issue at any depth"),
+    labels: Optional[List[str]] = typer.Option(None, "--label", help="Transition open issues carrying this label (repeatable)"),
+    status: Optional[str] = typer.Option(None, "--status", help="State of the issues --parent/--label select (default: the transition's starting state)"),
+    workers: Optional[int] = typer.Option(None, "--workers", help="Transitions to run at once (default: 8)"),
+    output_format: str = typer.Option("table", "--format", help="Output for several issues: 'table' or 'ndjson'"),
+    recursive: bool = typer.Option(False, "--recursive", help="Also approve every open sub-issue at any depth, bottom-up"),
     config_path: Optional[Path] = typer.Option(None, "--config", "-c", help="Path to ghoo.yaml configuration file")
 ):
     """Transition an issue from awaiting-completion-approval to closed state."""
@@ -1717,6 +1895,26 @@ def approve_work(
         # Initialize GitHub client with config
         github_client = GitHubClient(config=config, config_dir=config_loader.get_config_dir())
         
+        # Approve the whole sub-issue tree, deepest issues first
+        if recursive:
+            if issue_number is None or ids or parent is not None or labels:
+                raise ValueError("--recursive takes a single issue number and no --ids, --parent or --label")
+            _validate_output_format(output_format)
+            approve_work_command = ApproveWorkCommand(github_client, config)
+            results = approve_work_command.execute_recursive(repo, issue_number, message, workers=workers)
+            _report_bulk_results(results, output_format)
+            return
+        
+        # Transition several issues at once when a selection is given
+        if ids or parent is not None or labels:
+            _run_bulk_transition(
+                ApproveWorkCommand(github_client, config), repo, issue_number, ids, parent, labels,
+                status, message, workers, output_format
+            )
+            return
+        if issue_number is None:
+            raise ValueError("Provide an issue number, --ids, --parent or --label")
+        
         # Execute approve-work command
         approve_work_command = ApproveWorkCommand(github_client, config)
         result = approve_work_command.execute_transition(repo, issue_number, message)
@@ -1754,8 +1952,67 @@ def approve_work(
         sys.exit(1)
 
 
+@app.command()
+def serve(
+    socket_path: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        help="Unix socket to listen on (default: $GHOO_SOCKET or daemon.sock in the cache directory)"
+    ),
+    idle_timeout: int = typer.Option(
+        DEFAULT_IDLE_TIMEOUT,
+        "--idle-timeout",
+        help="Exit after this many seconds without requests (0 to run until stopped)"
+    ),
+    request_timeout: int = typer.Option(
+        DEFAULT_REQUEST_TIMEOUT,
+        "--request-timeout",
+        help="Abort a forwarded command after this many seconds (0 for no limit)"
+    ),
+    stop: bool = typer.Option(
+        False,
+        "--stop",
+        help="Stop the running daemon instead of starting one"
+    )
+):
+    """Run a background daemon that keeps GitHub clients warm for ghoo commands."""
+    path = socket_path or get_socket_path()
+    
+    if stop:
+        if stop_daemon(path):
+            typer.echo(f"✅ Stopped ghoo daemon on {path}")
+        else:
+            typer.echo(f"❌ No ghoo daemon is listening on {path}", err=True)
+            sys.exit(1)
+        return
+    
+    try:
+        daemon = GhooDaemon(path, idle_timeout=idle_timeout, request_timeout=request_timeout)
+    except RuntimeError as e:
+        typer.echo(f"❌ {str(e)}", err=True)
+        sys.exit(1)
+    except OSError as e:
+        typer.echo(f"❌ Could not listen on {path}: {str(e)}", err=True)
+        sys.exit(1)
+    
+    typer.echo(f"🚀 ghoo daemon listening on {path}")
+    try:
+        daemon.serve()
+    except KeyboardInterrupt:
+        pass
+
+
 def main():
-    """Main entry point for the ghoo CLI."""
+    """Main entry point for the ghoo CLI.
+    
+    Commands are forwarded to a running `ghoo serve` daemon when possible and
+    run in-process otherwise.
+    """
+    argv = sys.argv[1:]
+    if argv[:1] != ["serve"]:
+        exit_code = forward_to_daemon(argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
     app()
 
 
@@ -1,7 +1,7 @@
 """Data models for ghoo."""
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any, Literal
+from typing import List, Optional, Dict, Any, Literal, Tuple
 from datetime import datetime, timezone
 from enum import Enum
 
@@ -24,7 +24,7 @@ class WorkflowState(Enum):
     CLOSED = "closed"
 
 
-@dataclass
+@dataclass(slots=True)
 class Todo:
     """A todo item within a section."""
     text: str
@@ -32,7 +32,7 @@ class Todo:
     line_number: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Condition:
     """A verification condition within an issue.
     
@@ -56,7 +56,7 @@ class Condition:
     line_number: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class LogSubEntry:
     """A sub-entry within a log entry for future extensibility.
     
@@ -72,7 +72,7 @@ class LogSubEntry:
         return f"#### {self.title}\n{self.content}"
 
 
-@dataclass
+@dataclass(slots=True)
 class LogEntry:
     """A log entry representing a state transition.
     
@@ -117,7 +117,7 @@ class LogEntry:
         return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """A section within an issue body."""
     title: str
@@ -135,6 +135,62 @@ class Section:
         return len(self.todos)
 
 
+@dataclass(frozen=True, slots=True)
+class IssueSummary:
+    """A compact, immutable summary of a sub-issue.
+    
+    Holds only the fields the sub-issue list of `ghoo get` displays, in
+    tuples instead of nested lists and dicts.
+    
+    Attributes:
+        number: Issue number
+        title: Issue title
+        state: 'open' or 'closed'
+        author: Login of the issue author
+        assignees: Logins of the assignees
+        labels: (name, color) of each label
+        workflow_status: Status from the 'status:' label, if any
+    """
+    number: int
+    title: str
+    state: str
+    author: Optional[str] = None
+    assignees: Tuple[str, ...] = ()
+    labels: Tuple[Tuple[str, str], ...] = ()
+    workflow_status: Optional[str] = None
+    
+    @classmethod
+    def from_graphql(cls, node: Dict[str, Any]) -> 'IssueSummary':
+        """Build a summary from a GraphQL issue node."""
+        labels = tuple((label['name'], label['color'])
+                       for label in (node.get('labels') or {}).get('nodes', []))
+        workflow_status = next(
+            (name[len('status:'):] for name, _ in labels if name.startswith('status:')), None
+        )
+        return cls(
+            number=node['number'],
+            title=node['title'],
+            state=node['state'].lower(),
+            author=(node.get('author') or {}).get('login'),
+            assignees=tuple(assignee['login']
+                            for assignee in (node.get('assignees') or {}).get('nodes', [])),
+            labels=labels,
+            workflow_status=workflow_status,
+        )
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Format the summary like the sub-issue entries of `ghoo get`."""
+        return {
+            'number': self.number,
+            'title': self.title,
+            'state': self.state,
+            'author': self.author,
+            'assignees': list(self.assignees),
+            'labels': [{'name': name, 'color': color} for name, color in self.labels],
+            'workflow_status': self.workflow_status
+        }
+
+
 @dataclass
 class Milestone:
     """A GitHub milestone."""
@@ -274,6 +330,19 @@ class SubTask(Issue):
         self.issue_type = IssueType.SUB_TASK
 
 
+# Projects V2 Status option set for each workflow state with the status_field
+# method; these are the options `ghoo init-gh` creates
+DEFAULT_STATUS_FIELD_OPTIONS = {
+    "backlog": "Backlog",
+    "planning": "Planning",
+    "awaiting-plan-approval": "Review",
+    "plan-approved": "Planning",
+    "in-progress": "In Progress",
+    "awaiting-completion-approval": "Review",
+    "closed": "Done",
+}
+
+
 @dataclass
 class Config:
     """Configuration loaded from ghoo.yaml."""
@@ -283,6 +352,9 @@ class Config:
     issue_type_method: Literal["native", "labels"] = "native"
     required_sections: Dict[str, List[str]] = field(default_factory=dict)
     restrict_subissue_creation_states: bool = False  # If True, only allow sub-issue creation in planning/in-progress states
+    log_keep_entries: Optional[int] = None  # If set, older log entries are moved to archive comments
+    body_index: bool = False  # If True, written bodies carry a hidden ghoo:index summary line
+    status_field_options: Dict[str, Optional[str]] = field(default_factory=dict)  # Overrides DEFAULT_STATUS_FIELD_OPTIONS; None leaves the field alone
     
     def __post_init__(self):
         """Set default required sections if not provided and validate configuration."""
@@ -294,9 +366,32 @@ class Config:
         if self.issue_type_method not in ["native", "labels"]:
             raise ValueError(f"issue_type_method must be 'native' or 'labels', got '{self.issue_type_method}'")
         
+        # Validate log_keep_entries
+        if self.log_keep_entries is not None and (
+            isinstance(self.log_keep_entries, bool)
+            or not isinstance(self.log_keep_entries, int)
+            or self.log_keep_entries < 1
+        ):
+            raise ValueError(f"log_keep_entries must be a positive integer, got '{self.log_keep_entries}'")
+        
+        # Validate body_index
+        if not isinstance(self.body_index, bool):
+            raise ValueError(f"body_index must be true or false, got '{self.body_index}'")
+        
+        # Validate status_field_options
+        for state, option in self.status_field_options.items():
+            if state not in DEFAULT_STATUS_FIELD_OPTIONS:
+                raise ValueError(f"status_field_options has unknown workflow state '{state}'")
+            if option is not None and not isinstance(option, str):
+                raise ValueError(f"status_field_options.{state} must be an option name or null, got '{option}'")
+        
         if not self.required_sections:
             self.required_sections = {
                 "epic": ["Summary", "Acceptance Criteria", "Milestone Plan"],
                 "task": ["Summary", "Acceptance Criteria", "Implementation Plan"],
                 "subtask": ["Summary", "Acceptance Criteria"]
-            }
\ No newline at end of file
+            }
+    
+    def status_field_option(self, state: str) -> Optional[str]:
+        """Return the Status field option of a workflow state, or None to leave the field alone."""
+        return {**DEFAULT_STATUS_FIELD_OPTIONS, **self.status_field_options}.get(state)
\ No newline at end of file
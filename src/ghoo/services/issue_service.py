@@ -5,11 +5,15 @@ GitHub issues across different command types.
 """
 
 import re
-from typing import Dict, List, Any, Optional
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
 from github import GithubException
 
 from ..core import GitHubClient, IssueParser
 from ..exceptions import GraphQLError, FeatureUnavailableError
+from ..models import IssueSummary
+from ..utils.log_archive import is_archive_comment
+from .parent_index import ParentIndex
 
 
 class IssueService:
@@ -47,6 +51,43 @@ class IssueService:
         # If no config, default to native for SPEC compliance
         return self._detect_via_native_types(issue)
     
+    def detect_issue_types(self, issues: List[Any], repo: str) -> Dict[int, str]:
+        """Detect the types of many issues of one repository at once.
+        
+        Uses the same method as detect_issue_type(), but native types are
+        looked up with batched GraphQL queries instead of one query per issue.
+        
+        Args:
+            issues: PyGithub issue objects
+            repo: Repository in 'owner/repo' format
+            
+        Returns:
+            Dictionary mapping issue numbers to 'epic', 'task', 'subtask' or 'unknown'
+        """
+        config = self.github.config
+        if config and getattr(config, 'issue_type_method', None) == "labels":
+            return {issue.number: self._detect_via_labels(issue) for issue in issues}
+        
+        if not issues:
+            return {}
+        
+        repo_owner, repo_name = repo.split('/')
+        try:
+            nodes = self.github.graphql.get_issues_batch(
+                repo_owner, repo_name, [issue.number for issue in issues], fields="issueType { name }"
+            )
+        except GraphQLError:
+            return {issue.number: 'unknown' for issue in issues}
+        
+        types = {}
+        for issue in issues:
+            issue_type = (nodes.get(issue.number) or {}).get('issueType')
+            if issue_type and issue_type.get('name'):
+                types[issue.number] = self._type_from_native_name(issue_type['name'])
+            else:
+                types[issue.number] = 'unknown'
+        return types
+    
     def _detect_via_native_types(self, issue) -> str:
         """Detect issue type via native GitHub issue types only."""
         try:
@@ -80,13 +121,7 @@ class IssueService:
                 issue_type = issue_data.get('issueType')
                 
                 if issue_type and issue_type.get('name'):
-                    type_name = issue_type['name'].lower()
-                    if type_name == 'epic':
-                        return 'epic'
-                    elif type_name == 'task':
-                        return 'task'
-                    elif type_name in ['sub-task', 'subtask']:
-                        return 'subtask'
+                    return self._type_from_native_name(issue_type['name'])
                         
         except Exception:
             pass
@@ -97,62 +132,116 @@ class IssueService:
     
     def _detect_via_labels(self, issue) -> str:
         """Detect issue type via labels only."""
-        for label in issue.labels:
-            if label.name == 'type:epic':
+        return self._type_from_label_names(label.name for label in issue.labels)
+    
+    def _type_from_native_name(self, type_name: str) -> str:
+        """Map a native GitHub issue type name to a ghoo issue type."""
+        type_name = type_name.lower()
+        if type_name == 'epic':
+            return 'epic'
+        elif type_name == 'task':
+            return 'task'
+        elif type_name in ['sub-task', 'subtask']:
+            return 'subtask'
+        return 'unknown'
+    
+    def _type_from_label_names(self, label_names) -> str:
+        """Map 'type:*' label names to a ghoo issue type."""
+        for name in label_names:
+            if name == 'type:epic':
                 return 'epic'
-            elif label.name == 'type:task':
+            elif name == 'type:task':
                 return 'task'
-            elif label.name == 'type:sub-task':
+            elif name == 'type:sub-task':
                 return 'subtask'
-            elif label.name == 'type:subtask':
+            elif name == 'type:subtask':
                 return 'subtask'
         
         # If no type label found, this is an error condition
         # Don't fallback - the configuration specifies labels
         return 'unknown'
     
+    def _detect_type_from_graphql(self, issue_data: Dict[str, Any]) -> str:
+        """Detect issue type from issue data returned by a GraphQL query.
+        
+        Mirrors detect_issue_type() but reads the already fetched 'issueType'
+        and 'labels' fields instead of issuing another request.
+        
+        Args:
+            issue_data: GraphQL issue node with 'issueType' and 'labels' fields
+            
+        Returns:
+            Issue type: 'epic', 'task', 'subtask' or 'unknown'
+        """
+        config = self.github.config
+        if config and getattr(config, 'issue_type_method', None) == "labels":
+            return self._type_from_label_names(
+                label['name'] for label in issue_data.get('labels', {}).get('nodes', [])
+            )
+        
+        issue_type = issue_data.get('issueType')
+        if issue_type and issue_type.get('name'):
+            return self._type_from_native_name(issue_type['name'])
+        return 'unknown'
+    
     def find_parent_issue(self, repo: str, issue_number: int) -> Optional[Dict[str, Any]]:
         """Find parent issue for a task or sub-task.
         
+        The native sub-issue parent is used when available. Otherwise the parent
+        is resolved from body task-list references through the persisted
+        reverse index (see _find_parent_by_reference).
+        
         Args:
             repo: Repository in format 'owner/repo'
             issue_number: Issue number
             
         Returns:
             Parent issue information or None if not found
+        """
+        try:
+            repo_owner, repo_name = repo.split('/')
+            parent = self.github.graphql.get_issue_parent(repo_owner, repo_name, issue_number)
+            if parent:
+                return self._format_graphql_parent(parent)
+        except GraphQLError:
+            # No native hierarchy available, use body references instead
+            pass
+        
+        return self._find_parent_by_reference(repo, issue_number)
+    
+    def _find_parent_by_reference(self, repo: str, issue_number: int) -> Optional[Dict[str, Any]]:
+        """Find the issue whose body references this issue in a task list.
+        
+        Uses the child → parent ParentIndex persisted in the cache directory.
+        The index is brought up to date with the issues updated since its last
+        sync, so a lookup needs a constant number of requests rather than a
+        scan of every issue in the repository.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            issue_number: Issue number
             
-        Raises:
-            GithubException: If GitHub API access fails
+        Returns:
+            Parent issue information or None if not found
         """
         try:
             github_repo = self.github.github.get_repo(repo)
             
-            # Search through open issues to find ones that reference this issue
-            issues = github_repo.get_issues(state='all')
+            index = ParentIndex.for_repository(repo, self.github.cache_dir)
+            index.sync(github_repo)
             
-            # Patterns to look for in issue bodies
-            same_repo_pattern = re.compile(rf'- \[([x\s])\] #{issue_number}(?:\s|$)', re.IGNORECASE)
-            cross_repo_pattern = re.compile(rf'- \[([x\s])\] {re.escape(repo)}#{issue_number}(?:\s|$)', re.IGNORECASE)
+            parent_number = index.get_parent(issue_number)
+            if parent_number is None:
+                return None
             
-            for issue in issues:
-                if issue.number == issue_number:
-                    continue  # Skip the issue itself
-                
-                if not issue.body:
-                    continue
-                
-                # Check if this issue references our target issue
-                if same_repo_pattern.search(issue.body) or cross_repo_pattern.search(issue.body):
-                    # Found a parent issue
-                    return {
-                        'number': issue.number,
-                        'title': issue.title,
-                        'state': issue.state,
-                        'type': self.detect_issue_type(issue),
-                        'url': issue.html_url
-                    }
-            
-            return None
+            issue = github_repo.get_issue(parent_number)
+            return {
+                'number': issue.number,
+                'title': issue.title,
+                'state': issue.state,
+                'type': self.detect_issue_type(issue),
+                'url': issue.html_url
+            }
             
         except (GithubException, GraphQLError):
             # If we can't search for parent issues, just return None
@@ -176,40 +265,10 @@ class IssueService:
         try:
             # Try to get sub-issues via GraphQL
             if self.github.check_sub_issues_available(repo):
-                sub_issues_data = self.github.get_issue_with_sub_issues(repo, issue_number)
-                if 'node' in sub_issues_data and sub_issues_data['node']:
-                    sub_issues = sub_issues_data['node']['subIssues']['nodes']
-                    processed_sub_issues = []
-                    for sub in sub_issues:
-                        labels = [{'name': label['name'], 'color': label['color']} 
-                                 for label in sub.get('labels', {}).get('nodes', [])]
-                        workflow_status = self.extract_workflow_status(labels)
-                        assignees = [assignee['login'] for assignee in sub.get('assignees', {}).get('nodes', [])]
-                        
-                        processed_sub_issues.append({
-                            'number': sub['number'],
-                            'title': sub['title'],
-                            'state': sub['state'].lower(),
-                            'author': sub['author']['login'],
-                            'assignees': assignees,
-                            'labels': labels,
-                            'workflow_status': workflow_status
-                        })
-                    
-                    additional_data['sub_issues'] = processed_sub_issues
-                    
-                    # Calculate summary statistics locally from existing data
-                    total = len(processed_sub_issues)
-                    closed = sum(1 for sub in processed_sub_issues if sub['state'] == 'closed')
-                    open_count = total - closed
-                    completion_rate = (closed / total * 100) if total > 0 else 0
-                    
-                    additional_data['sub_issues_summary'] = {
-                        'total': total,
-                        'open': open_count,
-                        'closed': closed,
-                        'completion_rate': round(completion_rate, 1)
-                    }
+                sub_issues = list(self.github.iter_sub_issues(repo, issue_number))
+                processed_sub_issues, summary = self._process_sub_issue_nodes(sub_issues)
+                additional_data['sub_issues'] = processed_sub_issues
+                additional_data['sub_issues_summary'] = summary
         except (GraphQLError, FeatureUnavailableError):
             # Fall back to parsing issue body for task references
             github_repo = self.github.github.get_repo(repo)
@@ -246,40 +305,10 @@ class IssueService:
         # Also try to get sub-issues for tasks (they can have subtasks)
         try:
             if self.github.check_sub_issues_available(repo):
-                sub_issues_data = self.github.get_issue_with_sub_issues(repo, issue_number)
-                if 'node' in sub_issues_data and sub_issues_data['node']:
-                    sub_issues = sub_issues_data['node']['subIssues']['nodes']
-                    processed_sub_issues = []
-                    for sub in sub_issues:
-                        labels = [{'name': label['name'], 'color': label['color']} 
-                                 for label in sub.get('labels', {}).get('nodes', [])]
-                        workflow_status = self.extract_workflow_status(labels)
-                        assignees = [assignee['login'] for assignee in sub.get('assignees', {}).get('nodes', [])]
-                        
-                        processed_sub_issues.append({
-                            'number': sub['number'],
-                            'title': sub['title'],
-                            'state': sub['state'].lower(),
-                            'author': sub['author']['login'],
-                            'assignees': assignees,
-                            'labels': labels,
-                            'workflow_status': workflow_status
-                        })
-                    
-                    additional_data['sub_issues'] = processed_sub_issues
-                    
-                    # Calculate summary statistics locally from existing data
-                    total = len(processed_sub_issues)
-                    closed = sum(1 for sub in processed_sub_issues if sub['state'] == 'closed')
-                    open_count = total - closed
-                    completion_rate = (closed / total * 100) if total > 0 else 0
-                    
-                    additional_data['sub_issues_summary'] = {
-                        'total': total,
-                        'open': open_count,
-                        'closed': closed,
-                        'completion_rate': round(completion_rate, 1)
-                    }
+                sub_issues = list(self.github.iter_sub_issues(repo, issue_number))
+                processed_sub_issues, summary = self._process_sub_issue_nodes(sub_issues)
+                additional_data['sub_issues'] = processed_sub_issues
+                additional_data['sub_issues_summary'] = summary
         except (GraphQLError, FeatureUnavailableError):
             # Fall back to parsing issue body for subtask references
             github_repo = self.github.github.get_repo(repo)
@@ -290,6 +319,31 @@ class IssueService:
         
         return additional_data
     
+    def _process_sub_issue_nodes(self, sub_issues: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """Convert GraphQL sub-issue nodes into display data and a summary.
+        
+        Args:
+            sub_issues: Sub-issue nodes as returned by GraphQL
+            
+        Returns:
+            Tuple of (processed sub-issue list, summary statistics)
+        """
+        summaries = [IssueSummary.from_graphql(sub) for sub in sub_issues]
+        
+        # Calculate summary statistics locally from existing data
+        total = len(summaries)
+        closed = sum(1 for sub in summaries if sub.state == 'closed')
+        open_count = total - closed
+        completion_rate = (closed / total * 100) if total > 0 else 0
+        
+        summary = {
+            'total': total,
+            'open': open_count,
+            'closed': closed,
+            'completion_rate': round(completion_rate, 1)
+        }
+        return [sub.to_dict() for sub in summaries], summary
+    
     def extract_workflow_status(self, labels: List[Dict[str, Any]]) -> Optional[str]:
         """Extract workflow status from issue labels.
         
@@ -311,7 +365,8 @@ class IssueService:
                 
         return None
     
-    def format_section(self, section) -> Dict[str, Any]:
+    @staticmethod
+    def format_section(section) -> Dict[str, Any]:
         """Format a parsed section for display.
         
         Args:
@@ -460,15 +515,24 @@ class IssueService:
             'completion_rate': round(completion_rate, 1)
         }
     
-    def get_issue_with_details(self, repo: str, issue_number: int) -> Dict[str, Any]:
+    def get_issue_with_details(self, repo: str, issue_number: int,
+                               full_log: bool = False) -> Dict[str, Any]:
         """Get comprehensive issue data with all details.
         
         This method fetches an issue from GitHub, parses its body, detects its type,
         and gathers all related information (hierarchy, sub-issues, etc.).
         
+        The data is fetched with a single composed GraphQL query. If GraphQL is
+        unavailable for the repository, the REST based lookup is used instead;
+        both paths produce the same dictionary.
+        
+        Log archive comments aren't listed with the comments; they're linked
+        from 'log_archive' instead.
+        
         Args:
             repo: Repository in format 'owner/repo'
             issue_number: Issue number to retrieve
+            full_log: Also include the log entries archived to comments
             
         Returns:
             Dictionary containing complete issue data
@@ -481,12 +545,19 @@ class IssueService:
             # Parse repository information
             repo_owner, repo_name = repo.split('/')
             
-            # Get issue details using REST API first
+            try:
+                issue_data = self._get_issue_with_details_graphql(repo, repo_owner, repo_name, issue_number)
+                return self._attach_log_archive(issue_data, full_log)
+            except GraphQLError:
+                # Fall back to the REST lookup (e.g. no GraphQL access or no sub-issues feature)
+                pass
+            
+            # Get issue details using REST API
             github_repo = self.github.github.get_repo(repo)
             issue = github_repo.get_issue(issue_number)
             
             # Parse issue body using our parser
-            parsed_body = IssueParser.parse_body(issue.body or "")
+            parsed_body = IssueParser.parse_body_cached(issue.body or "")
             
             # Detect issue type from labels or body
             issue_type = self.detect_issue_type(issue)
@@ -522,7 +593,7 @@ class IssueService:
                 **additional_data
             }
             
-            return issue_data
+            return self._attach_log_archive(issue_data, full_log)
             
         except GithubException as e:
             if e.status == 404:
@@ -531,4 +602,174 @@ class IssueService:
         except ValueError as e:
             if "not enough values to unpack" in str(e):
                 raise ValueError(f"Invalid repository format '{repo}'. Expected 'owner/repo'")
-            raise
\ No newline at end of file
+            raise
+    
+    def get_issue_outline(self, repo: str, issue_number: int) -> Dict[str, Any]:
+        """Get an issue's body and a header index of it, for single-section reads.
+        
+        Unlike get_issue_with_details(), no comments, sub-issues or parent are
+        fetched and the body isn't parsed: one small GraphQL query returns
+        the body, and 'section_index' locates its sections so only the one
+        that's needed has to be parsed.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            issue_number: Issue number to retrieve
+            
+        Returns:
+            Dictionary with 'number', 'title', 'state', 'type', 'url',
+            'repository', 'body' and 'section_index' (a SectionIndex)
+            
+        Raises:
+            GithubException: If the issue is not found
+            ValueError: If the repository format is invalid
+        """
+        try:
+            repo_owner, repo_name = repo.split('/')
+        except ValueError:
+            raise ValueError(f"Invalid repository format '{repo}'. Expected 'owner/repo'")
+        
+        try:
+            issue = self.github.graphql.get_issue_body(repo_owner, repo_name, issue_number)
+            outline = {
+                'number': issue['number'],
+                'title': issue['title'],
+                'state': issue['state'].lower(),
+                'type': self._detect_type_from_graphql(issue),
+                'url': issue['url'],
+                'body': issue.get('body') or "",
+            }
+        except GraphQLError:
+            # Fall back to the REST issue (e.g. no GraphQL access)
+            issue = self.github.get_issue(repo, issue_number)
+            outline = {
+                'number': issue.number,
+                'title': issue.title,
+                'state': issue.state,
+                'type': self.detect_issue_type(issue),
+                'url': issue.html_url,
+                'body': issue.body or "",
+            }
+        
+        outline['repository'] = repo
+        outline['section_index'] = IssueParser.index_sections(outline['body'])
+        return outline
+    
+    def _get_issue_with_details_graphql(self, repo: str, repo_owner: str, repo_name: str,
+                                        issue_number: int) -> Dict[str, Any]:
+        """Build the get_issue_with_details() dictionary from one GraphQL query.
+        
+        Args:
+            repo: Repository in format 'owner/repo'
+            repo_owner: Repository owner
+            repo_name: Repository name
+            issue_number: Issue number to retrieve
+            
+        Returns:
+            Dictionary containing complete issue data
+            
+        Raises:
+            GraphQLError: If the composed query is not available or fails
+        """
+        issue = self.github.graphql.get_issue_details(repo_owner, repo_name, issue_number)
+        
+        parsed_body = IssueParser.parse_body_cached(issue.get('body') or "")
+        issue_type = self._detect_type_from_graphql(issue)
+        
+        # Additional data mirrors get_epic_data() / get_task_data()
+        additional_data = {}
+        if issue_type in ['epic', 'task', 'sub-task']:
+            if issue_type != 'epic':
+                parent_info = self._format_graphql_parent(issue.get('parent'))
+                if parent_info is None:
+                    parent_info = self._find_parent_by_reference(repo, issue_number)
+                if parent_info:
+                    additional_data['parent_issue'] = parent_info
+            
+            processed_sub_issues, summary = self._process_sub_issue_nodes(issue['subIssues']['nodes'])
+            additional_data['sub_issues'] = processed_sub_issues
+            additional_data['sub_issues_summary'] = summary
+        
+        milestone = issue.get('milestone')
+        author = issue.get('author')
+        
+        return {
+            'number': issue['number'],
+            'title': issue['title'],
+            'state': issue['state'].lower(),
+            'type': issue_type,
+            'author': author['login'] if author else 'ghost',
+            'created_at': self._graphql_isoformat(issue['createdAt']),
+            'updated_at': self._graphql_isoformat(issue['updatedAt']),
+            'url': issue['url'],
+            'labels': [{'name': label['name'], 'color': label['color']} for label in issue['labels']['nodes']],
+            'assignees': [assignee['login'] for assignee in issue['assignees']['nodes']],
+            'milestone': {
+                'title': milestone['title'],
+                'state': milestone['state'].lower(),
+                'due_on': self._graphql_isoformat(milestone['dueOn']) if milestone.get('dueOn') else None
+            } if milestone else None,
+            'pre_section_description': parsed_body['pre_section_description'],
+            'sections': [self.format_section(section) for section in parsed_body['sections']],
+            'log_entries': [self.format_log_entry(entry) for entry in parsed_body['log_entries']],
+            'comments': [self._format_graphql_comment(comment) for comment in issue['comments']['nodes']],
+            **additional_data
+        }
+    
+    def _attach_log_archive(self, issue_data: Dict[str, Any], full_log: bool) -> Dict[str, Any]:
+        """Move log archive comments out of an issue's comments.
+        
+        Args:
+            issue_data: Issue data built by get_issue_with_details()
+            full_log: Prepend the archived entries to 'log_entries'
+            
+        Returns:
+            The issue data; if it has archive comments, 'log_archive' lists
+            their URLs (and with full_log, the number of archived entries)
+        """
+        archive = [comment for comment in issue_data['comments'] if is_archive_comment(comment['body'])]
+        if not archive:
+            return issue_data
+        
+        issue_data['comments'] = [
+            comment for comment in issue_data['comments'] if not is_archive_comment(comment['body'])
+        ]
+        issue_data['log_archive'] = {'comments': [comment['html_url'] for comment in archive]}
+        
+        if full_log:
+            archived_entries = IssueParser.parse_log_archive(comment['body'] for comment in archive)
+            issue_data['log_entries'] = [
+                self.format_log_entry(entry) for entry in archived_entries
+            ] + issue_data['log_entries']
+            issue_data['log_archive']['entries'] = len(archived_entries)
+        
+        return issue_data
+    
+    def _format_graphql_parent(self, parent: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Format a native GraphQL parent issue like find_parent_issue() does."""
+        if not parent:
+            return None
+        return {
+            'number': parent['number'],
+            'title': parent['title'],
+            'state': parent['state'].lower(),
+            'type': self._detect_type_from_graphql(parent),
+            'url': parent['url']
+        }
+    
+    def _format_graphql_comment(self, comment: Dict[str, Any]) -> Dict[str, Any]:
+        """Format a GraphQL comment node like format_comment() formats REST comments."""
+        author = comment.get('author')
+        return {
+            'id': comment['databaseId'],
+            'author': author['login'] if author else 'ghost',
+            'body': comment['body'],
+            'created_at': self._graphql_isoformat(comment['createdAt']),
+            'updated_at': self._graphql_isoformat(comment['updatedAt']),
+            'html_url': comment['url']
+        }
+    
+    @staticmethod
+    def _graphql_isoformat(timestamp: str) -> str:
+        """Convert a GraphQL DateTime ('...Z') into the isoformat used by REST data."""
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).isoformat()
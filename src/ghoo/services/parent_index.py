@@ -0,0 +1,146 @@
+"""Persisted child → parent index for body-reference issue hierarchies.
+
+Repositories without native sub-issues express hierarchy through task list
+references in the parent body ("- [ ] #123"). Finding the parent of an issue
+then requires scanning every issue body in the repository. This module keeps
+the result of that scan on disk and refreshes it incrementally from the
+issues updated since the last sync, so a lookup costs O(1) requests.
+"""
+
+import json
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from ..utils.cache import write_json_atomic
+
+
+class ParentIndex:
+    """Reverse index mapping child issue numbers to the issue that references them."""
+
+    # Bump when the on-disk format changes; older files are rebuilt
+    VERSION = 1
+
+    def __init__(self, repo: str, path: Optional[Path] = None):
+        """Initialize an empty index for a repository.
+
+        Args:
+            repo: Repository in format 'owner/repo'
+            path: JSON file the index is persisted to (in-memory only if None)
+        """
+        self.repo = repo
+        self.path = path
+        self.synced_at: Optional[datetime] = None
+        self.children: Dict[int, int] = {}
+        self._reference_pattern = re.compile(
+            rf'- \[[x\s]\] (?:{re.escape(repo)})?#(\d+)(?=\s|$)', re.IGNORECASE
+        )
+
+    @classmethod
+    def for_repository(cls, repo: str, cache_dir: Path) -> 'ParentIndex':
+        """Load the persisted index for a repository (empty if none exists yet).
+
+        Args:
+            repo: Repository in format 'owner/repo'
+            cache_dir: ghoo cache directory
+
+        Returns:
+            ParentIndex instance backed by a file in the cache directory
+        """
+        owner, name = repo.split('/')
+        index = cls(repo, Path(cache_dir) / "parent_index" / f"{owner}__{name}.json")
+        index.load()
+        return index
+
+    def load(self) -> None:
+        """Load the index from disk, ignoring missing or unreadable files."""
+        if not self.path or not self.path.exists():
+            return
+
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+
+        if data.get('version') != self.VERSION or data.get('repo') != self.repo:
+            return
+
+        self.synced_at = datetime.fromisoformat(data['synced_at']) if data.get('synced_at') else None
+        self.children = {int(child): parent for child, parent in data.get('children', {}).items()}
+
+    def save(self) -> None:
+        """Persist the index atomically; failures leave the index in memory only."""
+        if not self.path:
+            return
+
+        data = {
+            'version': self.VERSION,
+            'repo': self.repo,
+            'synced_at': self.synced_at.isoformat() if self.synced_at else None,
+            'children': {str(child): parent for child, parent in self.children.items()},
+        }
+
+        try:
+            write_json_atomic(self.path, data)
+        except OSError:
+            pass
+
+    def extract_references(self, body: str) -> Set[int]:
+        """Return the issue numbers in this repository referenced from a body.
+
+        Args:
+            body: Issue body text
+
+        Returns:
+            Set of referenced issue numbers
+        """
+        if not body:
+            return set()
+        return {int(number) for number in self._reference_pattern.findall(body)}
+
+    def update_issue(self, issue_number: int, body: Optional[str]) -> None:
+        """Replace the references recorded for one (possible) parent issue.
+
+        Args:
+            issue_number: Number of the issue whose body changed
+            body: Current body of the issue
+        """
+        stale = [child for child, parent in self.children.items() if parent == issue_number]
+        for child in stale:
+            del self.children[child]
+
+        for child in self.extract_references(body):
+            if child != issue_number:
+                self.children[child] = issue_number
+
+    def sync(self, github_repo) -> None:
+        """Bring the index up to date with issues updated since the last sync.
+
+        The first sync reads every issue once; later syncs only request issues
+        whose updatedAt is at or after the previous high-water mark, which is
+        usually a single page.
+
+        Args:
+            github_repo: PyGithub Repository object for self.repo
+
+        Raises:
+            GithubException: If listing issues fails
+        """
+        kwargs = {'state': 'all', 'sort': 'updated', 'direction': 'asc'}
+        if self.synced_at:
+            kwargs['since'] = self.synced_at
+
+        changed = False
+        for issue in github_repo.get_issues(**kwargs):
+            self.update_issue(issue.number, issue.body)
+            if self.synced_at is None or issue.updated_at > self.synced_at:
+                self.synced_at = issue.updated_at
+            changed = True
+
+        if changed:
+            self.save()
+
+    def get_parent(self, issue_number: int) -> Optional[int]:
+        """Return the number of the issue referencing issue_number, if any."""
+        return self.children.get(issue_number)
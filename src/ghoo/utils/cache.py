@@ -0,0 +1,100 @@
+"""Location of ghoo's on-disk caches and how their files are written."""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+
+# Environment variable that overrides the cache location
+CACHE_DIR_ENV = "GHOO_CACHE_DIR"
+
+# Environment variable that disables the persistent caches when set to a true value
+NO_CACHE_ENV = "GHOO_NO_CACHE"
+
+# Length of the project directory hash naming a project's cache directory
+PROJECT_HASH_LENGTH = 16
+
+
+def cache_enabled() -> bool:
+    """Return False if persistent caching was disabled via GHOO_NO_CACHE."""
+    return os.getenv(NO_CACHE_ENV, "").lower() not in ("1", "true", "yes")
+
+
+def get_cache_dir(config_dir: Optional[Path] = None) -> Path:
+    """Return the directory ghoo uses for persisted caches and indexes.
+
+    The location is resolved in the following order:
+    1. The GHOO_CACHE_DIR environment variable
+    2. '~/.cache/ghoo/<hash of the config directory>' for a known project
+    3. '~/.cache/ghoo' when no config directory is known
+
+    Caches never live inside the project, so they can't leave untracked
+    files in its working tree (which `submit-work` would refuse) or be
+    committed along with it. State shared by all projects, such as the
+    rate-limit budget of a token, belongs in get_cache_dir() without a
+    config directory.
+
+    The directory is not created; writers create it on first use.
+
+    Args:
+        config_dir: Directory containing ghoo.yaml, if known
+
+    Returns:
+        Path to the cache directory
+    """
+    override = os.getenv(CACHE_DIR_ENV)
+    if override:
+        return Path(override).expanduser()
+
+    base = Path.home() / ".cache" / "ghoo"
+    if config_dir:
+        project = str(Path(config_dir).expanduser().resolve())
+        return base / hashlib.sha256(project.encode()).hexdigest()[:PROJECT_HASH_LENGTH]
+
+    return base
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace a file's content atomically, creating its directory if needed.
+
+    The data is written to a temporary file next to the target and renamed
+    over it, so concurrent readers see either the old or the new content.
+    The temporary file is removed if anything goes wrong.
+
+    Args:
+        path: File to write
+        data: New content
+
+    Raises:
+        OSError: If the file can't be written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_json_atomic(path: Path, data: Any, **options: Any) -> None:
+    """Write data as JSON with write_atomic().
+
+    Args:
+        path: File to write
+        data: JSON-serializable data
+        **options: Keyword arguments for json.dumps()
+
+    Raises:
+        OSError: If the file can't be written
+        TypeError: If data isn't JSON-serializable (nothing is written)
+    """
+    write_atomic(path, json.dumps(data, **options).encode('utf-8'))
@@ -0,0 +1,341 @@
+"""Persistent HTTP response cache with conditional revalidation.
+
+GitHub answers conditional requests (If-None-Match / If-Modified-Since) with
+'304 Not Modified' when a resource is unchanged, and those responses do not
+count against the primary rate limit. This module stores GET responses on
+disk together with their validators and transparently turns every repeated
+GET issued by PyGithub into a conditional request.
+
+Entries are keyed by URL, Accept header and a hash of the Authorization
+header, so responses are never shared between tokens. The cache is bounded
+by total size and evicts least recently used entries.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .rate_limit import RateLimitScheduler
+from .cache import write_atomic
+
+
+# Headers copied from a 304 response onto the cached response it revalidated
+_REFRESHED_HEADER_PREFIXES = ('x-ratelimit-', 'date', 'etag', 'last-modified')
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body together with its headers and validators."""
+    url: str
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b''
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get('ETag') or self.headers.get('etag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get('Last-Modified') or self.headers.get('last-modified')
+
+
+class HTTPCache:
+    """On-disk store of HTTP responses bounded by size with LRU eviction.
+
+    Each entry is one file holding a JSON metadata line followed by the raw
+    body. File modification times record last use and drive eviction.
+    """
+
+    # Default upper bound for the total size of all entries
+    DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+    # Fraction of max_bytes to shrink to when eviction runs
+    EVICTION_TARGET = 0.9
+
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory the entries are stored in (created on first write)
+            max_bytes: Maximum total size of all entries
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._total_bytes: Optional[int] = None
+
+    @staticmethod
+    def make_key(url: str, identity: str = '', accept: str = '') -> str:
+        """Build the cache key for a request.
+
+        Args:
+            url: Full request URL including the query string
+            identity: Value identifying the credentials (e.g. Authorization header)
+            accept: Accept header of the request
+
+        Returns:
+            Hex digest used as the entry file name
+        """
+        token_hash = hashlib.sha256(identity.encode()).hexdigest()
+        return hashlib.sha256(f"{token_hash}\n{accept}\n{url}".encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return a stored response and mark it as recently used.
+
+        Args:
+            key: Cache key from make_key()
+
+        Returns:
+            CachedResponse or None if the key is not cached or unreadable
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                meta = json.loads(f.readline())
+                body = f.read()
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+
+        return CachedResponse(url=meta['url'], status=meta['status'], headers=meta['headers'], body=body)
+
+    def put(self, key: str, response: CachedResponse) -> None:
+        """Store a response, evicting old entries if the size cap is exceeded.
+
+        Write failures are ignored; the cache is an optimization only.
+
+        Args:
+            key: Cache key from make_key()
+            response: Response to store
+        """
+        path = self._path(key)
+        meta = {'url': response.url, 'status': response.status, 'headers': response.headers}
+        data = json.dumps(meta).encode() + b'\n' + response.body
+
+        if len(data) > self.max_bytes:
+            return
+
+        try:
+            previous_size = path.stat().st_size if path.exists() else 0
+            write_atomic(path, data)
+        except OSError:
+            return
+
+        total = self._current_size() + len(data) - previous_size
+        self._total_bytes = total
+        if total > self.max_bytes:
+            self._evict()
+
+    def _current_size(self) -> int:
+        """Total size of all entries, scanned once and then tracked in memory."""
+        if self._total_bytes is None:
+            self._total_bytes = sum(size for _, _, size in self._entries())
+        return self._total_bytes
+
+    def _entries(self):
+        """Yield (mtime, path, size) for every stored entry."""
+        if not self.directory.exists():
+            return
+        for bucket in os.scandir(self.directory):
+            if not bucket.is_dir():
+                continue
+            for entry in os.scandir(bucket.path):
+                if entry.name.endswith('.tmp'):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                yield stat.st_mtime, entry.path, stat.st_size
+
+    def _evict(self) -> None:
+        """Delete least recently used entries until under the eviction target."""
+        entries = sorted(self._entries())
+        total = sum(size for _, _, size in entries)
+        target = self.max_bytes * self.EVICTION_TARGET
+
+        for _, path, size in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+
+        self._total_bytes = total
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        for _, path, _ in list(self._entries()):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._total_bytes = 0
+
+
+class CachingHTTPAdapter(HTTPAdapter):
+    """requests adapter that revalidates GET responses against an HTTPCache.
+
+    When a RateLimitScheduler is given, every request is also paced through it
+    and every response reports its rate-limit headers back to it. When an
+    on_unauthorized callback is given, it is called with every 401 response
+    and may raise to abort the request.
+    """
+
+    def __init__(self, cache: Optional[HTTPCache] = None, *args: Any,
+                 scheduler: Optional[RateLimitScheduler] = None,
+                 on_unauthorized: Optional[Callable[[requests.Response], None]] = None,
+                 **kwargs: Any):
+        """Initialize the adapter.
+
+        Args:
+            cache: Cache used to store and revalidate responses (None disables caching)
+            scheduler: Optional rate-limit scheduler shared with the GraphQL client
+            on_unauthorized: Optional callback invoked with 401 responses
+            *args, **kwargs: Passed on to requests.adapters.HTTPAdapter
+        """
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+        self.scheduler = scheduler
+        self.on_unauthorized = on_unauthorized
+
+    def send(self, request: requests.PreparedRequest, stream: bool = False, **kwargs: Any) -> requests.Response:
+        """Send a request, using cached validators for repeated GETs."""
+        if self.scheduler is not None:
+            self.scheduler.acquire(self.scheduler.resource_for_url(request.url))
+
+        response = self._send_with_cache(request, stream=stream, **kwargs)
+
+        if self.scheduler is not None:
+            body = response.text if response.status_code in (403, 429) and not stream else ''
+            self.scheduler.observe_headers(response.headers, response.status_code, body)
+
+        if response.status_code == 401 and self.on_unauthorized is not None:
+            self.on_unauthorized(response)
+
+        return response
+
+    def _send_with_cache(self, request: requests.PreparedRequest, stream: bool = False,
+                         **kwargs: Any) -> requests.Response:
+        """Send a request through the cache (if any) and return the response."""
+        if (self.cache is None or request.method != 'GET' or stream
+                or self._has_validators(request.headers)):
+            return super().send(request, stream=stream, **kwargs)
+
+        key = HTTPCache.make_key(
+            request.url,
+            request.headers.get('Authorization', ''),
+            request.headers.get('Accept', ''),
+        )
+        cached = self.cache.get(key)
+
+        if cached is not None:
+            if cached.etag:
+                request.headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                request.headers['If-Modified-Since'] = cached.last_modified
+
+        response = super().send(request, stream=stream, **kwargs)
+
+        if cached is not None and response.status_code == 304:
+            for name, value in response.headers.items():
+                if name.lower().startswith(_REFRESHED_HEADER_PREFIXES):
+                    cached.headers[name] = value
+            self.cache.put(key, cached)
+            return self._build_response(request, cached, response)
+
+        if response.status_code == 200 and self._is_storable(response):
+            self.cache.put(key, CachedResponse(
+                url=request.url,
+                status=response.status_code,
+                headers=dict(response.headers),
+                body=response.content,
+            ))
+
+        return response
+
+    @staticmethod
+    def _has_validators(headers) -> bool:
+        """Requests that already carry validators expect to see a 304 themselves."""
+        return 'If-None-Match' in headers or 'If-Modified-Since' in headers
+
+    @staticmethod
+    def _is_storable(response: requests.Response) -> bool:
+        headers = response.headers
+        if 'no-store' in headers.get('Cache-Control', ''):
+            return False
+        return bool(headers.get('ETag') or headers.get('Last-Modified'))
+
+    def _build_response(self, request: requests.PreparedRequest, cached: CachedResponse,
+                        revalidation: requests.Response) -> requests.Response:
+        """Build a response from a cached entry after a 304 revalidation."""
+        response = requests.Response()
+        response.status_code = cached.status
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(cached.headers)
+        response._content = cached.body
+        response._content_consumed = True
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers) or 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = revalidation.elapsed
+        return response
+
+
+def install_http_adapter(github_client: Any, cache: Optional[HTTPCache] = None,
+                         scheduler: Optional[RateLimitScheduler] = None,
+                         on_unauthorized: Optional[Callable[[requests.Response], None]] = None) -> bool:
+    """Route a PyGithub client's REST requests through a CachingHTTPAdapter.
+
+    PyGithub has no public hook for its HTTP session, so the connection class
+    of this client's Requester is replaced with one that mounts the adapter.
+    Other Github instances in the process are unaffected.
+
+    Args:
+        github_client: github.Github instance (before it has made any request)
+        cache: Response cache to use, or None to disable caching
+        scheduler: Rate-limit scheduler to pace requests through, if any
+        on_unauthorized: Callback invoked with 401 responses, if any
+
+    Returns:
+        True if the adapter was installed, False if the client is not supported
+    """
+    from github.Requester import HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass
+
+    requester = getattr(github_client, 'requester', None)
+    if requester is None or not hasattr(requester, '_Requester__connectionClass'):
+        return False
+
+    base_class = requester._Requester__connectionClass
+    supported = (HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass)
+    if not isinstance(base_class, type) or not issubclass(base_class, supported):
+        return False
+
+    class CachingConnectionClass(base_class):
+        def __init__(self, *args: Any, **kwargs: Any):
+            super().__init__(*args, **kwargs)
+            self.adapter = CachingHTTPAdapter(
+                cache,
+                scheduler=scheduler,
+                on_unauthorized=on_unauthorized,
+                max_retries=self.retry,
+                pool_connections=self.pool_size,
+                pool_maxsize=self.pool_size,
+            )
+            self.session.mount(f"{self.protocol}://", self.adapter)
+
+    requester._Requester__connectionClass = CachingConnectionClass
+    return True
@@ -0,0 +1,98 @@
+"""Disk cache of the login a GitHub token authenticates as.
+
+Commands that record who performed an action (workflow transitions, comments,
+condition sign-offs) need the viewer's login, which costs a 'GET /user' round
+trip. The answer only changes when the token changes, so it is stored per
+token hash with a time-to-live and shared by all ghoo processes.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Optional
+
+from .cache import write_json_atomic
+
+
+class IdentityCache:
+    """Viewer login of one token, persisted as a small JSON file."""
+
+    # Seconds a cached login is trusted before it is fetched again
+    DEFAULT_TTL = 24 * 60 * 60
+
+    def __init__(self, path: Optional[Path] = None, ttl: float = DEFAULT_TTL):
+        """Initialize the cache.
+
+        Args:
+            path: JSON file the login is stored in (in-memory only if None)
+            ttl: Seconds a stored login stays valid
+        """
+        self.path = path
+        self.ttl = ttl
+        self._login: Optional[str] = None
+        self._fetched_at = 0.0
+
+    @classmethod
+    def for_token(cls, token: str, cache_dir: Optional[Path] = None,
+                  ttl: float = DEFAULT_TTL) -> 'IdentityCache':
+        """Create the identity cache for a token.
+
+        Args:
+            token: GitHub token (only a hash of it is used)
+            cache_dir: ghoo cache directory, or None for an in-memory cache
+            ttl: Seconds a stored login stays valid
+
+        Returns:
+            IdentityCache instance
+        """
+        if cache_dir is None:
+            return cls(ttl=ttl)
+        token_hash = hashlib.sha256(token.encode()).hexdigest()[:16]
+        return cls(Path(cache_dir) / "identity" / f"{token_hash}.json", ttl=ttl)
+
+    def get(self) -> Optional[str]:
+        """Return the cached login, or None if it is missing or expired."""
+        now = time.time()
+        if self._login is not None and now - self._fetched_at < self.ttl:
+            return self._login
+
+        if not self.path:
+            return None
+        try:
+            data = json.loads(self.path.read_text())
+            login = data['login']
+            fetched_at = float(data['fetched_at'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if not isinstance(login, str) or not login or now - fetched_at >= self.ttl:
+            return None
+
+        self._login = login
+        self._fetched_at = fetched_at
+        return login
+
+    def put(self, login: str) -> None:
+        """Store a freshly fetched login; write failures keep it in memory only."""
+        if not isinstance(login, str) or not login:
+            return
+        self._login = login
+        self._fetched_at = time.time()
+
+        if not self.path:
+            return
+        try:
+            write_json_atomic(self.path, {'login': login, 'fetched_at': self._fetched_at})
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Forget the login, e.g. after the token was rejected."""
+        self._login = None
+        self._fetched_at = 0.0
+        if self.path:
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,100 @@
+"""Disk cache of the label node IDs of a repository.
+
+GraphQL mutations that add or remove labels take label node IDs rather than
+names. Labels are rarely created or renamed, so the name → ID map of each
+repository is stored with a time-to-live and shared by all ghoo processes;
+a workflow transition then resolves its status label without a request.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from .cache import write_json_atomic
+
+
+class LabelCache:
+    """Label name → node ID maps of repositories, persisted as JSON files."""
+
+    # Seconds a cached map is trusted before it is fetched again
+    DEFAULT_TTL = 24 * 60 * 60
+
+    def __init__(self, directory: Optional[Path] = None, ttl: float = DEFAULT_TTL):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory the maps are stored in (in-memory only if None)
+            ttl: Seconds a stored map stays valid
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self._labels: Dict[str, Dict[str, str]] = {}
+        self._fetched_at: Dict[str, float] = {}
+
+    @classmethod
+    def for_cache_dir(cls, cache_dir: Optional[Path] = None,
+                      ttl: float = DEFAULT_TTL) -> 'LabelCache':
+        """Create the label cache of a ghoo cache directory.
+
+        Args:
+            cache_dir: ghoo cache directory, or None for an in-memory cache
+            ttl: Seconds a stored map stays valid
+
+        Returns:
+            LabelCache instance
+        """
+        return cls(Path(cache_dir) / "labels" if cache_dir is not None else None, ttl=ttl)
+
+    def _path(self, repo: str) -> Optional[Path]:
+        if not self.directory:
+            return None
+        owner, name = repo.lower().split('/')
+        return self.directory / f"{owner}__{name}.json"
+
+    def get(self, repo: str) -> Optional[Dict[str, str]]:
+        """Return the cached map of a repository, or None if it is missing or expired.
+
+        Args:
+            repo: Repository in format 'owner/repo'
+        """
+        key = repo.lower()
+        now = time.time()
+        if key in self._labels and now - self._fetched_at[key] < self.ttl:
+            return self._labels[key]
+
+        path = self._path(repo)
+        if not path:
+            return None
+        try:
+            data = json.loads(path.read_text())
+            labels = data['labels']
+            fetched_at = float(data['fetched_at'])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if not isinstance(labels, dict) or now - fetched_at >= self.ttl:
+            return None
+
+        self._labels[key] = labels
+        self._fetched_at[key] = fetched_at
+        return labels
+
+    def put(self, repo: str, labels: Dict[str, str]) -> None:
+        """Store a freshly fetched map; write failures keep it in memory only.
+
+        Args:
+            repo: Repository in format 'owner/repo'
+            labels: Node ID of every label of the repository, keyed by name
+        """
+        key = repo.lower()
+        self._labels[key] = dict(labels)
+        self._fetched_at[key] = time.time()
+
+        path = self._path(repo)
+        if not path:
+            return
+        try:
+            write_json_atomic(path, {'labels': self._labels[key], 'fetched_at': self._fetched_at[key]})
+        except OSError:
+            pass
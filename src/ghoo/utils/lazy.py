@@ -0,0 +1,53 @@
+"""Deferred imports for the CLI modules.
+
+Importing ghoo.core pulls in PyGithub and requests, which dominates the start
+time of every ghoo invocation. The CLI modules therefore list the names they
+need from heavy modules in a mapping and resolve them on first use:
+
+- lazy_importer() builds a module-level __getattr__ (PEP 562), so
+  `from ghoo.main import GitHubClient` and mock.patch('ghoo.main.GitHubClient')
+  keep working.
+- load_lazy_imports() binds all names into the module namespace, so command
+  functions can refer to them as plain globals. The CLI calls it from a Typer
+  callback before a command that needs them runs.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, MutableMapping
+
+
+def load_lazy_imports(namespace: MutableMapping[str, Any], imports: Dict[str, str], package: str) -> None:
+    """Import deferred names into a module namespace.
+
+    Names that are already bound (e.g. replaced by a test or by the daemon's
+    client pool) are left alone.
+
+    Args:
+        namespace: Module globals() to bind the names in
+        imports: Mapping of name to the (possibly relative) module defining it
+        package: Package that relative module names are resolved against
+    """
+    for name, module_name in imports.items():
+        if name not in namespace:
+            namespace[name] = getattr(importlib.import_module(module_name, package), name)
+
+
+def lazy_importer(namespace: MutableMapping[str, Any], imports: Dict[str, str],
+                  package: str) -> Callable[[str], Any]:
+    """Build a module __getattr__ that imports deferred names on first access.
+
+    Args:
+        namespace: Module globals() to bind the names in
+        imports: Mapping of name to the (possibly relative) module defining it
+        package: Package that relative module names are resolved against
+
+    Returns:
+        Function to assign to the module's __getattr__
+    """
+    def __getattr__(name: str) -> Any:
+        if name not in imports:
+            raise AttributeError(f"module {namespace['__name__']!r} has no attribute {name!r}")
+        load_lazy_imports(namespace, imports, package)
+        return namespace[name]
+
+    return __getattr__
@@ -0,0 +1,114 @@
+"""Archive of rotated ## Log entries, kept in comments on the issue.
+
+When a log has more entries than the body should hold, the oldest ones are
+moved out of the issue body into "log archive" comments, and an index line
+right below the ## Log header links to them:
+
+    ## Log
+    _Archived 40 earlier log entries: [1](https://github.com/o/r/issues/5#issuecomment-11)_
+
+Archive comments start with ARCHIVE_MARKER, so they can be told apart from
+discussion comments. The index line sits before the first --- separator,
+where the log parser ignores it.
+"""
+
+import re
+from typing import List, Optional, Sequence, Tuple
+
+
+# GitHub's limit for issue and comment bodies
+GITHUB_BODY_LIMIT = 65536
+
+ARCHIVE_MARKER = '<!-- ghoo:log-archive -->'
+
+ARCHIVE_HEADER = f'{ARCHIVE_MARKER}\n## Log archive'
+
+INDEX_PATTERN = re.compile(r'^_Archived (\d+) earlier log entr(?:y|ies): (.*)_$')
+
+_LINK_PATTERN = re.compile(r'\[\d+\]\(([^)\s]+)\)')
+_COMMENT_ID_PATTERN = re.compile(r'#issuecomment-(\d+)$')
+
+
+class LogArchiveIndex:
+    """The index line below a ## Log header.
+
+    Attributes:
+        count: Number of archived entries
+        urls: URLs of the archive comments, oldest first
+    """
+
+    def __init__(self, count: int = 0, urls: Optional[List[str]] = None):
+        self.count = count
+        self.urls = urls or []
+
+    @classmethod
+    def parse(cls, line: str) -> Optional['LogArchiveIndex']:
+        """Parse an index line, or return None if the line isn't one."""
+        match = INDEX_PATTERN.match(line.strip())
+        if not match:
+            return None
+        return cls(int(match.group(1)), _LINK_PATTERN.findall(match.group(2)))
+
+    @property
+    def comment_ids(self) -> List[int]:
+        """IDs of the archive comments, oldest first."""
+        ids = []
+        for url in self.urls:
+            match = _COMMENT_ID_PATTERN.search(url)
+            if match:
+                ids.append(int(match.group(1)))
+        return ids
+
+    def render(self) -> str:
+        """Return the index line."""
+        noun = 'entry' if self.count == 1 else 'entries'
+        links = ' '.join(f'[{number}]({url})' for number, url in enumerate(self.urls, 1))
+        return f'_Archived {self.count} earlier log {noun}: {links}_'
+
+
+def is_archive_comment(body) -> bool:
+    """Return whether a comment body is a log archive."""
+    return isinstance(body, str) and body.startswith(ARCHIVE_MARKER)
+
+
+def pack_archive(blocks: Sequence[str], latest: Optional[str],
+                 limit: int = GITHUB_BODY_LIMIT) -> Tuple[Optional[str], List[str]]:
+    """Distribute log entry blocks over the latest archive comment and new ones.
+
+    Blocks are appended to the latest archive comment while it stays within
+    the limit; the rest go into as few new comments as possible.
+
+    Args:
+        blocks: Markdown of the entries to archive, oldest first
+        latest: Body of the most recent archive comment, if there is one
+        limit: Maximum length of a comment body
+
+    Returns:
+        Tuple of (new body for the latest comment, or None if it's
+        unchanged; bodies of the comments to create)
+    """
+    updated = None
+    created = []
+    current = latest
+    current_is_latest = latest is not None
+
+    def flush():
+        nonlocal updated
+        if current is None:
+            return
+        if current_is_latest:
+            if current != latest:
+                updated = current
+        else:
+            created.append(current)
+
+    for block in blocks:
+        if current is not None and len(current) + len(block) + 2 <= limit:
+            current = f'{current}\n\n{block}'
+            continue
+        flush()
+        current = f'{ARCHIVE_HEADER}\n\n{block}'
+        current_is_latest = False
+    flush()
+
+    return updated, created
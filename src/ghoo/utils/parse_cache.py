@@ -0,0 +1,187 @@
+"""Cache of IssueParser.parse_body() results keyed by a hash of the body.
+
+A command often parses the same body more than once (validation, then the
+edit), and successive invocations mostly see bodies that haven't changed.
+Results are stored in a compact serialized form, keyed by the SHA-256 of the
+body, in a bounded in-memory LRU and optionally on disk. Every hit is rebuilt
+into new model objects, so callers may modify what they get back.
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..models import Condition, LogEntry, LogSubEntry, Section, Todo
+from .cache import write_json_atomic
+
+
+# Bump when parse_body() output or the serialized form changes, so stale
+# entries written by another ghoo version are ignored
+FORMAT_VERSION = 1
+
+
+def dump_parsed(parsed: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a parse_body() result into compact JSON-serializable data."""
+    return {
+        'v': FORMAT_VERSION,
+        'p': parsed['pre_section_description'],
+        's': [
+            [section.title, section.body,
+             [[todo.text, todo.checked, todo.line_number] for todo in section.todos]]
+            for section in parsed['sections']
+        ],
+        'l': [
+            [entry.to_state, entry.timestamp.isoformat(), entry.author, entry.message,
+             [[sub.title, sub.content] for sub in entry.sub_entries], entry.from_state]
+            for entry in parsed['log_entries']
+        ],
+        'c': [
+            [condition.text, condition.verified, condition.signed_off_by,
+             condition.requirements, condition.evidence, condition.line_number]
+            for condition in parsed['conditions']
+        ],
+    }
+
+
+def load_parsed(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Rebuild a parse_body() result from dump_parsed() data.
+
+    Raises:
+        ValueError: If the data was written in another format version
+    """
+    if data.get('v') != FORMAT_VERSION:
+        raise ValueError(f"Unsupported parse cache format: {data.get('v')!r}")
+
+    return {
+        'pre_section_description': data['p'],
+        'sections': [
+            Section(title=title, body=body,
+                    todos=[Todo(text=text, checked=checked, line_number=line)
+                           for text, checked, line in todos])
+            for title, body, todos in data['s']
+        ],
+        'log_entries': [
+            LogEntry(to_state=to_state, timestamp=datetime.fromisoformat(timestamp),
+                     author=author, message=message,
+                     sub_entries=[LogSubEntry(title=title, content=content)
+                                  for title, content in sub_entries],
+                     from_state=from_state)
+            for to_state, timestamp, author, message, sub_entries, from_state in data['l']
+        ],
+        'conditions': [
+            Condition(text=text, verified=verified, signed_off_by=signed_off_by,
+                      requirements=requirements, evidence=evidence, line_number=line)
+            for text, verified, signed_off_by, requirements, evidence, line in data['c']
+        ],
+    }
+
+
+class ParseCache:
+    """Parsed issue bodies, in a bounded LRU and optionally on disk."""
+
+    # Bodies kept in memory
+    DEFAULT_MAX_ENTRIES = 128
+
+    # Files kept on disk; the least recently written are pruned beyond this
+    DEFAULT_MAX_DISK_ENTRIES = 1024
+
+    def __init__(self, directory: Optional[Path] = None,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory for the persistent layer (in-memory only if None)
+            max_entries: Maximum number of results kept in memory
+            max_disk_entries: Maximum number of results kept on disk
+        """
+        self.directory = Path(directory) if directory else None
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._entries: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(body: str) -> str:
+        """Return the cache key of a body (hex SHA-256 of its UTF-8 bytes)."""
+        return hashlib.sha256(body.encode('utf-8')).hexdigest()
+
+    def get(self, body: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of the cached result for a body, if any."""
+        key = self.key(body)
+        data = self._entries.get(key)
+        if data is not None:
+            self._entries.move_to_end(key)
+        else:
+            data = self._read(key)
+            if data is not None:
+                self._remember(key, data)
+
+        if data is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return load_parsed(data)
+
+    def put(self, body: str, parsed: Dict[str, Any]) -> None:
+        """Store the parse_body() result of a body."""
+        key = self.key(body)
+        data = dump_parsed(parsed)
+        self._remember(key, data)
+        self._write(key, data)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries and delete the persistent ones."""
+        self._entries.clear()
+        if self.directory and self.directory.is_dir():
+            for path in self.directory.glob('*.json'):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def _remember(self, key: str, data: Dict[str, Any]) -> None:
+        self._entries[key] = data
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.directory:
+            return None
+        try:
+            data = json.loads(self._path(key).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('v') != FORMAT_VERSION:
+            return None
+        return data
+
+    def _write(self, key: str, data: Dict[str, Any]) -> None:
+        """Write an entry atomically; failures only cost the persistent copy."""
+        if not self.directory:
+            return
+        try:
+            write_json_atomic(self._path(key), data, separators=(',', ':'), ensure_ascii=False)
+            self._prune()
+        except OSError:
+            pass
+
+    def _prune(self) -> None:
+        paths: List[Path] = list(self.directory.glob('*.json'))
+        excess = len(paths) - self.max_disk_entries
+        if excess <= 0:
+            return
+        paths.sort(key=lambda path: path.stat().st_mtime)
+        for path in paths[:excess]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
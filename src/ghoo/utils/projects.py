@@ -0,0 +1,183 @@
+"""Disk cache of Projects V2 schemas and project item IDs.
+
+Setting an issue's Status on a project board takes three node IDs besides
+the project's own: the Status field, the option to select and the issue's
+item in the project. Fields and options are rarely changed, so each
+project's schema (its fields and their options) is stored with a
+time-to-live and shared by all ghoo processes. Item IDs never change while
+an issue stays on the board; they are kept with the schema and expire with
+it. A status update then needs no query, only the mutation itself.
+
+Field values found missing from a freshly fetched schema are remembered too,
+so a value the board doesn't have costs one schema refetch per TTL rather
+than one per update.
+
+Bulk commands update issues from several threads, so entries are changed
+and written under a lock.
+"""
+
+import json
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .cache import write_json_atomic
+
+
+class ProjectCache:
+    """Project schemas and item IDs, persisted as one JSON file per project."""
+
+    # Seconds a cached schema (and the item IDs stored with it) is trusted
+    DEFAULT_TTL = 24 * 60 * 60
+
+    def __init__(self, directory: Optional[Path] = None, ttl: float = DEFAULT_TTL):
+        """Initialize the cache.
+
+        Args:
+            directory: Directory the projects are stored in (in-memory only if None)
+            ttl: Seconds a stored schema stays valid
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_cache_dir(cls, cache_dir: Optional[Path] = None,
+                      ttl: float = DEFAULT_TTL) -> 'ProjectCache':
+        """Create the project cache of a ghoo cache directory.
+
+        Args:
+            cache_dir: ghoo cache directory, or None for an in-memory cache
+            ttl: Seconds a stored schema stays valid
+
+        Returns:
+            ProjectCache instance
+        """
+        return cls(Path(cache_dir) / "projects" if cache_dir is not None else None, ttl=ttl)
+
+    def _path(self, key: str) -> Optional[Path]:
+        if not self.directory:
+            return None
+        return self.directory / f"{re.sub(r'[^A-Za-z0-9_.-]', '_', key.lower())}.json"
+
+    def _entry(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the unexpired entry of a project, reading it from disk if needed."""
+        now = time.time()
+        entry = self._entries.get(key.lower())
+        if entry is None:
+            path = self._path(key)
+            if not path:
+                return None
+            try:
+                entry = json.loads(path.read_text())
+                entry.setdefault('missing', [])
+                if (not isinstance(entry['project'], dict) or not isinstance(entry['items'], dict)
+                        or not isinstance(entry['missing'], list)):
+                    return None
+                entry['fetched_at'] = float(entry['fetched_at'])
+            except (OSError, ValueError, KeyError, TypeError):
+                return None
+            self._entries[key.lower()] = entry
+
+        if now - entry['fetched_at'] >= self.ttl:
+            return None
+        return entry
+
+    def _write(self, key: str) -> None:
+        """Persist the entry of a project; write failures keep it in memory only.
+
+        Called with the lock held.
+        """
+        path = self._path(key)
+        if not path:
+            return
+        try:
+            write_json_atomic(path, self._entries[key.lower()])
+        except OSError:
+            pass
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached schema of a project, or None if it is missing or expired.
+
+        Args:
+            key: Project URL path (e.g. 'orgs/acme/5') or project node ID
+        """
+        with self._lock:
+            entry = self._entry(key)
+        return entry['project'] if entry else None
+
+    def put(self, key: str, project: Dict[str, Any]) -> None:
+        """Store a freshly fetched schema, dropping the item IDs and misses stored before.
+
+        Args:
+            key: Project URL path (e.g. 'orgs/acme/5') or project node ID
+            project: Project ID, title and fields as returned by get_project_fields()
+        """
+        with self._lock:
+            self._entries[key.lower()] = {'project': project, 'items': {}, 'missing': [], 'fetched_at': time.time()}
+            self._write(key)
+
+    def get_item(self, key: str, issue: str) -> Optional[str]:
+        """Return the cached item ID of an issue in a project.
+
+        Args:
+            key: Project URL path or project node ID
+            issue: Issue as 'owner/repo#number'
+        """
+        with self._lock:
+            entry = self._entry(key)
+            return entry['items'].get(issue.lower()) if entry else None
+
+    def put_items(self, key: str, items: Dict[str, str]) -> None:
+        """Store item IDs of issues in a project whose schema is cached.
+
+        Args:
+            key: Project URL path or project node ID
+            items: Item IDs keyed by issue as 'owner/repo#number'
+        """
+        with self._lock:
+            entry = self._entry(key)
+            if entry is None or not items:
+                return
+            entry['items'].update({issue.lower(): item_id for issue, item_id in items.items()})
+            self._write(key)
+
+    def forget_item(self, key: str, issue: str) -> None:
+        """Drop the item ID of an issue, e.g. after it was removed from the board.
+
+        Args:
+            key: Project URL path or project node ID
+            issue: Issue as 'owner/repo#number'
+        """
+        with self._lock:
+            entry = self._entry(key)
+            if entry is not None and entry['items'].pop(issue.lower(), None) is not None:
+                self._write(key)
+
+    def is_missing(self, key: str, value: str) -> bool:
+        """Return whether a field value was missing from the cached schema.
+
+        Args:
+            key: Project URL path or project node ID
+            value: Field value as 'field=value'
+        """
+        with self._lock:
+            entry = self._entry(key)
+            return entry is not None and value.lower() in entry['missing']
+
+    def put_missing(self, key: str, value: str) -> None:
+        """Remember that the cached schema doesn't have a field value.
+
+        Args:
+            key: Project URL path or project node ID
+            value: Field value as 'field=value'
+        """
+        with self._lock:
+            entry = self._entry(key)
+            if entry is None or value.lower() in entry['missing']:
+                return
+            entry['missing'].append(value.lower())
+            self._write(key)
@@ -0,0 +1,366 @@
+"""Rate-limit-aware request scheduling shared by the REST and GraphQL clients.
+
+GitHub meters each token per resource ('core' for REST, 'graphql', 'search')
+over a fixed window that resets at a known time, and additionally enforces a
+secondary ("abuse") limit on bursts. The RateLimitScheduler reads the budget
+GitHub reports (X-RateLimit-* headers and the GraphQL rateLimit object) and
+spreads the remaining budget evenly over the time left in the window using
+a token bucket per resource, instead of spending it as fast as possible and
+stalling until the reset.
+
+State is persisted per token in the cache directory so that concurrent ghoo
+processes sharing a token also share one view of the budget and divide it
+between themselves.
+"""
+
+import hashlib
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+from .cache import write_json_atomic
+
+
+# Resources metered separately by GitHub
+RESOURCES = ('core', 'graphql', 'search')
+
+
+@dataclass
+class ResourceBudget:
+    """Last known budget of one rate-limit resource."""
+    limit: int = 0
+    remaining: int = 0
+    reset: float = 0.0
+    observed_at: float = 0.0
+    cost: float = 1.0
+    tokens: float = 0.0
+    last_refill: float = 0.0
+
+    @property
+    def known(self) -> bool:
+        return self.observed_at > 0
+
+
+class RateLimitScheduler:
+    """Paces requests so a token's budget lasts until its reset time.
+
+    Callers invoke acquire() before each request and observe_headers() (or
+    observe_graphql_rate_limit()) with each response. acquire() blocks for as
+    long as needed to stay within the budget share of this process.
+    """
+
+    # Requests that may be issued back to back before pacing kicks in
+    BURST = 20
+
+    # Budget kept untouched at the end of a window, as a fraction of the limit
+    RESERVE_FRACTION = 0.01
+
+    # Seconds after which a silent process no longer counts as a budget consumer
+    CLIENT_TIMEOUT = 120
+
+    # Bounds of the adaptive pause applied after secondary rate limit hits
+    MIN_SECONDARY_BACKOFF = 1.0
+    MAX_SECONDARY_BACKOFF = 300.0
+
+    # Successful responses needed to halve the spacing added after a secondary limit hit
+    RECOVERY_SUCCESSES = 20
+
+    # Waits longer than this many seconds are announced on stderr
+    NOTICE_DELAY = 5.0
+
+    def __init__(self, state_path: Optional[Path] = None):
+        """Initialize the scheduler.
+
+        Args:
+            state_path: JSON file used to share state between processes
+                        (in-memory only if None)
+        """
+        self.state_path = state_path
+        self.budgets: Dict[str, ResourceBudget] = {name: ResourceBudget() for name in RESOURCES}
+        self.backoff_until = 0.0
+        self.secondary_hits = 0
+        self.min_interval = 0.0
+        self._successes = 0
+        self._last_request = 0.0
+        self._clients: Dict[str, float] = {}
+        self._client_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._state_mtime = 0.0
+        self._lock = threading.Lock()
+        self._load_shared_state()
+
+    @classmethod
+    def for_token(cls, token: str, cache_dir: Optional[Path] = None) -> 'RateLimitScheduler':
+        """Create a scheduler whose state is shared by all processes using a token.
+
+        Args:
+            token: GitHub token (only a hash of it is used)
+            cache_dir: ghoo cache directory, or None for an in-memory scheduler
+
+        Returns:
+            RateLimitScheduler instance
+        """
+        if cache_dir is None:
+            return cls()
+        token_hash = hashlib.sha256(token.encode()).hexdigest()[:16]
+        return cls(Path(cache_dir) / "ratelimit" / f"{token_hash}.json")
+
+    @staticmethod
+    def resource_for_url(url: str) -> str:
+        """Return the rate-limit resource a REST or GraphQL URL is metered against."""
+        path = url.split('://', 1)[-1]
+        path = path[path.find('/'):] if '/' in path else '/'
+        if path.startswith('/graphql') or path.startswith('/api/graphql'):
+            return 'graphql'
+        if path.startswith('/search/') or path.startswith('/api/v3/search/'):
+            return 'search'
+        return 'core'
+
+    def acquire(self, resource: str = 'core') -> float:
+        """Wait until a request against a resource fits the budget.
+
+        Args:
+            resource: Rate-limit resource ('core', 'graphql' or 'search')
+
+        Waits longer than NOTICE_DELAY are announced on stderr, since queueing
+        for a window reset can block for up to an hour.
+
+        Returns:
+            Number of seconds waited
+        """
+        with self._lock:
+            self._load_shared_state()
+            delay = self._reserve(resource, time.time())
+
+        if delay > self.NOTICE_DELAY:
+            print(f"Waiting {self._format_delay(delay)} for GitHub's {resource} rate limit", file=sys.stderr)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    @staticmethod
+    def _format_delay(delay: float) -> str:
+        minutes, seconds = divmod(int(round(delay)), 60)
+        return f"{minutes}m {seconds}s" if minutes else f"{seconds}s"
+
+    def _reserve(self, resource: str, now: float) -> float:
+        """Take one request's cost from the bucket and return the required delay."""
+        delay = max(0.0, self.backoff_until - now)
+        if self.min_interval:
+            delay = max(delay, self._last_request + self.min_interval - now)
+
+        budget = self.budgets.setdefault(resource, ResourceBudget())
+        if budget.known:
+            if now >= budget.reset:
+                # The window has reset since the last observation
+                budget.remaining = budget.limit
+                budget.reset = now + 3600
+                budget.tokens = self.BURST
+
+            reserve = budget.limit * self.RESERVE_FRACTION
+            available = (budget.remaining - reserve) / self._active_clients(now)
+            if available < budget.cost:
+                # Queue until the window resets
+                delay = max(delay, budget.reset - now)
+            else:
+                rate = available / max(budget.reset - now, 1.0)
+                budget.tokens = min(self.BURST, budget.tokens + (now - budget.last_refill) * rate)
+                budget.last_refill = now
+                if budget.tokens < budget.cost:
+                    delay = max(delay, (budget.cost - budget.tokens) / rate)
+                budget.tokens -= budget.cost
+            budget.remaining -= budget.cost
+
+        self._last_request = now + delay
+        return delay
+
+    def _active_clients(self, now: float) -> int:
+        """Number of processes currently sharing the budget (at least 1)."""
+        active = {client for client, seen in self._clients.items() if now - seen < self.CLIENT_TIMEOUT}
+        active.add(self._client_id)
+        return len(active)
+
+    def observe_headers(self, headers: Mapping[str, Any], status_code: int = 200, body: str = '') -> None:
+        """Update the budget from a response's X-RateLimit-* headers.
+
+        Also detects secondary rate limit responses (403/429 with Retry-After
+        or a "secondary rate limit" message) and backs off adaptively.
+
+        Args:
+            headers: Response headers
+            status_code: HTTP status of the response
+            body: Response body text, used to recognise secondary limit errors
+        """
+        retry_after = self._int_header(headers, 'Retry-After')
+        secondary = self.is_secondary_limit(status_code, headers, body)
+
+        with self._lock:
+            now = time.time()
+            limit = self._int_header(headers, 'X-RateLimit-Limit')
+            remaining = self._int_header(headers, 'X-RateLimit-Remaining')
+            reset = self._int_header(headers, 'X-RateLimit-Reset')
+            if limit is not None and remaining is not None and reset is not None:
+                resource = headers.get('X-RateLimit-Resource') or 'core'
+                if not isinstance(resource, str):
+                    resource = 'core'
+                self._update_budget(resource, limit, remaining, float(reset), now)
+
+            if secondary:
+                self._record_secondary_limit(retry_after, now)
+            elif status_code < 400:
+                self._record_success()
+
+            self._save_shared_state(now)
+
+    @classmethod
+    def is_secondary_limit(cls, status_code: int, headers: Mapping[str, Any], body: str = '') -> bool:
+        """Return True if a response signals a secondary ("abuse") rate limit.
+
+        Args:
+            status_code: HTTP status of the response
+            headers: Response headers
+            body: Response body text
+
+        Returns:
+            True for 429 responses and for 403 responses carrying Retry-After
+            or a "secondary rate limit" message
+        """
+        if status_code == 429:
+            return True
+        if status_code != 403:
+            return False
+        if cls._int_header(headers, 'Retry-After') is not None:
+            return True
+        return isinstance(body, str) and 'secondary rate limit' in body.lower()
+
+    def observe_graphql_rate_limit(self, rate_limit: Mapping[str, Any]) -> None:
+        """Update the GraphQL budget from a query's rateLimit object.
+
+        Args:
+            rate_limit: Dictionary with 'cost', 'remaining', 'resetAt' and
+                        optionally 'limit' as returned by GraphQL
+        """
+        try:
+            remaining = int(rate_limit['remaining'])
+            reset = datetime.fromisoformat(rate_limit['resetAt'].replace('Z', '+00:00')).timestamp()
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return
+
+        with self._lock:
+            now = time.time()
+            budget = self.budgets.setdefault('graphql', ResourceBudget())
+            limit = int(rate_limit.get('limit') or budget.limit or remaining)
+            self._update_budget('graphql', limit, remaining, reset, now)
+            if rate_limit.get('cost'):
+                budget.cost = max(1.0, float(rate_limit['cost']))
+            self._save_shared_state(now)
+
+    def on_secondary_limit(self, retry_after: Optional[float] = None) -> float:
+        """Record a secondary rate limit hit reported outside of headers.
+
+        Args:
+            retry_after: Seconds GitHub asked to wait, if known
+
+        Returns:
+            Seconds all requests are paused for
+        """
+        with self._lock:
+            now = time.time()
+            self._record_secondary_limit(retry_after, now)
+            self._save_shared_state(now)
+            return self.backoff_until - now
+
+    def _update_budget(self, resource: str, limit: int, remaining: int, reset: float, now: float) -> None:
+        budget = self.budgets.setdefault(resource, ResourceBudget())
+        if not budget.known:
+            budget.tokens = self.BURST
+            budget.last_refill = now
+        budget.limit = limit
+        budget.remaining = remaining
+        budget.reset = reset
+        budget.observed_at = now
+
+    def _record_secondary_limit(self, retry_after: Optional[float], now: float) -> None:
+        self.secondary_hits += 1
+        self._successes = 0
+        penalty = min(self.MAX_SECONDARY_BACKOFF, self.MIN_SECONDARY_BACKOFF * 2 ** (self.secondary_hits - 1))
+        self.backoff_until = max(self.backoff_until, now + max(float(retry_after or 0), penalty))
+        self.min_interval = min(5.0, max(0.25, self.min_interval * 2))
+
+    def _record_success(self) -> None:
+        if not self.min_interval and not self.secondary_hits:
+            return
+        self._successes += 1
+        if self._successes >= self.RECOVERY_SUCCESSES:
+            self._successes = 0
+            self.secondary_hits = max(0, self.secondary_hits - 1)
+            self.min_interval = self.min_interval / 2 if self.min_interval > 0.05 else 0.0
+
+    @staticmethod
+    def _int_header(headers: Mapping[str, Any], name: str) -> Optional[int]:
+        try:
+            value = headers.get(name)
+            if value is None:
+                value = headers.get(name.lower())
+            return int(value) if value is not None else None
+        except (TypeError, ValueError, AttributeError):
+            return None
+
+    def _load_shared_state(self) -> None:
+        """Merge newer observations written by other processes."""
+        if not self.state_path:
+            return
+        try:
+            mtime = self.state_path.stat().st_mtime
+            if mtime <= self._state_mtime:
+                return
+            data = json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            return
+
+        self._state_mtime = mtime
+        for name, values in data.get('budgets', {}).items():
+            shared = ResourceBudget(**{key: values[key] for key in ('limit', 'remaining', 'reset', 'observed_at', 'cost')
+                                       if key in values})
+            budget = self.budgets.setdefault(name, ResourceBudget())
+            if shared.observed_at > budget.observed_at:
+                if not budget.known:
+                    budget.tokens = self.BURST
+                    budget.last_refill = time.time()
+                budget.limit = shared.limit
+                budget.remaining = shared.remaining
+                budget.reset = shared.reset
+                budget.observed_at = shared.observed_at
+                budget.cost = shared.cost
+        self.backoff_until = max(self.backoff_until, data.get('backoff_until', 0.0))
+        self._clients.update(data.get('clients', {}))
+
+    def _save_shared_state(self, now: float) -> None:
+        """Persist the current view atomically; failures keep state in memory."""
+        if not self.state_path:
+            return
+
+        self._clients[self._client_id] = now
+        self._clients = {client: seen for client, seen in self._clients.items()
+                         if now - seen < self.CLIENT_TIMEOUT}
+        data = {
+            'budgets': {
+                name: {key: value for key, value in asdict(budget).items()
+                       if key in ('limit', 'remaining', 'reset', 'observed_at', 'cost')}
+                for name, budget in self.budgets.items() if budget.known
+            },
+            'backoff_until': self.backoff_until,
+            'clients': self._clients,
+        }
+
+        try:
+            write_json_atomic(self.state_path, data)
+            self._state_mtime = self.state_path.stat().st_mtime
+        except OSError:
+            pass
@@ -1,14 +1,16 @@
 """Repository resolution utilities for get commands."""
 
 import os
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from pathlib import Path
 
-from ..core import ConfigLoader
 from ..exceptions import ConfigNotFoundError, InvalidYAMLError
 
+if TYPE_CHECKING:
+    from ..core import ConfigLoader
 
-def resolve_repository(repo: Optional[str], config_loader: ConfigLoader) -> str:
+
+def resolve_repository(repo: Optional[str], config_loader: 'ConfigLoader') -> str:
     """Resolve repository from parameter or configuration.
     
     This function centralizes repository resolution logic that was previously
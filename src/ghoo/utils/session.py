@@ -0,0 +1,164 @@
+"""Repository handles and issues shared by everything one invocation does.
+
+A single workflow command used to fetch the same repository and issue several
+times: once to validate the transition, again to update its labels, to append
+the log entry and to close it. A Session memoizes them for the duration of an
+invocation (an identity map), so every command and helper that goes through
+the PyGithub client sees the same Issue object and fetches it only once.
+
+Repository handles are lazy: asking for an issue doesn't fetch the repository
+itself. PyGithub's own `lazy=True` isn't used because it is deprecated and
+builds a new Requester, which would bypass the caching adapter installed by
+install_http_adapter().
+
+Issues edited through their own edit() method stay current, since PyGithub
+updates the object from the response. The label methods don't update it, so
+the session forgets an issue as soon as one of them is called on it. Writes
+made any other way (GraphQL mutations) must call invalidate() for the issues
+they touch.
+"""
+
+import functools
+from typing import Any, Dict, Optional, Tuple
+
+from github.Issue import Issue
+from github.MainClass import Github
+
+# Issue methods that write to GitHub without updating the Issue object
+STALE_WRITES = ('add_to_labels', 'remove_from_labels', 'set_labels', 'delete_labels')
+
+
+class RepositoryHandle:
+    """Lazy stand-in for a PyGithub Repository.
+
+    get_issue() is served by the session without fetching the repository;
+    any other attribute fetches the repository once and delegates to it.
+    """
+
+    def __init__(self, session: 'Session', full_name: str):
+        """Initialize the handle.
+
+        Args:
+            session: Session the handle belongs to
+            full_name: Repository in format 'owner/repo'
+        """
+        self._session = session
+        self.full_name = full_name
+
+    def get_issue(self, number: int) -> Issue:
+        """Return an issue of the repository, fetching it at most once."""
+        return self._session.get_issue(self.full_name, number)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session.repository(self.full_name), name)
+
+    def __repr__(self) -> str:
+        return f"RepositoryHandle({self.full_name!r})"
+
+
+class Session:
+    """Identity map of the repositories and issues fetched by one invocation."""
+
+    def __init__(self, github_client: Github):
+        """Initialize an empty session.
+
+        Args:
+            github_client: github.Github instance to fetch through
+        """
+        self._github = github_client
+        self._get_repo = github_client.get_repo
+        self._repositories: Dict[str, Any] = {}
+        self._handles: Dict[str, RepositoryHandle] = {}
+        self._issues: Dict[Tuple[str, int], Issue] = {}
+
+    def get_repo(self, full_name_or_id: Any, lazy: Any = None) -> Any:
+        """Replacement for Github.get_repo() that returns a shared lazy handle.
+
+        Repositories requested by ID are fetched as before.
+        """
+        if not isinstance(full_name_or_id, str):
+            return self._get_repo(full_name_or_id)
+
+        key = full_name_or_id.lower()
+        handle = self._handles.get(key)
+        if handle is None:
+            handle = self._handles[key] = RepositoryHandle(self, full_name_or_id)
+        return handle
+
+    def repository(self, full_name: str) -> Any:
+        """Return the PyGithub Repository, fetching it at most once."""
+        key = full_name.lower()
+        repository = self._repositories.get(key)
+        if repository is None:
+            repository = self._repositories[key] = self._get_repo(full_name)
+        return repository
+
+    def get_issue(self, full_name: str, number: int) -> Issue:
+        """Return an issue, fetching it at most once.
+
+        Raises:
+            GithubException: If the issue doesn't exist or can't be read
+        """
+        key = (full_name.lower(), number)
+        issue = self._issues.get(key)
+        if issue is None:
+            headers, data = self._github.requester.requestJsonAndCheck(
+                "GET", f"/repos/{full_name}/issues/{number}"
+            )
+            issue = self._issues[key] = self._github.create_from_raw_data(Issue, data, headers)
+            self._watch(key, issue)
+        return issue
+
+    def _watch(self, key: Tuple[str, int], issue: Issue) -> None:
+        """Forget an issue once a write that leaves it outdated is made through it."""
+        for name in STALE_WRITES:
+            method = getattr(issue, name)
+
+            @functools.wraps(method)
+            def write(*args, _method=method, **kwargs):
+                try:
+                    return _method(*args, **kwargs)
+                finally:
+                    if self._issues.get(key) is issue:
+                        del self._issues[key]
+
+            setattr(issue, name, write)
+
+    def invalidate(self, full_name: str, number: Optional[int] = None) -> None:
+        """Forget an issue (or all issues of a repository) after a write.
+
+        Args:
+            full_name: Repository in format 'owner/repo'
+            number: Issue number, or None for every issue of the repository
+        """
+        key = full_name.lower()
+        if number is not None:
+            self._issues.pop((key, number), None)
+        else:
+            self._issues = {k: v for k, v in self._issues.items() if k[0] != key}
+
+    def clear(self) -> None:
+        """Forget everything, starting a new unit of work."""
+        self._repositories.clear()
+        self._handles.clear()
+        self._issues.clear()
+
+
+def install_session(github_client: Any) -> Optional[Session]:
+    """Route a PyGithub client's get_repo() through a new Session.
+
+    Call sites keep using `github_client.get_repo(name).get_issue(number)`;
+    they now share repositories and issues with each other.
+
+    Args:
+        github_client: github.Github instance
+
+    Returns:
+        The Session, or None if the client is not a PyGithub Github instance
+    """
+    if not isinstance(github_client, Github):
+        return None
+
+    session = Session(github_client)
+    github_client.get_repo = session.get_repo
+    return session
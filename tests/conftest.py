@@ -72,6 +72,12 @@ def temp_project_dir(tmp_path):
     return project_dir
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep ghoo's persistent caches (identity, HTTP, rate limits) per test."""
+    monkeypatch.setenv("GHOO_CACHE_DIR", str(tmp_path / "ghoo-cache"))
+
+
 @pytest.fixture
 def github_test_issue_cleanup(test_repo):
     """Fixture to track and cleanup test issues created during tests."""
@@ -470,16 +470,10 @@ class TestWorkflowValidationIntegration:
         # Mock GraphQL client
         mock_graphql_client = Mock()
         mock_graphql_client.get_issue_node_id.return_value = "test_node_id_123"
-        mock_graphql_client.get_issue_with_sub_issues.return_value = {
-            'node': {
-                'subIssues': {
-                    'nodes': [
-                        {'number': 124, 'title': 'Sub-task 1', 'state': 'OPEN'},
-                        {'number': 125, 'title': 'Sub-task 2', 'state': 'CLOSED'}
-                    ]
-                }
-            }
-        }
+        mock_graphql_client.iter_sub_issues.return_value = iter([
+            {'number': 124, 'title': 'Sub-task 1', 'state': 'OPEN'},
+            {'number': 125, 'title': 'Sub-task 2', 'state': 'CLOSED'}
+        ])
         github_client.graphql = mock_graphql_client
         
         command = ApproveWorkCommand(github_client, mock_config_validation)
@@ -489,7 +483,7 @@ class TestWorkflowValidationIntegration:
         
         # Verify GraphQL was called
         mock_graphql_client.get_issue_node_id.assert_called_once_with("test", "repo", 123)
-        mock_graphql_client.get_issue_with_sub_issues.assert_called_once_with("test_node_id_123")
+        mock_graphql_client.iter_sub_issues.assert_called_once_with("test_node_id_123", fields="number title state")
     
     def test_approve_work_with_closed_sub_issues_graphql(self, mock_github_validation_api, mock_config_validation):
         """Test approve-work command succeeds when all sub-issues are closed using GraphQL."""
@@ -506,16 +500,10 @@ class TestWorkflowValidationIntegration:
         
         mock_graphql_client = Mock()
         mock_graphql_client.get_issue_node_id.return_value = "test_node_id_123"
-        mock_graphql_client.get_issue_with_sub_issues.return_value = {
-            'node': {
-                'subIssues': {
-                    'nodes': [
-                        {'number': 124, 'title': 'Sub-task 1', 'state': 'CLOSED'},
-                        {'number': 125, 'title': 'Sub-task 2', 'state': 'CLOSED'}
-                    ]
-                }
-            }
-        }
+        mock_graphql_client.iter_sub_issues.return_value = iter([
+            {'number': 124, 'title': 'Sub-task 1', 'state': 'CLOSED'},
+            {'number': 125, 'title': 'Sub-task 2', 'state': 'CLOSED'}
+        ])
         github_client.graphql = mock_graphql_client
         
         command = ApproveWorkCommand(github_client, mock_config_validation)
@@ -528,7 +516,7 @@ class TestWorkflowValidationIntegration:
         
         # Verify GraphQL was called
         mock_graphql_client.get_issue_node_id.assert_called_once_with("test", "repo", 123)
-        mock_graphql_client.get_issue_with_sub_issues.assert_called_once_with("test_node_id_123")
+        mock_graphql_client.iter_sub_issues.assert_called_once_with("test_node_id_123", fields="number title state")
     
     def test_approve_work_fallback_to_body_parsing(self, mock_github_validation_api, mock_config_validation):
         """Test approve-work falls back to body parsing when GraphQL fails."""
@@ -546,7 +534,7 @@ class TestWorkflowValidationIntegration:
         
         mock_graphql_client = Mock()
         mock_graphql_client.get_issue_node_id.return_value = "test_node_id_123"
-        mock_graphql_client.get_issue_with_sub_issues.side_effect = Exception("GraphQL failed")
+        mock_graphql_client.iter_sub_issues.side_effect = Exception("GraphQL failed")
         github_client.graphql = mock_graphql_client
         
         # Mock referenced issues (one open, one closed)
@@ -576,7 +564,7 @@ class TestWorkflowValidationIntegration:
         
         # Verify GraphQL was attempted and fallback occurred
         mock_graphql_client.get_issue_node_id.assert_called_once_with("test", "repo", 123)
-        mock_graphql_client.get_issue_with_sub_issues.assert_called_once_with("test_node_id_123")
+        mock_graphql_client.iter_sub_issues.assert_called_once_with("test_node_id_123", fields="number title state")
         # Verify body parsing fallback tried to get referenced issues
         assert mock_github_validation_api['repo'].get_issue.call_count >= 1
     
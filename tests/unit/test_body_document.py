@@ -0,0 +1,184 @@
+"""Unit tests for the lossless BodyDocument."""
+
+import pytest
+from ghoo.core import IssueParser
+
+
+BODY = """# Epic: Heading
+
+Intro paragraph.
+
+
+## Tasks
+- [ ] First
+  - [X] First
+- [ ] Second
+
+### CONDITION: Deployed
+- [ ] VERIFIED
+- **Signed-off by:** _Not yet verified_
+- **Requirements:** Deploy to staging
+- **Evidence:** _Not yet provided_
+
+## Log
+
+---
+### → planning [2024-01-01 10:00:00 UTC]
+*by @alice*
+
+---
+### → in-progress [2024-01-02 10:00:00 UTC]
+*by @bob*
+"""
+
+
+class TestBodyDocument:
+    """Test BodyDocument spans and in-place edits."""
+
+    @pytest.fixture
+    def document(self):
+        return IssueParser.parse_document(BODY)
+
+    def test_round_trip_is_identical(self, document):
+        """Test an unedited document renders the original body."""
+        assert document.text == BODY
+        assert IssueParser.parse_document('').text == ''
+
+    def test_section_spans(self, document):
+        """Test every section records the lines it occupies."""
+        titles = [(section.kind, section.title) for section in document.sections]
+        assert titles == [
+            ('section', 'Tasks'),
+            ('condition', 'CONDITION: Deployed'),
+            ('log', 'Log'),
+        ]
+        assert document.preamble_end == 5
+
+        tasks = document.find_section('TASKS')
+        assert document.lines[tasks.start] == '## Tasks'
+        assert document.lines[tasks.end] == '### CONDITION: Deployed'
+        assert [(todo.line, todo.text, todo.checked) for todo in tasks.todos] == [
+            (6, 'First', False), (7, 'First', True), (8, 'Second', False),
+        ]
+
+    def test_condition_fields_and_log_entries(self, document):
+        """Test condition field lines and log entry blocks are located."""
+        condition = document.find_condition('deployed')
+        assert document.field_value(condition, 'requirements') == 'Deploy to staging'
+        assert not document.is_verified(condition)
+
+        entries = document.log.entries
+        assert len(entries) == 2
+        assert [document.lines[start] for start, _ in entries] == ['---', '---']
+        assert entries[-1][1] == len(document.lines)
+
+    def test_span_offsets(self, document):
+        """Test line spans convert to character spans of the text."""
+        tasks = document.find_section('Tasks')
+        start, end = document.span_offsets(tasks.todos[0].line, tasks.todos[0].line + 1)
+        assert document.text[start:end] == '- [ ] First'
+
+    def test_duplicate_todos_are_edited_independently(self, document):
+        """Test toggling one of two todos with the same text."""
+        tasks = document.find_section('Tasks')
+        document.set_todo_checked(tasks.todos[1], False)
+
+        assert document.text == BODY.replace('  - [X] First', '  - [ ] First')
+
+    def test_condition_edits_rewrite_field_lines_only(self, document):
+        """Test evidence, sign-off and verification edits change single lines."""
+        condition = document.find_condition('Deployed')
+        document.set_field(condition, 'evidence', 'Deployed at 14:30')
+        document.set_field(condition, 'signed_off_by', 'alice')
+        document.set_verified(condition)
+
+        expected = (BODY
+                    .replace('- **Evidence:** _Not yet provided_', '- **Evidence:** Deployed at 14:30')
+                    .replace('- **Signed-off by:** _Not yet verified_', '- **Signed-off by:** alice')
+                    .replace('- [ ] VERIFIED', '- [x] VERIFIED'))
+        assert document.text == expected
+        assert document.is_verified(condition)
+
+    def test_add_todo_shifts_following_spans(self, document):
+        """Test inserting a todo keeps later spans pointing at their lines."""
+        tasks = document.find_section('Tasks')
+        document.add_todo(tasks, 'Third')
+
+        assert document.text == BODY.replace('- [ ] Second\n', '- [ ] Second\n- [ ] Third\n')
+        condition = document.find_condition('Deployed')
+        assert document.lines[condition.start] == '### CONDITION: Deployed'
+        assert document.lines[condition.fields['evidence']].startswith('- **Evidence:**')
+        assert document.lines[document.log.entries[0][0]] == '---'
+
+    def test_add_section_goes_before_log(self, document):
+        """Test new sections are inserted above the log with a blank separator."""
+        section = document.add_section('## Notes', ['Some notes.'])
+
+        assert document.text == BODY.replace('\n## Log', '\n## Notes\nSome notes.\n\n## Log')
+        assert document.lines[section.start] == '## Notes'
+        assert [s.title for s in document.sections] == ['Tasks', 'CONDITION: Deployed', 'Notes', 'Log']
+        assert document.lines[document.log.start] == '## Log'
+
+    def test_add_section_before_another(self, document):
+        """Test a section can be inserted in front of any other one."""
+        section = document.add_section('## Notes', ['- [ ] Review'], before=document.find_section('Tasks'))
+
+        assert document.text == BODY.replace('Intro paragraph.\n', 'Intro paragraph.\n\n## Notes\n- [ ] Review\n')
+        assert section.end == document.find_section('Tasks').start
+        assert [(document.lines[todo.line], todo.text) for todo in section.todos] == [('- [ ] Review', 'Review')]
+
+    def test_set_section_body_rewrites_only_its_text(self, document):
+        """Test replacing a section's text keeps its header, separators and the log."""
+        tasks = document.find_section('Tasks')
+        assert document.section_body(tasks) == '- [ ] First\n  - [X] First\n- [ ] Second'
+
+        document.set_section_body(tasks, ['Rewritten.', '- [x] Only'])
+
+        assert document.text == BODY.replace(
+            '- [ ] First\n  - [X] First\n- [ ] Second\n', 'Rewritten.\n- [x] Only\n'
+        )
+        assert [(todo.line, todo.text, todo.checked) for todo in tasks.todos] == [(7, 'Only', True)]
+        condition = document.find_condition('Deployed')
+        assert document.lines[condition.fields['verified']] == '- [ ] VERIFIED'
+        assert [document.lines[start] for start, _ in document.log.entries] == ['---', '---']
+
+        document.set_section_body(condition, [])
+        assert condition.fields == {}
+        assert '### CONDITION: Deployed\n\n## Log' in document.text
+
+    def test_crlf_line_endings_are_kept(self):
+        """Test lines inserted into a CRLF body end with CRLF like the rest."""
+        crlf = BODY.replace('\n', '\r\n')
+        document = IssueParser.parse_document(crlf)
+        assert document.newline == '\r\n'
+
+        document.add_todo(document.find_section('Tasks'), 'Third')
+        document.add_section('## Notes', ['Some notes.'])
+        condition = document.find_condition('Deployed')
+        document.set_field(condition, 'evidence', 'Done')
+
+        expected = (BODY.replace('- [ ] Second\n', '- [ ] Second\n- [ ] Third\n')
+                    .replace('\n## Log', '\n## Notes\nSome notes.\n\n## Log')
+                    .replace('_Not yet provided_', 'Done'))
+        assert document.text == expected.replace('\n', '\r\n')
+
+        # Appending after a last line without a line ending terminates it
+        document = IssueParser.parse_document('## Tasks\r\n- [ ] a')
+        document.add_section('## Notes', ['b'])
+        assert document.text == '## Tasks\r\n- [ ] a\r\n\r\n## Notes\r\nb'
+
+    def test_rotate_log_removes_oldest_entries(self, document):
+        """Test rotating keeps the newest entries and returns the rest."""
+        blocks = document.rotate_log(1)
+
+        assert blocks == ['---\n### → planning [2024-01-01 10:00:00 UTC]\n*by @alice*']
+        assert [document.lines[start] for start, _ in document.log.entries] == ['---']
+        assert document.rotate_log(1) == []
+
+        document.set_log_index('_Archived 1 earlier log entry: [1](https://example.com/#issuecomment-1)_')
+        assert document.text.endswith(
+            '## Log\n_Archived 1 earlier log entry: [1](https://example.com/#issuecomment-1)_\n\n'
+            '---\n### → in-progress [2024-01-02 10:00:00 UTC]\n*by @bob*\n'
+        )
+        assert document.log_index().comment_ids == [1]
+        assert [e.to_state for e in IssueParser.parse_body(document.text)['log_entries']] == ['in-progress']
@@ -0,0 +1,91 @@
+"""Unit tests for the ghoo:index summary line of issue bodies."""
+
+from unittest.mock import Mock
+
+import pytest
+from ghoo.core import BodyIndex, IssueParser
+
+
+BODY = """Intro paragraph.
+
+## Tasks
+- [x] First
+- [ ] Second
+
+### CONDITION: Deployed
+- [ ] VERIFIED
+- **Signed-off by:** _Not yet verified_
+- **Requirements:** Deploy to staging -- then prod
+- **Evidence:** _Not yet provided_
+
+## Log
+
+---
+### → planning [2024-01-01 10:00:00 UTC]
+*by @alice*
+"""
+
+
+class TestBodyIndex:
+    """Test writing, reading and invalidating the index."""
+
+    def test_attach_and_read(self):
+        """Test the index round-trips todo counts, conditions and log."""
+        body = BodyIndex.attach(BODY)
+        assert body.startswith(BodyIndex.PREFIX)
+        assert body.split('\n', 1)[1] == BODY
+        assert '--' not in body.split('\n', 1)[0][4:-3]
+
+        index = BodyIndex.read(body)
+        assert index.sections == [('Tasks', 2, 1), ('CONDITION: Deployed', 0, 0)]
+        assert index.section_titles[0] == 'Tasks'
+        assert index.has_open_todos
+        assert index.has_open_conditions
+        assert index.conditions[0].text == 'Deployed'
+        assert index.conditions[0].requirements == 'Deploy to staging -- then prod'
+        assert index.log == [('planning', None, '2024-01-01T10:00:00+00:00', 'alice')]
+
+    def test_attach_replaces_existing_index(self):
+        """Test attaching twice keeps a single index line."""
+        body = BodyIndex.attach(BodyIndex.attach(BODY))
+        assert body.count(BodyIndex.PREFIX) == 1
+
+    def test_hand_edit_invalidates_index(self):
+        """Test a checksum mismatch makes read() fall back to None."""
+        body = BodyIndex.attach(BODY).replace('- [ ] Second', '- [x] Second')
+        assert BodyIndex.read(body) is None
+
+    @pytest.mark.parametrize('body', [
+        None,
+        '',
+        BODY,
+        '<!-- ghoo:index {not json} -->\n' + BODY,
+        '<!-- ghoo:index {"v":99} -->\n' + BODY,
+    ])
+    def test_read_without_valid_index(self, body):
+        """Test bodies without a usable index return None."""
+        assert BodyIndex.read(body) is None
+
+    def test_parser_ignores_index_line(self):
+        """Test the index line is not part of the parsed description."""
+        parsed = IssueParser.parse_body(BodyIndex.attach(BODY))
+        assert parsed['pre_section_description'] == 'Intro paragraph.'
+        assert [s.title for s in parsed['sections']] == ['Tasks', 'CONDITION: Deployed']
+
+    def test_refresh(self):
+        """Test refresh() only indexes when enabled or already indexed."""
+        assert BodyIndex.refresh(BODY) == BODY
+        assert BodyIndex.refresh(BODY, BodyIndex.attach('old')).startswith(BodyIndex.PREFIX)
+
+        edited = BodyIndex.attach(BODY).replace('- [ ] Second', '- [x] Second')
+        assert BodyIndex.read(BodyIndex.refresh(edited)).has_open_todos is False
+
+        assert BodyIndex.read(BodyIndex.refresh(BODY, enabled=True)) is not None
+
+    def test_enabled_per_client(self):
+        """Test each client's own config decides whether new bodies are indexed."""
+        indexed, plain = Mock(body_index=True), Mock(body_index=False)
+
+        assert BodyIndex.enabled_for(indexed) is True
+        assert BodyIndex.enabled_for(plain) is False
+        assert BodyIndex.enabled_for(Mock()) is False
@@ -1,7 +1,7 @@
 """Unit tests for body parser functionality."""
 
 import pytest
-from ghoo.core import IssueParser
+from ghoo.core import BodyIndex, IssueParser
 from ghoo.models import Section, Todo
 
 
@@ -378,6 +378,55 @@ class TestBodyParserHelpers:
         assert todos[2].text == "Todo with extra spaces in text"
 
 
+class TestSectionIndex:
+    """Test IssueParser.index_sections()."""
+    
+    BODY = """Intro text
+## Summary
+Overview.
+
+### CONDITION: Deployed
+- [ ] VERIFIED
+
+## Tasks
+- [x] First
+- [ ] Second
+##NotAHeader
+## Log
+---
+### → planning [2024-01-01 10:00:00 UTC]
+*by @alice*
+"""
+    
+    def test_titles_match_parse_body(self):
+        """Test the index finds the same sections as a full parse."""
+        index = IssueParser.index_sections(self.BODY)
+        parsed = IssueParser.parse_body(self.BODY)
+        
+        assert index.titles() == [s.title for s in parsed['sections']]
+        assert [entry.kind for entry in index.entries] == ['section', 'condition', 'section', 'log']
+    
+    def test_section_matches_parse_body(self):
+        """Test a single indexed section equals the fully parsed one."""
+        index = IssueParser.index_sections(self.BODY)
+        expected = IssueParser.parse_body(self.BODY)['sections'][2]
+        
+        section = index.section(index.find('TASKS'))
+        
+        assert section.title == expected.title
+        assert section.body == expected.body
+        assert [(t.text, t.checked, t.line_number) for t in section.todos] == \
+            [(t.text, t.checked, t.line_number) for t in expected.todos]
+    
+    def test_find_missing_and_empty_body(self):
+        """Test lookups of unknown titles, the log and empty bodies."""
+        index = IssueParser.index_sections(self.BODY)
+        assert index.find('Nonexistent') is None
+        assert index.find('Log') is None
+        assert IssueParser.index_sections(None).titles() == []
+        assert IssueParser.index_sections('## Only').titles() == ['Only']
+
+
 class TestBodyParserEdgeCases:
     """Test edge cases for body parser."""
     
@@ -439,4 +488,109 @@ Content with [inline link](https://example.com).
         # Verify todos in next section
         next_section = result['sections'][1]
         assert next_section.total_todos == 2
-        assert next_section.completed_todos == 0
\ No newline at end of file
+        assert next_section.completed_todos == 0    
+    def test_single_pass_sections_conditions_and_log(self):
+        """Test todos, conditions and log entries are all read in one parse."""
+        body = """Intro
+
+## Tasks
+- [ ] First
+- [x] Second
+
+### CONDITION: Deployed
+- [x] VERIFIED
+- **Signed-off by:** @alice
+- **Requirements:** Deploy to staging
+- **Evidence:** Build 42
+
+## Log
+
+---
+### → planning [2024-01-15 10:30:00 UTC]
+*by @bob*
+**Message**: Start
+
+---
+### → in-progress [2024-01-16 09:00:00 UTC]
+*by @carol*
+#### Notes
+Looks good"""
+        
+        result = IssueParser.parse_body(body)
+        
+        assert [s.title for s in result['sections']] == ['Tasks', 'CONDITION: Deployed']
+        assert [(t.text, t.line_number) for t in result['sections'][0].todos] == [('First', 4), ('Second', 5)]
+        
+        condition = result['conditions'][0]
+        assert condition.text == 'Deployed'
+        assert condition.verified is True
+        assert condition.signed_off_by == '@alice'
+        assert condition.evidence == 'Build 42'
+        
+        assert [e.to_state for e in result['log_entries']] == ['planning', 'in-progress']
+        assert result['log_entries'][0].message == 'Start'
+        assert result['log_entries'][1].sub_entries[0].content == 'Looks good'
+    
+    def test_malformed_log_entry_skipped_with_warning(self, capsys):
+        """Test an entry with a bad timestamp is skipped without losing the others."""
+        body = """## Log
+---
+### → planning [not a timestamp]
+*by @bob*
+---
+### → done [2024-01-15 10:30:00 UTC]
+*by @bob*"""
+        
+        result = IssueParser.parse_body(body)
+        
+        assert [e.to_state for e in result['log_entries']] == ['done']
+        assert "Failed to parse log entry" in capsys.readouterr().err
+
+
+class TestParseMany:
+    """Test parsing batches of bodies across a process pool."""
+    
+    @staticmethod
+    def bodies(count):
+        return [
+            f"Issue {i}\n\n## Tasks\n- [x] Done {i}\n- [ ] Open {i}\n\n"
+            f"## Log\n---\n### → planning [2024-01-15 10:30:00 UTC]\n*by @user{i}*"
+            for i in range(count)
+        ]
+    
+    def test_parse_many_matches_parse_body_in_order(self):
+        """Test pooled results equal parse_body() results, in input order."""
+        bodies = self.bodies(IssueParser.PARALLEL_THRESHOLD + 10)
+        
+        results = IssueParser.parse_many(bodies, workers=2, chunk_size=16)
+        
+        assert results == [IssueParser.parse_body(body) for body in bodies]
+    
+    def test_iter_parse_many_unordered_yields_every_index(self):
+        """Test unordered streaming yields each body once with its index."""
+        bodies = self.bodies(IssueParser.PARALLEL_THRESHOLD + 10)
+        
+        results = dict(IssueParser.iter_parse_many(bodies, workers=2, chunk_size=16, ordered=False))
+        
+        assert sorted(results) == list(range(len(bodies)))
+        assert results[70]['pre_section_description'] == 'Issue 70'
+    
+    def test_small_batches_are_parsed_in_process(self, monkeypatch):
+        """Test batches below the threshold don't start a process pool."""
+        def no_pool(*args, **kwargs):
+            raise AssertionError("process pool started")
+        monkeypatch.setattr('ghoo.core.ProcessPoolExecutor', no_pool)
+        
+        results = IssueParser.parse_many(self.bodies(3) + [''], workers=4)
+        
+        assert [r['sections'][0].todos[1].text for r in results[:3]] == ['Open 0', 'Open 1', 'Open 2']
+        assert results[3]['sections'] == []
+    
+    def test_transform_runs_on_each_result(self):
+        """Test a transform's return values replace the parse results."""
+        bodies = self.bodies(IssueParser.PARALLEL_THRESHOLD + 10)
+        
+        results = IssueParser.parse_many(bodies, workers=2, transform=BodyIndex.from_parsed)
+        
+        assert [index.sections for index in results[:2]] == [[('Tasks', 2, 1)], [('Tasks', 2, 1)]]
+        assert results[-1].log[0][3] == f'user{len(bodies) - 1}'
@@ -0,0 +1,41 @@
+"""Unit tests for the cache location and atomic file writes."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from ghoo.utils.cache import write_atomic, write_json_atomic
+
+
+class TestWriteAtomic:
+    """Test cases for write_atomic and write_json_atomic."""
+
+    def test_creates_directory_and_replaces_content(self, tmp_path):
+        """Test the file is created with its directory and then replaced."""
+        path = tmp_path / "nested" / "entry.json"
+
+        write_json_atomic(path, {'a': 1})
+        write_json_atomic(path, {'b': "é"}, ensure_ascii=False)
+
+        assert json.loads(path.read_text(encoding='utf-8')) == {'b': "é"}
+        assert [p.name for p in path.parent.iterdir()] == ["entry.json"]
+
+    def test_failed_write_removes_temp_file(self, tmp_path):
+        """Test a failure after the temporary file was created leaves nothing behind."""
+        path = tmp_path / "entry.bin"
+        path.write_bytes(b"old")
+
+        with patch('ghoo.utils.cache.os.replace', side_effect=OSError("read-only")):
+            with pytest.raises(OSError):
+                write_atomic(path, b"new")
+
+        assert path.read_bytes() == b"old"
+        assert [p.name for p in tmp_path.iterdir()] == ["entry.bin"]
+
+    def test_unserializable_data_writes_nothing(self, tmp_path):
+        """Test data json can't encode raises before any file is created."""
+        with pytest.raises(TypeError):
+            write_json_atomic(tmp_path / "entry.json", {'value': object()})
+
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,55 @@
+"""Regression tests for CLI start-up cost (see benchmarks/startup.py)."""
+
+import importlib
+import os
+import subprocess
+import sys
+
+import pytest
+
+# The ghoo package also exports a function named 'main'
+cli = importlib.import_module('ghoo.main')
+
+HEAVY_MODULES = ['ghoo.core', 'github', 'requests', 'yaml']
+
+
+def _modules_loaded_by(code: str) -> set:
+    result = subprocess.run(
+        [sys.executable, '-c', f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, 'GHOO_NO_DAEMON': '1'},
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports:
+    """Test cases for deferred imports in the CLI modules."""
+
+    def test_importing_cli_skips_heavy_modules(self):
+        """Test importing the CLI doesn't load PyGithub, requests or ghoo.core."""
+        loaded = _modules_loaded_by('import ghoo.main')
+
+        assert not loaded & set(HEAVY_MODULES)
+
+    def test_version_command_skips_heavy_modules(self):
+        """Test a simple command runs without loading PyGithub or ghoo.core."""
+        loaded = _modules_loaded_by(
+            "import sys; from ghoo.main import app\n"
+            "try:\n    app(args=['version'], prog_name='ghoo')\nexcept SystemExit:\n    pass"
+        )
+
+        assert 'ghoo.main' in loaded
+        assert not loaded & set(HEAVY_MODULES)
+
+    def test_lazy_names_resolve_to_core(self):
+        """Test deferred names are importable from the CLI module."""
+        from ghoo.core import GitHubClient
+        from ghoo.utils.repository import resolve_repository
+
+        assert cli.GitHubClient is GitHubClient
+        assert cli.resolve_repository is resolve_repository
+
+    def test_unknown_attribute_raises(self):
+        """Test names that aren't deferred imports still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            cli.NoSuchName
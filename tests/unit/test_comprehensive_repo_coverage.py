@@ -37,6 +37,7 @@ class TestComprehensiveRepoeCoverage:
             'version',  # Version command doesn't need repo
             'display_audit_trail_info',  # Internal helper function
             'init_gh',  # Uses config file directly, doesn't need --repo parameter
+            'serve',  # Daemon serves commands for every repository
         }
         
         # Filter out exempt commands
@@ -12,6 +12,7 @@ from ghoo.core import (
     CreateConditionCommand, UpdateConditionCommand, CompleteConditionCommand, 
     VerifyConditionCommand, GetConditionsCommand, IssueParser
 )
+from ghoo.exceptions import InvalidTokenError
 from ghoo.models import Condition
 
 
@@ -322,7 +323,7 @@ class TestVerifyConditionCommand:
         self.mock_github_client.github = Mock()
         self.mock_user = Mock()
         self.mock_user.login = "test-user"
-        self.mock_github_client.github.get_user.return_value = self.mock_user
+        self.mock_github_client.get_authenticated_login.return_value = self.mock_user.login
         
         self.mock_issue = Mock()
         self.mock_issue.number = 123
@@ -391,6 +392,16 @@ class TestVerifyConditionCommand:
         
         assert result['was_verified'] == True
         assert result['signed_off_by'] == "test-user"
+    
+    def test_verify_condition_rejected_token(self):
+        """Test a rejected token fails the sign-off instead of signing as unknown-user."""
+        self.command._get_issue = Mock(return_value=self.mock_issue)
+        self.mock_github_client.get_authenticated_login.side_effect = InvalidTokenError("Invalid or expired token")
+        
+        with pytest.raises(InvalidTokenError):
+            self.command.execute("owner/repo", 123, "Deploy to staging")
+        
+        self.mock_issue.edit.assert_not_called()
 
 
 class TestGetConditionsCommand:
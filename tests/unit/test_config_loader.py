@@ -345,4 +345,68 @@ class TestConfigLoader:
         
         assert "issue_type_method" in str(exc_info.value)
         assert "native" in str(exc_info.value)
-        assert "labels" in str(exc_info.value)
\ No newline at end of file
+        assert "labels" in str(exc_info.value)
+    
+    def test_log_keep_entries(self, temp_dir):
+        """Test log_keep_entries is loaded and must be a positive integer."""
+        config_path = temp_dir / "ghoo.yaml"
+        config_data = {"project_url": "https://github.com/owner/repo"}
+        
+        with open(config_path, 'w') as f:
+            yaml.dump(config_data, f)
+        assert ConfigLoader(config_path).load().log_keep_entries is None
+        
+        config_data["log_keep_entries"] = 50
+        with open(config_path, 'w') as f:
+            yaml.dump(config_data, f)
+        assert ConfigLoader(config_path).load().log_keep_entries == 50
+        
+        config_data["log_keep_entries"] = 0
+        with open(config_path, 'w') as f:
+            yaml.dump(config_data, f)
+        with pytest.raises(InvalidFieldValueError) as exc_info:
+            ConfigLoader(config_path).load()
+        assert "log_keep_entries" in str(exc_info.value)
+    
+    def test_body_index(self, temp_dir):
+        """Test body_index defaults to False and must be a boolean."""
+        config_path = temp_dir / "ghoo.yaml"
+        config_data = {"project_url": "https://github.com/owner/repo"}
+        
+        with open(config_path, 'w') as f:
+            yaml.dump(config_data, f)
+        assert ConfigLoader(config_path).load().body_index is False
+        
+        config_data["body_index"] = True
+        with open(config_path, 'w') as f:
+            yaml.dump(config_data, f)
+        assert ConfigLoader(config_path).load().body_index is True
+        
+        config_data["body_index"] = "yes"
+        with open(config_path, 'w') as f:
+            yaml.dump(config_data, f)
+        with pytest.raises(InvalidFieldValueError) as exc_info:
+            ConfigLoader(config_path).load()
+        assert "body_index" in str(exc_info.value)
+    
+    def test_status_field_options(self, temp_dir):
+        """Test status_field_options overrides default Status options per workflow state."""
+        config_path = temp_dir / "ghoo.yaml"
+        config_data = {
+            "project_url": "https://github.com/orgs/acme/projects/5",
+            "status_field_options": {"in-progress": "Doing", "plan-approved": None},
+        }
+        
+        with open(config_path, 'w') as f:
+            yaml.dump(config_data, f)
+        config = ConfigLoader(config_path).load()
+        assert config.status_field_option("in-progress") == "Doing"
+        assert config.status_field_option("plan-approved") is None
+        assert config.status_field_option("closed") == "Done"
+        
+        config_data["status_field_options"] = {"reviewing": "Review"}
+        with open(config_path, 'w') as f:
+            yaml.dump(config_data, f)
+        with pytest.raises(InvalidFieldValueError) as exc_info:
+            ConfigLoader(config_path).load()
+        assert "status_field_options" in str(exc_info.value)
@@ -0,0 +1,235 @@
+"""Unit tests for the ghoo daemon and its thin client."""
+
+import importlib
+import io
+import json
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+import ghoo.daemon
+from ghoo.daemon import ClientPool, GhooDaemon, forward_to_daemon, stop_daemon
+
+# The ghoo package also exports a function named 'main'
+cli = importlib.import_module('ghoo.main')
+
+
+@pytest.fixture
+def socket_path():
+    """Short socket path (Unix socket paths are limited to ~100 characters)."""
+    directory = Path(tempfile.mkdtemp(prefix="ghoo"))
+    return directory / "d.sock"
+
+
+@pytest.fixture
+def daemon(socket_path):
+    """Run a daemon in a background thread."""
+    server = GhooDaemon(socket_path, idle_timeout=0)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    yield server
+    stop_daemon(socket_path)
+    thread.join(timeout=5)
+
+
+def fake_daemon(socket_path, replies):
+    """Serve one connection that reads each client message and sends the scripted replies."""
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen(1)
+
+    def serve():
+        connection, _ = listener.accept()
+        with connection, connection.makefile('rwb') as stream:
+            for reply in replies:
+                stream.readline()
+                if reply is not None:
+                    stream.write(json.dumps(reply).encode() + b'\n')
+                    stream.flush()
+        listener.close()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestClientPool:
+    """Test cases for ClientPool."""
+
+    def test_reuses_client_for_same_arguments(self, monkeypatch):
+        """Test a second request with the same credentials gets the warm client."""
+        monkeypatch.setenv('GITHUB_TOKEN', 'token-a')
+        pool = ClientPool()
+        pool._factory = Mock(side_effect=lambda **kwargs: object())
+
+        first = pool(config_dir=Path('/tmp/project'))
+        second = pool(config_dir=Path('/tmp/project'))
+
+        assert first is second
+        pool._factory.assert_called_once()
+
+    def test_separates_clients_by_token(self, monkeypatch):
+        """Test a different token never reuses another token's client."""
+        pool = ClientPool()
+        pool._factory = Mock(side_effect=lambda **kwargs: object())
+
+        monkeypatch.setenv('GITHUB_TOKEN', 'token-a')
+        first = pool()
+        monkeypatch.setenv('GITHUB_TOKEN', 'token-b')
+        second = pool()
+
+        assert first is not second
+
+    def test_reused_client_starts_a_new_session(self, monkeypatch):
+        """Test issues cached by one forwarded command aren't seen by the next."""
+        monkeypatch.setenv('GITHUB_TOKEN', 'token-a')
+        pool = ClientPool()
+        pool._factory = Mock(side_effect=lambda **kwargs: Mock())
+
+        client = pool()
+        client.session.clear.assert_not_called()
+        pool()
+        client.session.clear.assert_called_once()
+
+
+class TestForwarding:
+    """Test cases for forwarding commands to the daemon."""
+
+    def test_no_daemon_runs_in_process(self, socket_path):
+        """Test the client falls back when no socket exists."""
+        assert forward_to_daemon(['version'], socket_path) is None
+
+    def test_disabled_by_env(self, daemon, socket_path, monkeypatch):
+        """Test GHOO_NO_DAEMON bypasses a running daemon."""
+        monkeypatch.setenv('GHOO_NO_DAEMON', '1')
+        assert forward_to_daemon(['version'], socket_path) is None
+
+    def test_forwards_command_and_output(self, daemon, socket_path, capsys):
+        """Test a command runs in the daemon and its output is relayed."""
+        exit_code = forward_to_daemon(['version'], socket_path)
+
+        assert exit_code == 0
+        assert capsys.readouterr().out.startswith('ghoo version')
+
+    def test_forwards_exit_code_and_stderr(self, daemon, socket_path, capsys):
+        """Test usage errors keep their exit code and stderr output."""
+        exit_code = forward_to_daemon(['no-such-command'], socket_path)
+
+        assert exit_code == 2
+        assert 'No such command' in capsys.readouterr().err
+
+    def test_forwards_stdin_on_demand(self, daemon, socket_path, monkeypatch):
+        """Test the daemon reads the client's stdin only when the command does."""
+        received = {}
+
+        def fake_run(argv, cwd, env, stdin):
+            received['isatty'] = stdin.isatty()
+            received['data'] = stdin.read()
+            return 0, '', ''
+
+        monkeypatch.setattr(daemon, 'run_command', fake_run)
+        monkeypatch.setattr(sys, 'stdin', io.StringIO('piped body'))
+
+        assert forward_to_daemon(['set-body', '1'], socket_path) == 0
+        assert received == {'isatty': False, 'data': 'piped body'}
+
+    def test_busy_daemon_runs_in_process(self, socket_path, monkeypatch):
+        """Test a daemon that doesn't pick the command up lets the client run it."""
+        monkeypatch.setattr(ghoo.daemon, 'ACCEPT_TIMEOUT', 0.1)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(socket_path))
+        listener.listen(1)
+
+        try:
+            assert forward_to_daemon(['version'], socket_path) is None
+        finally:
+            listener.close()
+
+    def test_lost_result_is_not_rerun(self, socket_path, capsys):
+        """Test a command the daemon took is never run in-process as well."""
+        thread = fake_daemon(socket_path, [{'type': 'ready', 'timeout': 5}, None])
+
+        exit_code = forward_to_daemon(['issue-close', '1'], socket_path)
+        thread.join(timeout=5)
+
+        assert exit_code == 1
+        assert 'Lost the result' in capsys.readouterr().err
+
+    def test_unconfirmed_command_is_not_run(self, daemon, socket_path, monkeypatch):
+        """Test the daemon drops a command whose client stopped waiting for it."""
+        calls = []
+        monkeypatch.setattr(daemon, 'run_command', lambda argv, *args: calls.append(argv) or (0, '', ''))
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            with sock.makefile('rwb') as stream:
+                stream.write(json.dumps({'type': 'run', 'protocol': ghoo.daemon.PROTOCOL_VERSION,
+                                         'argv': ['issue-close', '1'], 'cwd': '/', 'env': {}}).encode() + b'\n')
+                stream.flush()
+                assert json.loads(stream.readline())['type'] == 'ready'
+
+        assert forward_to_daemon(['version'], socket_path) == 0
+        assert calls == [['version']]
+
+    def test_daemon_uses_client_pool(self, daemon):
+        """Test CLI modules create clients through the pool while serving."""
+        assert cli.GitHubClient is daemon.pool
+
+
+def test_pool_removed_after_shutdown(socket_path):
+    """Test stopping the daemon restores the CLI's GitHubClient."""
+    original = cli.GitHubClient
+    server = GhooDaemon(socket_path, idle_timeout=0)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+
+    assert stop_daemon(socket_path) is True
+    thread.join(timeout=5)
+
+    assert cli.GitHubClient is original
+    assert not socket_path.exists()
+
+
+def test_second_daemon_refuses_to_start(daemon, socket_path):
+    """Test a live socket isn't taken over by another daemon."""
+    with pytest.raises(RuntimeError, match="already listening"):
+        GhooDaemon(socket_path)
+
+
+def test_refuses_directory_writable_by_others():
+    """Test a socket directory ghoo doesn't own is checked, not chmodded."""
+    shared = Path(tempfile.mkdtemp(prefix="ghoo"))
+    shared.chmod(0o777)
+
+    with pytest.raises(RuntimeError, match="writable by other users"):
+        GhooDaemon(shared / "d.sock")
+    assert shared.stat().st_mode & 0o777 == 0o777
+
+
+def test_creates_private_socket_directory():
+    """Test a socket directory created by the daemon is private to the user."""
+    directory = Path(tempfile.mkdtemp(prefix="ghoo")) / "new"
+    server = GhooDaemon(directory / "d.sock", idle_timeout=0)
+    server.server_close()
+
+    assert directory.stat().st_mode & 0o777 == 0o700
+
+
+def test_aborts_command_after_request_timeout(socket_path, monkeypatch):
+    """Test a hung command is aborted instead of blocking the daemon."""
+    server = GhooDaemon(socket_path, idle_timeout=0, request_timeout=0.2)
+    monkeypatch.setattr(cli, 'app', lambda **kwargs: time.sleep(5))
+
+    try:
+        exit_code, _, stderr = server.run_command(['get', 'epic'], '/', {}, io.StringIO())
+    finally:
+        server.server_close()
+
+    assert exit_code == 1
+    assert 'aborted the command after 0.2 seconds' in stderr
@@ -160,8 +160,7 @@ class TestGetMilestoneCommand:
         self.github_client.github.get_repo.return_value = mock_repo
         
         # Mock issue service type detection
-        self.command.issue_service.detect_issue_type = Mock()
-        self.command.issue_service.detect_issue_type.side_effect = ["epic", "task"]
+        self.command.issue_service.detect_issue_types = Mock(return_value={10: "epic", 11: "task"})
         
         result = self.command._fetch_milestone_issues(milestone_data, "owner/repo")
         
@@ -176,6 +175,10 @@ class TestGetMilestoneCommand:
         assert issue1['state'] == "open"
         assert issue1['type'] == "epic"
         assert issue1['author'] == "user1"
+        assert result['issues'][1]['type'] == "task"
+        self.command.issue_service.detect_issue_types.assert_called_once_with(
+            [mock_issue1, mock_issue2], "owner/repo"
+        )
 
     def test_fetch_milestone_issues_no_issues(self):
         """Test milestone issues fetching when no issues exist."""
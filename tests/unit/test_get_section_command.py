@@ -9,6 +9,27 @@ from ghoo.services import IssueService
 from ghoo.exceptions import MissingTokenError, InvalidTokenError, GraphQLError
 
 
+def make_outline(issue_data):
+    """Build a get_issue_outline() result from section dicts.
+
+    The section index is a stand-in that hands back the given section dicts,
+    so tests control the formatted sections (and their line numbers) directly.
+    """
+    outline = {key: value for key, value in issue_data.items() if key != 'sections'}
+    sections = issue_data.get('sections', [])
+
+    def find(title):
+        return next((section for section in sections
+                     if section['title'].lower() == title.lower()), None)
+
+    section_index = Mock()
+    section_index.titles.return_value = [section['title'] for section in sections]
+    section_index.find.side_effect = find
+    section_index.section.side_effect = lambda entry: entry
+    outline['section_index'] = section_index
+    return outline
+
+
 class TestGetSectionCommand:
     """Test cases for GetSectionCommand class."""
 
@@ -17,6 +38,7 @@ class TestGetSectionCommand:
         self.github_client = Mock(spec=GitHubClient)
         self.config_loader = Mock(spec=ConfigLoader)
         self.issue_service = Mock(spec=IssueService)
+        self.issue_service.format_section.side_effect = lambda section: section
         
         # Create command instance
         self.command = GetSectionCommand(self.github_client, self.config_loader)
@@ -60,7 +82,7 @@ class TestGetSectionCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Execute command
         result = self.command.execute("owner/repo", 123, "Test Section", "rich")
@@ -69,7 +91,7 @@ class TestGetSectionCommand:
         mock_resolve.assert_called_once_with("owner/repo", self.config_loader)
         
         # Verify issue service call
-        self.issue_service.get_issue_with_details.assert_called_once_with("owner/repo", 123)
+        self.issue_service.get_issue_outline.assert_called_once_with("owner/repo", 123)
         
         # Verify result includes section data with metadata
         assert result['title'] == 'Test Section'
@@ -103,7 +125,7 @@ class TestGetSectionCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Execute command with None repo (uses config)
         result = self.command.execute(None, 456, "Summary", "json")
@@ -143,7 +165,7 @@ class TestGetSectionCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Test lowercase input matches title case section
         result = self.command.execute("owner/repo", 789, "problem statement", "rich")
@@ -166,7 +188,7 @@ class TestGetSectionCommand:
                 {'title': 'Section C', 'body': 'Content C'}
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Test with non-existent section
         with pytest.raises(ValueError) as exc_info:
@@ -189,7 +211,7 @@ class TestGetSectionCommand:
             'number': 123,
             'sections': []  # No sections
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Test with issue that has no sections
         with pytest.raises(ValueError) as exc_info:
@@ -216,7 +238,7 @@ class TestGetSectionCommand:
         """Test error propagation from IssueService."""
         # Set up mocks
         mock_resolve.return_value = "owner/repo"
-        self.issue_service.get_issue_with_details.side_effect = GraphQLError("API Error")
+        self.issue_service.get_issue_outline.side_effect = GraphQLError("API Error")
         
         # Test that IssueService errors are propagated
         with pytest.raises(GraphQLError):
@@ -242,7 +264,7 @@ class TestGetSectionCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Execute command
         result = self.command.execute("owner/repo", 123, "Empty Section", "rich")
@@ -272,7 +294,7 @@ class TestGetSectionCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Test matching section with special characters
         result = self.command.execute("owner/repo", 123, "API & Implementation", "rich")
@@ -320,7 +342,7 @@ class TestGetSectionCommand:
             'number': 123,
             'sections': [{'title': 'Test Section', 'body': 'Content'}]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Should not raise error regardless of case
         result = self.command.execute("owner/repo", 123, "Test Section", format_type)
@@ -353,7 +375,7 @@ class TestGetSectionCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         result = self.command.execute("test/repo", 999, "Complete Section", "json")
         
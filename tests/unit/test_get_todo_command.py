@@ -9,6 +9,27 @@ from ghoo.services import IssueService
 from ghoo.exceptions import MissingTokenError, InvalidTokenError, GraphQLError
 
 
+def make_outline(issue_data):
+    """Build a get_issue_outline() result from section dicts.
+
+    The section index is a stand-in that hands back the given section dicts,
+    so tests control the formatted sections (and their line numbers) directly.
+    """
+    outline = {key: value for key, value in issue_data.items() if key != 'sections'}
+    sections = issue_data.get('sections', [])
+
+    def find(title):
+        return next((section for section in sections
+                     if section['title'].lower() == title.lower()), None)
+
+    section_index = Mock()
+    section_index.titles.return_value = [section['title'] for section in sections]
+    section_index.find.side_effect = find
+    section_index.section.side_effect = lambda entry: entry
+    outline['section_index'] = section_index
+    return outline
+
+
 class TestGetTodoCommand:
     """Test cases for GetTodoCommand class."""
 
@@ -17,6 +38,7 @@ class TestGetTodoCommand:
         self.github_client = Mock(spec=GitHubClient)
         self.config_loader = Mock(spec=ConfigLoader)
         self.issue_service = Mock(spec=IssueService)
+        self.issue_service.format_section.side_effect = lambda section: section
         
         # Create command instance with mocked IssueService
         with patch('ghoo.commands.get_todo.IssueService') as mock_service_class:
@@ -57,7 +79,7 @@ class TestGetTodoCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Execute with exact match
         result = self.command.execute("owner/repo", 123, "Test Section", "First todo", "rich")
@@ -66,7 +88,7 @@ class TestGetTodoCommand:
         mock_resolve.assert_called_once_with("owner/repo", self.config_loader)
         
         # Verify issue service call
-        self.issue_service.get_issue_with_details.assert_called_once_with("owner/repo", 123)
+        self.issue_service.get_issue_outline.assert_called_once_with("owner/repo", 123)
         
         # Verify result includes todo data with context
         assert result['text'] == 'First todo'
@@ -102,7 +124,7 @@ class TestGetTodoCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Execute with different case
         result = self.command.execute("owner/repo", 456, "Tasks", "review code changes", "json")
@@ -132,7 +154,7 @@ class TestGetTodoCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Execute with partial match
         result = self.command.execute("owner/repo", 789, "Implementation", "authentication", "rich")
@@ -163,7 +185,7 @@ class TestGetTodoCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Search for "test" - should find exact match with highest priority
         result = self.command.execute("owner/repo", 100, "Priority Test", "test", "rich")
@@ -191,7 +213,7 @@ class TestGetTodoCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Test with non-matching todo text
         with pytest.raises(ValueError) as exc_info:
@@ -223,7 +245,7 @@ class TestGetTodoCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Search for "Test the" which matches multiple todos
         with pytest.raises(ValueError) as exc_info:
@@ -250,7 +272,7 @@ class TestGetTodoCommand:
                 {'title': 'Existing Section', 'todos': []}
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Test with non-existent section
         with pytest.raises(ValueError) as exc_info:
@@ -274,7 +296,7 @@ class TestGetTodoCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Test with section that has no todos
         with pytest.raises(ValueError) as exc_info:
@@ -300,7 +322,7 @@ class TestGetTodoCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Test lowercase section name
         result = self.command.execute("owner/repo", 123, "acceptance criteria", "Feature works", "rich")
@@ -332,7 +354,7 @@ class TestGetTodoCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Execute with None repo (uses config) and JSON format
         result = self.command.execute(None, 456, "Goals", "project setup", "json")
@@ -393,7 +415,7 @@ class TestGetTodoCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Should not raise error regardless of case
         result = self.command.execute("owner/repo", 123, "Test Section", "Test todo", format_type)
@@ -418,7 +440,7 @@ class TestGetTodoCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         # Test exact match with special characters
         result = self.command.execute("owner/repo", 123, "Special Tasks", "Fix issue #42 (high priority)", "rich")
@@ -444,7 +466,7 @@ class TestGetTodoCommand:
         """Test error propagation from IssueService."""
         # Set up mocks
         mock_resolve.return_value = "owner/repo"
-        self.issue_service.get_issue_with_details.side_effect = GraphQLError("API Error")
+        self.issue_service.get_issue_outline.side_effect = GraphQLError("API Error")
         
         # Test that IssueService errors are propagated
         with pytest.raises(GraphQLError):
@@ -474,7 +496,7 @@ class TestGetTodoCommand:
                 }
             ]
         }
-        self.issue_service.get_issue_with_details.return_value = mock_issue_data
+        self.issue_service.get_issue_outline.return_value = make_outline(mock_issue_data)
         
         result = self.command.execute("complete/repo", 999, "Complete Section", "Target todo", "json")
         
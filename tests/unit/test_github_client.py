@@ -26,7 +26,8 @@ class TestGitHubClient:
         
         assert client.token == "test_token_123"
         mock_github_class.assert_called_once()
-        mock_github.get_user.assert_called_once()
+        # The token is validated by the first real API request, not up front
+        mock_github.get_user.assert_not_called()
     
     @patch('ghoo.core.Github')
     @patch.dict(os.environ, {'GITHUB_TOKEN': 'env_token_456'})
@@ -87,12 +88,13 @@ class TestGitHubClient:
         mock_github = Mock()
         mock_github_class.return_value = mock_github
         
-        # Simulate 401 error on validation
+        # Simulate 401 error on explicit validation
         mock_exception = GithubException(401, {"message": "Bad credentials"}, None)
         mock_github.get_user.side_effect = mock_exception
         
+        client = GitHubClient(token="invalid_token")
         with pytest.raises(InvalidTokenError) as exc_info:
-            GitHubClient(token="invalid_token")
+            client._validate_token()
         
         assert "Invalid or expired token" in str(exc_info.value)
         assert "generate a new token" in str(exc_info.value)
@@ -103,12 +105,13 @@ class TestGitHubClient:
         mock_github = Mock()
         mock_github_class.return_value = mock_github
         
-        # Simulate 403 error on validation
+        # Simulate 403 error on explicit validation
         mock_exception = GithubException(403, {"message": "Forbidden"}, None)
         mock_github.get_user.side_effect = mock_exception
         
+        client = GitHubClient(token="limited_token")
         with pytest.raises(InvalidTokenError) as exc_info:
-            GitHubClient(token="limited_token")
+            client._validate_token()
         
         assert "lacks required permissions" in str(exc_info.value)
     
@@ -163,4 +166,276 @@ class TestGitHubClient:
             
             # With use_testing_token, should use TESTING_GITHUB_TOKEN
             client = GitHubClient(use_testing_token=True)
-            assert client.token == "testing_token"
\ No newline at end of file
+            assert client.token == "testing_token"    
+    @patch('ghoo.core.install_http_adapter')
+    @patch('ghoo.core.Github')
+    def test_http_cache_installed_under_user_cache(self, mock_github_class, mock_install, tmp_path):
+        """Test the REST response cache is kept per project outside its working tree."""
+        mock_github = Mock()
+        mock_github_class.return_value = mock_github
+        project = tmp_path / "project"
+        user_cache = tmp_path / "home" / ".cache" / "ghoo"
+        
+        with patch.dict(os.environ, {'HOME': str(tmp_path / "home")}, clear=False):
+            os.environ.pop('GHOO_CACHE_DIR', None)
+            os.environ.pop('GHOO_NO_CACHE', None)
+            client = GitHubClient(token="test_token", config_dir=project)
+            other = GitHubClient(token="test_token", config_dir=tmp_path / "other")
+        
+        github_arg, cache_arg, scheduler_arg = mock_install.call_args_list[0][0]
+        assert mock_install.call_args_list[0][1]['on_unauthorized'] == client._on_unauthorized
+        assert github_arg is mock_github
+        assert client.cache_dir.parent == user_cache
+        assert cache_arg.directory == client.cache_dir / "http"
+        assert other.cache_dir != client.cache_dir
+        assert not project.exists()
+        # REST and GraphQL requests share one rate-limit budget, across projects
+        assert scheduler_arg is client.rate_limiter
+        assert client.graphql.scheduler is client.rate_limiter
+        assert client.rate_limiter.state_path.parent == user_cache / "ratelimit"
+        assert other.rate_limiter.state_path == client.rate_limiter.state_path
+    
+    @patch('ghoo.core.install_http_adapter')
+    @patch('ghoo.core.Github')
+    @patch.dict(os.environ, {'GHOO_NO_CACHE': '1'})
+    def test_http_cache_disabled_by_env(self, mock_github_class, mock_install):
+        """Test GHOO_NO_CACHE disables the REST response cache and shared state."""
+        mock_github_class.return_value = Mock()
+        
+        client = GitHubClient(token="test_token")
+        
+        assert mock_install.call_args[0][1] is None
+        assert client.rate_limiter.state_path is None
+    
+    @patch('ghoo.core.Github')
+    def test_body_index_option_is_per_client(self, mock_github_class):
+        """Test one client's body_index option doesn't leak into another's writes."""
+        from ghoo.core import BodyIndex
+        from ghoo.models import Config
+        mock_github_class.return_value = Mock()
+        
+        indexed = GitHubClient(token="test_token", config=Config(project_url="https://github.com/o/a", body_index=True))
+        plain = GitHubClient(token="test_token", config=Config(project_url="https://github.com/o/b"))
+        
+        assert BodyIndex.enabled_for(indexed) is True
+        assert BodyIndex.enabled_for(plain) is False
+    
+    @patch('ghoo.core.Github')
+    def test_unauthorized_response_raises_invalid_token(self, mock_github_class, tmp_path):
+        """Test a 401 from any REST request surfaces as InvalidTokenError."""
+        mock_github_class.return_value = Mock()
+        client = GitHubClient(token="revoked_token")
+        client.identity.put("former-user")
+        
+        with pytest.raises(InvalidTokenError, match="Invalid or expired token"):
+            client._on_unauthorized(Mock(status_code=401))
+        
+        # The cached identity of a rejected token is dropped
+        assert client.identity.get() is None
+    
+    @patch('ghoo.core.Github')
+    def test_authenticated_login_cached_across_clients(self, mock_github_class, tmp_path):
+        """Test the viewer login is fetched once and reused by later processes."""
+        mock_github = Mock()
+        mock_github_class.return_value = mock_github
+        mock_github.get_user.return_value = Mock(login="cached-user")
+        
+        with patch.dict(os.environ, {'GHOO_CACHE_DIR': str(tmp_path)}):
+            first = GitHubClient(token="test_token")
+            assert first.get_authenticated_login() == "cached-user"
+            assert first.get_authenticated_login() == "cached-user"
+            second = GitHubClient(token="test_token")
+            assert second.get_authenticated_login() == "cached-user"
+            other = GitHubClient(token="other_token")
+            other.get_authenticated_login()
+        
+        # One lookup for test_token, one for other_token
+        assert mock_github.get_user.call_count == 2
+        assert len(list((tmp_path / "identity").glob("*.json"))) == 2
+    
+    @patch('ghoo.core.Github')
+    def test_add_sub_issue_resolves_node_ids_in_one_batch(self, mock_github_class):
+        """Test parent and child in the same repo are resolved with one query."""
+        mock_github_class.return_value = Mock()
+        client = GitHubClient(token="test_token")
+        client.graphql = Mock()
+        client.graphql.check_sub_issues_available.return_value = True
+        client.graphql.get_node_ids.return_value = {1: 'parent-node', 2: 'child-node'}
+        
+        client.add_sub_issue('owner/repo', 1, 'owner/repo', 2)
+        
+        client.graphql.get_node_ids.assert_called_once_with('owner', 'repo', [1, 2])
+        client.graphql.get_node_id.assert_not_called()
+        client.graphql.add_sub_issue.assert_called_once_with('parent-node', 'child-node')
+    
+    @patch('ghoo.core.Github')
+    def test_add_sub_issues_reports_each_child(self, mock_github_class):
+        """Test bulk linking reports missing and failed children individually."""
+        mock_github_class.return_value = Mock()
+        client = GitHubClient(token="test_token")
+        client.graphql = Mock()
+        client.graphql.check_sub_issues_available.return_value = True
+        client.graphql.get_node_ids.return_value = {1: 'p', 2: 'c2', 3: None, 4: 'c4'}
+        client.graphql.add_sub_issues.return_value = [
+            {'success': True, 'data': {}, 'error': None},
+            {'success': False, 'data': None, 'error': 'already linked'},
+        ]
+        
+        results = client.add_sub_issues('owner/repo', 1, 'owner/repo', [2, 3, 4])
+        
+        client.graphql.get_node_ids.assert_called_once_with('owner', 'repo', [1, 2, 3, 4])
+        client.graphql.add_sub_issues.assert_called_once_with('p', ['c2', 'c4'])
+        assert [r['success'] for r in results] == [True, False, False]
+        assert 'not found' in results[1]['error']
+        assert results[2]['error'] == 'already linked'
+    
+    @patch('ghoo.core.Github')
+    def test_label_ids_cached_across_clients(self, mock_github_class, tmp_path):
+        """Test label IDs are fetched once and refetched only for unknown names."""
+        mock_github_class.return_value = Mock()
+        
+        with patch.dict(os.environ, {'GHOO_CACHE_DIR': str(tmp_path)}):
+            first = GitHubClient(token="test_token")
+            first.graphql = Mock()
+            first.graphql.get_repository_labels.return_value = {'status:planning': 'LA_1'}
+            assert first.get_label_ids('owner/repo', ['status:planning']) == {'status:planning': 'LA_1'}
+            
+            second = GitHubClient(token="test_token")
+            second.graphql = Mock()
+            assert second.get_label_ids('owner/repo', ['status:planning']) == {'status:planning': 'LA_1'}
+            second.graphql.get_repository_labels.assert_not_called()
+            
+            # A name missing from the cached map refreshes it
+            second.graphql.get_repository_labels.return_value = {'status:planning': 'LA_1'}
+            assert second.get_label_ids('owner/repo', ['status:done']) == {}
+            second.graphql.get_repository_labels.assert_called_once_with('owner', 'repo')
+    
+    @patch('ghoo.core.Github')
+    def test_apply_issue_mutations_sends_one_document(self, mock_github_class):
+        """Test all changes to an issue are aliased mutations of one request."""
+        mock_github_class.return_value = Mock()
+        client = GitHubClient(token="test_token")
+        client.graphql = Mock()
+        client.graphql.execute_mutations.side_effect = lambda operations: [
+            {'success': True, 'data': {}, 'error': None} for _ in operations
+        ]
+        client.session = Mock()
+        issue = Mock(node_id="I_1", number=7)
+        
+        results = client.apply_issue_mutations(
+            'owner/repo', issue, remove_label_ids=['LA_old'], add_label_ids=['LA_new'],
+            body="new body", close=True
+        )
+        
+        operations = client.graphql.execute_mutations.call_args[0][0]
+        assert [op['mutation'] for op in operations] == [
+            'removeLabelsFromLabelable', 'addLabelsToLabelable', 'updateIssue', 'closeIssue'
+        ]
+        assert operations[2]['input'] == {'id': 'I_1', 'body': "new body"}
+        assert list(results) == ['remove_labels', 'add_labels', 'body', 'close']
+        client.session.invalidate.assert_called_once_with('owner/repo', 7)
+    
+    @patch('ghoo.core.Github')
+    def test_sub_issue_tree_is_walked_level_by_level(self, mock_github_class):
+        """Test sub-issues at every depth are yielded once, shallowest first."""
+        mock_github_class.return_value = Mock()
+        client = GitHubClient(token="test_token")
+        client.graphql = Mock()
+        client.graphql.get_node_id.return_value = 'epic'
+        children = {
+            'epic': [{'id': 'task1'}, {'id': 'task2'}],
+            'task1': [{'id': 'sub1'}],
+            'task2': [{'id': 'sub2'}, {'id': 'sub1'}],
+        }
+        client.graphql.iter_sub_issues.side_effect = lambda node_id, fields: iter(
+            [dict(node) for node in children.get(node_id, [])]
+        )
+        
+        nodes = list(client.iter_sub_issue_tree('owner/repo', 12))
+        
+        assert [(n['id'], n['parent'], n['depth']) for n in nodes] == [
+            ('task1', 'epic', 1), ('task2', 'epic', 1), ('sub1', 'task1', 2), ('sub2', 'task2', 2)
+        ]
+        client.graphql.get_node_id.assert_called_once_with('owner', 'repo', 12)
+    
+    @patch('ghoo.core.Github')
+    def test_project_field_update_is_one_mutation_once_cached(self, mock_github_class):
+        """Test schema and item ID are fetched once and later updates only mutate."""
+        mock_github_class.return_value = Mock()
+        client = GitHubClient(token="test_token")
+        client.graphql = Mock()
+        client.graphql.get_project_schema.return_value = {
+            'project_id': 'PVT_1', 'project_title': 'Roadmap',
+            'fields': {'Status': {'id': 'F_1', 'name': 'Status', 'dataType': 'SINGLE_SELECT',
+                                  'options': {'In Progress': 'O_1', 'Done': 'O_2'}}},
+        }
+        client.graphql.get_project_item_ids.return_value = {12: 'PVTI_12'}
+        url = "https://github.com/orgs/acme/projects/5"
+        
+        client.update_project_field(url, 'owner/repo', 12, 'Status', 'In Progress')
+        client.update_project_field(url, 'owner/repo', 12, 'status', 'done')
+        
+        client.graphql.get_project_schema.assert_called_once_with('orgs', 'acme', 5)
+        client.graphql.get_project_item_ids.assert_called_once_with('owner', 'repo', 'PVT_1', [12])
+        assert client.graphql.update_project_field.call_args_list == [
+            (('PVT_1', 'PVTI_12', 'F_1', 'O_1'),),
+            (('PVT_1', 'PVTI_12', 'F_1', 'O_2'),),
+        ]
+    
+    @patch('ghoo.core.Github')
+    def test_project_schema_refreshed_for_unknown_option(self, mock_github_class):
+        """Test an option missing from the cached schema refetches it once."""
+        mock_github_class.return_value = Mock()
+        client = GitHubClient(token="test_token")
+        client.graphql = Mock()
+        old = {'project_id': 'PVT_1', 'project_title': 'Roadmap',
+               'fields': {'Status': {'id': 'F_1', 'name': 'Status', 'dataType': 'SINGLE_SELECT', 'options': {}}}}
+        new = {'project_id': 'PVT_1', 'project_title': 'Roadmap',
+               'fields': {'Status': {'id': 'F_1', 'name': 'Status', 'dataType': 'SINGLE_SELECT',
+                                     'options': {'Done': 'O_2'}}}}
+        client.graphql.get_project_fields.side_effect = [old, new]
+        client.graphql.get_project_item_ids.return_value = {12: 'PVTI_12'}
+        client.get_project('PVT_1')
+        
+        client.update_project_field('PVT_1', 'owner/repo', 12, 'Status', 'Done')
+        
+        assert client.graphql.get_project_fields.call_count == 2
+        client.graphql.update_project_field.assert_called_once_with('PVT_1', 'PVTI_12', 'F_1', 'O_2')
+    
+    @patch('ghoo.core.Github')
+    def test_missing_option_is_not_refetched(self, mock_github_class):
+        """Test an option the board doesn't have costs one refetch, not one per update."""
+        from ghoo.exceptions import GraphQLError
+        mock_github_class.return_value = Mock()
+        client = GitHubClient(token="test_token")
+        client.graphql = Mock()
+        client.graphql.get_project_fields.return_value = {
+            'project_id': 'PVT_1', 'project_title': 'Roadmap',
+            'fields': {'Status': {'id': 'F_1', 'name': 'Status', 'dataType': 'SINGLE_SELECT',
+                                  'options': {'Done': 'O_2'}}},
+        }
+        client.get_project('PVT_1')
+        
+        for _ in range(3):
+            with pytest.raises(GraphQLError, match="Option 'Blocked' not found"):
+                client.update_project_field('PVT_1', 'owner/repo', 12, 'Status', 'Blocked')
+        
+        assert client.graphql.get_project_fields.call_count == 2
+        client.graphql.update_project_field.assert_not_called()
+    
+    @patch('ghoo.core.Github')
+    def test_project_field_update_requires_item(self, mock_github_class):
+        """Test an issue that isn't on the board is reported instead of updated."""
+        from ghoo.exceptions import GraphQLError
+        mock_github_class.return_value = Mock()
+        client = GitHubClient(token="test_token")
+        client.graphql = Mock()
+        client.graphql.get_project_fields.return_value = {
+            'project_id': 'PVT_1', 'project_title': 'Roadmap',
+            'fields': {'Notes': {'id': 'F_2', 'name': 'Notes', 'dataType': 'TEXT'}},
+        }
+        client.graphql.get_project_item_ids.return_value = {12: None}
+        
+        with pytest.raises(GraphQLError, match="not in project 'Roadmap'"):
+            client.update_project_field('PVT_1', 'owner/repo', 12, 'Notes', 'hello')
+        client.graphql.update_project_field.assert_not_called()
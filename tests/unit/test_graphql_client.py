@@ -1,6 +1,8 @@
 """Unit tests for GraphQL client functionality."""
 
 import json
+import re
+import time
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 import requests
@@ -87,13 +89,36 @@ class TestGraphQLClient:
         
         mock_post.side_effect = [rate_limited_response, success_response]
 
-        with patch('ghoo.core.sleep') as mock_sleep:
+        with patch('ghoo.utils.rate_limit.time.sleep') as mock_sleep:
             result = client._execute("query { test }")
         
         assert result == {'test': 'success'}
-        mock_sleep.assert_called_once_with(1)
+        # The scheduler waits out retry-after before the second attempt
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(1, abs=0.1)
         assert mock_post.call_count == 2
 
+    @patch('ghoo.core.requests.Session.post')
+    def test_execute_reports_budget_to_scheduler(self, mock_post, client, mock_response):
+        """Test rate-limit headers and the rateLimit object feed the scheduler."""
+        mock_response.headers = {
+            'X-RateLimit-Limit': '5000',
+            'X-RateLimit-Remaining': '4000',
+            'X-RateLimit-Reset': '4102444800',
+            'X-RateLimit-Resource': 'graphql',
+        }
+        mock_response.json.return_value = {
+            'data': {'rateLimit': {'cost': 3, 'remaining': 3990, 'resetAt': '2100-01-01T00:00:00Z'}}
+        }
+        mock_post.return_value = mock_response
+
+        client._execute("query { rateLimit { cost remaining resetAt } }")
+
+        budget = client.scheduler.budgets['graphql']
+        assert budget.limit == 5000
+        assert budget.remaining == 3990
+        assert budget.cost == 3
+
     @patch('ghoo.core.requests.Session.post')
     def test_execute_authentication_error(self, mock_post, client):
         """Test authentication error handling."""
@@ -204,6 +229,76 @@ class TestGraphQLClient:
         assert 'removeSubIssue' in result
         mock_execute.assert_called_once()
 
+    @patch.object(GraphQLClient, '_execute_partial')
+    def test_execute_mutations_reports_partial_failures(self, mock_execute_partial, client):
+        """Test errors are mapped back to the operation whose alias failed."""
+        mock_execute_partial.return_value = (
+            {'op0': {'subIssue': {'id': 'c1'}}, 'op1': None, 'op2': {'subIssue': {'id': 'c3'}}},
+            [{'path': ['op1'], 'message': 'Issue may not contain duplicate sub-issues'}]
+        )
+
+        results = client.add_sub_issues('parent', ['c1', 'c2', 'c3'])
+
+        assert [r['success'] for r in results] == [True, False, True]
+        assert 'duplicate sub-issues' in results[1]['error']
+        assert results[0]['data'] == {'subIssue': {'id': 'c1'}}
+        document, variables = mock_execute_partial.call_args[0]
+        assert 'op2: addSubIssue(input: $input2)' in document
+        assert '$input0: AddSubIssueInput!' in document
+        assert variables['input1'] == {'issueId': 'parent', 'subIssueId': 'c2'}
+
+    @patch.object(GraphQLClient, '_execute_partial')
+    def test_execute_mutations_chunks_documents(self, mock_execute_partial, client):
+        """Test large batches are split into several documents."""
+        mock_execute_partial.side_effect = lambda document, variables: (
+            {alias.replace('input', 'op'): {'clientMutationId': None} for alias in variables}, []
+        )
+
+        results = client.add_labels_batch({f"issue{n}": ['label'] for n in range(30)})
+
+        assert len(results) == 30
+        assert all(r['success'] for r in results)
+        assert mock_execute_partial.call_count == 2
+
+    @patch.object(GraphQLClient, '_execute_partial')
+    def test_execute_mutations_unattributed_error_fails_operations_without_data(self, mock_execute_partial, client):
+        """Test an error without an alias path fails only the operations that returned nothing."""
+        mock_execute_partial.return_value = (
+            {'op0': {'clientMutationId': None}, 'op1': None},
+            [{'message': 'Something went wrong'}]
+        )
+
+        results = client.remove_sub_issues('parent', ['c1', 'c2'])
+
+        assert [r['success'] for r in results] == [True, False]
+        assert 'Something went wrong' in results[1]['error']
+
+    @patch.object(GraphQLClient, '_execute_partial')
+    def test_execute_mutations_keeps_earlier_documents(self, mock_execute_partial, client):
+        """Test a later document's failure doesn't discard the applied ones."""
+        applied = ({f"op{n}": {'clientMutationId': None} for n in range(client.MUTATION_BATCH_SIZE)}, [])
+        mock_execute_partial.side_effect = [
+            applied,
+            ({}, [{'message': 'Variable $input0 is invalid'}]),
+            GraphQLError("Connection error: reset"),
+        ]
+        count = client.MUTATION_BATCH_SIZE
+        results = client.add_labels_batch({f"issue{n}": ['label'] for n in range(count * 3)})
+
+        assert len(results) == count * 3
+        assert all(r['success'] for r in results[:count])
+        assert not any(r['success'] for r in results[count:])
+        assert 'Variable $input0 is invalid' in results[count]['error']
+        assert results[-1]['error'] == "Connection error: reset"
+
+    @patch.object(GraphQLClient, '_execute_partial')
+    def test_execute_mutations_first_request_failure_raises(self, mock_execute_partial, client):
+        """Test a batch whose first request fails as a whole raises, as nothing was applied."""
+        mock_execute_partial.side_effect = GraphQLError("Authentication failed")
+
+        with pytest.raises(GraphQLError, match="Authentication failed"):
+            client.remove_sub_issues('parent', ['c1'])
+
     @patch.object(GraphQLClient, '_execute')
     def test_get_issue_with_sub_issues(self, mock_execute, client):
         """Test get_issue_with_sub_issues method."""
@@ -272,6 +367,255 @@ class TestGraphQLClient:
         assert result['closed'] == 0
         assert result['completion_rate'] == 0
 
+    @patch.object(GraphQLClient, '_execute')
+    def test_paginate_follows_cursors(self, mock_execute, client):
+        """Test paginate yields nodes from every page in order."""
+        mock_execute.side_effect = [
+            {'node': {'items': {'nodes': [{'n': 1}, {'n': 2}],
+                                'pageInfo': {'hasNextPage': True, 'endCursor': 'c1'}}}},
+            {'node': {'items': {'nodes': [{'n': 3}],
+                                'pageInfo': {'hasNextPage': False, 'endCursor': 'c2'}}}},
+        ]
+
+        nodes = list(client.paginate('query', {'id': 'x'}, ('node', 'items'), page_size=2))
+
+        assert [node['n'] for node in nodes] == [1, 2, 3]
+        assert mock_execute.call_args_list[0][0][1] == {'id': 'x', 'first': 2, 'after': None}
+        assert mock_execute.call_args_list[1][0][1] == {'id': 'x', 'first': 2, 'after': 'c1'}
+
+    @patch.object(GraphQLClient, '_execute')
+    def test_paginate_prefetches_next_page(self, mock_execute, client):
+        """Test the next page is requested before the current page is consumed."""
+        mock_execute.side_effect = [
+            {'node': {'items': {'nodes': [{'n': 1}],
+                                'pageInfo': {'hasNextPage': True, 'endCursor': 'c1'}}}},
+            {'node': {'items': {'nodes': [{'n': 2}],
+                                'pageInfo': {'hasNextPage': False, 'endCursor': 'c2'}}}},
+        ]
+
+        pages = client.paginate('query', {}, ('node', 'items'))
+        assert next(pages) == {'n': 1}
+
+        # The prefetch runs in the background; wait for it without consuming
+        for _ in range(200):
+            if mock_execute.call_count == 2:
+                break
+            time.sleep(0.01)
+        assert mock_execute.call_count == 2
+        assert list(pages) == [{'n': 2}]
+
+    @patch.object(GraphQLClient, '_execute')
+    def test_paginate_missing_connection(self, mock_execute, client):
+        """Test paginate yields nothing when the node doesn't exist."""
+        mock_execute.return_value = {'node': None}
+
+        assert list(client.paginate('query', {}, ('node', 'items'))) == []
+
+    @patch.object(GraphQLClient, '_execute')
+    def test_get_issue_with_sub_issues_fetches_remaining_pages(self, mock_execute, client):
+        """Test sub-issues beyond the first page are appended."""
+        mock_execute.side_effect = [
+            {'node': {'id': 'issue-id', 'subIssues': {
+                'totalCount': 101,
+                'nodes': [{'number': n, 'state': 'OPEN'} for n in range(100)],
+                'pageInfo': {'hasNextPage': True, 'endCursor': 'c1'}
+            }}},
+            {'node': {'subIssues': {
+                'nodes': [{'number': 100, 'state': 'CLOSED'}],
+                'pageInfo': {'hasNextPage': False, 'endCursor': 'c2'}
+            }}},
+        ]
+
+        result = client.get_issue_with_sub_issues('issue-id')
+
+        sub_issues = result['node']['subIssues']
+        assert len(sub_issues['nodes']) == 101
+        assert sub_issues['nodes'][-1]['number'] == 100
+        assert sub_issues['pageInfo']['hasNextPage'] is False
+
+    @patch.object(GraphQLClient, '_execute')
+    def test_iter_sub_issues_completes_labels(self, mock_execute, client):
+        """Test labels beyond the first page of a sub-issue are fetched."""
+        mock_execute.side_effect = [
+            {'node': {'subIssues': {
+                'nodes': [{
+                    'id': 'sub1',
+                    'number': 2,
+                    'labels': {'nodes': [{'name': 'a', 'color': '000000'}],
+                               'pageInfo': {'hasNextPage': True, 'endCursor': 'l1'}},
+                    'assignees': {'nodes': [], 'pageInfo': {'hasNextPage': False, 'endCursor': None}}
+                }],
+                'pageInfo': {'hasNextPage': False, 'endCursor': 's1'}
+            }}},
+            {'node': {'labels': {
+                'nodes': [{'name': 'b', 'color': 'ffffff'}],
+                'pageInfo': {'hasNextPage': False, 'endCursor': 'l2'}
+            }}},
+        ]
+
+        sub_issues = list(client.iter_sub_issues('issue-id'))
+
+        assert [label['name'] for label in sub_issues[0]['labels']['nodes']] == ['a', 'b']
+        assert mock_execute.call_args[0][1] == {'id': 'sub1', 'first': 100, 'after': 'l1'}
+
+    @patch.object(GraphQLClient, '_execute')
+    def test_get_sub_issues_summary_counts_all_pages(self, mock_execute, client):
+        """Test summary statistics include sub-issues past the first 100."""
+        mock_execute.side_effect = [
+            {'node': {'subIssues': {
+                'totalCount': 150,
+                'nodes': [{'state': 'CLOSED'}] * 100,
+                'pageInfo': {'hasNextPage': True, 'endCursor': 'c1'}
+            }}},
+            {'node': {'subIssues': {
+                'totalCount': 150,
+                'nodes': [{'state': 'OPEN'}] * 50,
+                'pageInfo': {'hasNextPage': False, 'endCursor': 'c2'}
+            }}},
+        ]
+
+        result = client.get_sub_issues_summary('issue-id')
+
+        assert result['total'] == 150
+        assert result['closed'] == 100
+        assert result['open'] == 50
+        assert abs(result['completion_rate'] - 66.67) < 0.01
+
+    @patch.object(GraphQLClient, '_execute')
+    def test_get_issue_details_single_query(self, mock_execute, client):
+        """Test get_issue_details fetches everything with one query."""
+        mock_execute.return_value = {
+            'repository': {
+                'issue': {
+                    'id': 'issue-id',
+                    'number': 42,
+                    'title': 'Epic',
+                    'comments': {
+                        'nodes': [{'databaseId': 1, 'body': 'hi'}],
+                        'pageInfo': {'hasNextPage': False, 'endCursor': None}
+                    },
+                    'subIssues': {
+                        'totalCount': 1,
+                        'nodes': [{'number': 43, 'title': 'Task', 'state': 'OPEN'}],
+                        'pageInfo': {'hasNextPage': False, 'endCursor': None}
+                    }
+                }
+            }
+        }
+
+        result = client.get_issue_details('owner', 'repo', 42)
+
+        assert result['number'] == 42
+        assert len(result['comments']['nodes']) == 1
+        assert len(result['subIssues']['nodes']) == 1
+        mock_execute.assert_called_once()
+        query = mock_execute.call_args[0][0]
+        for field in ('issueType', 'milestone', 'parent', 'comments', 'subIssues'):
+            assert field in query
+
+    @patch.object(GraphQLClient, '_execute')
+    def test_get_issue_details_fetches_remaining_comment_pages(self, mock_execute, client):
+        """Test get_issue_details follows comment cursors until exhausted."""
+        mock_execute.side_effect = [
+            {
+                'repository': {
+                    'issue': {
+                        'id': 'issue-id',
+                        'number': 42,
+                        'comments': {
+                            'nodes': [{'databaseId': 1}],
+                            'pageInfo': {'hasNextPage': True, 'endCursor': 'c1'}
+                        },
+                        'subIssues': {
+                            'totalCount': 0,
+                            'nodes': [],
+                            'pageInfo': {'hasNextPage': False, 'endCursor': None}
+                        }
+                    }
+                }
+            },
+            {
+                'node': {
+                    'comments': {
+                        'nodes': [{'databaseId': 2}],
+                        'pageInfo': {'hasNextPage': False, 'endCursor': 'c2'}
+                    }
+                }
+            }
+        ]
+
+        result = client.get_issue_details('owner', 'repo', 42)
+
+        assert [c['databaseId'] for c in result['comments']['nodes']] == [1, 2]
+        assert mock_execute.call_count == 2
+        assert mock_execute.call_args[0][1] == {'id': 'issue-id', 'first': 100, 'after': 'c1'}
+
+    @patch.object(GraphQLClient, '_execute')
+    def test_get_issue_body_requests_only_body_fields(self, mock_execute, client):
+        """Test get_issue_body doesn't request comments, sub-issues or parent."""
+        mock_execute.return_value = {'repository': {'issue': {'number': 42, 'body': '## Summary'}}}
+
+        result = client.get_issue_body('owner', 'repo', 42)
+
+        assert result['body'] == '## Summary'
+        query = mock_execute.call_args[0][0]
+        assert 'body' in query
+        for field in ('comments', 'subIssues', 'parent', 'milestone'):
+            assert field not in query
+
+        mock_execute.return_value = {'repository': {'issue': None}}
+        with pytest.raises(GraphQLError, match="Issue #42 not found"):
+            client.get_issue_body('owner', 'repo', 42)
+
+    @patch.object(GraphQLClient, '_execute')
+    def test_get_issue_details_not_found(self, mock_execute, client):
+        """Test get_issue_details raises when the issue doesn't exist."""
+        mock_execute.return_value = {'repository': {'issue': None}}
+
+        with pytest.raises(GraphQLError, match="Issue #42 not found"):
+            client.get_issue_details('owner', 'repo', 42)
+
+    @patch.object(GraphQLClient, '_execute_partial')
+    def test_get_issues_batch_chunks_aliased_queries(self, mock_execute_partial, client):
+        """Test get_issues_batch resolves 120 issues with ceil(120 / 50) requests."""
+        def respond(query, variables):
+            numbers = [int(n) for n in re.findall(r'issue\(number: (\d+)\)', query)]
+            return {'repository': {f"issue{n}": {'id': f"node-{n}"} for n in numbers}}, []
+        mock_execute_partial.side_effect = respond
+
+        result = client.get_issues_batch('owner', 'repo', list(range(1, 121)), fields="id")
+
+        assert mock_execute_partial.call_count == 3
+        assert len(result) == 120
+        assert result[120] == {'id': 'node-120'}
+        assert 'issue1: issue(number: 1)' in mock_execute_partial.call_args_list[0][0][0]
+
+    @patch.object(GraphQLClient, '_execute_partial')
+    def test_get_issues_batch_missing_issue(self, mock_execute_partial, client):
+        """Test missing issues map to None without failing the batch."""
+        mock_execute_partial.return_value = (
+            {'repository': {'issue1': {'id': 'node-1'}, 'issue2': None}},
+            [{'type': 'NOT_FOUND', 'path': ['repository', 'issue2'],
+              'message': 'Could not resolve to an Issue with the number of 2.'}]
+        )
+
+        result = client.get_node_ids('owner', 'repo', [1, 2, 1])
+
+        assert result == {1: 'node-1', 2: None}
+        mock_execute_partial.assert_called_once()
+
+    @patch.object(GraphQLClient, '_execute_partial')
+    def test_get_issues_batch_other_errors_raise(self, mock_execute_partial, client):
+        """Test errors other than missing issues fail the batch."""
+        mock_execute_partial.return_value = (
+            {'repository': None},
+            [{'type': 'NOT_FOUND', 'path': ['repository'],
+              'message': 'Could not resolve to a Repository.'}]
+        )
+
+        with pytest.raises(GraphQLError, match="Could not resolve to a Repository"):
+            client.get_issues_batch('owner', 'repo', [1])
+
     @patch.object(GraphQLClient, '_execute')
     def test_get_node_id(self, mock_execute, client):
         """Test get_node_id method."""
@@ -399,6 +743,47 @@ class TestGraphQLClient:
         assert result['fields']['Status']['options']['Done'] == 'opt-2'
         assert 'options' not in result['fields']['Priority']
 
+    @patch.object(GraphQLClient, '_execute')
+    def test_get_project_schema_from_url_parts(self, mock_execute, client):
+        """Test a project's ID and fields are fetched from its owner and number."""
+        mock_execute.return_value = {
+            'organization': {
+                'projectV2': {
+                    'id': 'proj-id',
+                    'title': 'Roadmap',
+                    'fields': {'nodes': [
+                        {'id': 'field-1', 'name': 'Status', 'dataType': 'SINGLE_SELECT',
+                         'options': [{'id': 'opt-1', 'name': 'Done'}]},
+                    ]}
+                }
+            }
+        }
+
+        result = client.get_project_schema('orgs', 'acme', 5)
+
+        assert result['project_id'] == 'proj-id'
+        assert result['fields']['Status']['options'] == {'Done': 'opt-1'}
+        assert mock_execute.call_args[0][1] == {'owner': 'acme', 'number': 5}
+        assert 'organization(login: $owner)' in mock_execute.call_args[0][0]
+
+    @patch.object(GraphQLClient, 'get_issues_batch')
+    def test_get_project_item_ids_picks_the_project(self, mock_batch, client):
+        """Test item IDs are resolved in one batch and filtered by project."""
+        mock_batch.return_value = {
+            1: {'projectItems': {'nodes': [
+                {'id': 'item-other', 'project': {'id': 'other-proj'}},
+                {'id': 'item-1', 'project': {'id': 'proj-id'}},
+            ]}},
+            2: {'projectItems': {'nodes': []}},
+            3: None,
+        }
+
+        result = client.get_project_item_ids('owner', 'repo', 'proj-id', [1, 2, 3])
+
+        assert result == {1: 'item-1', 2: None, 3: None}
+        mock_batch.assert_called_once()
+        assert 'projectItems' in mock_batch.call_args[1]['fields']
+
     @patch.object(GraphQLClient, '_execute')
     def test_check_sub_issues_available_true(self, mock_execute, client):
         """Test check_sub_issues_available when feature is available."""
@@ -0,0 +1,162 @@
+"""Unit tests for the persistent HTTP response cache."""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+from github import Github
+from github.Auth import Token
+
+from ghoo.utils.http_cache import CachedResponse, CachingHTTPAdapter, HTTPCache, install_http_adapter
+
+
+def _response(status, headers=None, body=b''):
+    response = requests.Response()
+    response.status_code = status
+    response.headers = requests.structures.CaseInsensitiveDict(headers or {})
+    response._content = body
+    return response
+
+
+def _request(url="https://api.github.com/repos/owner/repo", method="GET", auth="token abc"):
+    return requests.Request(method, url, headers={'Authorization': auth, 'Accept': 'application/json'}).prepare()
+
+
+class TestHTTPCache:
+    """Test cases for HTTPCache storage."""
+
+    def test_put_and_get_roundtrip(self, tmp_path):
+        """Test a stored response is returned unchanged."""
+        cache = HTTPCache(tmp_path)
+        key = HTTPCache.make_key("https://api.github.com/x", "token abc")
+        cache.put(key, CachedResponse(url="https://api.github.com/x", status=200,
+                                      headers={'ETag': '"1"'}, body=b'{"a": 1}'))
+
+        cached = cache.get(key)
+
+        assert cached.body == b'{"a": 1}'
+        assert cached.etag == '"1"'
+
+    def test_key_depends_on_token_identity(self):
+        """Test responses are never shared between tokens."""
+        url = "https://api.github.com/x"
+        assert HTTPCache.make_key(url, "token a") != HTTPCache.make_key(url, "token b")
+
+    def test_get_missing_key(self, tmp_path):
+        """Test a missing entry returns None."""
+        assert HTTPCache(tmp_path).get("0" * 64) is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test the size cap evicts the entries used longest ago."""
+        cache = HTTPCache(tmp_path)
+        keys = [HTTPCache.make_key(f"https://api.github.com/{i}") for i in range(3)]
+        for age, key in enumerate(keys):
+            cache.put(key, CachedResponse(url="u", status=200, body=b'x' * 150))
+            os.utime(cache._path(key), (1000 + age, 1000 + age))
+        entry_size = cache._path(keys[0]).stat().st_size
+        cache.max_bytes = int(entry_size * 3.5)
+
+        cache.get(keys[0])  # keys[0] becomes the most recently used entry
+        cache.put(HTTPCache.make_key("https://api.github.com/new"),
+                  CachedResponse(url="u", status=200, body=b'x' * 150))
+
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[2]) is not None
+        assert cache._current_size() <= cache.max_bytes
+
+
+class TestCachingHTTPAdapter:
+    """Test cases for conditional revalidation in CachingHTTPAdapter."""
+
+    @pytest.fixture
+    def adapter(self, tmp_path):
+        return CachingHTTPAdapter(HTTPCache(tmp_path))
+
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_revalidates_with_etag_and_serves_304_from_cache(self, mock_send, adapter):
+        """Test a repeated GET sends If-None-Match and turns 304 into the cached body."""
+        mock_send.return_value = _response(200, {'ETag': '"v1"', 'Content-Type': 'application/json'}, b'{"n": 1}')
+        first = adapter.send(_request())
+        assert first.content == b'{"n": 1}'
+
+        mock_send.return_value = _response(304, {'ETag': '"v1"', 'X-RateLimit-Remaining': '4999'})
+        request = _request()
+        second = adapter.send(request)
+
+        assert request.headers['If-None-Match'] == '"v1"'
+        assert second.status_code == 200
+        assert second.json() == {'n': 1}
+        assert second.headers['X-RateLimit-Remaining'] == '4999'
+
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_changed_resource_replaces_entry(self, mock_send, adapter):
+        """Test a 200 on revalidation stores the new representation."""
+        mock_send.return_value = _response(200, {'ETag': '"v1"'}, b'old')
+        adapter.send(_request())
+        mock_send.return_value = _response(200, {'ETag': '"v2"'}, b'new')
+        adapter.send(_request())
+
+        mock_send.return_value = _response(304, {})
+        request = _request()
+        assert adapter.send(request).content == b'new'
+        assert request.headers['If-None-Match'] == '"v2"'
+
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_non_get_requests_bypass_cache(self, mock_send, adapter):
+        """Test writes are never cached or made conditional."""
+        mock_send.return_value = _response(200, {'ETag': '"v1"'}, b'{}')
+        request = _request(method="PATCH")
+
+        adapter.send(request)
+
+        assert 'If-None-Match' not in request.headers
+        assert not list(adapter.cache._entries())
+
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_caller_validators_are_left_alone(self, mock_send, adapter):
+        """Test requests that already carry validators receive the raw 304."""
+        mock_send.return_value = _response(200, {'ETag': '"v1"'}, b'{}')
+        adapter.send(_request())
+        mock_send.return_value = _response(304, {})
+        request = _request()
+        request.headers['If-None-Match'] = '"mine"'
+
+        assert adapter.send(request).status_code == 304
+        assert request.headers['If-None-Match'] == '"mine"'
+
+    @patch('requests.adapters.HTTPAdapter.send')
+    def test_unauthorized_callback(self, mock_send, tmp_path):
+        """Test 401 responses are handed to on_unauthorized, which may raise."""
+        callback = Mock(side_effect=RuntimeError("bad token"))
+        adapter = CachingHTTPAdapter(HTTPCache(tmp_path), on_unauthorized=callback)
+
+        mock_send.return_value = _response(200, {}, b'{}')
+        adapter.send(_request())
+        callback.assert_not_called()
+
+        mock_send.return_value = _response(401, {}, b'{"message": "Bad credentials"}')
+        with pytest.raises(RuntimeError, match="bad token"):
+            adapter.send(_request())
+        callback.assert_called_once_with(mock_send.return_value)
+
+
+class TestInstallHTTPCache:
+    """Test cases for installing the cache into PyGithub."""
+
+    def test_install_on_github_client(self, tmp_path):
+        """Test the cache is installed into a real Github instance only."""
+        github = Github(auth=Token("test-token"))
+        other = Github(auth=Token("test-token"))
+
+        assert install_http_adapter(github, HTTPCache(tmp_path)) is True
+        connection_class = github.requester._Requester__connectionClass
+        assert connection_class is not other.requester._Requester__connectionClass
+
+        connection = connection_class("api.github.com", 443)
+        assert isinstance(connection.session.get_adapter("https://api.github.com/"), CachingHTTPAdapter)
+
+    def test_install_on_unsupported_object(self, tmp_path):
+        """Test objects without a PyGithub requester are left untouched."""
+        assert install_http_adapter(Mock(), HTTPCache(tmp_path)) is False
@@ -0,0 +1,62 @@
+"""Unit tests for the on-disk viewer identity cache."""
+
+from unittest.mock import patch
+
+from ghoo.utils.identity import IdentityCache
+
+
+NOW = 1_700_000_000.0
+
+
+class TestIdentityCache:
+    """Test cases for IdentityCache."""
+
+    def test_roundtrip_between_instances(self, tmp_path):
+        """Test a login stored by one process is read by another."""
+        IdentityCache.for_token("token-a", tmp_path).put("octocat")
+
+        assert IdentityCache.for_token("token-a", tmp_path).get() == "octocat"
+        assert IdentityCache.for_token("token-b", tmp_path).get() is None
+
+    def test_token_is_not_stored(self, tmp_path):
+        """Test only a hash of the token ends up on disk."""
+        cache = IdentityCache.for_token("secret-token", tmp_path)
+        cache.put("octocat")
+
+        assert "secret-token" not in str(cache.path)
+        assert "secret-token" not in cache.path.read_text()
+
+    def test_expires_after_ttl(self, tmp_path):
+        """Test a login older than the TTL is fetched again."""
+        with patch('ghoo.utils.identity.time.time', return_value=NOW):
+            IdentityCache.for_token("token", tmp_path, ttl=60).put("octocat")
+
+        with patch('ghoo.utils.identity.time.time', return_value=NOW + 59):
+            assert IdentityCache.for_token("token", tmp_path, ttl=60).get() == "octocat"
+        with patch('ghoo.utils.identity.time.time', return_value=NOW + 61):
+            assert IdentityCache.for_token("token", tmp_path, ttl=60).get() is None
+
+    def test_corrupt_file_is_a_miss(self, tmp_path):
+        """Test an unreadable cache file is ignored."""
+        cache = IdentityCache.for_token("token", tmp_path)
+        cache.path.parent.mkdir(parents=True)
+        cache.path.write_text("{not json")
+
+        assert cache.get() is None
+
+    def test_clear_removes_file(self, tmp_path):
+        """Test clear() forgets the login in memory and on disk."""
+        cache = IdentityCache.for_token("token", tmp_path)
+        cache.put("octocat")
+        cache.clear()
+
+        assert cache.get() is None
+        assert not cache.path.exists()
+
+    def test_in_memory_without_cache_dir(self):
+        """Test the cache still memoizes when persistence is disabled."""
+        cache = IdentityCache.for_token("token", None)
+        cache.put("octocat")
+
+        assert cache.path is None
+        assert cache.get() == "octocat"
@@ -1,6 +1,8 @@
 """Unit tests for IssueService."""
 
 import pytest
+import tempfile
+from datetime import datetime, timezone
 from unittest.mock import Mock, MagicMock
 from github import GithubException
 
@@ -20,6 +22,12 @@ class TestIssueService:
         """Set up test fixtures."""
         self.github_client = Mock(spec=GitHubClient)
         self.github_client.github = Mock()  # Add github attribute
+        self.github_client.config = None
+        self.github_client.graphql = Mock()
+        # Default to the REST fallback; GraphQL tests configure their own response
+        self.github_client.graphql.get_issue_details.side_effect = GraphQLError("GraphQL unavailable")
+        self.github_client.graphql.get_issue_parent.return_value = None
+        self.github_client.cache_dir = Path(tempfile.mkdtemp())
         self.service = IssueService(self.github_client)
 
     def test_detect_issue_type_from_labels(self):
@@ -301,13 +309,16 @@ class TestIssueService:
         parent_issue.html_url = "https://github.com/owner/repo/issues/100"
         parent_issue.body = "Tasks:\n- [x] #123 Subtask 1\n- [ ] #124 Subtask 2"
         parent_issue.labels = []
+        parent_issue.updated_at = datetime(2024, 1, 2, tzinfo=timezone.utc)
         
         # Mock other issue that doesn't reference target
         other_issue = Mock()
         other_issue.number = 99
         other_issue.body = "No references here"
+        other_issue.updated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
         
-        github_repo.get_issues.return_value = [parent_issue, other_issue]
+        github_repo.get_issues.return_value = [other_issue, parent_issue]
+        github_repo.get_issue.return_value = parent_issue
         
         result = self.service.find_parent_issue("owner/repo", 123)
         
@@ -330,6 +341,7 @@ class TestIssueService:
         other_issue = Mock()
         other_issue.number = 99
         other_issue.body = "No references to #123 here"
+        other_issue.updated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
         
         github_repo.get_issues.return_value = [other_issue]
         
@@ -343,33 +355,95 @@ class TestIssueService:
         result = self.service.find_parent_issue("owner/repo", 123)
         assert result is None
 
+    def test_find_parent_issue_native_parent(self):
+        """Test the native parent is used without listing repository issues."""
+        self.github_client.graphql.get_issue_parent.return_value = {
+            'number': 100, 'title': 'Epic', 'state': 'OPEN',
+            'url': 'https://github.com/owner/repo/issues/100',
+            'issueType': {'name': 'Epic'}, 'labels': {'nodes': []}
+        }
+        
+        result = self.service.find_parent_issue("owner/repo", 123)
+        
+        assert result == {
+            'number': 100, 'title': 'Epic', 'state': 'open',
+            'type': 'epic', 'url': 'https://github.com/owner/repo/issues/100'
+        }
+        self.github_client.github.get_repo.assert_not_called()
+
+    def test_find_parent_issue_reuses_persisted_index(self):
+        """Test later lookups only request issues updated since the last sync."""
+        github_repo = Mock()
+        self.github_client.github.get_repo.return_value = github_repo
+        synced_at = datetime(2024, 1, 2, tzinfo=timezone.utc)
+        parent_issue = Mock()
+        parent_issue.number = 100
+        parent_issue.title = "Parent"
+        parent_issue.state = "open"
+        parent_issue.html_url = "https://github.com/owner/repo/issues/100"
+        parent_issue.body = "- [ ] #123 Child"
+        parent_issue.updated_at = synced_at
+        github_repo.get_issues.return_value = [parent_issue]
+        github_repo.get_issue.return_value = parent_issue
+        self.service.detect_issue_type = Mock(return_value='epic')
+        
+        assert self.service.find_parent_issue("owner/repo", 123)['number'] == 100
+        
+        # A new service instance reads the index from disk and syncs incrementally
+        github_repo.get_issues.return_value = []
+        service = IssueService(self.github_client)
+        service.detect_issue_type = Mock(return_value='epic')
+        
+        assert service.find_parent_issue("owner/repo", 123)['number'] == 100
+        assert github_repo.get_issues.call_args.kwargs['since'] == synced_at
+
+    def test_detect_issue_types_batches_native_lookups(self):
+        """Test native types of many issues are fetched with one batch call."""
+        issues = [Mock(number=n) for n in (1, 2, 3)]
+        self.github_client.graphql.get_issues_batch.return_value = {
+            1: {'issueType': {'name': 'Epic'}},
+            2: {'issueType': {'name': 'Sub-task'}},
+            3: None,
+        }
+        
+        result = self.service.detect_issue_types(issues, "owner/repo")
+        
+        assert result == {1: 'epic', 2: 'subtask', 3: 'unknown'}
+        self.github_client.graphql.get_issues_batch.assert_called_once_with(
+            "owner", "repo", [1, 2, 3], fields="issueType { name }"
+        )
+    
+    def test_detect_issue_types_from_labels(self):
+        """Test label-based type detection doesn't query GraphQL."""
+        self.github_client.config = Mock(issue_type_method="labels")
+        label = Mock()
+        label.name = 'type:task'
+        issue = Mock(number=5, labels=[label])
+        
+        assert self.service.detect_issue_types([issue], "owner/repo") == {5: 'task'}
+        self.github_client.graphql.get_issues_batch.assert_not_called()
+    
     def test_get_epic_data_with_graphql(self):
         """Test getting epic data with GraphQL support."""
         # Mock GraphQL support
         self.github_client.check_sub_issues_available.return_value = True
         
-        sub_issues_data = {
-            'node': {
-                'subIssues': {
-                    'nodes': [
-                        {
-                            'number': 124,
-                            'title': 'Sub-task 1',
-                            'state': 'OPEN',
-                            'author': {'login': 'user1'}
-                        },
-                        {
-                            'number': 125,
-                            'title': 'Sub-task 2', 
-                            'state': 'CLOSED',
-                            'author': {'login': 'user2'}
-                        }
-                    ]
-                }
+        sub_issues = [
+            {
+                'number': 124,
+                'title': 'Sub-task 1',
+                'state': 'OPEN',
+                'author': {'login': 'user1'}
+            },
+            {
+                'number': 125,
+                'title': 'Sub-task 2', 
+                'state': 'CLOSED',
+                'author': {'login': 'user2'}
             }
-        }
+        ]
         
-        self.github_client.get_issue_with_sub_issues.return_value = sub_issues_data
+        self.github_client.iter_sub_issues.return_value = iter(sub_issues)
         self.github_client.get_sub_issues_summary.return_value = {
             'total': 2,
             'open': 1,
@@ -498,4 +572,179 @@ class TestIssueService:
     def test_get_issue_with_details_invalid_repo(self):
         """Test getting issue with invalid repo format."""
         with pytest.raises(ValueError, match="Invalid repository format"):
-            self.service.get_issue_with_details("invalid-repo", 123)
\ No newline at end of file
+            self.service.get_issue_with_details("invalid-repo", 123)
+
+    def _graphql_issue(self, **overrides):
+        """Build a GraphQL issue node as returned by get_issue_details."""
+        issue = {
+            'id': 'issue-id',
+            'number': 123,
+            'title': 'Test Epic',
+            'body': 'Intro\n\n## Summary\n- [x] Done\n- [ ] Todo',
+            'state': 'OPEN',
+            'createdAt': '2023-12-01T10:00:00Z',
+            'updatedAt': '2023-12-01T12:00:00Z',
+            'url': 'https://github.com/owner/repo/issues/123',
+            'author': {'login': 'testuser'},
+            'issueType': {'name': 'Epic'},
+            'labels': {'nodes': [{'name': 'status:planning', 'color': 'ededed'}]},
+            'assignees': {'nodes': [{'login': 'dev1'}]},
+            'milestone': {'title': 'v1', 'state': 'OPEN', 'dueOn': '2024-01-31T00:00:00Z'},
+            'parent': None,
+            'comments': {
+                'nodes': [{
+                    'databaseId': 99,
+                    'author': {'login': 'reviewer'},
+                    'body': 'Looks good',
+                    'createdAt': '2023-12-02T10:00:00Z',
+                    'updatedAt': '2023-12-02T10:00:00Z',
+                    'url': 'https://github.com/owner/repo/issues/123#issuecomment-99'
+                }],
+                'pageInfo': {'hasNextPage': False, 'endCursor': None}
+            },
+            'subIssues': {
+                'totalCount': 2,
+                'nodes': [
+                    {'number': 124, 'title': 'Task A', 'state': 'CLOSED', 'author': {'login': 'dev1'},
+                     'labels': {'nodes': [{'name': 'status:done', 'color': '00ff00'}]},
+                     'assignees': {'nodes': []}},
+                    {'number': 125, 'title': 'Task B', 'state': 'OPEN', 'author': {'login': 'dev2'},
+                     'labels': {'nodes': []}, 'assignees': {'nodes': [{'login': 'dev2'}]}}
+                ],
+                'pageInfo': {'hasNextPage': False, 'endCursor': None}
+            }
+        }
+        issue.update(overrides)
+        return issue
+
+    def test_get_issue_with_details_graphql_single_query(self):
+        """Test issue details are built from one composed GraphQL query."""
+        self.github_client.graphql.get_issue_details.side_effect = None
+        self.github_client.graphql.get_issue_details.return_value = self._graphql_issue()
+
+        result = self.service.get_issue_with_details("owner/repo", 123)
+
+        self.github_client.graphql.get_issue_details.assert_called_once_with('owner', 'repo', 123)
+        self.github_client.github.get_repo.assert_not_called()
+        assert result['state'] == 'open'
+        assert result['type'] == 'epic'
+        assert result['created_at'] == '2023-12-01T10:00:00+00:00'
+        assert result['labels'] == [{'name': 'status:planning', 'color': 'ededed'}]
+        assert result['assignees'] == ['dev1']
+        assert result['milestone'] == {'title': 'v1', 'state': 'open', 'due_on': '2024-01-31T00:00:00+00:00'}
+        assert result['pre_section_description'] == 'Intro'
+        assert result['sections'][0]['completed_todos'] == 1
+        assert result['comments'] == [{
+            'id': 99,
+            'author': 'reviewer',
+            'body': 'Looks good',
+            'created_at': '2023-12-02T10:00:00+00:00',
+            'updated_at': '2023-12-02T10:00:00+00:00',
+            'html_url': 'https://github.com/owner/repo/issues/123#issuecomment-99'
+        }]
+        assert [sub['number'] for sub in result['sub_issues']] == [124, 125]
+        assert result['sub_issues'][0]['workflow_status'] == 'done'
+        assert result['sub_issues_summary'] == {'total': 2, 'open': 1, 'closed': 1, 'completion_rate': 50.0}
+        assert 'parent_issue' not in result
+
+    def test_get_issue_with_details_log_archive(self):
+        """Test archive comments are hidden from comments and stitched in on request."""
+        archive_comment = {
+            'databaseId': 100,
+            'author': {'login': 'dev1'},
+            'body': ('<!-- ghoo:log-archive -->\n## Log archive\n\n'
+                     '---\n### → planning [2024-01-01 10:00:00 UTC]\n*by @dev1*'),
+            'createdAt': '2023-12-03T10:00:00Z',
+            'updatedAt': '2023-12-03T10:00:00Z',
+            'url': 'https://github.com/owner/repo/issues/123#issuecomment-100'
+        }
+        issue = self._graphql_issue(body=(
+            '## Summary\nText\n\n## Log\n'
+            '_Archived 1 earlier log entry: [1](https://github.com/owner/repo/issues/123#issuecomment-100)_\n\n'
+            '---\n### → in-progress [2024-01-02 10:00:00 UTC]\n*by @dev1*'
+        ))
+        issue['comments']['nodes'].append(archive_comment)
+        self.github_client.graphql.get_issue_details.side_effect = None
+        self.github_client.graphql.get_issue_details.return_value = issue
+
+        result = self.service.get_issue_with_details("owner/repo", 123)
+
+        assert [comment['id'] for comment in result['comments']] == [99]
+        assert [entry['to_state'] for entry in result['log_entries']] == ['in-progress']
+        assert result['log_archive'] == {'comments': [archive_comment['url']]}
+
+        result = self.service.get_issue_with_details("owner/repo", 123, full_log=True)
+
+        assert [entry['to_state'] for entry in result['log_entries']] == ['planning', 'in-progress']
+        assert result['log_archive']['entries'] == 1
+
+    def test_get_issue_with_details_graphql_task_uses_native_parent(self):
+        """Test task details use the native parent without scanning issues."""
+        parent = {
+            'number': 1, 'title': 'Parent Epic', 'state': 'OPEN',
+            'url': 'https://github.com/owner/repo/issues/1',
+            'issueType': {'name': 'Epic'}, 'labels': {'nodes': []}
+        }
+        self.github_client.graphql.get_issue_details.side_effect = None
+        self.github_client.graphql.get_issue_details.return_value = self._graphql_issue(
+            issueType={'name': 'Task'}, parent=parent
+        )
+        self.service.find_parent_issue = Mock()
+
+        result = self.service.get_issue_with_details("owner/repo", 123)
+
+        self.service.find_parent_issue.assert_not_called()
+        assert result['type'] == 'task'
+        assert result['parent_issue'] == {
+            'number': 1, 'title': 'Parent Epic', 'state': 'open',
+            'type': 'epic', 'url': 'https://github.com/owner/repo/issues/1'
+        }
+
+    def test_get_issue_with_details_graphql_label_types(self):
+        """Test type detection honours the labels issue type method."""
+        self.github_client.config = Mock(issue_type_method='labels')
+        self.github_client.graphql.get_issue_details.side_effect = None
+        self.github_client.graphql.get_issue_details.return_value = self._graphql_issue(
+            issueType=None,
+            labels={'nodes': [{'name': 'type:epic', 'color': '000000'}]}
+        )
+
+        result = self.service.get_issue_with_details("owner/repo", 123)
+
+        assert result['type'] == 'epic'
+
+    def test_get_issue_outline_fetches_body_only(self):
+        """Test the outline comes from the body query and indexes its sections."""
+        self.github_client.graphql.get_issue_body.return_value = {
+            'number': 123, 'title': 'Test', 'state': 'OPEN',
+            'url': 'https://github.com/owner/repo/issues/123',
+            'body': 'Intro\n\n## Summary\nText\n\n## Tasks\n- [x] Done\n- [ ] Open\n',
+            'issueType': {'name': 'Task'}, 'labels': {'nodes': []}
+        }
+
+        result = self.service.get_issue_outline("owner/repo", 123)
+
+        self.github_client.graphql.get_issue_body.assert_called_once_with('owner', 'repo', 123)
+        self.github_client.graphql.get_issue_details.assert_not_called()
+        assert result['state'] == 'open'
+        assert result['type'] == 'task'
+        index = result['section_index']
+        assert index.titles() == ['Summary', 'Tasks']
+
+        section = self.service.format_section(index.section(index.find('tasks')))
+        assert section['completed_todos'] == 1
+        assert section['todos'][1] == {'text': 'Open', 'checked': False, 'line_number': 8}
+
+    def test_get_issue_outline_falls_back_to_rest(self):
+        """Test the outline uses the REST issue when GraphQL fails."""
+        self.github_client.graphql.get_issue_body.side_effect = GraphQLError("unavailable")
+        issue = Mock(number=5, title='Bug', state='closed', body=None,
+                     html_url='https://github.com/owner/repo/issues/5', labels=[])
+        self.github_client.get_issue.return_value = issue
+        self.service.detect_issue_type = Mock(return_value='task')
+
+        result = self.service.get_issue_outline("owner/repo", 5)
+
+        self.github_client.get_issue.assert_called_once_with("owner/repo", 5)
+        assert result['body'] == ''
+        assert result['section_index'].titles() == []
@@ -0,0 +1,45 @@
+"""Unit tests for the on-disk label node ID cache."""
+
+from unittest.mock import patch
+
+from ghoo.utils.labels import LabelCache
+
+
+NOW = 1_700_000_000.0
+
+
+class TestLabelCache:
+    """Test cases for LabelCache."""
+
+    def test_roundtrip_between_instances(self, tmp_path):
+        """Test labels stored by one process are read by another."""
+        LabelCache.for_cache_dir(tmp_path).put("Owner/Repo", {"status:planning": "LA_1"})
+
+        cache = LabelCache.for_cache_dir(tmp_path)
+        assert cache.get("owner/repo") == {"status:planning": "LA_1"}
+        assert cache.get("owner/other") is None
+
+    def test_in_memory_without_directory(self):
+        """Test the cache works without a cache directory."""
+        cache = LabelCache.for_cache_dir(None)
+        cache.put("owner/repo", {"bug": "LA_2"})
+
+        assert cache.get("owner/repo") == {"bug": "LA_2"}
+
+    def test_expires_after_ttl(self, tmp_path):
+        """Test a map older than the TTL is fetched again."""
+        with patch('ghoo.utils.labels.time.time', return_value=NOW):
+            LabelCache.for_cache_dir(tmp_path, ttl=60).put("owner/repo", {"bug": "LA_2"})
+
+        with patch('ghoo.utils.labels.time.time', return_value=NOW + 59):
+            assert LabelCache.for_cache_dir(tmp_path, ttl=60).get("owner/repo") == {"bug": "LA_2"}
+        with patch('ghoo.utils.labels.time.time', return_value=NOW + 61):
+            assert LabelCache.for_cache_dir(tmp_path, ttl=60).get("owner/repo") is None
+
+    def test_corrupt_file_is_a_miss(self, tmp_path):
+        """Test an unreadable cache file is ignored."""
+        path = tmp_path / "labels" / "owner__repo.json"
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        assert LabelCache.for_cache_dir(tmp_path).get("owner/repo") is None
@@ -0,0 +1,58 @@
+"""Unit tests for the log archive helpers."""
+
+from ghoo.utils.log_archive import (
+    ARCHIVE_HEADER,
+    LogArchiveIndex,
+    is_archive_comment,
+    pack_archive,
+)
+
+
+class TestLogArchiveIndex:
+    """Test parsing and rendering the index line."""
+
+    def test_round_trip(self):
+        """Test a rendered index line parses back to the same index."""
+        index = LogArchiveIndex(12, [
+            'https://github.com/owner/repo/issues/5#issuecomment-11',
+            'https://github.com/owner/repo/issues/5#issuecomment-42',
+        ])
+
+        line = index.render()
+        parsed = LogArchiveIndex.parse(line)
+
+        assert line.startswith('_Archived 12 earlier log entries: [1](')
+        assert parsed.count == 12
+        assert parsed.urls == index.urls
+        assert parsed.comment_ids == [11, 42]
+
+    def test_other_lines_are_not_indexes(self):
+        """Test ordinary log lines aren't mistaken for the index."""
+        assert LogArchiveIndex.parse('---') is None
+        assert LogArchiveIndex.parse('*by @alice*') is None
+        assert LogArchiveIndex.parse('_Archived some entries_') is None
+
+
+class TestPackArchive:
+    """Test distributing entries over archive comments."""
+
+    def test_appends_to_latest_comment(self):
+        """Test blocks go into the latest comment while it has room."""
+        latest = f'{ARCHIVE_HEADER}\n\n---\nold'
+
+        updated, created = pack_archive(['---\nA', '---\nB'], latest)
+
+        assert updated == f'{latest}\n\n---\nA\n\n---\nB'
+        assert created == []
+
+    def test_starts_new_comments_at_the_limit(self):
+        """Test blocks that don't fit start new archive comments."""
+        block = '---\n' + 'x' * 40
+        limit = len(ARCHIVE_HEADER) + 2 + len(block)
+
+        updated, created = pack_archive([block, block], None, limit=limit)
+
+        assert updated is None
+        assert created == [f'{ARCHIVE_HEADER}\n\n{block}'] * 2
+        assert all(is_archive_comment(body) for body in created)
+        assert not is_archive_comment('Looks good')
@@ -5,8 +5,8 @@ from datetime import datetime, timezone
 from unittest.mock import Mock, patch, MagicMock
 from github import GithubException
 
-from ghoo.core import GitHubClient
-from ghoo.models import LogEntry, LogSubEntry
+from ghoo.core import GitHubClient, IssueParser
+from ghoo.models import Config, LogEntry, LogSubEntry
 
 
 class TestLogGeneration:
@@ -26,6 +26,7 @@ class TestLogGeneration:
         # Create GitHubClient with mocked github attribute
         self.client = GitHubClient.__new__(GitHubClient)
         self.client.github = self.mock_github_client
+        self.client.config = None
 
     def test_ensure_log_section_empty_body(self):
         """Test _ensure_log_section with empty body."""
@@ -215,6 +216,69 @@ Content only
                 message="This would make the body too long"
             )
 
+    def _archive_comments(self):
+        """Make the mock issue store the comments created on it."""
+        comments = {}
+
+        def create_comment(body):
+            comment_id = 1000 + len(comments)
+            comment = Mock(body=body, html_url=f"https://github.com/owner/repo/issues/123#issuecomment-{comment_id}")
+            comment.edit.side_effect = lambda new_body: setattr(comment, 'body', new_body)
+            comments[comment_id] = comment
+            return comment
+
+        self.mock_issue.create_comment.side_effect = create_comment
+        self.mock_issue.get_comment.side_effect = lambda comment_id: comments[comment_id]
+        self.mock_issue.edit.side_effect = lambda body: setattr(self.mock_issue, 'body', body)
+        return comments
+
+    def test_append_log_entry_rotates_to_archive_comment(self):
+        """Test entries beyond log_keep_entries move to an archive comment."""
+        self.client.config = Config(project_url="https://github.com/owner/repo", log_keep_entries=2)
+        self.mock_issue.body = "## Summary\nContent"
+        comments = self._archive_comments()
+
+        for state in ["planning", "awaiting-plan-approval", "plan-approved", "in-progress"]:
+            self.client.append_log_entry(repo="owner/repo", issue_number=123, to_state=state, author="dev")
+
+        parsed = IssueParser.parse_body(self.mock_issue.body)
+        assert [entry.to_state for entry in parsed['log_entries']] == ["plan-approved", "in-progress"]
+        assert "_Archived 2 earlier log entries: [1](https://github.com/owner/repo/issues/123#issuecomment-1000)_" \
+            in self.mock_issue.body
+
+        # Later rotations append to the same archive comment
+        assert list(comments) == [1000]
+        archived = IssueParser.parse_log_archive([comments[1000].body])
+        assert [entry.to_state for entry in archived] == ["planning", "awaiting-plan-approval"]
+
+    def test_append_log_entry_skips_rotation_within_limit(self):
+        """Test appends below log_keep_entries don't parse the body."""
+        self.client.config = Config(project_url="https://github.com/owner/repo", log_keep_entries=2)
+        self.mock_issue.body = "## Summary\nContent"
+        self._archive_comments()
+
+        with patch.object(IssueParser, 'parse_document') as parse_document:
+            for state in ["planning", "awaiting-plan-approval"]:
+                self.client.append_log_entry(repo="owner/repo", issue_number=123, to_state=state, author="dev")
+
+        parse_document.assert_not_called()
+        assert self.client._count_log_entries(self.mock_issue.body) == 2
+
+    def test_append_log_entry_rotates_when_body_too_large(self):
+        """Test an oversized log is rotated even without log_keep_entries."""
+        entry = "---\n### → in-progress [2024-01-15 10:30:00 UTC]\n*by @dev*\n**Message**: " + "x" * 2000
+        self.mock_issue.body = "## Summary\nContent\n\n## Log\n\n" + "\n\n".join([entry] * 32)
+        self._archive_comments()
+
+        self.client.append_log_entry(repo="owner/repo", issue_number=123, to_state="done", author="dev")
+
+        body = self.mock_issue.body
+        assert len(body) < 65536
+        log_entries = IssueParser.parse_body(body)['log_entries']
+        assert len(log_entries) == GitHubClient.DEFAULT_LOG_KEEP_ENTRIES
+        assert log_entries[-1].to_state == "done"
+        assert self.mock_issue.create_comment.call_count == 1
+
     def test_append_log_entry_empty_body(self):
         """Test appending to issue with empty body."""
         self.mock_issue.body = None
@@ -410,4 +474,29 @@ More text here"""
         assert "@user1" in final_body
         assert "@user2" in final_body
         assert "@user3" in final_body
-        assert "Starting work" in final_body
\ No newline at end of file
+        assert "Starting work" in final_body
+
+    def test_ends_with_log_entry(self):
+        """Test the tail anchor only matches a log entry at the end of the body."""
+        entry = "---\n### → planning [2024-01-15 09:00:00 UTC]\n*by @user1*"
+        
+        assert self.client._ends_with_log_entry(f"## Summary\nText\n\n## Log\n\n{entry}")
+        assert self.client._ends_with_log_entry(f"## Log\n\n{entry}\n\n#### Checks\nAll green\n")
+        assert not self.client._ends_with_log_entry("## Summary\nText\n\n## Log")
+        assert not self.client._ends_with_log_entry(f"## Log\n\n{entry}\n\n## Notes\nLater section")
+        assert not self.client._ends_with_log_entry("## Summary\nText\n---\nA horizontal rule")
+
+    def test_append_to_log_section_anchored_matches_full_scan(self):
+        """Test the tail append produces the same body as locating the ## Log header."""
+        log_entry = LogEntry(
+            to_state="in-progress",
+            timestamp=datetime(2024, 1, 15, 10, 30, 0, tzinfo=timezone.utc),
+            author="testuser"
+        )
+        body = "## Summary\nContent\n\n## Log\n\n---\n### → planning [2024-01-15 09:00:00 UTC]\n*by @user1*\n"
+        
+        with patch.object(self.client, '_ends_with_log_entry', return_value=False):
+            expected = self.client._append_to_log_section(body, log_entry)
+        
+        with patch.object(self.client, '_ensure_log_section', side_effect=AssertionError("full scan")):
+            assert self.client._append_to_log_section(body, log_entry) == expected
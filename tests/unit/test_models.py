@@ -4,7 +4,7 @@ import pytest
 from datetime import datetime
 from ghoo.models import (
     Todo, Section, Issue, Epic, Task, SubTask,
-    IssueType, WorkflowState, Config
+    IssueType, WorkflowState, Config, Condition, IssueSummary
 )
 
 
@@ -58,4 +58,33 @@ class TestModels:
         config = Config(project_url="https://github.com/test/repo")
         assert "epic" in config.required_sections
         assert "Summary" in config.required_sections["epic"]
-        assert "Acceptance Criteria" in config.required_sections["epic"]
\ No newline at end of file
+        assert "Acceptance Criteria" in config.required_sections["epic"]
+    
+    def test_parsed_models_have_no_instance_dict(self):
+        """Test the parsed body models are slotted."""
+        for obj in (Todo("Task"), Section("Tasks", ""), Condition("Deployed")):
+            assert not hasattr(obj, '__dict__')
+            with pytest.raises(AttributeError):
+                obj.extra = True
+    
+    def test_issue_summary(self):
+        """Test IssueSummary from a GraphQL node."""
+        summary = IssueSummary.from_graphql({
+            'number': 7,
+            'title': 'Sub-task',
+            'state': 'OPEN',
+            'author': {'login': 'alice'},
+            'assignees': {'nodes': [{'login': 'bob'}]},
+            'labels': {'nodes': [{'name': 'status:in-progress', 'color': 'fbca04'}]},
+        })
+        assert summary.workflow_status == 'in-progress'
+        assert summary.to_dict() == {
+            'number': 7,
+            'title': 'Sub-task',
+            'state': 'open',
+            'author': 'alice',
+            'assignees': ['bob'],
+            'labels': [{'name': 'status:in-progress', 'color': 'fbca04'}],
+            'workflow_status': 'in-progress'
+        }
+        assert not hasattr(summary, '__dict__')
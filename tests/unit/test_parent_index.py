@@ -0,0 +1,75 @@
+"""Unit tests for the persisted child → parent reference index."""
+
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+from ghoo.services.parent_index import ParentIndex
+
+
+def _issue(number, body, day):
+    issue = Mock()
+    issue.number = number
+    issue.body = body
+    issue.updated_at = datetime(2024, 1, day, tzinfo=timezone.utc)
+    return issue
+
+
+class TestParentIndex:
+    """Test cases for ParentIndex."""
+
+    def test_extract_references_same_and_cross_repo(self):
+        """Test both '#N' and 'owner/repo#N' references are recognised."""
+        index = ParentIndex("owner/repo")
+        body = "- [ ] #12 First\n- [x] owner/repo#13\n- [ ] other/repo#14\n- [ ] #15x"
+
+        assert index.extract_references(body) == {12, 13}
+
+    def test_update_issue_replaces_previous_references(self):
+        """Test an edited parent body drops children it no longer references."""
+        index = ParentIndex("owner/repo")
+        index.update_issue(1, "- [ ] #2\n- [ ] #3")
+        index.update_issue(1, "- [ ] #3")
+
+        assert index.get_parent(2) is None
+        assert index.get_parent(3) == 1
+
+    def test_update_issue_ignores_self_reference(self):
+        """Test an issue never becomes its own parent."""
+        index = ParentIndex("owner/repo")
+        index.update_issue(5, "- [ ] #5")
+
+        assert index.get_parent(5) is None
+
+    def test_sync_is_incremental_and_persisted(self, tmp_path):
+        """Test the index is saved and later syncs pass the high-water mark."""
+        github_repo = Mock()
+        github_repo.get_issues.return_value = [
+            _issue(1, "- [ ] #3", 1),
+            _issue(2, "- [ ] #4", 2),
+        ]
+
+        index = ParentIndex.for_repository("owner/repo", tmp_path)
+        index.sync(github_repo)
+
+        assert 'since' not in github_repo.get_issues.call_args.kwargs
+
+        github_repo.get_issues.return_value = [_issue(1, "- [ ] #5", 3)]
+        reloaded = ParentIndex.for_repository("owner/repo", tmp_path)
+        reloaded.sync(github_repo)
+
+        assert github_repo.get_issues.call_args.kwargs['since'] == datetime(2024, 1, 2, tzinfo=timezone.utc)
+        assert reloaded.get_parent(3) is None
+        assert reloaded.get_parent(4) == 2
+        assert reloaded.get_parent(5) == 1
+        assert reloaded.synced_at == datetime(2024, 1, 3, tzinfo=timezone.utc)
+
+    def test_load_ignores_corrupt_file(self, tmp_path):
+        """Test an unreadable index file results in an empty index."""
+        path = tmp_path / "parent_index" / "owner__repo.json"
+        path.parent.mkdir()
+        path.write_text("{not json")
+
+        index = ParentIndex.for_repository("owner/repo", tmp_path)
+
+        assert index.children == {}
+        assert index.synced_at is None
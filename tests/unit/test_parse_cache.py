@@ -0,0 +1,97 @@
+"""Unit tests for the parsed issue body cache."""
+
+from ghoo.core import IssueParser
+from ghoo.utils.parse_cache import ParseCache
+
+
+BODY = """Description
+
+## Tasks
+- [ ] First
+- [x] Second
+
+### CONDITION: Deployed
+- [x] VERIFIED
+- **Signed-off by:** alice
+- **Requirements:** Deploy to staging
+- **Evidence:** Deployed at 14:30
+
+## Log
+
+---
+### → planning [2024-01-01 10:00:00 UTC]
+*by @alice*
+**Message**: Starting
+
+#### Notes
+Some detail
+"""
+
+
+class TestParseCache:
+    """Test cases for ParseCache and IssueParser.parse_body_cached."""
+
+    def test_cached_result_equals_fresh_parse(self):
+        """Test a cache hit returns the same data as parsing."""
+        cache = ParseCache()
+        first = IssueParser.parse_body_cached(BODY, cache)
+        second = IssueParser.parse_body_cached(BODY, cache)
+
+        assert second == first == IssueParser.parse_body(BODY)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_hits_return_fresh_objects(self):
+        """Test callers can modify a result without affecting later hits."""
+        cache = ParseCache()
+        first = IssueParser.parse_body_cached(BODY, cache)
+        first['sections'][0].todos[0].checked = True
+
+        second = IssueParser.parse_body_cached(BODY, cache)
+
+        assert second['sections'][0].todos[0].checked is False
+        assert second['sections'][0] is not first['sections'][0]
+
+    def test_changed_body_is_parsed_again(self):
+        """Test the key follows the body content."""
+        cache = ParseCache()
+        IssueParser.parse_body_cached(BODY, cache)
+
+        parsed = IssueParser.parse_body_cached(BODY.replace('- [ ] First', '- [x] First'), cache)
+
+        assert parsed['sections'][0].todos[0].checked is True
+        assert cache.misses == 2
+
+    def test_lru_is_bounded(self):
+        """Test the in-memory layer evicts the least recently used body."""
+        cache = ParseCache(max_entries=2)
+        for body in ('## A', '## B', '## C'):
+            IssueParser.parse_body_cached(body, cache)
+
+        assert cache.get('## A') is None
+        assert cache.get('## C') is not None
+
+    def test_persistent_layer_is_shared(self, tmp_path):
+        """Test a result written by one process is read by another."""
+        IssueParser.parse_body_cached(BODY, ParseCache(tmp_path))
+
+        other = ParseCache(tmp_path)
+        assert other.get(BODY) == IssueParser.parse_body(BODY)
+        assert len(list(tmp_path.glob('*.json'))) == 1
+
+    def test_persistent_layer_is_pruned(self, tmp_path):
+        """Test the oldest files are removed beyond max_disk_entries."""
+        cache = ParseCache(tmp_path, max_disk_entries=2)
+        for body in ('## A', '## B', '## C'):
+            IssueParser.parse_body_cached(body, cache)
+
+        assert len(list(tmp_path.glob('*.json'))) == 2
+
+    def test_corrupt_or_stale_file_is_a_miss(self, tmp_path):
+        """Test unreadable entries and entries in another format are ignored."""
+        cache = ParseCache(tmp_path)
+        cache._path(cache.key(BODY)).write_text('{"v": 0}')
+        cache._path(cache.key('## A')).write_text('not json')
+
+        assert cache.get(BODY) is None
+        assert cache.get('## A') is None
+        assert IssueParser.parse_body_cached(BODY, cache) == IssueParser.parse_body(BODY)
@@ -0,0 +1,113 @@
+"""Unit tests for the on-disk Projects V2 schema and item ID cache."""
+
+import threading
+from unittest.mock import patch
+
+from ghoo.utils.projects import ProjectCache
+
+
+NOW = 1_700_000_000.0
+SCHEMA = {
+    'project_id': "PVT_1",
+    'project_title': "Roadmap",
+    'fields': {'Status': {'id': "F_1", 'name': "Status", 'dataType': "SINGLE_SELECT",
+                          'options': {'Done': "O_1"}}},
+}
+
+
+class TestProjectCache:
+    """Test cases for ProjectCache."""
+
+    def test_roundtrip_between_instances(self, tmp_path):
+        """Test schemas and item IDs stored by one process are read by another."""
+        cache = ProjectCache.for_cache_dir(tmp_path)
+        cache.put("orgs/Acme/5", SCHEMA)
+        cache.put_items("orgs/acme/5", {"Owner/Repo#12": "PVTI_12"})
+
+        other = ProjectCache.for_cache_dir(tmp_path)
+        assert other.get("orgs/acme/5") == SCHEMA
+        assert other.get_item("orgs/acme/5", "owner/repo#12") == "PVTI_12"
+        assert other.get_item("orgs/acme/5", "owner/repo#13") is None
+        assert other.get("orgs/acme/6") is None
+
+    def test_items_need_a_cached_schema(self):
+        """Test item IDs of a project without a cached schema are not stored."""
+        cache = ProjectCache.for_cache_dir(None)
+        cache.put_items("PVT_1", {"owner/repo#12": "PVTI_12"})
+
+        assert cache.get_item("PVT_1", "owner/repo#12") is None
+
+    def test_new_schema_drops_items(self):
+        """Test refreshing a schema forgets the item IDs stored with the old one."""
+        cache = ProjectCache.for_cache_dir(None)
+        cache.put("PVT_1", SCHEMA)
+        cache.put_items("PVT_1", {"owner/repo#12": "PVTI_12", "owner/repo#13": "PVTI_13"})
+        cache.forget_item("PVT_1", "owner/repo#13")
+        assert cache.get_item("PVT_1", "owner/repo#12") == "PVTI_12"
+        assert cache.get_item("PVT_1", "owner/repo#13") is None
+
+        cache.put("PVT_1", SCHEMA)
+        assert cache.get_item("PVT_1", "owner/repo#12") is None
+
+    def test_missing_values_until_refresh(self, tmp_path):
+        """Test values missing from a schema are remembered until it is fetched again."""
+        cache = ProjectCache.for_cache_dir(tmp_path)
+        cache.put("PVT_1", SCHEMA)
+        cache.put_missing("PVT_1", "Status=Blocked")
+
+        assert ProjectCache.for_cache_dir(tmp_path).is_missing("PVT_1", "status=blocked")
+        assert not cache.is_missing("PVT_1", "Status=Done")
+
+        cache.put("PVT_1", SCHEMA)
+        assert not cache.is_missing("PVT_1", "Status=Blocked")
+
+    def test_expires_after_ttl(self, tmp_path):
+        """Test a schema and its items older than the TTL are fetched again."""
+        with patch('ghoo.utils.projects.time.time', return_value=NOW):
+            cache = ProjectCache.for_cache_dir(tmp_path, ttl=60)
+            cache.put("PVT_1", SCHEMA)
+            cache.put_items("PVT_1", {"owner/repo#12": "PVTI_12"})
+
+        with patch('ghoo.utils.projects.time.time', return_value=NOW + 59):
+            assert ProjectCache.for_cache_dir(tmp_path, ttl=60).get("PVT_1") == SCHEMA
+        with patch('ghoo.utils.projects.time.time', return_value=NOW + 61):
+            cache = ProjectCache.for_cache_dir(tmp_path, ttl=60)
+            assert cache.get("PVT_1") is None
+            assert cache.get_item("PVT_1", "owner/repo#12") is None
+
+    def test_corrupt_file_is_a_miss(self, tmp_path):
+        """Test an unreadable cache file is ignored."""
+        path = tmp_path / "projects" / "pvt_1.json"
+        path.parent.mkdir(parents=True)
+        path.write_text("{not json")
+
+        assert ProjectCache.for_cache_dir(tmp_path).get("PVT_1") is None
+
+    def test_concurrent_item_updates(self, tmp_path):
+        """Test item IDs stored from several threads are all written."""
+        cache = ProjectCache.for_cache_dir(tmp_path)
+        cache.put("PVT_1", SCHEMA)
+
+        def store(worker):
+            for number in range(50):
+                cache.put_items("PVT_1", {f"owner/repo#{worker * 100 + number}": f"PVTI_{worker}_{number}"})
+
+        threads = [threading.Thread(target=store, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        other = ProjectCache.for_cache_dir(tmp_path)
+        assert other.get_item("PVT_1", "owner/repo#749") == "PVTI_7_49"
+        assert len(other._entry("PVT_1")['items']) == 400
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path):
+        """Test a write that fails removes its temporary file and keeps the entry in memory."""
+        cache = ProjectCache.for_cache_dir(tmp_path)
+
+        with patch('ghoo.utils.cache.os.replace', side_effect=OSError("read-only")):
+            cache.put("PVT_1", SCHEMA)
+
+        assert cache.get("PVT_1") == SCHEMA
+        assert list((tmp_path / "projects").iterdir()) == []
@@ -0,0 +1,135 @@
+"""Unit tests for the shared rate-limit scheduler."""
+
+from unittest.mock import patch
+
+import pytest
+
+from ghoo.utils.rate_limit import RateLimitScheduler
+
+
+NOW = 1_700_000_000.0
+
+
+def _headers(remaining, reset_in=3600, limit=5000, resource='core'):
+    return {
+        'X-RateLimit-Limit': str(limit),
+        'X-RateLimit-Remaining': str(remaining),
+        'X-RateLimit-Reset': str(int(NOW + reset_in)),
+        'X-RateLimit-Resource': resource,
+    }
+
+
+@pytest.fixture
+def clock():
+    """Freeze time.time and record time.sleep calls inside the scheduler."""
+    with patch('ghoo.utils.rate_limit.time.time', return_value=NOW), \
+         patch('ghoo.utils.rate_limit.time.sleep') as mock_sleep:
+        yield mock_sleep
+
+
+class TestRateLimitScheduler:
+    """Test cases for RateLimitScheduler."""
+
+    def test_no_pacing_without_observations(self, clock):
+        """Test requests are not delayed before any budget is known."""
+        scheduler = RateLimitScheduler()
+
+        assert scheduler.acquire('core') == 0
+        clock.assert_not_called()
+
+    def test_burst_then_paced(self, clock):
+        """Test requests beyond the burst are spread over the remaining window."""
+        scheduler = RateLimitScheduler()
+        scheduler.observe_headers(_headers(remaining=360 + 50, reset_in=3600))
+
+        delays = [scheduler.acquire('core') for _ in range(RateLimitScheduler.BURST + 1)]
+
+        assert all(delay == 0 for delay in delays[:-1])
+        # ~360 usable requests over 3600s -> one request every ~10s
+        assert delays[-1] == pytest.approx(10, rel=0.2)
+
+    def test_exhausted_budget_waits_for_reset(self, clock):
+        """Test an exhausted budget queues the request until the reset time."""
+        scheduler = RateLimitScheduler()
+        scheduler.observe_headers(_headers(remaining=10, reset_in=120))
+
+        assert scheduler.acquire('core') == pytest.approx(120)
+
+    def test_long_wait_is_announced(self, clock, capsys):
+        """Test waits beyond NOTICE_DELAY print the wait and resource to stderr."""
+        scheduler = RateLimitScheduler()
+        scheduler.observe_headers(_headers(remaining=10, reset_in=1500))
+
+        scheduler.acquire('core')
+
+        assert capsys.readouterr().err == "Waiting 25m 0s for GitHub's core rate limit\n"
+
+    def test_short_wait_is_silent(self, clock, capsys):
+        """Test pacing delays below NOTICE_DELAY print nothing."""
+        scheduler = RateLimitScheduler()
+        scheduler.on_secondary_limit(retry_after=2)
+
+        assert scheduler.acquire('core') == pytest.approx(2)
+        assert capsys.readouterr().err == ""
+
+    def test_resources_are_independent(self, clock):
+        """Test an exhausted REST budget does not delay GraphQL requests."""
+        scheduler = RateLimitScheduler()
+        scheduler.observe_headers(_headers(remaining=0))
+
+        assert scheduler.acquire('graphql') == 0
+
+    def test_secondary_limit_backs_off_adaptively(self, clock):
+        """Test repeated secondary limit hits increase the pause."""
+        scheduler = RateLimitScheduler()
+
+        scheduler.observe_headers({}, 403, "You have exceeded a secondary rate limit")
+        first = scheduler.acquire('core')
+        scheduler.observe_headers({}, 403, "You have exceeded a secondary rate limit")
+        second = scheduler.backoff_until - NOW
+
+        assert first == pytest.approx(1)
+        assert second == pytest.approx(2)
+        assert scheduler.min_interval > 0
+
+    def test_retry_after_is_honoured(self, clock):
+        """Test Retry-After on a 429 sets the pause length."""
+        scheduler = RateLimitScheduler()
+        scheduler.observe_headers({'Retry-After': '30'}, 429)
+
+        assert scheduler.acquire('graphql') == pytest.approx(30)
+
+    def test_graphql_rate_limit_object(self, clock):
+        """Test the GraphQL rateLimit object updates the graphql budget and cost."""
+        scheduler = RateLimitScheduler()
+        scheduler.observe_graphql_rate_limit(
+            {'cost': 5, 'remaining': 4000, 'limit': 5000, 'resetAt': '2023-11-14T22:13:20Z'}
+        )
+
+        budget = scheduler.budgets['graphql']
+        assert budget.remaining == 4000
+        assert budget.cost == 5
+        assert budget.reset == NOW
+
+    def test_state_shared_between_processes(self, clock, tmp_path):
+        """Test a second scheduler on the same state file sees the budget and splits it."""
+        path = tmp_path / "ratelimit" / "token.json"
+        first = RateLimitScheduler(path)
+        first.observe_headers(_headers(remaining=0, reset_in=60))
+
+        second = RateLimitScheduler(path)
+        second._client_id = "other-host:1"
+
+        assert second.budgets['core'].remaining == 0
+        assert second._active_clients(NOW) == 2
+        assert second.acquire('core') == pytest.approx(60)
+
+    def test_resource_for_url(self):
+        """Test URLs map to the resource GitHub meters them against."""
+        assert RateLimitScheduler.resource_for_url("https://api.github.com/graphql") == 'graphql'
+        assert RateLimitScheduler.resource_for_url("https://api.github.com/search/issues?q=x") == 'search'
+        assert RateLimitScheduler.resource_for_url("https://api.github.com/repos/o/r/issues/1") == 'core'
+
+    def test_for_token_without_cache_dir_is_in_memory(self):
+        """Test a scheduler without cache dir does not persist state."""
+        assert RateLimitScheduler.for_token("token").state_path is None
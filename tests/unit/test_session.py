@@ -0,0 +1,119 @@
+"""Unit tests for the per-invocation repository and issue session."""
+
+from unittest.mock import Mock, PropertyMock, patch
+
+import pytest
+from github import Github, UnknownObjectException
+
+from ghoo.utils.session import RepositoryHandle, Session, install_session
+
+
+def issue_data(number, title="Issue"):
+    return {
+        'number': number,
+        'title': title,
+        'state': 'open',
+        'url': f'https://api.github.com/repos/owner/repo/issues/{number}',
+    }
+
+
+@pytest.fixture
+def requester():
+    requester = Mock()
+    requester.requestJsonAndCheck.side_effect = \
+        lambda verb, url: ({}, issue_data(int(url.rsplit('/', 1)[1])))
+    return requester
+
+
+@pytest.fixture
+def github(requester):
+    with patch.object(Github, 'requester', new_callable=PropertyMock, return_value=requester):
+        yield Github()
+
+
+class TestSession:
+    """Test cases for Session and install_session."""
+
+    def test_install_routes_get_repo_through_session(self, github, requester):
+        """Test get_repo() returns a shared handle without a request."""
+        session = install_session(github)
+
+        handle = github.get_repo("owner/repo")
+
+        assert isinstance(handle, RepositoryHandle)
+        assert github.get_repo("Owner/Repo") is handle
+        assert session.get_repo("owner/repo") is handle
+        requester.requestJsonAndCheck.assert_not_called()
+
+    def test_issue_is_fetched_once(self, github, requester):
+        """Test repeated lookups of an issue share one object and one request."""
+        install_session(github)
+
+        first = github.get_repo("owner/repo").get_issue(7)
+        second = github.get_repo("owner/repo").get_issue(7)
+
+        assert first is second
+        assert first.number == 7 and first.title == "Issue"
+        requester.requestJsonAndCheck.assert_called_once_with("GET", "/repos/owner/repo/issues/7")
+
+    def test_invalidate_and_clear_refetch(self, github, requester):
+        """Test an invalidated issue is fetched again."""
+        session = install_session(github)
+        issue = session.get_issue("owner/repo", 7)
+        session.get_issue("owner/repo", 8)
+
+        session.invalidate("owner/repo", 7)
+        assert session.get_issue("owner/repo", 7) is not issue
+        assert session.get_issue("owner/repo", 8) is session.get_issue("owner/repo", 8)
+
+        session.invalidate("owner/repo")
+        session.get_issue("owner/repo", 8)
+        session.clear()
+        session.get_issue("owner/repo", 8)
+        assert requester.requestJsonAndCheck.call_count == 5
+
+    def test_label_writes_drop_issue(self, github, requester):
+        """Test label methods, which don't update the Issue, make the next lookup refetch."""
+        session = install_session(github)
+        requester.requestJsonAndCheck.side_effect = lambda verb, url, *args, **kwargs: (
+            ({}, [{'name': 'status:backlog', 'url': 'https://api.github.com/labels/1'}])
+            if url.endswith('/labels') else ({}, issue_data(7))
+        )
+        issue = session.get_issue("owner/repo", 7)
+        issue._requester = requester
+
+        issue.add_to_labels("status:backlog")
+
+        fresh = session.get_issue("owner/repo", 7)
+        assert fresh is not issue
+        assert session.get_issue("owner/repo", 7) is fresh
+
+    def test_missing_issue_is_not_cached(self, github, requester):
+        """Test a failed fetch raises and is retried next time."""
+        session = install_session(github)
+        requester.requestJsonAndCheck.side_effect = UnknownObjectException(404, None, None)
+
+        with pytest.raises(UnknownObjectException):
+            session.get_issue("owner/repo", 404)
+        with pytest.raises(UnknownObjectException):
+            session.get_issue("owner/repo", 404)
+        assert requester.requestJsonAndCheck.call_count == 2
+
+    def test_other_repository_attributes_fetch_repository_once(self, github):
+        """Test attributes other than get_issue resolve the real repository."""
+        session = install_session(github)
+        repository = Mock(full_name="owner/repo", private=True)
+        session._get_repo = Mock(return_value=repository)
+
+        handle = github.get_repo("owner/repo")
+
+        assert handle.private is True
+        assert handle.get_labels is repository.get_labels
+        session._get_repo.assert_called_once_with("owner/repo")
+
+    def test_install_ignores_other_clients(self):
+        """Test mocked clients are left alone."""
+        client = Mock()
+
+        assert install_session(client) is None
+        assert isinstance(client.get_repo, Mock)
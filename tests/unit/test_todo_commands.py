@@ -85,76 +85,6 @@ This is a test issue.
         for invalid_repo in invalid_repos:
             with pytest.raises(ValueError, match="Invalid repository format"):
                 todo_command._get_issue_and_parsed_body(invalid_repo, 456)
-    
-    def test_find_section_success(self, todo_command, sample_parsed_body):
-        """Test finding a section by name."""
-        section = todo_command._find_section(sample_parsed_body, "Tasks")
-        assert section is not None
-        assert section.title == "Tasks"
-        assert len(section.todos) == 3
-    
-    def test_find_section_case_insensitive(self, todo_command, sample_parsed_body):
-        """Test finding a section with case insensitive matching."""
-        section = todo_command._find_section(sample_parsed_body, "tasks")
-        assert section is not None
-        assert section.title == "Tasks"
-        
-        section = todo_command._find_section(sample_parsed_body, "TASKS")
-        assert section is not None
-        assert section.title == "Tasks"
-    
-    def test_find_section_not_found(self, todo_command, sample_parsed_body):
-        """Test finding non-existent section."""
-        section = todo_command._find_section(sample_parsed_body, "Nonexistent")
-        assert section is None
-    
-    def test_reconstruct_body_with_todos(self, todo_command, sample_parsed_body):
-        """Test body reconstruction with existing todos."""
-        reconstructed = todo_command._reconstruct_body(sample_parsed_body)
-        expected_lines = [
-            "This is a test issue.",
-            "",
-            "## Tasks",
-            "- [ ] Task 1",
-            "- [x] Task 2", 
-            "- [ ] Task 3"
-        ]
-        assert reconstructed == '\n'.join(expected_lines)
-    
-    def test_reconstruct_body_with_updated_todos(self, todo_command, sample_parsed_body):
-        """Test body reconstruction with updated todo states."""
-        # Update todo states
-        sample_parsed_body['sections'][0].todos[0].checked = True  # Task 1 checked
-        sample_parsed_body['sections'][0].todos[1].checked = False  # Task 2 unchecked
-        
-        reconstructed = todo_command._reconstruct_body(sample_parsed_body)
-        expected_lines = [
-            "This is a test issue.",
-            "",
-            "## Tasks",
-            "- [x] Task 1",
-            "- [ ] Task 2", 
-            "- [ ] Task 3"
-        ]
-        assert reconstructed == '\n'.join(expected_lines)
-    
-    def test_reconstruct_body_with_new_todos(self, todo_command, sample_parsed_body):
-        """Test body reconstruction with new todos added."""
-        # Add a new todo without line number
-        new_todo = Todo(text='New Task', checked=False, line_number=None)
-        sample_parsed_body['sections'][0].todos.append(new_todo)
-        
-        reconstructed = todo_command._reconstruct_body(sample_parsed_body)
-        expected_lines = [
-            "This is a test issue.",
-            "",
-            "## Tasks",
-            "- [ ] Task 1",
-            "- [x] Task 2", 
-            "- [ ] Task 3",
-            "- [ ] New Task"
-        ]
-        assert reconstructed == '\n'.join(expected_lines)
 
 
 class TestCreateTodoCommand:
@@ -222,9 +152,23 @@ Some notes here.
         assert result['section_name'] == "New Section"
         assert result['todo_text'] == "New task"
         assert result['total_todos_in_section'] == 1
+        assert result['section_created'] is True
         
         create_todo_command.set_body_command.execute.assert_called_once()
     
+    def test_execute_inserts_only_the_todo_line(self, create_todo_command, mock_github_client, mock_issue_with_sections):
+        """Test the new todo goes after the last todo and nothing else changes."""
+        mock_repo = Mock()
+        mock_repo.get_issue.return_value = mock_issue_with_sections
+        mock_github_client.github.get_repo.return_value = mock_repo
+        
+        create_todo_command.execute("owner/repo", 123, "Tasks", "New task")
+        
+        new_body = create_todo_command.set_body_command.execute.call_args[0][2]
+        assert new_body == mock_issue_with_sections.body.replace(
+            "- [ ] Existing task\n", "- [ ] Existing task\n- [ ] New task\n"
+        )
+    
     def test_execute_section_not_found_no_create(self, create_todo_command, mock_github_client, mock_issue_with_sections):
         """Test error when section doesn't exist and create_section=False."""
         mock_repo = Mock()
@@ -367,6 +311,35 @@ class TestCheckTodoCommand:
         with pytest.raises(ValueError, match="Match text cannot be empty"):
             check_todo_command.execute("owner/repo", 456, "Tasks", "   ")
     
+    def test_execute_rewrites_only_the_checkbox(self, check_todo_command, mock_github_client):
+        """Test checking a todo leaves the rest of the body byte-for-byte identical."""
+        body = (
+            "# Epic: Heading\r\n"
+            "Intro with trailing spaces   \r\n"
+            "\r\n"
+            "\r\n"
+            "## Tasks\r\n"
+            "- [ ] Deploy app\r\n"
+            "  - [ ] Deploy docs\r\n"
+            "\r\n"
+            "## Log\r\n"
+            "---\r\n"
+            "### → planning [2024-01-01 10:00:00 UTC]\r\n"
+            "*by @user*\r\n"
+        )
+        mock_issue = Mock()
+        mock_issue.number = 789
+        mock_issue.title = "Formatted Issue"
+        mock_issue.body = body
+        mock_repo = Mock()
+        mock_repo.get_issue.return_value = mock_issue
+        mock_github_client.github.get_repo.return_value = mock_repo
+        
+        check_todo_command.execute("owner/repo", 789, "Tasks", "docs")
+        
+        new_body = check_todo_command.set_body_command.execute.call_args[0][2]
+        assert new_body == body.replace("  - [ ] Deploy docs", "  - [x] Deploy docs")
+    
     def test_execute_no_todos_in_section(self, check_todo_command, mock_github_client):
         """Test error when section has no todos."""
         mock_issue = Mock()